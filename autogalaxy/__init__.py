@@ -1,6 +1,10 @@
-from . import aggregator as agg
-from . import plot
+import importlib
+
 from . import util
+from .dataset.grid_adaptive import GridAdaptive
+from .dataset.super_pixels import SuperPixels, GridSuperPixels
+from .dataset.psf_gaussians import PSFGaussians
+from .dataset.visibilities_compression import VisibilitiesCompression
 from .dataset.imaging import MaskedImaging, SettingsMaskedImaging, SimulatorImaging
 from .dataset.interferometer import (
     MaskedInterferometer,
@@ -36,24 +40,6 @@ from .galaxy.galaxy_data import GalaxyData
 from .galaxy.galaxy_model import GalaxyModel
 from .galaxy.masked_galaxy_data import MaskedGalaxyDataset
 from .hyper import hyper_data
-from .pipeline.phase.abstract import phase
-from .pipeline.phase.abstract.phase import AbstractPhase
-from .pipeline.phase.extensions.hyper_phase import HyperPhase
-from .pipeline.phase.imaging.phase import PhaseImaging
-from .pipeline.phase.interferometer.phase import PhaseInterferometer
-from .pipeline.phase.phase_galaxy import PhaseGalaxy
-from .pipeline.phase.settings import SettingsPhaseImaging
-from .pipeline.phase.settings import SettingsPhaseInterferometer
-from .pipeline.pipeline import PipelineDataset
-from .pipeline.setup import (
-    SetupPipeline,
-    SetupHyper,
-    SetupLightParametric,
-    SetupLightInversion,
-    SetupMassTotal,
-    SetupMassLightDark,
-    SetupSMBH,
-)
 from .plane.plane import Plane
 from .profiles import (
     light_profiles as lp,
@@ -64,4 +50,54 @@ from . import convert
 
 conf.instance.register(__file__)
 
+# The plotting, aggregator and pipeline modules import matplotlib and the non-linear searches, which are not needed to
+# fit a model (e.g. in a worker process), so they are imported on first access of their attribute (see `__getattr__`).
+_lazy_imports = {
+    "agg": (".aggregator", None),
+    "plot": (".plot", None),
+    "phase": (".pipeline.phase.abstract.phase", None),
+    "AbstractPhase": (".pipeline.phase.abstract.phase", "AbstractPhase"),
+    "HyperPhase": (".pipeline.phase.extensions.hyper_phase", "HyperPhase"),
+    "PhaseImaging": (".pipeline.phase.imaging.phase", "PhaseImaging"),
+    "PhaseInterferometer": (
+        ".pipeline.phase.interferometer.phase",
+        "PhaseInterferometer",
+    ),
+    "PhaseGalaxy": (".pipeline.phase.phase_galaxy", "PhaseGalaxy"),
+    "SettingsPhaseImaging": (".pipeline.phase.settings", "SettingsPhaseImaging"),
+    "SettingsPhaseInterferometer": (
+        ".pipeline.phase.settings",
+        "SettingsPhaseInterferometer",
+    ),
+    "PipelineDataset": (".pipeline.pipeline", "PipelineDataset"),
+    "SetupPipeline": (".pipeline.setup", "SetupPipeline"),
+    "SetupHyper": (".pipeline.setup", "SetupHyper"),
+    "SetupLightParametric": (".pipeline.setup", "SetupLightParametric"),
+    "SetupLightInversion": (".pipeline.setup", "SetupLightInversion"),
+    "SetupMassTotal": (".pipeline.setup", "SetupMassTotal"),
+    "SetupMassLightDark": (".pipeline.setup", "SetupMassLightDark"),
+    "SetupSMBH": (".pipeline.setup", "SetupSMBH"),
+}
+
+
+def __getattr__(name):
+
+    if name not in _lazy_imports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attribute = _lazy_imports[name]
+
+    value = importlib.import_module(module_name, __name__)
+
+    if attribute is not None:
+        value = getattr(value, attribute)
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
+
 __version__ = '0.17.1'
@@ -1,3 +1,10 @@
+from autogalaxy.aggregator.aggregator import map_from_aggregator
+from autogalaxy.aggregator.aggregator import cached_value_from_agg_obj
+from autogalaxy.aggregator.aggregator import (
+    cached_generator_from_aggregator as Cached,
+)
+from autogalaxy.aggregator.aggregator import dataset_from_agg_obj
+from autogalaxy.aggregator.aggregator import mask_from_agg_obj
 from autogalaxy.aggregator.aggregator import fit_imaging_from_agg_obj
 from autogalaxy.aggregator.aggregator import (
     fit_imaging_generator_from_aggregator as FitImaging,
@@ -14,3 +21,11 @@ from autogalaxy.aggregator.aggregator import (
 )
 from autogalaxy.aggregator.aggregator import plane_from_agg_obj
 from autogalaxy.aggregator.aggregator import plane_generator_from_aggregator as Plane
+from autogalaxy.aggregator.summary_index import SummaryIndex
+from autogalaxy.aggregator.derived_quantities import DarkFractionAtRadius
+from autogalaxy.aggregator.derived_quantities import EinsteinMass
+from autogalaxy.aggregator.derived_quantities import EinsteinRadius
+from autogalaxy.aggregator.derived_quantities import LuminosityWithinCircle
+from autogalaxy.aggregator.derived_quantities import StellarFractionAtRadius
+from autogalaxy.aggregator.derived_quantities import derived_quantities_from_agg_obj
+from autogalaxy.aggregator.derived_quantities import derived_quantities_from_samples
@@ -1,7 +1,131 @@
+import functools
+import hashlib
+import json
+import multiprocessing
+import os
+import pickle
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from os import path
+
+import autofit as af
 import autogalaxy as ag
+from autogalaxy.dataset import dataset_store as ds
 
+_masked_dataset_cache = OrderedDict()
+_masked_dataset_cache_size = 8
 
-def plane_generator_from_aggregator(aggregator):
+
+def _func_from_directory(directory, func):
+    return func(af.PhaseOutput(directory=directory))
+
+
+def _pool_map_from(directories, func, number_of_processes, start_method):
+
+    with ProcessPoolExecutor(
+        max_workers=number_of_processes,
+        mp_context=multiprocessing.get_context(start_method),
+    ) as executor:
+
+        yield from executor.map(
+            functools.partial(_func_from_directory, func=func), directories
+        )
+
+
+def map_from_aggregator(aggregator, func, number_of_processes=None, start_method=None):
+    """
+    Returns a generator of a function mapped over every result in an aggregator, in the same order as
+    `aggregator.map`.
+
+    If `number_of_processes` is greater than 1 the function is mapped using a pool of worker processes, which each
+    load the *PhaseOutput* of a result from its directory and return the function's value. The function must
+    therefore be picklable (e.g. a module-level function rather than a lambda), as must the values it returns.
+
+    Parameters
+    ----------
+    aggregator : af.Aggregator
+        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits.
+    func : func
+        A function which takes an aggregator's *PhaseOutput* object, e.g. `fit_imaging_from_agg_obj`.
+    number_of_processes : int or None
+        The number of worker processes, where `None` or 1 maps the function serially.
+    start_method : str or None
+        The multiprocessing start method of the workers, where `None` uses "fork" if available and "spawn"
+        otherwise.
+    """
+    if number_of_processes is None or number_of_processes <= 1:
+        return aggregator.map(func=func)
+
+    if start_method is None:
+        start_method = (
+            "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        )
+
+    return _pool_map_from(
+        directories=[phase.directory for phase in aggregator.phases],
+        func=func,
+        number_of_processes=number_of_processes,
+        start_method=start_method,
+    )
+
+
+def cached_value_from_agg_obj(agg_obj, name, func):
+    """
+    Returns a quantity derived from a result, for example the figure of merit of its fit, the images of its galaxies
+    or the Einstein radius of its plane, which is computed once and pickled to the result's `aggregator_cache`
+    folder. Later calls with the same name load the quantity from this file rather than computing it.
+
+    The cache is not invalidated if `func` is changed, therefore a changed function must be given a new name (or
+    the `aggregator_cache` folder removed).
+
+    Parameters
+    ----------
+    agg_obj : af.PhaseOutput
+        A PyAutoFit aggregator's PhaseOutput object containing the generators of the results of PyAutoGalaxy model-fits.
+    name : str
+        The name the quantity is cached under.
+    func : func
+        A function which takes the *PhaseOutput* object and returns the quantity.
+    """
+    file_path = path.join(agg_obj.directory, "aggregator_cache", f"{name}.pickle")
+
+    if path.exists(file_path):
+        with open(file_path, "rb") as f:
+            return pickle.load(f)
+
+    value = func(agg_obj)
+
+    ds.write_atomically(file_path=file_path, write_func=lambda f: pickle.dump(value, f))
+
+    return value
+
+
+def cached_generator_from_aggregator(aggregator, name, func, number_of_processes=None):
+    """
+    Returns a generator of a quantity derived from every result in an aggregator, which is cached to disk per result
+    such that repeated runs of an analysis script load it rather than computing it (see `cached_value_from_agg_obj`).
+
+    Parameters
+    ----------
+    aggregator : af.Aggregator
+        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits.
+    name : str
+        The name the quantity is cached under.
+    func : func
+        A function which takes an aggregator's *PhaseOutput* object and returns the quantity, for example
+        `lambda agg_obj: fit_imaging_from_agg_obj(agg_obj).figure_of_merit` (which must be a module-level function if
+        `number_of_processes` is greater than 1).
+    number_of_processes : int or None
+        The number of worker processes the quantities are computed with (see `map_from_aggregator`).
+    """
+    return map_from_aggregator(
+        aggregator=aggregator,
+        func=functools.partial(cached_value_from_agg_obj, name=name, func=func),
+        number_of_processes=number_of_processes,
+    )
+
+
+def plane_generator_from_aggregator(aggregator, number_of_processes=None):
     """
     Returns a generator of `Plane` objects from an input aggregator, which generates a list of the `Plane` objects
     for every set of results loaded in the aggregator.
@@ -12,8 +136,15 @@ def plane_generator_from_aggregator(aggregator):
     Parameters
     ----------
     aggregator : af.Aggregator
-        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits."""
-    return aggregator.map(func=plane_from_agg_obj)
+        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits.
+    number_of_processes : int or None
+        The number of worker processes the results are mapped with (see `map_from_aggregator`).
+    """
+    return map_from_aggregator(
+        aggregator=aggregator,
+        func=plane_from_agg_obj,
+        number_of_processes=number_of_processes,
+    )
 
 
 def plane_from_agg_obj(agg_obj):
@@ -52,7 +183,118 @@ def plane_from_agg_obj(agg_obj):
     return ag.Plane(galaxies=galaxies)
 
 
-def masked_imaging_generator_from_aggregator(aggregator):
+def dataset_from_agg_obj(agg_obj):
+    """
+    Returns the dataset fitted by a phase from an aggregator's *PhaseOutput* class, which is loaded from the dataset
+    store of the output folder with its arrays memory-mapped (see `DatasetStore`).
+
+    Results output before datasets were saved to the dataset store have their dataset loaded from its pickle.
+
+    The dataset is loaded via the JSON reference in the phase's pickles folder, whose path to the store is relative,
+    such that this works after the output folder is moved. The phase's dataset.pickle (and therefore
+    `agg_obj.dataset`) references the store by its absolute path and raises a `FileNotFoundError` once the output
+    folder is moved, therefore this function should be used to load the dataset.
+
+    Parameters
+    ----------
+    agg_obj : af.PhaseOutput
+        A PyAutoFit aggregator's PhaseOutput object containing the generators of the results of PyAutoGalaxy model-fits.
+    """
+    file_path = path.join(agg_obj.pickle_path, "dataset.json")
+
+    if path.exists(file_path):
+        return ds.load_from_reference(file_path=file_path)
+
+    return agg_obj.dataset
+
+
+def mask_from_agg_obj(agg_obj):
+    """
+    Returns the mask of a phase from an aggregator's *PhaseOutput* class, which is loaded from the dataset store of the
+    output folder with its arrays memory-mapped (see `DatasetStore`).
+
+    Results output before masks were saved to the dataset store have their mask loaded from its pickle.
+
+    As for `dataset_from_agg_obj`, the mask is loaded via its relative JSON reference, such that this works after the
+    output folder is moved, whereas `agg_obj.mask` raises a `FileNotFoundError`.
+
+    Parameters
+    ----------
+    agg_obj : af.PhaseOutput
+        A PyAutoFit aggregator's PhaseOutput object containing the generators of the results of PyAutoGalaxy model-fits.
+    """
+    file_path = path.join(agg_obj.pickle_path, "mask.json")
+
+    if path.exists(file_path):
+        return ds.load_from_reference(file_path=file_path)
+
+    return agg_obj.mask
+
+
+def masked_dataset_key_from(agg_obj, objects):
+    """
+    Returns a key which is equal for two results which fitted the same dataset with the same mask and the same
+    objects (e.g. the *SettingsMaskedImaging* of the phase), or `None` if the result's dataset or mask is not in the
+    dataset store (see `DatasetStore`).
+
+    The dataset and mask are described by their content address in the dataset store, therefore they are not
+    loaded to compute the key.
+
+    Parameters
+    ----------
+    agg_obj : af.PhaseOutput
+        A PyAutoFit aggregator's PhaseOutput object containing the generators of the results of PyAutoGalaxy model-fits.
+    objects : tuple
+        The other objects the masked dataset is created from, which must be picklable.
+    """
+    keys = []
+
+    for name in ["dataset", "mask"]:
+
+        file_path = path.join(agg_obj.pickle_path, f"{name}.json")
+
+        if not path.exists(file_path):
+            return None
+
+        with open(file_path) as f:
+            keys.append(json.load(f)["key"])
+
+    return (*keys, hashlib.sha256(pickle.dumps(objects)).hexdigest())
+
+
+def masked_dataset_from_cache(key, make_masked_dataset):
+    """
+    Returns a masked dataset (e.g. a `MaskedImaging`) from a least-recently-used cache of the masked datasets
+    created by this process, or creates it using `make_masked_dataset` and adds it to the cache.
+
+    Creating a masked dataset (including its `Convolver` or transformer) is often the slowest part of creating a
+    fit, and many results (e.g. every phase of a pipeline) fit the same dataset with the same mask and settings.
+
+    Parameters
+    ----------
+    key : tuple or None
+        The key of the masked dataset (see `masked_dataset_key_from`), where `None` bypasses the cache.
+    make_masked_dataset : func
+        A function which creates the masked dataset if it is not in the cache.
+    """
+    if key is None:
+        return make_masked_dataset()
+
+    if key in _masked_dataset_cache:
+        _masked_dataset_cache.move_to_end(key)
+        return _masked_dataset_cache[key]
+
+    masked_dataset = make_masked_dataset()
+
+    _masked_dataset_cache[key] = masked_dataset
+
+    if len(_masked_dataset_cache) > _masked_dataset_cache_size:
+        _masked_dataset_cache.popitem(last=False)
+
+    return masked_dataset
+
+
+def masked_imaging_generator_from_aggregator(aggregator, number_of_processes=None):
     """
     Returns a generator of `MaskImaging` objects from an input aggregator, which generates a list of the
     `MaskImaging` objects for every set of results loaded in the aggregator.
@@ -64,8 +306,15 @@ def masked_imaging_generator_from_aggregator(aggregator):
     Parameters
     ----------
     aggregator : af.Aggregator
-        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits."""
-    return aggregator.map(func=masked_imaging_from_agg_obj)
+        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits.
+    number_of_processes : int or None
+        The number of worker processes the results are mapped with (see `map_from_aggregator`).
+    """
+    return map_from_aggregator(
+        aggregator=aggregator,
+        func=masked_imaging_from_agg_obj,
+        number_of_processes=number_of_processes,
+    )
 
 
 def masked_imaging_from_agg_obj(agg_obj):
@@ -81,16 +330,23 @@ def masked_imaging_from_agg_obj(agg_obj):
     ----------
     agg_obj : af.PhaseOutput
         A PyAutoFit aggregator's PhaseOutput object containing the generators of the results of PyAutoGalaxy model-fits.
-    """
 
-    return ag.MaskedImaging(
-        imaging=agg_obj.dataset,
-        mask=agg_obj.mask,
-        settings=agg_obj.settings.settings_masked_imaging,
+    Results which fitted the same dataset with the same mask and settings as an earlier result reuse its
+    `MaskImaging` (see `masked_dataset_from_cache`).
+    """
+    settings = agg_obj.settings.settings_masked_imaging
+
+    return masked_dataset_from_cache(
+        key=masked_dataset_key_from(agg_obj=agg_obj, objects=(settings,)),
+        make_masked_dataset=lambda: ag.MaskedImaging(
+            imaging=dataset_from_agg_obj(agg_obj=agg_obj),
+            mask=mask_from_agg_obj(agg_obj=agg_obj),
+            settings=settings,
+        ),
     )
 
 
-def fit_imaging_generator_from_aggregator(aggregator):
+def fit_imaging_generator_from_aggregator(aggregator, number_of_processes=None):
     """
     Returns a generator of `FitImaging` objects from an input aggregator, which generates a list of the
     `FitImaging` objects for every set of results loaded in the aggregator.
@@ -101,8 +357,15 @@ def fit_imaging_generator_from_aggregator(aggregator):
     Parameters
     ----------
     aggregator : af.Aggregator
-        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits."""
-    return aggregator.map(func=fit_imaging_from_agg_obj)
+        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits.
+    number_of_processes : int or None
+        The number of worker processes the results are mapped with (see `map_from_aggregator`).
+    """
+    return map_from_aggregator(
+        aggregator=aggregator,
+        func=fit_imaging_from_agg_obj,
+        number_of_processes=number_of_processes,
+    )
 
 
 def fit_imaging_from_agg_obj(agg_obj):
@@ -130,7 +393,9 @@ def fit_imaging_from_agg_obj(agg_obj):
     )
 
 
-def masked_interferometer_generator_from_aggregator(aggregator):
+def masked_interferometer_generator_from_aggregator(
+    aggregator, number_of_processes=None
+):
     """
     Returns a generator of *MaskedInterferometer* objects from an input aggregator, which generates a list of the
     *MaskedInterferometer* objects for every set of results loaded in the aggregator.
@@ -142,8 +407,15 @@ def masked_interferometer_generator_from_aggregator(aggregator):
     Parameters
     ----------
     aggregator : af.Aggregator
-        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits."""
-    return aggregator.map(func=masked_interferometer_from_agg_obj)
+        A PyAutoFit aggregator object containing the results of PyAutoGalaxy model-fits.
+    number_of_processes : int or None
+        The number of worker processes the results are mapped with (see `map_from_aggregator`).
+    """
+    return map_from_aggregator(
+        aggregator=aggregator,
+        func=masked_interferometer_from_agg_obj,
+        number_of_processes=number_of_processes,
+    )
 
 
 def masked_interferometer_from_agg_obj(agg_obj):
@@ -161,17 +433,27 @@ def masked_interferometer_from_agg_obj(agg_obj):
     ----------
     agg_obj : af.PhaseOutput
         A PyAutoFit aggregator's PhaseOutput object containing the generators of the results of PyAutoGalaxy model-fits.
-    """
 
-    return ag.MaskedInterferometer(
-        interferometer=agg_obj.dataset,
-        visibilities_mask=agg_obj.mask,
-        real_space_mask=agg_obj.attributes.real_space_mask,
-        settings=agg_obj.settings.settings_masked_interferometer,
+    Results which fitted the same dataset with the same masks and settings as an earlier result reuse its
+    *MaskedInterferometer* (see `masked_dataset_from_cache`).
+    """
+    real_space_mask = agg_obj.attributes.real_space_mask
+    settings = agg_obj.settings.settings_masked_interferometer
+
+    return masked_dataset_from_cache(
+        key=masked_dataset_key_from(
+            agg_obj=agg_obj, objects=(settings, real_space_mask)
+        ),
+        make_masked_dataset=lambda: ag.MaskedInterferometer(
+            interferometer=dataset_from_agg_obj(agg_obj=agg_obj),
+            visibilities_mask=mask_from_agg_obj(agg_obj=agg_obj),
+            real_space_mask=real_space_mask,
+            settings=settings,
+        ),
     )
 
 
-def fit_interferometer_generator_from_aggregator(aggregator):
+def fit_interferometer_generator_from_aggregator(aggregator, number_of_processes=None):
     """
     Returns a *FitInterferometer* object from an aggregator's *PhaseOutput* class, which we call an 'agg_obj' to
     describe that it acts as the aggregator object for one result in the *Aggregator*. This uses the aggregator's
@@ -185,7 +467,11 @@ def fit_interferometer_generator_from_aggregator(aggregator):
     agg_obj : af.PhaseOutput
         A PyAutoFit aggregator's PhaseOutput object containing the generators of the results of PyAutoGalaxy model-fits.
     """
-    return aggregator.map(func=fit_interferometer_from_agg_obj)
+    return map_from_aggregator(
+        aggregator=aggregator,
+        func=fit_interferometer_from_agg_obj,
+        number_of_processes=number_of_processes,
+    )
 
 
 def fit_interferometer_from_agg_obj(agg_obj):
@@ -0,0 +1,819 @@
+import hashlib
+import math
+import multiprocessing
+import types
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from os import path
+
+import numpy as np
+from autofit.non_linear.samples import quantile
+from scipy import special
+
+from autogalaxy.aggregator import summary_index as si
+from autogalaxy.dataset import dataset_store as ds
+from autogalaxy.plane import plane as pl
+from autogalaxy.profiles import light_profiles as lp
+from autogalaxy.profiles.mass_profiles import (
+    dark_mass_profiles as dmp,
+    stellar_mass_profiles as smp,
+    total_mass_profiles as tmp,
+)
+
+_worker = types.SimpleNamespace(model=None, quantities=None)
+
+
+def sersic_within_circle_from(
+    radius, intensity, effective_radius, sersic_index, sersic_constant
+):
+    """
+    Returns the integral of a Sersic profile within circles of the input radii, which is the value
+    `luminosity_within_circle` (and, multiplied by the mass-to-light ratio, `mass_angular_within_circle`)
+    integrates numerically. Every input may be an ndarray, such that the integral of many profiles is computed at
+    once.
+    """
+    two_n = 2.0 * sersic_index
+
+    return (
+        2.0
+        * np.pi
+        * intensity
+        * effective_radius ** 2
+        * sersic_index
+        * np.exp(sersic_constant)
+        / sersic_constant ** two_n
+        * special.gamma(two_n)
+        * special.gammainc(
+            two_n, sersic_constant * (radius / effective_radius) ** (1.0 / sersic_index)
+        )
+    )
+
+
+def gaussian_within_circle_from(radius, intensity, sigma):
+    """
+    Returns the integral of a Gaussian profile within circles of the input radii, where `sigma` is the profile's
+    sigma divided by the square root of its axis ratio (see `EllipticalGaussian.image_from_grid_radii`).
+    """
+    return (
+        2.0
+        * np.pi
+        * intensity
+        * sigma ** 2
+        * (1.0 - np.exp(-0.5 * (radius / sigma) ** 2))
+    )
+
+
+def power_law_within_circle_from(radius, einstein_radius_rescaled, slope, core_radius):
+    """
+    Returns the integral of the convergence of a cored power-law within circles of the input radii, which for a
+    core radius of zero is the integral of a power-law.
+    """
+    exponent = 3.0 - slope
+
+    return (
+        2.0
+        * np.pi
+        * einstein_radius_rescaled
+        / exponent
+        * (
+            (core_radius ** 2 + radius ** 2) ** (exponent / 2.0)
+            - core_radius ** exponent
+        )
+    )
+
+
+def nfw_within_circle_from(radius, kappa_s, scale_radius):
+    """
+    Returns the integral of the convergence of an NFW profile within circles of the input radii, which is
+    4 * pi * kappa_s * scale_radius**2 * (ln(x / 2) + F(x)) for x = radius / scale_radius (see `coord_func_h`).
+    """
+    x = radius / scale_radius
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f_x = np.where(
+            x < 1.0,
+            np.arccosh(1.0 / np.minimum(x, 1.0))
+            / np.sqrt(1.0 - np.minimum(x, 1.0) ** 2),
+            np.arccos(1.0 / np.maximum(x, 1.0))
+            / np.sqrt(np.maximum(x, 1.0) ** 2 - 1.0),
+        )
+
+    f_x = np.where(x == 1.0, 1.0, f_x)
+
+    return 4.0 * np.pi * kappa_s * scale_radius ** 2 * (np.log(x / 2.0) + f_x)
+
+
+def within_circle_func_and_parameters_from(profile):
+    """
+    Returns the function which computes the integral of a profile's light (for a light profile) or convergence (for
+    a mass profile) within a circle in closed form and the parameters of the profile it takes, or `None` if the
+    profile has no closed form integral.
+    """
+    if isinstance(profile, (lp.EllipticalCoreSersic, smp.EllipticalCoreSersic)):
+        return None
+
+    scale = getattr(profile, "mass_to_light_ratio", 1.0)
+
+    if isinstance(profile, (lp.EllipticalSersic, smp.EllipticalSersic)):
+        return (
+            sersic_within_circle_from,
+            (
+                scale * profile.intensity,
+                profile.effective_radius,
+                profile.sersic_index,
+                profile.sersic_constant,
+            ),
+        )
+
+    if isinstance(profile, (lp.EllipticalGaussian, smp.EllipticalGaussian)):
+        return (
+            gaussian_within_circle_from,
+            (scale * profile.intensity, profile.sigma / np.sqrt(profile.axis_ratio)),
+        )
+
+    if isinstance(profile, tmp.EllipticalCoredPowerLaw):
+        return (
+            power_law_within_circle_from,
+            (profile.einstein_radius_rescaled, profile.slope, profile.core_radius),
+        )
+
+    if isinstance(profile, dmp.EllipticalNFW):
+        return (
+            nfw_within_circle_from,
+            (profile.kappa_s, profile.scale_radius),
+        )
+
+    return None
+
+
+class ProfileBatch:
+    def __init__(self, total_samples, groups):
+        """
+        The profiles of many samples of a model, grouped by the closed form function which integrates them within a
+        circle, such that the integral of every profile of every sample is computed using one call of each function
+        on ndarrays of the profiles' parameters.
+
+        Use `ProfileBatch.from_profiles` to create a batch.
+
+        Parameters
+        ----------
+        total_samples : int
+            The number of samples.
+        groups : {func: (np.ndarray, np.ndarray)}
+            For every closed form function, the sample index of every profile it integrates and an ndarray of
+            shape [total_parameters, total_profiles] of their parameters.
+        """
+        self.total_samples = total_samples
+        self.groups = groups
+
+    @classmethod
+    def from_profiles(cls, profiles_of_samples):
+        """
+        Returns a batch of the profiles of every sample, or `None` if any profile has no closed form integral.
+
+        Parameters
+        ----------
+        profiles_of_samples : [[LightProfile or MassProfile]]
+            The profiles of every sample.
+        """
+        entries = defaultdict(list)
+
+        for sample_index, profiles in enumerate(profiles_of_samples):
+            for profile in profiles:
+
+                func_and_parameters = within_circle_func_and_parameters_from(
+                    profile=profile
+                )
+
+                if func_and_parameters is None:
+                    return None
+
+                func, parameters = func_and_parameters
+                entries[func].append((sample_index, *parameters))
+
+        groups = {}
+
+        for func, rows in entries.items():
+            rows = np.asarray(rows, dtype="float").T
+            groups[func] = (rows[0].astype("int"), rows[1:])
+
+        return cls(total_samples=len(profiles_of_samples), groups=groups)
+
+    def values_within_circles_from(self, radii) -> np.ndarray:
+        """
+        Returns the sum of the integrals of every sample's profiles within a circle, where the radius of every
+        sample's circle is given by `radii`, which is a float or an ndarray of one radius per sample.
+        """
+        radii = np.broadcast_to(np.asarray(radii, dtype="float"), (self.total_samples,))
+
+        values = np.zeros(self.total_samples)
+
+        for func, (sample_indexes, parameters) in self.groups.items():
+            values += np.bincount(
+                sample_indexes,
+                weights=func(radii[sample_indexes], *parameters),
+                minlength=self.total_samples,
+            )
+
+        return values
+
+
+def einstein_radii_from(batch, lower_radius=1.0e-4, upper_radius=1.0e3, iterations=60):
+    """
+    Returns the Einstein radius of every sample of a batch of circularly symmetric mass profiles sharing a centre,
+    which is the radius of the circle within which their mean convergence is 1 (the tangential critical curve).
+
+    The radii are found by bisecting the logarithm of the radius of every sample at once. Samples whose mean
+    convergence is not 1 at a radius between `lower_radius` and `upper_radius` have an Einstein radius of NaN.
+    """
+
+    def mean_convergence_above_one(log_radii):
+        radii = np.exp(log_radii)
+        return batch.values_within_circles_from(radii=radii) > np.pi * radii ** 2
+
+    lower = np.full(batch.total_samples, np.log(lower_radius))
+    upper = np.full(batch.total_samples, np.log(upper_radius))
+
+    has_einstein_radius = mean_convergence_above_one(
+        lower
+    ) & ~mean_convergence_above_one(upper)
+
+    for _ in range(iterations):
+
+        middle = 0.5 * (lower + upper)
+        above = mean_convergence_above_one(middle)
+
+        lower = np.where(above, middle, lower)
+        upper = np.where(above, upper, middle)
+
+    return np.where(has_einstein_radius, np.exp(0.5 * (lower + upper)), np.nan)
+
+
+class AbstractDerivedQuantity:
+    def __init__(self, name, galaxy_names=None):
+        """
+        A quantity derived from the galaxies of a model instance (e.g. their Einstein radius), which is computed for
+        the samples of a non-linear search by `derived_quantities_from_samples`.
+
+        Every quantity is computed for a sample using the same methods of the galaxies and planes as an analysis
+        script would (see `value_from`). Where the quantity has a closed form for the galaxies' profiles, it is
+        computed for all samples at once using ndarrays of the profiles' parameters instead (see `values_from`).
+
+        Parameters
+        ----------
+        name : str
+            The name the quantity's values are returned under.
+        galaxy_names : [str] or None
+            The names of the galaxies in the instance (e.g. ["lens"]) the quantity is computed for, where `None`
+            uses every galaxy.
+        """
+        self.name = name
+        self.galaxy_names = galaxy_names
+
+    @property
+    def arguments(self) -> tuple:
+        """
+        The inputs of the quantity which change its value, which are included in the key its values are cached
+        under.
+        """
+        return ()
+
+    @property
+    def key(self) -> str:
+        return repr((type(self).__name__, self.galaxy_names, *self.arguments))
+
+    def galaxies_from(self, instance):
+        """
+        Returns the galaxies of a model instance the quantity is computed for.
+        """
+        galaxy_items = si.galaxy_items_from_instance(instance=instance)
+
+        if self.galaxy_names is None:
+            return [galaxy for _, galaxy in galaxy_items]
+
+        galaxies = dict(galaxy_items)
+
+        return [galaxies[name] for name in self.galaxy_names]
+
+    def value_from(self, instance) -> float:
+        """
+        Returns the quantity of one model instance.
+        """
+        raise NotImplementedError()
+
+    def values_from(self, instances):
+        """
+        Returns an ndarray of the quantity of every model instance computed in closed form, or `None` if the
+        quantity has no closed form for the instances' profiles, in which case `value_from` is used for every
+        instance.
+        """
+        return None
+
+
+class EinsteinRadius(AbstractDerivedQuantity):
+    def __init__(
+        self, grid, pixel_scale=0.05, galaxy_names=None, name="einstein_radius"
+    ):
+        """
+        The Einstein radius of the galaxies, which is computed from the area of their tangential critical curve (see
+        `einstein_radius_from_grid`).
+
+        If the galaxies' mass profiles are all circularly symmetric, share a centre and have a closed form mass
+        within a circle (e.g. spherical power-laws, NFWs and stellar Sersics), their critical curve is the circle
+        within which their mean convergence is 1. The Einstein radius is then computed in closed form (see
+        `einstein_radii_from`), which is the value the critical curve calculation converges to as its pixel scale
+        is reduced.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The grid the critical curves are computed on, if the Einstein radius has no closed form.
+        pixel_scale : float
+            The pixel scale of the grid the critical curves are computed on.
+        """
+        super().__init__(name=name, galaxy_names=galaxy_names)
+
+        self.grid = grid
+        self.pixel_scale = pixel_scale
+
+    @property
+    def arguments(self) -> tuple:
+        return ds.array_key_from(array=np.asarray(self.grid)), self.pixel_scale
+
+    def value_from(self, instance) -> float:
+        return pl.Plane(
+            galaxies=self.galaxies_from(instance=instance)
+        ).einstein_radius_from_grid(grid=self.grid, pixel_scale=self.pixel_scale)
+
+    def values_from(self, instances):
+
+        profiles_of_samples = [
+            [
+                profile
+                for galaxy in self.galaxies_from(instance=instance)
+                for profile in galaxy.mass_profiles
+            ]
+            for instance in instances
+        ]
+
+        for profiles in profiles_of_samples:
+
+            if len(profiles) == 0 or len({profile.centre for profile in profiles}) > 1:
+                return None
+
+            if any(getattr(profile, "axis_ratio", None) != 1.0 for profile in profiles):
+                return None
+
+        batch = ProfileBatch.from_profiles(profiles_of_samples=profiles_of_samples)
+
+        if batch is None:
+            return None
+
+        return einstein_radii_from(batch=batch)
+
+
+class EinsteinMass(EinsteinRadius):
+    def __init__(self, grid, pixel_scale=0.05, galaxy_names=None, name="einstein_mass"):
+        """
+        The angular Einstein mass of the galaxies, which is pi times their Einstein radius squared (see
+        `EinsteinRadius`).
+        """
+        super().__init__(
+            grid=grid, pixel_scale=pixel_scale, galaxy_names=galaxy_names, name=name
+        )
+
+    def value_from(self, instance) -> float:
+        return np.pi * super().value_from(instance=instance) ** 2
+
+    def values_from(self, instances):
+
+        einstein_radii = super().values_from(instances=instances)
+
+        if einstein_radii is None:
+            return None
+
+        return np.pi * einstein_radii ** 2
+
+
+class LuminosityWithinCircle(AbstractDerivedQuantity):
+    def __init__(self, radius, galaxy_names=None, name="luminosity_within_circle"):
+        """
+        The total luminosity of the galaxies' light profiles within a circle centred on each profile (see
+        `Galaxy.luminosity_within_circle`), which is computed in closed form for Sersic and Gaussian light profiles.
+
+        Parameters
+        ----------
+        radius : float
+            The radius of the circle.
+        """
+        super().__init__(name=name, galaxy_names=galaxy_names)
+
+        self.radius = radius
+
+    @property
+    def arguments(self) -> tuple:
+        return (self.radius,)
+
+    def value_from(self, instance) -> float:
+        return sum(
+            galaxy.luminosity_within_circle(radius=self.radius)
+            for galaxy in self.galaxies_from(instance=instance)
+            if galaxy.has_light_profile
+        )
+
+    def values_from(self, instances):
+
+        batch = ProfileBatch.from_profiles(
+            profiles_of_samples=[
+                [
+                    profile
+                    for galaxy in self.galaxies_from(instance=instance)
+                    for profile in galaxy.light_profiles
+                ]
+                for instance in instances
+            ]
+        )
+
+        if batch is None:
+            return None
+
+        return batch.values_within_circles_from(radii=self.radius)
+
+
+class DarkFractionAtRadius(AbstractDerivedQuantity):
+    def __init__(self, radius, galaxy_names=None, name="dark_fraction_at_radius"):
+        """
+        The fraction of the galaxies' mass within a circle which is in their dark matter profiles (see
+        `Galaxy.dark_fraction_at_radius`), which is computed in closed form for NFW dark matter and Sersic and
+        Gaussian stellar profiles.
+
+        Parameters
+        ----------
+        radius : float
+            The radius of the circle.
+        """
+        super().__init__(name=name, galaxy_names=galaxy_names)
+
+        self.radius = radius
+
+    @property
+    def arguments(self) -> tuple:
+        return (self.radius,)
+
+    def value_from(self, instance) -> float:
+
+        galaxies = self.galaxies_from(instance=instance)
+
+        stellar_mass = sum(
+            galaxy.stellar_mass_angular_within_circle(radius=self.radius)
+            for galaxy in galaxies
+            if galaxy.has_stellar_profile
+        )
+        dark_mass = sum(
+            galaxy.dark_mass_angular_within_circle(radius=self.radius)
+            for galaxy in galaxies
+            if galaxy.has_dark_profile
+        )
+
+        return dark_mass / (stellar_mass + dark_mass)
+
+    def values_from(self, instances):
+
+        stellar_batch = ProfileBatch.from_profiles(
+            profiles_of_samples=[
+                [
+                    profile
+                    for galaxy in self.galaxies_from(instance=instance)
+                    for profile in galaxy.stellar_profiles
+                ]
+                for instance in instances
+            ]
+        )
+        dark_batch = ProfileBatch.from_profiles(
+            profiles_of_samples=[
+                [
+                    profile
+                    for galaxy in self.galaxies_from(instance=instance)
+                    for profile in galaxy.dark_profiles
+                ]
+                for instance in instances
+            ]
+        )
+
+        if stellar_batch is None or dark_batch is None:
+            return None
+
+        stellar_mass = stellar_batch.values_within_circles_from(radii=self.radius)
+        dark_mass = dark_batch.values_within_circles_from(radii=self.radius)
+
+        return dark_mass / (stellar_mass + dark_mass)
+
+
+class StellarFractionAtRadius(DarkFractionAtRadius):
+    def __init__(self, radius, galaxy_names=None, name="stellar_fraction_at_radius"):
+        """
+        The fraction of the galaxies' mass within a circle which is in their stellar profiles, which is one minus
+        their dark matter fraction (see `DarkFractionAtRadius`).
+        """
+        super().__init__(radius=radius, galaxy_names=galaxy_names, name=name)
+
+    def value_from(self, instance) -> float:
+        return 1.0 - super().value_from(instance=instance)
+
+    def values_from(self, instances):
+
+        dark_fractions = super().values_from(instances=instances)
+
+        if dark_fractions is None:
+            return None
+
+        return 1.0 - dark_fractions
+
+
+class DerivedQuantitySamples:
+    def __init__(self, values, weights):
+        """
+        The values of a derived quantity for the samples of a non-linear search and the weights of those samples,
+        from which the quantity's posterior is summarized.
+
+        Samples whose quantity is NaN (e.g. a model with no Einstein radius) are excluded from the summary
+        statistics.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The quantity of every sample.
+        weights : np.ndarray
+            The weight of every sample.
+        """
+        self.values = np.asarray(values, dtype="float")
+        self.weights = np.asarray(weights, dtype="float")
+
+    @property
+    def _finite(self):
+        finite = np.isfinite(self.values)
+        return self.values[finite], self.weights[finite]
+
+    @property
+    def mean(self) -> float:
+        values, weights = self._finite
+        return float(np.average(values, weights=weights))
+
+    @property
+    def standard_deviation(self) -> float:
+        values, weights = self._finite
+        return float(
+            np.sqrt(
+                np.average(
+                    (values - np.average(values, weights=weights)) ** 2, weights=weights
+                )
+            )
+        )
+
+    @property
+    def median(self) -> float:
+        values, weights = self._finite
+        return float(quantile(x=values, q=0.5, weights=weights)[0])
+
+    def value_at_sigma(self, sigma) -> (float, float):
+        """
+        The lower and upper values of the quantity at an input sigma of its probability density function, using the
+        same convention as `PDFSamples.vector_at_sigma`.
+
+        Parameters
+        ----------
+        sigma : float
+            The sigma within which the PDF is used to estimate errors (e.g. sigma = 1.0 uses 0.6826 of the PDF).
+        """
+        values, weights = self._finite
+
+        limit = math.erf(0.5 * sigma * math.sqrt(2))
+
+        return (
+            float(quantile(x=values, q=1.0 - limit, weights=weights)[0]),
+            float(quantile(x=values, q=limit, weights=weights)[0]),
+        )
+
+
+def sample_indexes_and_weights_from(samples, total_draws=None, seed=1):
+    """
+    Returns the indexes of the samples of a non-linear search the derived quantities are computed for and their
+    weights.
+
+    If `total_draws` is `None` every sample with a positive weight is used with its weight. Otherwise, the samples
+    are drawn with replacement in proportion to their weights, and every sample drawn is used once with its number
+    of draws as its weight, such that a sample drawn many times is only computed once.
+
+    Parameters
+    ----------
+    samples : af.PDFSamples
+        The samples of the non-linear search.
+    total_draws : int or None
+        The number of samples drawn, where `None` uses every sample.
+    seed : int
+        The seed of the random draws.
+    """
+    weights = np.asarray(samples.weights, dtype="float")
+
+    if np.sum(weights) <= 0.0:
+        weights = np.ones(weights.shape[0])
+
+    if total_draws is None:
+        indexes = np.flatnonzero(weights > 0.0)
+        return indexes, weights[indexes]
+
+    draws = np.random.RandomState(seed).choice(
+        weights.shape[0], size=total_draws, p=weights / np.sum(weights)
+    )
+
+    indexes, counts = np.unique(draws, return_counts=True)
+
+    return indexes, counts.astype("float")
+
+
+def _initialize_worker(model, quantities):
+
+    _worker.model = model
+    _worker.quantities = quantities
+
+
+def _values_from_vector(vector):
+
+    instance = _worker.model.instance_from_vector(vector=vector)
+
+    return [quantity.value_from(instance=instance) for quantity in _worker.quantities]
+
+
+def _values_from_vectors(model, quantities, vectors, number_of_processes, start_method):
+
+    if start_method is None:
+        start_method = (
+            "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        )
+
+    with ProcessPoolExecutor(
+        max_workers=number_of_processes,
+        mp_context=multiprocessing.get_context(start_method),
+        initializer=_initialize_worker,
+        initargs=(model, quantities),
+    ) as executor:
+
+        return list(
+            executor.map(
+                _values_from_vector,
+                vectors,
+                chunksize=max(1, len(vectors) // (4 * number_of_processes)),
+            )
+        )
+
+
+def derived_quantities_from_samples(
+    samples,
+    quantities,
+    total_draws=None,
+    seed=1,
+    number_of_processes=None,
+    cache_directory=None,
+    start_method=None,
+) -> {str: DerivedQuantitySamples}:
+    """
+    Returns the posterior of quantities derived from the samples of a non-linear search (e.g. the Einstein radius
+    or luminosity of its galaxies), as a dictionary of `DerivedQuantitySamples` keyed by the quantities' names.
+
+    The quantities are computed for every sample, or for samples drawn in proportion to their weights (see
+    `sample_indexes_and_weights_from`). Quantities with a closed form for the model's profiles are computed for
+    all samples at once (see `AbstractDerivedQuantity.values_from`). The others are computed for each sample from
+    its model instance, using a pool of worker processes if `number_of_processes` is greater than 1.
+
+    If a `cache_directory` is input, the values of every quantity are saved to it, named by the hash of the
+    quantity's key and the parameters of the samples, such that repeated calls load them rather than computing
+    them. The cache is not invalidated if the calculation of a quantity is changed, therefore the cache directory
+    should be removed if it is.
+
+    Parameters
+    ----------
+    samples : af.PDFSamples
+        The samples of the non-linear search, including its model.
+    quantities : [AbstractDerivedQuantity]
+        The quantities which are computed, which must have different names.
+    total_draws : int or None
+        The number of samples drawn in proportion to their weights, where `None` uses every sample.
+    seed : int
+        The seed of the random draws.
+    number_of_processes : int or None
+        The number of worker processes quantities without a closed form are computed with, where `None` or 1
+        computes them serially.
+    cache_directory : str or None
+        The directory the values of the quantities are cached in, where `None` does not cache them.
+    start_method : str or None
+        The multiprocessing start method of the workers, where `None` uses "fork" if available and "spawn"
+        otherwise.
+    """
+    indexes, weights = sample_indexes_and_weights_from(
+        samples=samples, total_draws=total_draws, seed=seed
+    )
+
+    parameters = samples.parameters
+    vectors = [parameters[index] for index in indexes]
+
+    vectors_key = ds.array_key_from(array=np.asarray(vectors, dtype="float"))
+
+    values = {}
+    file_paths = {}
+
+    if cache_directory is not None:
+
+        for quantity in quantities:
+
+            key = hashlib.sha256(f"{quantity.key}{vectors_key}".encode()).hexdigest()
+            file_paths[quantity.name] = path.join(cache_directory, f"{key}.npy")
+
+            if path.exists(file_paths[quantity.name]):
+                values[quantity.name] = np.load(file_paths[quantity.name])
+
+    uncached_quantities = [
+        quantity for quantity in quantities if quantity.name not in values
+    ]
+
+    if uncached_quantities:
+
+        instances = [
+            samples.model.instance_from_vector(vector=vector) for vector in vectors
+        ]
+
+        remaining_quantities = []
+
+        for quantity in uncached_quantities:
+
+            quantity_values = quantity.values_from(instances=instances)
+
+            if quantity_values is None:
+                remaining_quantities.append(quantity)
+            else:
+                values[quantity.name] = quantity_values
+
+        if remaining_quantities:
+
+            if number_of_processes is None or number_of_processes <= 1:
+                remaining_values = [
+                    [
+                        quantity.value_from(instance=instance)
+                        for quantity in remaining_quantities
+                    ]
+                    for instance in instances
+                ]
+            else:
+                remaining_values = _values_from_vectors(
+                    model=samples.model,
+                    quantities=remaining_quantities,
+                    vectors=vectors,
+                    number_of_processes=number_of_processes,
+                    start_method=start_method,
+                )
+
+            remaining_values = np.asarray(remaining_values, dtype="float").reshape(
+                len(vectors), len(remaining_quantities)
+            )
+
+            for index, quantity in enumerate(remaining_quantities):
+                values[quantity.name] = remaining_values[:, index]
+
+        for quantity in uncached_quantities:
+            if quantity.name in file_paths:
+                ds.write_atomically(
+                    file_path=file_paths[quantity.name],
+                    write_func=lambda f, array=values[quantity.name]: np.save(f, array),
+                )
+
+    return {
+        quantity.name: DerivedQuantitySamples(
+            values=values[quantity.name], weights=weights
+        )
+        for quantity in quantities
+    }
+
+
+def derived_quantities_from_agg_obj(
+    agg_obj, quantities, total_draws=None, seed=1, number_of_processes=None
+) -> {str: DerivedQuantitySamples}:
+    """
+    Returns the posterior of quantities derived from the samples of a result (see
+    `derived_quantities_from_samples`), which are cached in the result's `aggregator_cache` folder.
+
+    Parameters
+    ----------
+    agg_obj : af.PhaseOutput
+        A PyAutoFit aggregator's PhaseOutput object containing the generators of the results of PyAutoGalaxy model-fits.
+    quantities : [AbstractDerivedQuantity]
+        The quantities which are computed, which must have different names.
+    """
+    return derived_quantities_from_samples(
+        samples=agg_obj.samples,
+        quantities=quantities,
+        total_draws=total_draws,
+        seed=seed,
+        number_of_processes=number_of_processes,
+        cache_directory=path.join(
+            agg_obj.directory, "aggregator_cache", "derived_quantities"
+        ),
+    )
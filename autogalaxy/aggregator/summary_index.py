@@ -0,0 +1,304 @@
+import numbers
+import os
+import sqlite3
+from os import path
+
+import autofit as af
+from autofit.aggregator.aggregator import AbstractAggregator
+from autogalaxy.galaxy import galaxy as g
+from autogalaxy.profiles import light_profiles as lp
+from autogalaxy.profiles import mass_profiles as mp
+
+metadata_columns = ["name", "tag", "pipeline", "dataset_name", "non_linear_search"]
+
+
+def galaxy_items_from_instance(instance) -> [(str, g.Galaxy)]:
+    """
+    Returns a list of the (name, galaxy) tuples of the galaxies of a model instance, where the name is the galaxy's
+    attribute name in `instance.galaxies` (e.g. "lens") or its index if the galaxies are a list.
+
+    Parameters
+    ----------
+    instance : af.ModelInstance
+        The instance whose galaxies are returned.
+    """
+    galaxies = getattr(instance, "galaxies", None)
+
+    if galaxies is None:
+        return []
+
+    if isinstance(galaxies, (list, tuple)):
+        return [(str(index), galaxy) for index, galaxy in enumerate(galaxies)]
+
+    return [
+        (name, galaxy)
+        for name, galaxy in vars(galaxies).items()
+        if isinstance(galaxy, g.Galaxy)
+    ]
+
+
+def parameters_from_instance(instance) -> dict:
+    """
+    Returns a dictionary of the parameters of every galaxy in a model instance, e.g. the maximum log likelihood
+    instance of a result, keyed by their path (e.g. "galaxies.lens.light.intensity").
+
+    Every numerical attribute of a profile is included, which includes attributes derived from its parameters (e.g.
+    the axis_ratio of an elliptical profile). Tuple parameters are split into one entry per element (e.g.
+    "galaxies.lens.light.centre_0").
+
+    Parameters
+    ----------
+    instance : af.ModelInstance
+        The instance whose galaxies' parameters are returned.
+    """
+    parameters = {}
+
+    def add(name, value):
+
+        if isinstance(value, bool):
+            return
+        if isinstance(value, numbers.Real):
+            parameters[name] = float(value)
+        elif isinstance(value, tuple):
+            for index, element in enumerate(value):
+                add(name=f"{name}_{index}", value=element)
+
+    for galaxy_name, galaxy in galaxy_items_from_instance(instance=instance):
+
+        add(name=f"galaxies.{galaxy_name}.redshift", value=galaxy.redshift)
+
+        for profile_name, profile in vars(galaxy).items():
+
+            if isinstance(profile, (lp.LightProfile, mp.MassProfile)):
+                for name, value in vars(profile).items():
+                    if not name.startswith("_"):
+                        add(
+                            name=f"galaxies.{galaxy_name}.{profile_name}.{name}",
+                            value=value,
+                        )
+
+    return parameters
+
+
+class SummaryIndex:
+    def __init__(self, file_path):
+        """
+        An SQLite index of the results in an output folder, which stores one row per result with its directory,
+        metadata, phase tag, maximum log likelihood, log evidence, the parameters of its maximum log likelihood
+        model and any derived quantities (e.g. Einstein radii) requested when it is updated.
+
+        Every result's samples are unpickled once, when the index is first updated after the result is output.
+        Population studies then query and filter the results using the index, and can create an aggregator of only
+        the selected results (see `aggregator`), without unpickling anything.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the SQLite database file, which is created if it does not exist.
+        """
+        self.file_path = file_path
+        self.connection = sqlite3.connect(file_path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+
+        columns = ", ".join(f"{column} TEXT" for column in metadata_columns)
+
+        self.connection.executescript(
+            f"""
+            CREATE TABLE IF NOT EXISTS results (
+                id INTEGER PRIMARY KEY,
+                directory TEXT UNIQUE,
+                {columns},
+                phase_tag TEXT,
+                log_likelihood REAL,
+                log_evidence REAL,
+                modified REAL
+            );
+            CREATE TABLE IF NOT EXISTS result_values (
+                result_id INTEGER REFERENCES results(id) ON DELETE CASCADE,
+                name TEXT,
+                kind TEXT,
+                value REAL,
+                PRIMARY KEY (result_id, name)
+            );
+            CREATE INDEX IF NOT EXISTS result_values_name ON result_values (name, value);
+            """
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+    def update(self, directory, derived_quantities=None) -> int:
+        """
+        Add every result in an output folder which is not in the index, or whose samples have changed since it
+        was indexed, and return the number of results added.
+
+        Parameters
+        ----------
+        directory : str
+            The output folder which is searched for results, in the same way as an `af.Aggregator`.
+        derived_quantities : {str: func} or None
+            Functions which take an aggregator's *PhaseOutput* object and return a float (e.g. the Einstein radius
+            of its maximum log likelihood plane), whose values are stored under their key.
+        """
+        derived_quantities = derived_quantities or {}
+
+        indexed = dict(
+            self.connection.execute("SELECT directory, modified FROM results")
+        )
+
+        total_added = 0
+
+        for agg_obj in af.Aggregator(directory=directory).phases:
+
+            samples_path = path.join(agg_obj.pickle_path, "samples.pickle")
+
+            if not path.exists(samples_path):
+                continue
+
+            modified = os.path.getmtime(samples_path)
+
+            if indexed.get(agg_obj.directory) == modified:
+                continue
+
+            self.add(
+                agg_obj=agg_obj,
+                modified=modified,
+                derived_quantities=derived_quantities,
+            )
+
+            total_added += 1
+
+        self.connection.commit()
+
+        return total_added
+
+    def add(self, agg_obj, modified=None, derived_quantities=None):
+        """
+        Add a result to the index, replacing its row if it is already indexed.
+
+        Parameters
+        ----------
+        agg_obj : af.PhaseOutput
+            A PyAutoFit aggregator's PhaseOutput object containing the generators of the results of PyAutoGalaxy
+            model-fits.
+        modified : float or None
+            The modification time of the result's samples, which `update` uses to re-index changed results.
+        derived_quantities : {str: func} or None
+            Functions which take the *PhaseOutput* object and return a float, whose values are stored under their
+            key.
+        """
+        samples = agg_obj.samples
+        settings = agg_obj.settings
+
+        self.connection.execute(
+            "DELETE FROM results WHERE directory = ?", (agg_obj.directory,)
+        )
+
+        row = {
+            "directory": agg_obj.directory,
+            **{column: getattr(agg_obj, column) for column in metadata_columns},
+            "phase_tag": getattr(settings, "phase_tag_with_inversion", None),
+            "log_likelihood": float(max(samples.log_likelihoods)),
+            "log_evidence": getattr(samples, "log_evidence", None),
+            "modified": modified,
+        }
+
+        result_id = self.connection.execute(
+            f"INSERT INTO results ({', '.join(row)}) VALUES ({', '.join('?' * len(row))})",
+            tuple(row.values()),
+        ).lastrowid
+
+        values = [
+            (result_id, name, "parameter", value)
+            for name, value in parameters_from_instance(
+                instance=samples.max_log_likelihood_instance
+            ).items()
+        ]
+
+        values += [
+            (result_id, name, "derived", float(func(agg_obj)))
+            for name, func in (derived_quantities or {}).items()
+        ]
+
+        self.connection.executemany(
+            "INSERT INTO result_values VALUES (?, ?, ?, ?)", values
+        )
+
+    @property
+    def value_names(self) -> [str]:
+        """
+        The names of every parameter and derived quantity in the index.
+        """
+        return [
+            name
+            for (name,) in self.connection.execute(
+                "SELECT DISTINCT name FROM result_values ORDER BY name"
+            )
+        ]
+
+    def rows(self, names=(), where=None, parameters=()) -> [dict]:
+        """
+        Returns a list of dictionaries of every indexed result, with the columns of the results table and the input
+        parameters and derived quantities as columns (which are `None` for results which do not have them).
+
+        Parameters
+        ----------
+        names : [str]
+            The names of the parameters and derived quantities included as columns.
+        where : str or None
+            An SQL condition the results are filtered by, which can refer to the columns of the results table and
+            the input names (in double quotes), e.g. '"galaxies.lens.mass.einstein_radius" > 1.0'.
+        parameters : tuple
+            The values of any ? placeholders in `where`.
+        """
+        joins = "".join(
+            f" LEFT JOIN result_values AS v{index} ON v{index}.result_id = results.id AND v{index}.name = ?"
+            for index in range(len(names))
+        )
+
+        columns = "".join(
+            f', v{index}.value AS "{name}"' for index, name in enumerate(names)
+        )
+
+        query = f"SELECT * FROM (SELECT results.*{columns} FROM results{joins})"
+
+        if where is not None:
+            query += f" WHERE {where}"
+
+        cursor = self.connection.execute(query + " ORDER BY id", (*names, *parameters))
+
+        column_names = [description[0] for description in cursor.description]
+
+        return [dict(zip(column_names, row)) for row in cursor]
+
+    def directories(self, names=(), where=None, parameters=()) -> [str]:
+        """
+        Returns the directories of the results which satisfy an SQL condition (see `rows`).
+        """
+        return [
+            row["directory"]
+            for row in self.rows(names=names, where=where, parameters=parameters)
+        ]
+
+    def aggregator(self, names=(), where=None, parameters=()) -> AbstractAggregator:
+        """
+        Returns an aggregator of the results which satisfy an SQL condition (see `rows`), which can be passed to the
+        generators of `autogalaxy.aggregator` (e.g. `ag.agg.Plane`) without the other results being loaded.
+        """
+        return AbstractAggregator(
+            phases=[
+                af.PhaseOutput(directory=directory)
+                for directory in self.directories(
+                    names=names, where=where, parameters=parameters
+                )
+            ]
+        )
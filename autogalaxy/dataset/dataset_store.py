@@ -0,0 +1,295 @@
+import hashlib
+import io
+import json
+import os
+import pickle
+import tempfile
+from os import path
+
+import dill
+import numpy as np
+
+
+def array_key_from(array) -> str:
+    """
+    Returns the content address of an ndarray, which is the SHA-256 hash of its dtype, shape and values, such that two
+    arrays have the same key if and only if they are identical.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        The array whose key is computed.
+    """
+    sha = hashlib.sha256()
+    sha.update(f"{array.dtype.str}{array.shape}".encode())
+    sha.update(np.ascontiguousarray(array).data)
+    return sha.hexdigest()
+
+
+def write_atomically(file_path, write_func):
+    """
+    Write a file by writing to a temporary file in the same directory which is then renamed, such that phases which
+    save the same file to the store at the same time never read or leave a partially written file.
+    """
+    if path.exists(file_path):
+        return
+
+    os.makedirs(path.dirname(file_path), exist_ok=True)
+
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=path.dirname(file_path))
+
+    try:
+        with os.fdopen(file_descriptor, "wb") as f:
+            write_func(f)
+        os.replace(temporary_path, file_path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+
+class StorePickler(dill.Pickler):
+    def __init__(self, file, store):
+        """
+        Pickles an object such that its ndarrays are not written to the pickle, but are instead saved to a
+        `DatasetStore` as .npy files and referenced in the pickle by their content address (see `array_key_from`).
+
+        Parameters
+        ----------
+        file
+            The file-like object the pickle is written to.
+        store : DatasetStore
+            The store the ndarrays are saved to.
+        """
+        super().__init__(file, protocol=dill.HIGHEST_PROTOCOL)
+
+        self.store = store
+        self.keys = {}
+
+    def persistent_id(self, obj):
+
+        if (
+            not isinstance(obj, np.ndarray)
+            or obj.dtype.hasobject
+            or obj.nbytes < self.store.minimum_stored_bytes
+        ):
+            return None
+
+        if id(obj) not in self.keys:
+            self.keys[id(obj)] = self.store.save_array(array=obj)
+
+        return (
+            "stored_array",
+            self.keys[id(obj)],
+            type(obj),
+            getattr(obj, "__dict__", {}),
+        )
+
+
+class StoreUnpickler(dill.Unpickler):
+    def __init__(self, file, store, mmap_mode="r"):
+        """
+        Unpickles an object pickled by a `StorePickler`, where every ndarray saved to the store is loaded from its
+        .npy file using `np.load`, memory-mapped by default.
+
+        Parameters
+        ----------
+        file
+            The file-like object the pickle is read from.
+        store : DatasetStore
+            The store the ndarrays are loaded from.
+        mmap_mode : str or None
+            The `mmap_mode` of `np.load`, where "r" maps the arrays read-only and `None` loads them into memory.
+        """
+        super().__init__(file)
+
+        self.store = store
+        self.mmap_mode = mmap_mode
+        self.arrays = {}
+
+    def persistent_load(self, pid):
+
+        _, key, cls, attributes = pid
+
+        if key not in self.arrays:
+
+            array = np.load(
+                self.store.array_path_from(key=key), mmap_mode=self.mmap_mode
+            )
+            array = array.view(cls)
+
+            if cls is not np.ndarray:
+                array.__dict__.update(attributes)
+
+            self.arrays[key] = array
+
+        return self.arrays[key]
+
+
+class DatasetStore:
+    def __init__(self, directory, minimum_stored_bytes=1024):
+        """
+        A content-addressed store of the datasets and masks fitted by phases, which is shared by every phase whose
+        output is in the same output folder.
+
+        An object (e.g. an `Imaging`, `Interferometer` or `Mask2D`) is saved as a small pickle of everything but its
+        ndarrays, which are saved as .npy files named by the hash of their contents (see `StorePickler`). The pickle
+        is itself named by the hash of its contents. A phase saves only a JSON reference to the object (see
+        `save_reference`), such that a dataset fitted by many phases is stored once, and the aggregator loads its
+        arrays memory-mapped.
+
+        Parameters
+        ----------
+        directory : str
+            The directory of the store, containing an `arrays` and `objects` folder.
+        minimum_stored_bytes : int
+            Arrays smaller than this number of bytes are pickled with the object rather than saved as .npy files.
+        """
+        self.directory = directory
+        self.minimum_stored_bytes = minimum_stored_bytes
+
+    def array_path_from(self, key) -> str:
+        return path.join(self.directory, "arrays", f"{key}.npy")
+
+    def object_path_from(self, key) -> str:
+        return path.join(self.directory, "objects", f"{key}.pickle")
+
+    def save_array(self, array) -> str:
+        """
+        Save an ndarray to the store as a .npy file, unless an identical array is already stored, and return its key.
+        """
+        key = array_key_from(array=array)
+
+        write_atomically(
+            file_path=self.array_path_from(key=key),
+            write_func=lambda f: np.save(f, np.asarray(array), allow_pickle=False),
+        )
+
+        return key
+
+    def save(self, obj) -> str:
+        """
+        Save an object to the store, unless an identical object is already stored, and return its key.
+        """
+        file = io.BytesIO()
+
+        StorePickler(file=file, store=self).dump(obj)
+
+        obj_bytes = file.getvalue()
+        key = hashlib.sha256(obj_bytes).hexdigest()
+
+        write_atomically(
+            file_path=self.object_path_from(key=key),
+            write_func=lambda f: f.write(obj_bytes),
+        )
+
+        return key
+
+    def load(self, key, mmap_mode="r"):
+        """
+        Load an object from the store by its key, where its ndarrays are memory-mapped if `mmap_mode` is not `None`.
+        """
+        with open(self.object_path_from(key=key), "rb") as f:
+            return StoreUnpickler(file=f, store=self, mmap_mode=mmap_mode).load()
+
+    def save_reference(self, obj, file_path):
+        """
+        Save an object to the store and write a JSON reference to it at the input file path.
+
+        The reference gives the path of the store relative to the reference, such that an output folder can be moved
+        or copied without breaking the references of its phases.
+
+        A pickle of a `StoreReference` is also written next to the JSON reference (e.g. "pickles/dataset.pickle"),
+        which loads the object from the store when unpickled, such that code which unpickles the object directly
+        continues to work. This pickle contains the absolute path of the store and therefore cannot be loaded once
+        the output folder is moved, in which case the JSON reference must be used (see `load_from_reference`).
+
+        Parameters
+        ----------
+        obj
+            The object which is saved to the store.
+        file_path : str
+            The path of the JSON reference, e.g. "pickles/dataset.json" in the output of a phase.
+        """
+        key = self.save(obj=obj)
+
+        reference = {
+            "key": key,
+            "type": type(obj).__name__,
+            "store": path.relpath(self.directory, path.dirname(file_path)),
+        }
+
+        with open(file_path, "w") as f:
+            json.dump(reference, f, indent=4)
+
+        with open(f"{path.splitext(file_path)[0]}.pickle", "wb") as f:
+            pickle.dump(
+                StoreReference(directory=path.abspath(self.directory), key=key), f
+            )
+
+
+def load_from_store(directory, key, mmap_mode="r"):
+    """
+    Load an object from the store in a directory by its key, which is the function the pickle of a `StoreReference`
+    is unpickled with.
+
+    The pickle of a `StoreReference` contains the absolute path of the store, therefore a `FileNotFoundError`
+    explaining how to load the object via its JSON reference is raised if the store is not at this path (e.g. because
+    the output folder was moved).
+    """
+    store = DatasetStore(directory=directory)
+
+    if not path.exists(store.object_path_from(key=key)):
+        raise FileNotFoundError(
+            f"The object {key} is not in the dataset store at {directory}, which is the absolute path of the store "
+            f"when the pickle was written. If the output folder was moved, load the dataset and mask of the phase via "
+            f"their JSON references using ag.agg.dataset_from_agg_obj and ag.agg.mask_from_agg_obj (or "
+            f"autogalaxy.dataset.dataset_store.load_from_reference) instead of agg_obj.dataset and agg_obj.mask."
+        )
+
+    return store.load(key=key, mmap_mode=mmap_mode)
+
+
+class StoreReference:
+    def __init__(self, directory, key):
+        """
+        A reference to an object in a `DatasetStore`, which is pickled in place of the object such that unpickling it
+        loads the object from the store (see `load_from_store`).
+
+        This is written to the dataset.pickle and mask.pickle files of a phase, such that the aggregator's
+        `agg_obj.dataset` and `agg_obj.mask` (which unpickle these files) continue to return the dataset and mask.
+        The pickle contains the absolute path of the store, therefore if an output folder is moved the JSON
+        reference, which is relative, must be used instead (see `load_from_reference`).
+
+        Parameters
+        ----------
+        directory : str
+            The directory of the store.
+        key : str
+            The key of the object in the store.
+        """
+        self.directory = directory
+        self.key = key
+
+    def __reduce__(self):
+        return load_from_store, (self.directory, self.key)
+
+
+def load_from_reference(file_path, mmap_mode="r"):
+    """
+    Load the object a JSON reference written by `DatasetStore.save_reference` refers to.
+
+    Parameters
+    ----------
+    file_path : str
+        The path of the JSON reference.
+    mmap_mode : str or None
+        The `mmap_mode` of `np.load`, where "r" maps the arrays read-only and `None` loads them into memory.
+    """
+    with open(file_path) as f:
+        reference = json.load(f)
+
+    store = DatasetStore(
+        directory=path.normpath(path.join(path.dirname(file_path), reference["store"]))
+    )
+
+    return store.load(key=reference["key"], mmap_mode=mmap_mode)
@@ -0,0 +1,384 @@
+import numpy as np
+
+from autoarray.structures import arrays
+from autoarray.structures import grids
+from autoarray.util import grid_util
+
+
+def sub_steps_from_none(sub_steps):
+
+    if sub_steps is None:
+        return [2, 4, 8, 16]
+    return sub_steps
+
+
+def grid_at_sub_size_from(grid_1d, pixel_scales, pixel_indexes, sub_size) -> np.ndarray:
+    """
+    Returns the (y,x) sub-grid coordinates of the input pixels of a grid at an input sub-size, as an ndarray of shape
+    [total_pixels*sub_size**2, 2] where the sub-pixels of every pixel are contiguous.
+
+    Parameters
+    ----------
+    grid_1d : np.ndarray
+        The (y,x) coordinates of the centre of every unmasked pixel.
+    pixel_scales : (float, float)
+        The (y,x) arc-second dimensions of every pixel.
+    pixel_indexes : np.ndarray
+        The 1D indexes of the unmasked pixels whose sub-grid is computed.
+    sub_size : int
+        The size (sub_size x sub_size) of the sub-grid of every pixel.
+    """
+    steps = (np.arange(sub_size) + 0.5) / sub_size - 0.5
+
+    offsets = np.stack(
+        np.meshgrid(-steps * pixel_scales[0], steps * pixel_scales[1], indexing="ij"),
+        axis=-1,
+    ).reshape(-1, 2)
+
+    centres = grid_1d[pixel_indexes]
+
+    return (centres[:, None, :] + offsets[None, :, :]).reshape(-1, 2)
+
+
+class GridAdaptive(grids.Grid):
+    def __new__(
+        cls,
+        grid,
+        mask,
+        fractional_accuracy=0.9999,
+        sub_steps=None,
+        centre_radius=None,
+        store_in_1d=True,
+        *args,
+        **kwargs,
+    ):
+        """
+        Represents a grid of coordinates as described for the `Grid` class, where every coordinate is the centre of
+        an unmasked pixel, but which adapts the sub-grid resolution used in each pixel when the image of a `Galaxy` or
+        `Plane` is computed from it (see `Galaxy.binned_image_from_grid` and `Plane.binned_image_from_grid`).
+
+        The sub-size of each pixel is chosen as follows:
+
+        - Pixels within `centre_radius` of a light profile centre, where steep profiles (e.g. Sersic bulges with
+          n ~ 4) or point-like components are poorly sampled by any low resolution sub-grid, are evaluated at the
+          highest sub-size in `sub_steps`.
+
+        - For all other pixels the image is first evaluated at the pixel centres. The error of the pixel centre value
+          relative to the pixel's mean is estimated from the local curvature of the image (its discrete Laplacian)
+          and pixels where this error meets the fractional accuracy are not sub-gridded at all.
+
+        - The remaining pixels are refined in a quadtree style, where every sub-pixel of a pixel is split into four
+          (for the default `sub_steps` of [2, 4, 8, 16]) until the binned value of the pixel changes by less than
+          the fractional accuracy or the highest sub-size is reached.
+
+        Compared to a `GridIterate`, which iterates every pixel starting from a sub-size of 2, the majority of
+        pixels in the outskirts of a galaxy are therefore evaluated once, whereas its centre is evaluated at the
+        highest resolution without the intermediate iterations.
+
+        If a `GridAdaptive` is passed directly to a light or mass profile it behaves as a `Grid` with a sub-size of 1.
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y,x) coordinates of the centre of every unmasked pixel.
+        mask : msk.Mask2D
+            The 2D mask associated with the grid, which must have a sub-size of 1.
+        fractional_accuracy : float
+            The fractional accuracy the binned value of every pixel must meet, where this accuracy is the ratio of the
+            value at a higher sub-size to the value computed using the previous sub-size.
+        sub_steps : [int] or None
+            The sub-size values used to iteratively refine unconverged pixels. If None, they are setup as the default
+            values [2, 4, 8, 16].
+        centre_radius : float or None
+            Pixels whose centre is within this distance (in scaled units) of a light profile centre are evaluated at
+            the highest sub-size. If None, the diagonal of one pixel is used.
+        store_in_1d : bool
+            If True, the grid is stored in 1D as an ndarray of shape [total_unmasked_pixels, 2]. If False, it is
+            stored in 2D as an ndarray of shape [total_y_pixels, total_x_pixels, 2].
+        """
+        obj = super().__new__(cls, grid=grid, mask=mask, store_in_1d=store_in_1d)
+        obj.fractional_accuracy = fractional_accuracy
+        obj.sub_steps = sub_steps_from_none(sub_steps=sub_steps)
+        obj.centre_radius = centre_radius
+        return obj
+
+    def __array_finalize__(self, obj):
+
+        super(GridAdaptive, self).__array_finalize__(obj)
+
+        if hasattr(obj, "fractional_accuracy"):
+            self.fractional_accuracy = obj.fractional_accuracy
+
+        if hasattr(obj, "sub_steps"):
+            self.sub_steps = obj.sub_steps
+
+        if hasattr(obj, "centre_radius"):
+            self.centre_radius = obj.centre_radius
+
+    def _new_structure(self, grid, mask, store_in_1d):
+        """
+        Conveninence method for creating a new instance of the GridAdaptive class from this grid, such that the in_1d
+        and in_2d methods return instances of the GridAdaptive.
+        """
+        return GridAdaptive(
+            grid=grid,
+            mask=mask,
+            fractional_accuracy=self.fractional_accuracy,
+            sub_steps=self.sub_steps,
+            centre_radius=self.centre_radius,
+            store_in_1d=store_in_1d,
+        )
+
+    @classmethod
+    def from_mask(
+        cls,
+        mask,
+        fractional_accuracy=0.9999,
+        sub_steps=None,
+        centre_radius=None,
+        store_in_1d=True,
+    ):
+        """
+        Create a GridAdaptive (see *GridAdaptive.__new__*) from a mask, where only unmasked pixels are included in
+        the grid (if the grid is represented in 2D masked values are (0.0, 0.0)).
+
+        The sub-size of the mask is ignored, as the grid's coordinates are the centre of every unmasked pixel.
+
+        Parameters
+        ----------
+        mask : Mask2D
+            The mask whose unmasked pixels are used to setup the grid.
+        fractional_accuracy : float
+            The fractional accuracy the binned value of every pixel must meet.
+        sub_steps : [int] or None
+            The sub-size values used to iteratively refine unconverged pixels.
+        centre_radius : float or None
+            Pixels within this distance of a light profile centre are evaluated at the highest sub-size.
+        store_in_1d : bool
+            If True, the grid is stored in 1D as an ndarray of shape [total_unmasked_pixels, 2]. If False, it is
+            stored in 2D as an ndarray of shape [total_y_pixels, total_x_pixels, 2].
+        """
+        mask = mask.mask_sub_1
+
+        grid_1d = grid_util.grid_1d_via_mask_from(
+            mask=mask, pixel_scales=mask.pixel_scales, sub_size=1, origin=mask.origin
+        )
+
+        if not store_in_1d:
+            grid_1d = grid_util.sub_grid_2d_from(
+                sub_grid_1d=grid_1d, mask=mask, sub_size=1
+            )
+
+        return GridAdaptive(
+            grid=grid_1d,
+            mask=mask,
+            fractional_accuracy=fractional_accuracy,
+            sub_steps=sub_steps,
+            centre_radius=centre_radius,
+            store_in_1d=store_in_1d,
+        )
+
+    def blurring_grid_from_kernel_shape(self, kernel_shape_2d):
+        """
+        Returns the blurring grid from a grid and create it as a GridAdaptive, via an input 2D kernel shape.
+
+        For a full description of blurring grids, checkout *blurring_grid_from_mask_and_kernel_shape*.
+
+        Parameters
+        ----------
+        kernel_shape_2d : (float, float)
+            The 2D shape of the kernel which convolves signal from masked pixels to unmasked pixels.
+        """
+        blurring_mask = self.mask.regions.blurring_mask_from_kernel_shape(
+            kernel_shape_2d=kernel_shape_2d
+        )
+
+        return GridAdaptive.from_mask(
+            mask=blurring_mask,
+            fractional_accuracy=self.fractional_accuracy,
+            sub_steps=self.sub_steps,
+            centre_radius=self.centre_radius,
+            store_in_1d=self.store_in_1d,
+        )
+
+    def grid_at_sub_size_from(self, pixel_indexes, sub_size) -> np.ndarray:
+        """
+        Returns the (y,x) sub-grid coordinates of the input pixels at an input sub-size, as an ndarray of shape
+        [total_pixels*sub_size**2, 2] where the sub-pixels of every pixel are contiguous.
+
+        Parameters
+        ----------
+        pixel_indexes : np.ndarray
+            The 1D indexes of the unmasked pixels whose sub-grid is computed.
+        sub_size : int
+            The size (sub_size x sub_size) of the sub-grid of every pixel.
+        """
+        return grid_at_sub_size_from(
+            grid_1d=np.asarray(self.in_1d),
+            pixel_scales=self.mask.pixel_scales,
+            pixel_indexes=pixel_indexes,
+            sub_size=sub_size,
+        )
+
+    def binned_values_at_sub_size_from_func(self, func, pixel_indexes, sub_size):
+        """
+        Returns the values of a function evaluated on the sub-grid of the input pixels and binned up to each pixel.
+
+        Parameters
+        ----------
+        func : func
+            A function which takes an ndarray of (y,x) coordinates and returns an ndarray of a value at each.
+        pixel_indexes : np.ndarray
+            The 1D indexes of the unmasked pixels the function is evaluated in.
+        sub_size : int
+            The size (sub_size x sub_size) of the sub-grid of every pixel.
+        """
+        values = func(
+            self.grid_at_sub_size_from(pixel_indexes=pixel_indexes, sub_size=sub_size)
+        )
+
+        return np.asarray(values).reshape(-1, sub_size ** 2).mean(axis=1)
+
+    def centre_pixels_from(self, light_profile_centres) -> np.ndarray:
+        """
+        Returns a boolean array which is `True` for every pixel whose centre is within the `centre_radius` of any of
+        the input light profile centres.
+
+        Parameters
+        ----------
+        light_profile_centres : GridIrregularGrouped or [(float, float)] or None
+            The (y,x) centres of the light profiles the image is computed from.
+        """
+        grid_1d = np.asarray(self.in_1d)
+
+        centre_pixels = np.full(shape=grid_1d.shape[0], fill_value=False)
+
+        if light_profile_centres is None or len(light_profile_centres) == 0:
+            return centre_pixels
+
+        centre_radius = self.centre_radius
+
+        if centre_radius is None:
+            centre_radius = np.sqrt(np.sum(np.square(self.mask.pixel_scales)))
+
+        for centre in np.asarray(light_profile_centres).reshape(-1, 2):
+
+            distances = np.sqrt(np.sum(np.square(grid_1d - centre), axis=1))
+
+            centre_pixels[distances <= centre_radius] = True
+
+        return centre_pixels
+
+    def smooth_pixels_from(self, values) -> np.ndarray:
+        """
+        Returns a boolean array which is `True` for every pixel where the value evaluated at the pixel centre is
+        within the fractional accuracy of the pixel's mean value, estimated from the local curvature of the values.
+
+        For a function sampled at the centre of a pixel, the mean over the pixel differs from the centre value by
+        (d2f/dy2 + d2f/dx2) / 24 to second order (in units of pixels), which is computed via the discrete Laplacian
+        of the values of every pixel and its four neighbours. Pixels with a masked neighbour are not smooth.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The values of the function at the centre of every unmasked pixel.
+        """
+        mask = np.asarray(self.mask)
+
+        pixel_indexes_2d = np.argwhere(~mask)
+
+        values_2d = np.zeros(shape=mask.shape)
+        values_2d[pixel_indexes_2d[:, 0], pixel_indexes_2d[:, 1]] = values
+
+        values_2d = np.pad(values_2d, pad_width=1)
+        unmasked_2d = np.pad(~mask, pad_width=1, constant_values=False)
+
+        y = pixel_indexes_2d[:, 0] + 1
+        x = pixel_indexes_2d[:, 1] + 1
+
+        has_neighbours = (
+            unmasked_2d[y - 1, x]
+            & unmasked_2d[y + 1, x]
+            & unmasked_2d[y, x - 1]
+            & unmasked_2d[y, x + 1]
+        )
+
+        laplacian = (
+            values_2d[y - 1, x]
+            + values_2d[y + 1, x]
+            + values_2d[y, x - 1]
+            + values_2d[y, x + 1]
+            - 4.0 * values_2d[y, x]
+        )
+
+        return has_neighbours & (
+            np.abs(laplacian) / 24.0
+            <= (1.0 - self.fractional_accuracy) * np.abs(values)
+        )
+
+    def converged_pixels_from(self, values_lower_sub, values_higher_sub) -> np.ndarray:
+        """
+        Returns a boolean array which is `True` for every pixel where the ratio of the values computed at a lower and
+        higher sub-size meets the fractional accuracy (see `GridIterate.fractional_mask_from_arrays`).
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.abs(values_lower_sub / values_higher_sub)
+
+        ratio = np.where(ratio > 1.0, 1.0 / ratio, ratio)
+
+        return (values_lower_sub == values_higher_sub) | (
+            ratio >= self.fractional_accuracy
+        )
+
+    def binned_array_from_func(self, func, light_profile_centres=None):
+        """
+        Returns the values of a function evaluated on the grid, where the sub-size used to evaluate each pixel is
+        adapted to the light profile centres and local curvature of the function (see *GridAdaptive.__new__*).
+
+        Parameters
+        ----------
+        func : func
+            A function which takes an ndarray of (y,x) coordinates and returns an ndarray of a value at each, for
+            example a lambda function wrapping `Galaxy.image_from_grid`.
+        light_profile_centres : GridIrregularGrouped or [(float, float)] or None
+            The (y,x) centres of the light profiles the function evaluates, whose pixels are evaluated at the highest
+            sub-size.
+        """
+        values = np.asarray(func(np.asarray(self.in_1d)), dtype="float").copy()
+
+        centre_pixels = self.centre_pixels_from(
+            light_profile_centres=light_profile_centres
+        )
+
+        smooth_pixels = self.smooth_pixels_from(values=values)
+
+        if np.any(centre_pixels):
+
+            values[centre_pixels] = self.binned_values_at_sub_size_from_func(
+                func=func,
+                pixel_indexes=np.where(centre_pixels)[0],
+                sub_size=max(self.sub_steps),
+            )
+
+        unconverged = ~(centre_pixels | smooth_pixels)
+
+        for sub_size in self.sub_steps:
+
+            pixel_indexes = np.where(unconverged)[0]
+
+            if len(pixel_indexes) == 0:
+                break
+
+            values_higher_sub = self.binned_values_at_sub_size_from_func(
+                func=func, pixel_indexes=pixel_indexes, sub_size=sub_size
+            )
+
+            converged = self.converged_pixels_from(
+                values_lower_sub=values[pixel_indexes],
+                values_higher_sub=values_higher_sub,
+            )
+
+            values[pixel_indexes] = values_higher_sub
+            unconverged[pixel_indexes[converged]] = False
+
+        return arrays.Array(array=values, mask=self.mask, store_in_1d=True)
@@ -1,10 +1,15 @@
 import copy
 
 import numpy as np
+from autoconf import conf
 from autoarray.structures import arrays
 from autoarray.structures import grids
 from autoarray.structures import kernel
 from autoarray.dataset import imaging
+from autogalaxy import exc
+from autogalaxy.dataset import grid_adaptive
+from autogalaxy.dataset import psf_gaussians as psf_g
+from autogalaxy.dataset import super_pixels as sp
 from autogalaxy.plane import plane as pl
 
 
@@ -21,6 +26,9 @@ class SettingsMaskedImaging(imaging.SettingsMaskedImaging):
         signal_to_noise_limit=None,
         psf_shape_2d=None,
         renormalize_psf=True,
+        psf_total_gaussians=None,
+        super_pixel_signal_to_noise=None,
+        super_pixel_max_size=8,
     ):
         """
         The lens dataset is the collection of data_type (image, noise-map, PSF), a mask, grid, convolver \
@@ -33,27 +41,52 @@ class SettingsMaskedImaging(imaging.SettingsMaskedImaging):
         ----------
         grid_class : ag.Grid
             The type of grid used to create the image from the `Galaxy` and `Plane`. The options are `Grid`,
-            `GridIterate` and `GridInterpolate` (see the `Grid` documentation for a description of these options).
+            `GridIterate`, `GridInterpolate` and `GridAdaptive` (see the `Grid` and `GridAdaptive` documentation for
+            a description of these options).
         grid_inversion_class : ag.Grid
             The type of grid used to create the grid that maps the `Inversion` source pixels to the data's image-pixels.
             The options are `Grid`, `GridIterate` and `GridInterpolate` (see the `Grid` documentation for a
-            description of these options).
+            description of these options). A `GridAdaptive` cannot be used, as its adaptive sub-gridding is only
+            performed when an image is computed from it.
         sub_size : int
             If the grid and / or grid_inversion use a `Grid`, this sets the sub-size used by the `Grid`.
         fractional_accuracy : float
-            If the grid and / or grid_inversion use a `GridIterate`, this sets the fractional accuracy it
-            uses when evaluating functions.
+            If the grid and / or grid_inversion use a `GridIterate` (or the grid a `GridAdaptive`), this sets the
+            fractional accuracy it uses when evaluating functions.
         sub_steps : [int]
-            If the grid and / or grid_inversion use a `GridIterate`, this sets the steps the sub-size is increased by
-            to meet the fractional accuracy when evaluating functions.
+            If the grid and / or grid_inversion use a `GridIterate` (or the grid a `GridAdaptive`), this sets the
+            steps the sub-size is increased by to meet the fractional accuracy when evaluating functions.
         pixel_scales_interp : float or (float, float)
             If the grid and / or grid_inversion use a `GridInterpolate`, this sets the resolution of the interpolation
             grid.
         signal_to_noise_limit : float
             If input, the dataset's noise-map is rescaled such that no pixel has a signal-to-noise above the
             signa to noise limit.
+        psf_total_gaussians : int or None
+            If input, the PSF is fitted with this many circular Gaussians (see `PSFGaussians`), which light profiles
+            made of Gaussians use to compute their blurred image analytically without the `Convolver`.
+        super_pixel_signal_to_noise : float or None
+            If input, the unmasked pixels are grouped into super-pixels whose combined signal-to-noise is below this
+            value (see `SuperPixels`), such that low signal-to-noise regions of the image are fitted as one binned
+            pixel. This speeds up the early phases of a pipeline and is turned off in later phases.
+        super_pixel_max_size : int
+            The size of the largest (super_pixel_max_size x super_pixel_max_size) super-pixels.
+            Super-pixels replace the grid with a `GridSuperPixels`, which is built from a uniform `Grid`, therefore
+            they can only be used with a `grid_class` of `Grid`.
         """
 
+        if grid_inversion_class is grid_adaptive.GridAdaptive:
+            raise exc.DatasetException(
+                "The GridAdaptive chooses the sub-size of each pixel when an image is computed from it, which an "
+                "Inversion does not do, therefore it cannot be used as the grid_inversion_class."
+            )
+
+        if super_pixel_signal_to_noise is not None and grid_class is not grids.Grid:
+            raise exc.DatasetException(
+                f"Super-pixels use a GridSuperPixels for the grid, therefore they cannot be used with the grid class "
+                f"{grid_class.__name__}, use Grid instead."
+            )
+
         super().__init__(
             grid_class=grid_class,
             grid_inversion_class=grid_inversion_class,
@@ -67,6 +100,110 @@ class SettingsMaskedImaging(imaging.SettingsMaskedImaging):
             renormalize_psf=renormalize_psf,
         )
 
+        self.psf_total_gaussians = psf_total_gaussians
+        self.super_pixel_signal_to_noise = super_pixel_signal_to_noise
+        self.super_pixel_max_size = super_pixel_max_size
+
+    @property
+    def tag_no_inversion(self):
+        return (
+            f"{conf.instance['notation']['settings_tags']['imaging']['imaging']}"
+            f"[{self.grid_tag_no_inversion}"
+            f"{self.signal_to_noise_limit_tag}"
+            f"{self.bin_up_factor_tag}"
+            f"{self.psf_shape_tag}"
+            f"{self.psf_total_gaussians_tag}"
+            f"{self.super_pixels_tag}]"
+        )
+
+    @property
+    def tag_with_inversion(self):
+        return (
+            f"{conf.instance['notation']['settings_tags']['imaging']['imaging']}"
+            f"[{self.grid_tag_with_inversion}"
+            f"{self.signal_to_noise_limit_tag}"
+            f"{self.bin_up_factor_tag}"
+            f"{self.psf_shape_tag}"
+            f"{self.psf_total_gaussians_tag}"
+            f"{self.super_pixels_tag}]"
+        )
+
+    @property
+    def psf_total_gaussians_tag(self):
+        """Generate a PSF Gaussians tag, to customize phase names based on the number of Gaussians the PSF is fitted
+        with for analytic convolution.
+
+        This changes the phase settings folder as follows:
+
+        psf_total_gaussians = None -> settings
+        psf_total_gaussians = 3 -> settings__psf_gauss_3
+        """
+        if self.psf_total_gaussians is None:
+            return ""
+        return (
+            "__"
+            + conf.instance["notation"]["settings_tags"]["imaging"]["psf_gaussians"]
+            + "_"
+            + str(self.psf_total_gaussians)
+        )
+
+    @property
+    def super_pixels_tag(self):
+        """Generate a super-pixels tag, to customize phase names based on the signal-to-noise threshold of the
+        super-pixels the image is binned into.
+
+        This changes the phase settings folder as follows:
+
+        super_pixel_signal_to_noise = None -> settings
+        super_pixel_signal_to_noise = 5.0 -> settings__super_pix_snr_5.0
+        super_pixel_signal_to_noise = 5.0, super_pixel_max_size = 4 -> settings__super_pix_snr_5.0_max_4
+        """
+        if self.super_pixel_signal_to_noise is None:
+            return ""
+
+        max_size_tag = (
+            ""
+            if self.super_pixel_max_size == 8
+            else f"_max_{self.super_pixel_max_size}"
+        )
+
+        return (
+            "__"
+            + conf.instance["notation"]["settings_tags"]["imaging"]["super_pixels"]
+            + "_snr_"
+            + str(self.super_pixel_signal_to_noise)
+            + max_size_tag
+        )
+
+    def grid_from_mask(self, mask):
+
+        if self.grid_class is grid_adaptive.GridAdaptive:
+            return grid_adaptive.GridAdaptive.from_mask(
+                mask=mask,
+                fractional_accuracy=self.fractional_accuracy,
+                sub_steps=self.sub_steps,
+            )
+
+        return super().grid_from_mask(mask=mask)
+
+    @property
+    def grid_fractional_accuracy_tag(self):
+        """Generate a fractional accuracy tag, to customize phase names based on the fractional accuracy of the
+        GridIterate or GridAdaptive class.
+
+        This changes the phase settings folder as follows:
+
+        fraction_accuracy = 0.5 -> settings__facc_0.5
+        grid_class = GridAdaptive, fractional_accuracy = 0.5 -> settings__adapt_facc_0.5
+        """
+        if not self.grid_class is grid_adaptive.GridAdaptive:
+            return super().grid_fractional_accuracy_tag
+        return (
+            f"{conf.instance['notation']['settings_tags']['dataset']['grid_adaptive']}_"
+            f"{conf.instance['notation']['settings_tags']['dataset']['fractional_accuracy']}_"
+            f"{str(self.fractional_accuracy)}"
+        )
+
 
 class MaskedImaging(imaging.MaskedImaging):
     def __init__(self, imaging, mask, settings=SettingsMaskedImaging()):
@@ -101,6 +238,35 @@ class MaskedImaging(imaging.MaskedImaging):
             imaging=imaging, mask=mask, settings=settings
         )
 
+        self.psf_gaussians = None
+
+        if self.psf is not None and settings.psf_total_gaussians is not None:
+
+            self.psf_gaussians = psf_g.PSFGaussians.from_kernel(
+                kernel=self.psf, total_gaussians=settings.psf_total_gaussians
+            )
+
+        self.super_pixels = None
+
+        if settings.super_pixel_signal_to_noise is not None:
+
+            self.super_pixels = sp.SuperPixels.from_mask_image_and_noise_map(
+                mask=self.mask,
+                image=self.image,
+                noise_map=self.noise_map,
+                signal_to_noise_threshold=settings.super_pixel_signal_to_noise,
+                max_size=settings.super_pixel_max_size,
+            )
+
+            self.image = self.super_pixels.binned_array_from(array=self.image)
+            self.noise_map = self.super_pixels.noise_map_from(noise_map=self.noise_map)
+
+            self.grid = sp.GridSuperPixels.from_mask(
+                mask=self.mask,
+                super_pixels=self.super_pixels,
+                sub_size=settings.sub_size,
+            )
+
 
 class SimulatorImaging(imaging.SimulatorImaging):
     def __init__(
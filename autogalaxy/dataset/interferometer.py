@@ -1,7 +1,10 @@
 import numpy as np
+from autoconf import conf
 from autoarray.structures import grids
 from autoarray.dataset import interferometer
 from autoarray.operators import transformer
+from autogalaxy import exc
+from autogalaxy.dataset import visibilities_compression as vis_comp
 from autogalaxy.plane import plane as pl
 
 
@@ -16,6 +19,9 @@ class SettingsMaskedInterferometer(interferometer.SettingsMaskedInterferometer):
         pixel_scales_interp=None,
         signal_to_noise_limit=None,
         transformer_class=transformer.TransformerNUFFT,
+        visibilities_compression=None,
+        decorrelation=0.01,
+        analytic_visibilities=False,
     ):
         """
           The lens dataset is the collection of data_type (image, noise-map), a mask, grid, convolver \
@@ -47,8 +53,26 @@ class SettingsMaskedInterferometer(interferometer.SettingsMaskedInterferometer):
         signal_to_noise_limit : float
             If input, the dataset's noise-map is rescaled such that no pixel has a signal-to-noise above the
             signa to noise limit.
+        visibilities_compression : str or None
+            If input, the visibilities are compressed by combining them in cells of the uv-plane, where "average"
+            places every combined visibility at the weighted mean (u,v) of its cell and "grid" at the cell centre
+            (see `VisibilitiesCompression`).
+        decorrelation : float
+            If the visibilities are compressed, the maximum fractional error of the visibilities of emission at the
+            edge of the real-space mask, which sets the size of the uv-plane cells. The "grid" method uses far
+            smaller cells than "average" for the same decorrelation (see `cell_size_from`).
+        analytic_visibilities : bool
+            If `True`, the visibilities of galaxies whose light profiles support it (e.g. Gaussians) are computed
+            analytically at the uv-wavelengths (see *LightProfile.visibilities_from_uv_wavelengths*), instead of
+            transforming their image evaluated on the grid.
           """
 
+        if visibilities_compression not in [None, "average", "grid"]:
+            raise exc.DatasetException(
+                f"The visibilities compression {visibilities_compression} is not supported, use None, average or "
+                f"grid."
+            )
+
         super().__init__(
             grid_class=grid_class,
             grid_inversion_class=grid_inversion_class,
@@ -60,6 +84,68 @@ class SettingsMaskedInterferometer(interferometer.SettingsMaskedInterferometer):
             transformer_class=transformer_class,
         )
 
+        self.visibilities_compression = visibilities_compression
+        self.decorrelation = decorrelation
+        self.analytic_visibilities = analytic_visibilities
+
+    @property
+    def tag_no_inversion(self):
+        return (
+            f"{conf.instance['notation']['settings_tags']['interferometer']['interferometer']}["
+            f"{self.grid_tag_no_inversion}"
+            f"{self.transformer_tag}"
+            f"{self.signal_to_noise_limit_tag}"
+            f"{self.visibilities_compression_tag}"
+            f"{self.analytic_visibilities_tag}]"
+        )
+
+    @property
+    def tag_with_inversion(self):
+        return (
+            f"{conf.instance['notation']['settings_tags']['interferometer']['interferometer']}["
+            f"{self.grid_tag_with_inversion}"
+            f"{self.transformer_tag}"
+            f"{self.signal_to_noise_limit_tag}"
+            f"{self.visibilities_compression_tag}"
+            f"{self.analytic_visibilities_tag}]"
+        )
+
+    @property
+    def visibilities_compression_tag(self):
+        """Generate a visibilities compression tag, to customize phase names based on the method and decorrelation
+        used to compress the visibilities.
+
+        This changes the phase settings folder as follows:
+
+        visibilities_compression = None -> settings
+        visibilities_compression = "average", decorrelation = 0.01 -> settings__vis_avg_0.01
+        visibilities_compression = "grid", decorrelation = 0.01 -> settings__vis_grid_0.01
+        """
+        if self.visibilities_compression is None:
+            return ""
+        return (
+            "__"
+            + conf.instance["notation"]["settings_tags"]["interferometer"][
+                f"visibilities_{self.visibilities_compression}"
+            ]
+            + "_"
+            + str(self.decorrelation)
+        )
+
+    @property
+    def analytic_visibilities_tag(self):
+        """Generate an analytic visibilities tag, to customize phase names based on whether the visibilities of
+        light profiles are computed analytically.
+
+        This changes the phase settings folder as follows:
+
+        analytic_visibilities = False -> settings
+        analytic_visibilities = True -> settings__vis_analytic
+        """
+        if not self.analytic_visibilities:
+            return ""
+        return f"__{conf.instance['notation']['settings_tags']['interferometer']['analytic_visibilities']}"
+
 
 class MaskedInterferometer(interferometer.MaskedInterferometer):
     def __init__(
@@ -93,6 +179,23 @@ class MaskedInterferometer(interferometer.MaskedInterferometer):
             interpolated to the grid, sub and blurring grids.
         """
 
+        self.visibilities_compression = None
+
+        if settings.visibilities_compression is not None:
+
+            self.visibilities_compression = vis_comp.VisibilitiesCompression.from_interferometer(
+                interferometer=interferometer,
+                real_space_mask=real_space_mask,
+                decorrelation=settings.decorrelation,
+                method=settings.visibilities_compression,
+                visibilities_mask=visibilities_mask,
+            )
+
+            interferometer = self.visibilities_compression.interferometer
+            visibilities_mask = np.full(
+                fill_value=False, shape=interferometer.visibilities.shape
+            )
+
         super(MaskedInterferometer, self).__init__(
             interferometer=interferometer,
             visibilities_mask=visibilities_mask,
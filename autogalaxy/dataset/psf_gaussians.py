@@ -0,0 +1,114 @@
+import numpy as np
+from scipy.optimize import nnls
+
+
+class PSFGaussians:
+    def __init__(self, sigmas, weights, fractional_residual=0.0):
+        """
+        A representation of a PSF as a sum of circular Gaussians centred on the PSF centre, which is used to convolve
+        Gaussian light profiles with the PSF analytically.
+
+        The convolution of an elliptical Gaussian with a circular Gaussian is another elliptical Gaussian, whose
+        sigma along each axis is the quadrature sum of the two sigmas and whose total flux is unchanged (see
+        `EllipticalGaussian.gaussians_convolved_with`). A light profile made of Gaussians can therefore be evaluated
+        already convolved with the PSF, without a `Convolver` or blurring grid.
+
+        Parameters
+        ----------
+        sigmas : [float]
+            The sigma of every Gaussian in arc-seconds.
+        weights : [float]
+            The weight of every Gaussian, which is the fraction of the PSF's total flux it contains.
+        fractional_residual : float
+            The sum of the absolute residuals of the Gaussians fitted to the PSF kernel divided by the sum of the
+            absolute values of the kernel, which describes how well the Gaussians represent the PSF.
+        """
+        self.sigmas = list(sigmas)
+        self.weights = list(weights)
+        self.fractional_residual = fractional_residual
+
+    def __len__(self):
+        return len(self.sigmas)
+
+    @classmethod
+    def from_kernel(cls, kernel, total_gaussians=3, total_sigmas=20, sub_size=4):
+        """
+        Fit a PSF kernel with a sum of circular Gaussians centred on the kernel centre.
+
+        The fit first solves for the non-negative weights of `total_sigmas` Gaussians whose sigmas are spaced
+        logarithmically between a quarter of a pixel and half the kernel's half-width. The `total_gaussians`
+        Gaussians with the largest weights are then refitted on their own, giving a small mixture which can be
+        convolved with light profiles cheaply.
+
+        Every Gaussian is integrated over the kernel's pixels using a sub-grid of size `sub_size`, such that Gaussians
+        narrower than a pixel are fitted correctly.
+
+        Parameters
+        ----------
+        kernel : Kernel
+            The PSF kernel which is fitted, which must have an odd shape so that its centre is the central pixel.
+        total_gaussians : int
+            The number of Gaussians in the fitted mixture.
+        total_sigmas : int
+            The number of sigma values the initial fit chooses the Gaussians from.
+        sub_size : int
+            The size of the sub-grid every pixel of the kernel is integrated over.
+        """
+        kernel_2d = np.asarray(kernel.in_2d)
+        pixel_scales = kernel.pixel_scales
+
+        shape = kernel_2d.shape
+
+        y_sub = (
+            (shape[0] - 1) / 2.0
+            - (np.arange(shape[0] * sub_size) + 0.5) / sub_size
+            + 0.5
+        ) * pixel_scales[0]
+        x_sub = (
+            (np.arange(shape[1] * sub_size) + 0.5) / sub_size
+            - 0.5
+            - (shape[1] - 1) / 2.0
+        ) * pixel_scales[1]
+
+        radii_squared_sub = np.add.outer(np.square(y_sub), np.square(x_sub))
+
+        min_pixel_scale = min(pixel_scales)
+        max_sigma = 0.25 * min(shape[0] * pixel_scales[0], shape[1] * pixel_scales[1])
+
+        sigmas = np.geomspace(
+            0.25 * min_pixel_scale, max(max_sigma, min_pixel_scale), total_sigmas
+        )
+
+        def kernel_of_gaussian_from(sigma):
+            gaussian_sub = np.exp(-0.5 * radii_squared_sub / sigma ** 2.0) / (
+                2.0 * np.pi * sigma ** 2.0
+            )
+            return (
+                gaussian_sub.reshape(shape[0], sub_size, shape[1], sub_size).mean(
+                    axis=(1, 3)
+                )
+                * pixel_scales[0]
+                * pixel_scales[1]
+            )
+
+        kernels = np.stack(
+            [kernel_of_gaussian_from(sigma=sigma).ravel() for sigma in sigmas], axis=1
+        )
+
+        weights, _ = nnls(kernels, kernel_2d.ravel())
+
+        indexes = np.sort(np.argsort(weights)[::-1][:total_gaussians])
+
+        weights, _ = nnls(kernels[:, indexes], kernel_2d.ravel())
+
+        model_kernel = np.dot(kernels[:, indexes], weights)
+
+        fractional_residual = np.sum(np.abs(kernel_2d.ravel() - model_kernel)) / np.sum(
+            np.abs(kernel_2d)
+        )
+
+        return PSFGaussians(
+            sigmas=list(sigmas[indexes]),
+            weights=list(weights),
+            fractional_residual=float(fractional_residual),
+        )
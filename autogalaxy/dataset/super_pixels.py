@@ -0,0 +1,332 @@
+import numpy as np
+
+from autoarray.structures import arrays
+from autoarray.structures import grids
+from autoarray.util import grid_util
+from autogalaxy.dataset import grid_adaptive
+
+
+class SuperPixels:
+    def __init__(self, super_pixel_indexes, total_super_pixels):
+        """
+        A grouping of the unmasked pixels of a masked dataset into super-pixels, where the data and model of every
+        super-pixel are the mean of its pixels.
+
+        Parameters
+        ----------
+        super_pixel_indexes : np.ndarray
+            The index of the super-pixel every unmasked pixel (in 1D) belongs to.
+        total_super_pixels : int
+            The number of super-pixels.
+        """
+        self.super_pixel_indexes = super_pixel_indexes
+        self.total_super_pixels = total_super_pixels
+        self.sizes = np.bincount(super_pixel_indexes, minlength=total_super_pixels)
+
+    def __len__(self):
+        return self.total_super_pixels
+
+    @classmethod
+    def from_mask_image_and_noise_map(
+        cls, mask, image, noise_map, signal_to_noise_threshold, max_size=8
+    ):
+        """
+        Group the unmasked pixels of a masked image into square super-pixels using a quadtree, such that pixels of low
+        signal-to-noise (e.g. background sky) are combined whereas pixels containing the signal of a galaxy are not.
+
+        The mask is first divided into blocks of `max_size` x `max_size` pixels. A block whose combined
+        signal-to-noise (the sum of its pixels' image values divided by the quadrature sum of their noise-map values)
+        is above the threshold is split into quadrants, which are split in the same way, until single pixels are
+        reached. Every block which is not split is a super-pixel.
+
+        Parameters
+        ----------
+        mask : Mask2D
+            The mask of the image, whose unmasked pixels are grouped.
+        image : Array
+            The image whose signal-to-noise decides which pixels are grouped.
+        noise_map : Array
+            The noise-map of the image.
+        signal_to_noise_threshold : float
+            Blocks with a combined signal-to-noise above this value are split.
+        max_size : int
+            The size of the largest (max_size x max_size) super-pixels.
+        """
+        mask_2d = np.asarray(mask, dtype="bool")
+
+        pixel_indexes_2d = np.full(mask_2d.shape, -1, dtype="int")
+        pixel_indexes_2d[~mask_2d] = np.arange(np.sum(~mask_2d))
+
+        image_1d = np.asarray(image.in_1d)
+        variances_1d = np.square(np.asarray(noise_map.in_1d))
+
+        super_pixel_indexes = np.zeros(image_1d.shape[0], dtype="int")
+        total_super_pixels = 0
+
+        blocks = [
+            (
+                y0,
+                x0,
+                min(max_size, mask_2d.shape[0] - y0),
+                min(max_size, mask_2d.shape[1] - x0),
+            )
+            for y0 in range(0, mask_2d.shape[0], max_size)
+            for x0 in range(0, mask_2d.shape[1], max_size)
+        ]
+
+        while blocks:
+
+            y0, x0, height, width = blocks.pop()
+
+            pixel_indexes = pixel_indexes_2d[y0 : y0 + height, x0 : x0 + width]
+            pixel_indexes = pixel_indexes[pixel_indexes >= 0]
+
+            if len(pixel_indexes) == 0:
+                continue
+
+            signal_to_noise = np.sum(image_1d[pixel_indexes]) / np.sqrt(
+                np.sum(variances_1d[pixel_indexes])
+            )
+
+            if len(pixel_indexes) > 1 and signal_to_noise > signal_to_noise_threshold:
+
+                half_height = max(height // 2, 1)
+                half_width = max(width // 2, 1)
+
+                for (y1, block_height) in [
+                    (y0, half_height),
+                    (y0 + half_height, height - half_height),
+                ]:
+                    for (x1, block_width) in [
+                        (x0, half_width),
+                        (x0 + half_width, width - half_width),
+                    ]:
+                        if block_height > 0 and block_width > 0:
+                            blocks.append((y1, x1, block_height, block_width))
+
+                continue
+
+            super_pixel_indexes[pixel_indexes] = total_super_pixels
+            total_super_pixels += 1
+
+        return SuperPixels(
+            super_pixel_indexes=super_pixel_indexes,
+            total_super_pixels=total_super_pixels,
+        )
+
+    def binned_from(self, values) -> np.ndarray:
+        """
+        Returns the mean of an ndarray of values (one per unmasked pixel) in every super-pixel.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The values of every unmasked pixel in 1D.
+        """
+        return (
+            np.bincount(
+                self.super_pixel_indexes,
+                weights=np.asarray(values),
+                minlength=self.total_super_pixels,
+            )
+            / self.sizes
+        )
+
+    def binned_array_from(self, array):
+        """
+        Returns a copy of an array (one value per unmasked pixel) where every pixel's value is the mean of its
+        super-pixel.
+
+        Parameters
+        ----------
+        array : Array
+            The array which is binned.
+        """
+        binned_array = array.copy()
+
+        np.asarray(binned_array)[:] = self.binned_from(values=array)[
+            self.super_pixel_indexes
+        ]
+
+        return binned_array
+
+    def noise_map_from(self, noise_map):
+        """
+        Returns the noise-map of the binned image (see *binned_array_from*), where every pixel of a super-pixel with
+        N pixels has N times the variance of the super-pixel's mean.
+
+        The noise of the mean of a super-pixel is the quadrature sum of its pixels' noise divided by N. A binned image
+        and model, which are constant within every super-pixel, therefore have a chi-squared summed over the N pixels
+        of a super-pixel equal to the chi-squared of the super-pixel's mean.
+
+        Parameters
+        ----------
+        noise_map : Array
+            The noise-map of the unbinned image.
+        """
+        binned_noise_map = noise_map.copy()
+
+        np.asarray(binned_noise_map)[:] = np.sqrt(
+            self.binned_from(values=np.square(noise_map))
+        )[self.super_pixel_indexes]
+
+        return binned_noise_map
+
+
+class GridSuperPixels(grids.Grid):
+    def __new__(
+        cls, grid, mask, super_pixels, sub_size=2, store_in_1d=True, *args, **kwargs
+    ):
+        """
+        Represents a grid of coordinates as described for the `Grid` class, where every coordinate is the centre of
+        an unmasked pixel, but where the image of a `Galaxy` or `Plane` computed from it (see
+        `Galaxy.binned_image_from_grid` and `Plane.binned_image_from_grid`) is evaluated once per super-pixel (see
+        `SuperPixels`).
+
+        Super-pixels of one pixel are evaluated on a sub-grid of size `sub_size`, as for a `Grid`. Super-pixels of
+        more than one pixel, which contain low signal-to-noise data, are evaluated at the mean coordinate of their
+        pixels, and this value is given to every pixel.
+
+        If a `GridSuperPixels` is passed directly to a light or mass profile it behaves as a `Grid` with a sub-size
+        of 1.
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y,x) coordinates of the centre of every unmasked pixel.
+        mask : msk.Mask2D
+            The 2D mask associated with the grid, which must have a sub-size of 1.
+        super_pixels : SuperPixels
+            The super-pixels the unmasked pixels are grouped into.
+        sub_size : int
+            The size of the sub-grid used to evaluate super-pixels of one pixel.
+        store_in_1d : bool
+            If True, the grid is stored in 1D as an ndarray of shape [total_unmasked_pixels, 2]. If False, it is
+            stored in 2D as an ndarray of shape [total_y_pixels, total_x_pixels, 2].
+        """
+        obj = super().__new__(cls, grid=grid, mask=mask, store_in_1d=store_in_1d)
+        obj.super_pixels = super_pixels
+        obj.sub_size_super_pixels = sub_size
+        return obj
+
+    def __array_finalize__(self, obj):
+
+        super(GridSuperPixels, self).__array_finalize__(obj)
+
+        if hasattr(obj, "super_pixels"):
+            self.super_pixels = obj.super_pixels
+
+        if hasattr(obj, "sub_size_super_pixels"):
+            self.sub_size_super_pixels = obj.sub_size_super_pixels
+
+    def _new_structure(self, grid, mask, store_in_1d):
+        """
+        Conveninence method for creating a new instance of the GridSuperPixels class from this grid, such that the
+        in_1d and in_2d methods return instances of the GridSuperPixels.
+        """
+        return GridSuperPixels(
+            grid=grid,
+            mask=mask,
+            super_pixels=self.super_pixels,
+            sub_size=self.sub_size_super_pixels,
+            store_in_1d=store_in_1d,
+        )
+
+    @classmethod
+    def from_mask(cls, mask, super_pixels, sub_size=2, store_in_1d=True):
+        """
+        Create a GridSuperPixels (see *GridSuperPixels.__new__*) from a mask, where only unmasked pixels are included
+        in the grid.
+
+        The sub-size of the mask is ignored, as the grid's coordinates are the centre of every unmasked pixel.
+
+        Parameters
+        ----------
+        mask : Mask2D
+            The mask whose unmasked pixels are used to setup the grid.
+        super_pixels : SuperPixels
+            The super-pixels the unmasked pixels are grouped into.
+        sub_size : int
+            The size of the sub-grid used to evaluate super-pixels of one pixel.
+        store_in_1d : bool
+            If True, the grid is stored in 1D as an ndarray of shape [total_unmasked_pixels, 2]. If False, it is
+            stored in 2D as an ndarray of shape [total_y_pixels, total_x_pixels, 2].
+        """
+        mask = mask.mask_sub_1
+
+        grid_1d = grid_util.grid_1d_via_mask_from(
+            mask=mask, pixel_scales=mask.pixel_scales, sub_size=1, origin=mask.origin
+        )
+
+        if not store_in_1d:
+            grid_1d = grid_util.sub_grid_2d_from(
+                sub_grid_1d=grid_1d, mask=mask, sub_size=1
+            )
+
+        return GridSuperPixels(
+            grid=grid_1d,
+            mask=mask,
+            super_pixels=super_pixels,
+            sub_size=sub_size,
+            store_in_1d=store_in_1d,
+        )
+
+    @property
+    def super_pixel_centres(self) -> np.ndarray:
+        """
+        The mean (y,x) coordinate of the pixels of every super-pixel.
+        """
+        grid_1d = np.asarray(self.in_1d)
+
+        return np.stack(
+            (
+                self.super_pixels.binned_from(values=grid_1d[:, 0]),
+                self.super_pixels.binned_from(values=grid_1d[:, 1]),
+            ),
+            axis=1,
+        )
+
+    def binned_array_from_func(self, func, light_profile_centres=None):
+        """
+        Returns the values of a function evaluated on the grid, where the function is evaluated once per super-pixel
+        of more than one pixel and on a sub-grid in every other pixel (see *GridSuperPixels.__new__*).
+
+        Parameters
+        ----------
+        func : func
+            A function which takes an ndarray of (y,x) coordinates and returns an ndarray of a value at each, for
+            example a lambda function wrapping `Galaxy.image_from_grid`.
+        light_profile_centres : GridIrregularGrouped or [(float, float)] or None
+            Unused, but input by the `Galaxy` and `Plane` in the same way as for a `GridAdaptive`.
+        """
+        super_pixel_indexes = self.super_pixels.super_pixel_indexes
+
+        grouped_super_pixels = np.where(self.super_pixels.sizes > 1)[0]
+
+        values_of_super_pixels = np.zeros(self.super_pixels.total_super_pixels)
+
+        if len(grouped_super_pixels) > 0:
+            values_of_super_pixels[grouped_super_pixels] = np.asarray(
+                func(self.super_pixel_centres[grouped_super_pixels])
+            )
+
+        values = values_of_super_pixels[super_pixel_indexes]
+
+        pixel_indexes = np.where(self.super_pixels.sizes[super_pixel_indexes] == 1)[0]
+
+        if len(pixel_indexes) > 0:
+
+            sub_grid = grid_adaptive.grid_at_sub_size_from(
+                grid_1d=np.asarray(self.in_1d),
+                pixel_scales=self.mask.pixel_scales,
+                pixel_indexes=pixel_indexes,
+                sub_size=self.sub_size_super_pixels,
+            )
+
+            values[pixel_indexes] = (
+                np.asarray(func(sub_grid))
+                .reshape(-1, self.sub_size_super_pixels ** 2)
+                .mean(axis=1)
+            )
+
+        return arrays.Array(array=values, mask=self.mask, store_in_1d=True)
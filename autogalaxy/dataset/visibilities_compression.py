@@ -0,0 +1,297 @@
+import numpy as np
+from autoarray.dataset import interferometer as inter
+from autoarray.operators import transformer as trans
+from autoarray.structures import visibilities as vis
+from autogalaxy import exc
+
+
+def cell_size_from(real_space_mask, decorrelation, method="average"):
+    """
+    Returns the size (in wavelengths) of the square uv-plane cells visibilities are combined in, such that the
+    compression of the emission within the real-space mask is in error by at most a fraction `decorrelation`.
+
+    For the "average" method the model is evaluated at the noise-weighted mean (u,v) of every cell, therefore the
+    linear phase variation over the cell cancels and the error is the loss of amplitude from averaging. For emission
+    at an offset theta (in radians) from the phase centre this is approximately (pi * cell_size * theta)^2 / 6 along
+    each axis. The largest offset is the corner of the mask's outermost pixel, therefore the cell size is:
+
+    cell_size = sqrt(3 * decorrelation) / (pi * theta_max)
+
+    For the "grid" method the model is evaluated at the cell centre, whereas the data are combined at their true
+    (u,v). This introduces a phase error 2 * pi * (du * x + dv * y), which for offsets du, dv of up to half a cell is
+    at most 2 * pi * cell_size * theta_max. This error is linear (not quadratic) in the cell size, therefore the
+    "grid" method requires far smaller cells:
+
+    cell_size = decorrelation / (2 * pi * theta_max)
+
+    Parameters
+    ----------
+    real_space_mask : Mask2D
+        The real-space mask which contains all emission in the model images.
+    decorrelation : float
+        The maximum fractional error of the visibilities of emission at the edge of the mask.
+    method : str
+        Whether the compressed visibilities are placed at the weighted mean (u,v) of every cell ("average") or
+        at the cell centres ("grid").
+    """
+    grid = np.asarray(real_space_mask.geometry.masked_grid_sub_1)
+
+    theta_max = (np.max(np.abs(grid)) + 0.5 * max(real_space_mask.pixel_scales)) * (
+        np.pi / 648000.0
+    )
+
+    if method == "grid":
+        return decorrelation / (2.0 * np.pi * theta_max)
+
+    return np.sqrt(3.0 * decorrelation) / (np.pi * theta_max)
+
+
+class VisibilitiesCompression:
+    def __init__(
+        self,
+        interferometer,
+        uncompressed_interferometer,
+        cell_size,
+        scatter_chi_squared,
+    ):
+        """
+        The compression of an `Interferometer` dataset, which bins its visibilities in cells of the uv-plane (see
+        *from_interferometer*).
+
+        Parameters
+        ----------
+        interferometer : Interferometer
+            The compressed dataset, whose visibilities, noise-map and (u,v) wavelengths are one per uv-cell.
+        uncompressed_interferometer : Interferometer
+            The dataset before compression, which is used to compute the error the compression introduces.
+        cell_size : float
+            The size of every uv-cell in wavelengths.
+        scatter_chi_squared : float
+            The chi-squared of the uncompressed visibilities relative to the compressed visibilities of their cell,
+            which is the constant difference between the chi-squared of a model fitted to the two datasets.
+        """
+        self.interferometer = interferometer
+        self.uncompressed_interferometer = uncompressed_interferometer
+        self.cell_size = cell_size
+        self.scatter_chi_squared = scatter_chi_squared
+
+    @classmethod
+    def from_interferometer(
+        cls,
+        interferometer,
+        real_space_mask,
+        decorrelation=0.01,
+        method="average",
+        visibilities_mask=None,
+    ):
+        """
+        Compress an `Interferometer` dataset by combining all visibilities within square cells of the uv-plane.
+
+        Visibilities which are masked (e.g. flagged) are removed before they are combined, such that they are not
+        fitted via the cells they lie in. The uncompressed dataset the compression error is computed relative to
+        (see `log_likelihood_error_from_image`) is the unmasked visibilities.
+
+        The sky is real, therefore a visibility at (u,v) is the complex conjugate of the visibility at (-u,-v).
+        Visibilities in the lower half of the uv-plane are first conjugated and moved to the upper half, such that
+        both halves are combined into the same cells.
+
+        The real and imaginary parts of the visibilities in a cell are combined using inverse-variance weights, such
+        that the compressed noise-map gives the same chi-squared for a model which is constant within the cell. Two
+        methods place the compressed visibility of a cell:
+
+        - average: at the noise-weighted mean (u,v) of the cell's visibilities.
+        - grid: at the centre of the cell, such that the compressed visibilities lie on a regular uv-plane grid.
+
+        The cell size is set by the extent of the real-space mask and the method (see `cell_size_from`), which bounds
+        the error of the model's visibilities within a cell. The compression is therefore approximate, with an error
+        that can be estimated for a model image via `log_likelihood_error_from_image`.
+
+        Parameters
+        ----------
+        interferometer : Interferometer
+            The dataset which is compressed.
+        real_space_mask : Mask2D
+            The real-space mask which contains all emission in the model images.
+        decorrelation : float
+            The maximum fractional loss of amplitude of emission at the edge of the mask.
+        method : str
+            Whether the compressed visibilities are placed at the weighted mean (u,v) of every cell ("average") or
+            at the cell centres ("grid").
+        visibilities_mask : np.ndarray or None
+            The mask of the visibilities, where `True` entries are removed before the compression.
+        """
+        if method not in ["average", "grid"]:
+            raise exc.DatasetException(
+                f"The visibilities compression method {method} is not supported, use average or grid."
+            )
+
+        if visibilities_mask is not None:
+
+            total_visibilities = interferometer.visibilities.shape[0]
+
+            unmasked = ~np.any(
+                np.asarray(visibilities_mask).reshape(total_visibilities, -1), axis=1
+            )
+
+            interferometer = inter.Interferometer(
+                visibilities=vis.Visibilities(
+                    visibilities=np.asarray(interferometer.visibilities)[unmasked]
+                ),
+                noise_map=vis.VisibilitiesNoiseMap(
+                    visibilities=np.asarray(interferometer.noise_map)[unmasked]
+                ),
+                uv_wavelengths=np.asarray(interferometer.uv_wavelengths)[unmasked],
+                positions=interferometer.positions,
+                name=interferometer.name,
+            )
+
+        cell_size = cell_size_from(
+            real_space_mask=real_space_mask, decorrelation=decorrelation, method=method
+        )
+
+        uv_wavelengths = np.array(interferometer.uv_wavelengths, dtype="float")
+        visibilities = np.array(interferometer.visibilities, dtype="complex128")
+        noise_map = np.asarray(interferometer.noise_map)
+
+        conjugate = (uv_wavelengths[:, 1] < 0.0) | (
+            (uv_wavelengths[:, 1] == 0.0) & (uv_wavelengths[:, 0] < 0.0)
+        )
+
+        uv_wavelengths[conjugate] *= -1.0
+        visibilities[conjugate] = np.conj(visibilities[conjugate])
+
+        cells, cell_indexes = np.unique(
+            np.floor(uv_wavelengths / cell_size).astype("int"),
+            axis=0,
+            return_inverse=True,
+        )
+        cell_indexes = cell_indexes.ravel()
+
+        def weighted_mean_from(values, weights, weights_sum):
+            return (
+                np.bincount(
+                    cell_indexes, weights=values * weights, minlength=len(cells)
+                )
+                / weights_sum
+            )
+
+        weights_real = 1.0 / np.square(np.real(noise_map))
+        weights_imag = 1.0 / np.square(np.imag(noise_map))
+
+        weights_sum_real = np.bincount(
+            cell_indexes, weights=weights_real, minlength=len(cells)
+        )
+        weights_sum_imag = np.bincount(
+            cell_indexes, weights=weights_imag, minlength=len(cells)
+        )
+
+        compressed_real = weighted_mean_from(
+            np.real(visibilities), weights_real, weights_sum_real
+        )
+        compressed_imag = weighted_mean_from(
+            np.imag(visibilities), weights_imag, weights_sum_imag
+        )
+
+        if method == "average":
+
+            weights = weights_real + weights_imag
+            weights_sum = weights_sum_real + weights_sum_imag
+
+            compressed_uv_wavelengths = np.stack(
+                (
+                    weighted_mean_from(uv_wavelengths[:, 0], weights, weights_sum),
+                    weighted_mean_from(uv_wavelengths[:, 1], weights, weights_sum),
+                ),
+                axis=1,
+            )
+
+        else:
+
+            compressed_uv_wavelengths = (cells + 0.5) * cell_size
+
+        scatter_chi_squared = float(
+            np.sum(
+                weights_real
+                * np.square(np.real(visibilities) - compressed_real[cell_indexes])
+            )
+            + np.sum(
+                weights_imag
+                * np.square(np.imag(visibilities) - compressed_imag[cell_indexes])
+            )
+        )
+
+        compressed_interferometer = inter.Interferometer(
+            visibilities=vis.Visibilities(
+                visibilities=compressed_real + 1j * compressed_imag
+            ),
+            noise_map=vis.VisibilitiesNoiseMap(
+                visibilities=1.0 / np.sqrt(weights_sum_real)
+                + 1j / np.sqrt(weights_sum_imag)
+            ),
+            uv_wavelengths=compressed_uv_wavelengths,
+            positions=interferometer.positions,
+            name=interferometer.name,
+        )
+
+        return VisibilitiesCompression(
+            interferometer=compressed_interferometer,
+            uncompressed_interferometer=interferometer,
+            cell_size=cell_size,
+            scatter_chi_squared=scatter_chi_squared,
+        )
+
+    @property
+    def compression_ratio(self) -> float:
+        """
+        The number of visibilities in the uncompressed dataset divided by the number in the compressed dataset.
+        """
+        return (
+            self.uncompressed_interferometer.visibilities.shape[0]
+            / self.interferometer.visibilities.shape[0]
+        )
+
+    def log_likelihood_error_from_image(
+        self, image, transformer_class=trans.TransformerNUFFT
+    ) -> float:
+        """
+        Returns the error in the log likelihood of a model image fitted to the compressed dataset, compared to the
+        same model image fitted to the uncompressed dataset.
+
+        For a model whose visibilities are constant within every uv-cell, the chi-squared of the uncompressed fit is
+        the chi-squared of the compressed fit plus the constant `scatter_chi_squared`, therefore this error is zero.
+        The error is therefore the decorrelation of the model's visibilities within the cells.
+
+        Parameters
+        ----------
+        image : Array
+            The model image, whose mask is the real-space mask both datasets are fitted with.
+        transformer_class : class
+            The transformer used to compute the model visibilities of the two datasets.
+        """
+
+        def chi_squared_from(interferometer):
+
+            transformer = transformer_class(
+                uv_wavelengths=interferometer.uv_wavelengths,
+                real_space_mask=image.mask,
+            )
+
+            residual_map = (
+                interferometer.visibilities
+                - transformer.visibilities_from_image(image=image)
+            )
+
+            return float(
+                np.sum(
+                    np.square(np.real(residual_map) / np.real(interferometer.noise_map))
+                )
+                + np.sum(
+                    np.square(np.imag(residual_map) / np.imag(interferometer.noise_map))
+                )
+            )
+
+        return -0.5 * (
+            chi_squared_from(interferometer=self.uncompressed_interferometer)
+            - chi_squared_from(interferometer=self.interferometer)
+            - self.scatter_chi_squared
+        )
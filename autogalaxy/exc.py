@@ -23,6 +23,10 @@ class PlottingException(Exception):
     pass
 
 
+class PrecisionException(Exception):
+    pass
+
+
 class PixelizationException(af.exc.FitException):
     pass
 
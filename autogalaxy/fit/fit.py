@@ -1,9 +1,12 @@
 import numpy as np
+from scipy import sparse
 
 from autoconf import conf
 from autoarray.fit import fit as aa_fit
 from autoarray.inversion import pixelizations as pix, inversions as inv
+from autogalaxy import exc
 from autogalaxy.galaxy import galaxy as g
+from autogalaxy.util import profiling_util
 
 
 class FitImaging(aa_fit.FitImaging):
@@ -30,6 +33,20 @@ class FitImaging(aa_fit.FitImaging):
 
         self.plane = plane
 
+        with profiling_util.timer(stage="blurred_image"):
+            self.blurred_image = plane.blurred_image_from_grid_and_convolver(
+                grid=masked_imaging.grid,
+                convolver=masked_imaging.convolver,
+                blurring_grid=masked_imaging.blurring_grid,
+                psf_gaussians=masked_imaging.psf_gaussians,
+            )
+
+        if masked_imaging.super_pixels is not None:
+
+            self.blurred_image = masked_imaging.super_pixels.binned_array_from(
+                array=self.blurred_image
+            )
+
         if use_hyper_scalings:
 
             image = hyper_image_from_image_and_hyper_image_sky(
@@ -57,12 +74,6 @@ class FitImaging(aa_fit.FitImaging):
             image = masked_imaging.image
             noise_map = masked_imaging.noise_map
 
-        self.blurred_image = plane.blurred_image_from_grid_and_convolver(
-            grid=masked_imaging.grid,
-            convolver=masked_imaging.convolver,
-            blurring_grid=masked_imaging.blurring_grid,
-        )
-
         self.profile_subtracted_image = image - self.blurred_image
 
         if not plane.has_pixelization:
@@ -72,14 +83,15 @@ class FitImaging(aa_fit.FitImaging):
 
         else:
 
-            inversion = plane.inversion_imaging_from_grid_and_data(
-                grid=masked_imaging.grid_inversion,
-                image=self.profile_subtracted_image,
-                noise_map=noise_map,
-                convolver=masked_imaging.convolver,
-                settings_pixelization=settings_pixelization,
-                settings_inversion=settings_inversion,
-            )
+            with profiling_util.timer(stage="inversion"):
+                inversion = plane.inversion_imaging_from_grid_and_data(
+                    grid=masked_imaging.grid_inversion,
+                    image=self.profile_subtracted_image,
+                    noise_map=noise_map,
+                    convolver=masked_imaging.convolver,
+                    settings_pixelization=settings_pixelization,
+                    settings_inversion=settings_inversion,
+                )
 
             model_image = self.blurred_image + inversion.mapped_reconstructed_image
 
@@ -90,6 +102,8 @@ class FitImaging(aa_fit.FitImaging):
             use_mask_in_fit=False,
         )
 
+        self._blurred_images_of_galaxies = None
+
     @property
     def galaxies(self):
         return self.plane.galaxies
@@ -98,16 +112,41 @@ class FitImaging(aa_fit.FitImaging):
     def grid(self):
         return self.masked_imaging.grid
 
+    @property
+    def blurred_images_of_galaxies(self):
+        """
+        The blurred image of every galaxy in the plane, computed using the masked imaging's `Convolver` and binned
+        to its super-pixels if the masked imaging uses them.
+
+        These are computed the first time they are used and stored, such that the `galaxy_model_image_dict`,
+        `model_images_of_galaxies` and `subtracted_images_of_galaxies` (which are all used for visualization and
+        results) do not each reevaluate the images of the plane's galaxies.
+        """
+        if self._blurred_images_of_galaxies is None:
+
+            self._blurred_images_of_galaxies = self.plane.blurred_images_of_galaxies_from_grid_and_convolver(
+                grid=self.grid,
+                convolver=self.masked_imaging.convolver,
+                blurring_grid=self.masked_imaging.blurring_grid,
+                psf_gaussians=self.masked_imaging.psf_gaussians,
+            )
+
+            if self.masked_imaging.super_pixels is not None:
+
+                self._blurred_images_of_galaxies = [
+                    self.masked_imaging.super_pixels.binned_array_from(array=image)
+                    for image in self._blurred_images_of_galaxies
+                ]
+
+        return self._blurred_images_of_galaxies
+
     @property
     def galaxy_model_image_dict(self) -> {g.Galaxy: np.ndarray}:
         """
         A dictionary associating galaxies with their corresponding model images
         """
-
-        galaxy_model_image_dict = self.plane.galaxy_blurred_image_dict_from_grid_and_convolver(
-            grid=self.grid,
-            convolver=self.masked_imaging.convolver,
-            blurring_grid=self.masked_imaging.blurring_grid,
+        galaxy_model_image_dict = dict(
+            zip(self.galaxies, self.blurred_images_of_galaxies)
         )
 
         for galaxy in self.galaxies:
@@ -123,19 +162,18 @@ class FitImaging(aa_fit.FitImaging):
     @property
     def model_images_of_galaxies(self):
 
-        model_images_of_galaxies = self.plane.blurred_images_of_galaxies_from_grid_and_psf(
-            grid=self.grid,
-            psf=self.masked_imaging.psf,
-            blurring_grid=self.masked_imaging.blurring_grid,
-        )
+        model_images_of_galaxies = []
 
-        for galaxy_index, galaxy in enumerate(self.galaxies):
+        for galaxy, blurred_image in zip(
+            self.galaxies, self.blurred_images_of_galaxies
+        ):
 
             if galaxy.has_pixelization:
-
-                model_images_of_galaxies[
-                    galaxy_index
-                ] += self.inversion.mapped_reconstructed_image
+                model_images_of_galaxies.append(
+                    blurred_image + self.inversion.mapped_reconstructed_image
+                )
+            else:
+                model_images_of_galaxies.append(blurred_image)
 
         return model_images_of_galaxies
 
@@ -219,10 +257,21 @@ class FitInterferometer(aa_fit.FitInterferometer):
 
         self.plane = plane
 
-        self.profile_visibilities = plane.profile_visibilities_from_grid_and_transformer(
-            grid=masked_interferometer.grid,
-            transformer=masked_interferometer.transformer,
-        )
+        with profiling_util.timer(stage="profile_visibilities"):
+
+            self._profile_visibilities_of_galaxies = plane.profile_visibilities_of_galaxies_from_grid_and_transformer(
+                grid=masked_interferometer.grid,
+                transformer=masked_interferometer.transformer,
+                analytic_visibilities=masked_interferometer.settings.analytic_visibilities,
+            )
+
+            if self._profile_visibilities_of_galaxies:
+                self.profile_visibilities = sum(self._profile_visibilities_of_galaxies)
+            else:
+                self.profile_visibilities = plane.profile_visibilities_from_grid_and_transformer(
+                    grid=masked_interferometer.grid,
+                    transformer=masked_interferometer.transformer,
+                )
 
         self.profile_subtracted_visibilities = (
             masked_interferometer.visibilities - self.profile_visibilities
@@ -235,14 +284,15 @@ class FitInterferometer(aa_fit.FitInterferometer):
 
         else:
 
-            inversion = plane.inversion_interferometer_from_grid_and_data(
-                grid=masked_interferometer.grid_inversion,
-                visibilities=self.profile_subtracted_visibilities,
-                noise_map=noise_map,
-                transformer=masked_interferometer.transformer,
-                settings_pixelization=settings_pixelization,
-                settings_inversion=settings_inversion,
-            )
+            with profiling_util.timer(stage="inversion"):
+                inversion = plane.inversion_interferometer_from_grid_and_data(
+                    grid=masked_interferometer.grid_inversion,
+                    visibilities=self.profile_subtracted_visibilities,
+                    noise_map=noise_map,
+                    transformer=masked_interferometer.transformer,
+                    settings_pixelization=settings_pixelization,
+                    settings_inversion=settings_inversion,
+                )
 
             model_visibilities = (
                 self.profile_visibilities + inversion.mapped_reconstructed_visibilities
@@ -286,14 +336,25 @@ class FitInterferometer(aa_fit.FitInterferometer):
 
         return galaxy_model_image_dict
 
+    @property
+    def profile_visibilities_of_galaxies(self):
+        """
+        The profile visibilities of every galaxy in the plane, which are transformed in one batch (see
+        *Plane.profile_visibilities_of_galaxies_from_grid_and_transformer*).
+
+        These are computed once when the fit is created and summed to give the `profile_visibilities`, such that
+        the images of the plane's galaxies are not transformed again for the `galaxy_model_visibilities_dict` and
+        `model_visibilities_of_galaxies`.
+        """
+        return self._profile_visibilities_of_galaxies
+
     @property
     def galaxy_model_visibilities_dict(self) -> {g.Galaxy: np.ndarray}:
         """
         A dictionary associating galaxies with their corresponding model images
         """
-        galaxy_model_visibilities_dict = self.plane.galaxy_profile_visibilities_dict_from_grid_and_transformer(
-            grid=self.masked_interferometer.grid,
-            transformer=self.masked_interferometer.transformer,
+        galaxy_model_visibilities_dict = dict(
+            zip(self.galaxies, self.profile_visibilities_of_galaxies)
         )
 
         # TODO : Extend to multiple inversioons across Planes
@@ -310,18 +371,16 @@ class FitInterferometer(aa_fit.FitInterferometer):
 
     def model_visibilities_of_galaxies(self):
 
-        model_visibilities_of_galaxies = self.plane.profile_visibilities_of_galaxies_from_grid_and_transformer(
-            grid=self.masked_interferometer.grid,
-            transformer=self.masked_interferometer.transformer,
-        )
+        model_visibilities_of_galaxies = list(self.profile_visibilities_of_galaxies)
 
         for (galaxy_index, galaxy) in enumerate(self.galaxies):
 
             if galaxy.has_pixelization:
 
-                model_visibilities_of_galaxies[
-                    galaxy_index
-                ] += self.inversion.mapped_reconstructed_image
+                model_visibilities_of_galaxies[galaxy_index] = (
+                    model_visibilities_of_galaxies[galaxy_index]
+                    + self.inversion.mapped_reconstructed_visibilities
+                )
 
         return model_visibilities_of_galaxies
 
@@ -330,6 +389,491 @@ class FitInterferometer(aa_fit.FitInterferometer):
         return 1
 
 
+precision_dtypes = {
+    "float64": ("float64", "complex128"),
+    "float32": ("float32", "complex64"),
+}
+
+
+def structure_with_precision(structure, dtype):
+    """
+    Returns a structure (e.g. an `Array`, `Grid` or `Visibilities`) converted to an input dtype, where the structure
+    is returned unchanged if it already has this dtype (such that its identity is retained, which the `GalaxyCache`
+    uses to recognise the masked dataset's grids). Converted grids are registered with a `GalaxyCache` via
+    `GalaxyCache.register_grids`.
+    """
+    if structure is None or structure.dtype == dtype:
+        return structure
+    return structure.astype(dtype)
+
+
+def psf_matrix_from(
+    frame_1d_indexes, frame_1d_kernels, frame_1d_lengths, total_image_pixels
+):
+    """
+    Returns the sparse matrix of the frames of a `Convolver`, whose product with an ndarray of images (one image per
+    column) is their PSF convolved images.
+
+    Column i of the matrix is the blurred image of a unit value in pixel i, therefore the matrix multiplication
+    performs the same sums as the `Convolver`'s `convolve_jit` function for every image in one operation.
+
+    Parameters
+    ----------
+    frame_1d_indexes : np.ndarray
+        The 1D indexes of the image pixels every pixel's light is blurred into.
+    frame_1d_kernels : np.ndarray
+        The PSF kernel values of every pixel's frame.
+    frame_1d_lengths : np.ndarray
+        The number of image pixels in every pixel's frame.
+    total_image_pixels : int
+        The number of unmasked pixels of the blurred images.
+    """
+    in_frame = np.arange(frame_1d_indexes.shape[1])[None, :] < frame_1d_lengths[:, None]
+
+    return sparse.csr_matrix(
+        (
+            frame_1d_kernels[in_frame],
+            (
+                frame_1d_indexes[in_frame],
+                np.repeat(np.arange(frame_1d_indexes.shape[0]), frame_1d_lengths),
+            ),
+        ),
+        shape=(total_image_pixels, frame_1d_indexes.shape[0]),
+    )
+
+
+class AbstractLikelihoodWorkspace:
+    def __init__(self, masked_dataset, precision="float64"):
+        """
+        Abstract base class of the likelihood workspaces, which compute the log likelihood of a fit using buffers that
+        are allocated once (see `LikelihoodWorkspaceImaging`).
+
+        The `precision` of a workspace sets the dtype the image of the plane (and therefore every light profile) is
+        evaluated in and the dtype of the residual-map and chi-squared-map buffers. For a precision of "float32" the
+        grids and data of the masked dataset are stored as float32 (or complex64) copies, halving the memory
+        bandwidth of every likelihood evaluation. The chi-squared and noise normalization are always summed in float64.
+
+        Parameters
+        ----------
+        masked_dataset : MaskedImaging or MaskedInterferometer
+            The masked dataset that is fitted.
+        precision : str
+            The precision of the evaluation, "float64" or "float32".
+        """
+        if precision not in precision_dtypes:
+            raise exc.PrecisionException(
+                f"The precision {precision} of a likelihood workspace must be one of {list(precision_dtypes)}"
+            )
+
+        self.masked_dataset = masked_dataset
+        self.precision = precision
+        self.dtype, self.complex_dtype = precision_dtypes[precision]
+
+        self.grid = structure_with_precision(
+            structure=masked_dataset.grid, dtype=self.dtype
+        )
+
+        self._workspace_float64 = None
+
+    def log_likelihood_from_plane(self, plane, **kwargs) -> float:
+        raise NotImplementedError()
+
+    @property
+    def workspace_float64(self):
+        """
+        A workspace of the same masked dataset using float64 precision, which is the reference the errors of lower
+        precision log likelihoods are measured against.
+        """
+        if self.precision == "float64":
+            return self
+
+        if self._workspace_float64 is None:
+            self._workspace_float64 = self.__class__(self.masked_dataset)
+
+        return self._workspace_float64
+
+    def log_likelihood_precision_error_from_plane(self, plane, **kwargs) -> dict:
+        """
+        Returns a report of the error in the log likelihood of a plane's fit caused by the workspace's precision,
+        which is used to check a lower precision is sufficiently accurate for a model before using it in a phase.
+
+        The report is a dictionary containing the log likelihoods computed in float64 and the workspace's precision
+        and their absolute and relative differences.
+
+        Parameters
+        ----------
+        plane : Plane
+            The plane of galaxies whose fit's log likelihood is computed.
+        kwargs
+            The hyper components passed to `log_likelihood_from_plane`.
+        """
+        log_likelihood = self.workspace_float64.log_likelihood_from_plane(
+            plane=plane, **kwargs
+        )
+        log_likelihood_precision = self.log_likelihood_from_plane(plane=plane, **kwargs)
+
+        absolute_error = abs(log_likelihood_precision - log_likelihood)
+
+        return {
+            "precision": self.precision,
+            "log_likelihood_float64": log_likelihood,
+            "log_likelihood": log_likelihood_precision,
+            "absolute_error": absolute_error,
+            "relative_error": absolute_error / abs(log_likelihood)
+            if log_likelihood != 0.0
+            else 0.0,
+        }
+
+
+class LikelihoodWorkspaceImaging(AbstractLikelihoodWorkspace):
+    def __init__(self, masked_imaging, precision="float64"):
+        """
+        Computes the log likelihood of a plane's fit to a masked imaging dataset without creating a `FitImaging`
+        object, which is used by a phase's `Analysis` to perform model-fitting.
+
+        A `FitImaging` creates the residual-map, chi-squared-map, etc. of the fit as new `Array` objects, which are
+        required for visualization and results but not by the `log_likelihood_function`. The workspace instead
+        computes these quantities using buffers which are allocated once and reused for every likelihood evaluation,
+        and stores the noise normalization of the masked imaging's noise-map (which only changes if hyper-galaxies or
+        a hyper background noise are fitted).
+
+        Fits using an `Inversion` are not supported and must use a `FitImaging`.
+
+        Parameters
+        ----------
+        masked_imaging : MaskedImaging
+            The masked imaging dataset that is fitted.
+        precision : str
+            The precision of the evaluation, "float64" or "float32" (see `AbstractLikelihoodWorkspace`).
+        """
+        super().__init__(masked_dataset=masked_imaging, precision=precision)
+
+        self.masked_imaging = masked_imaging
+
+        self.blurring_grid = structure_with_precision(
+            structure=masked_imaging.blurring_grid, dtype=self.dtype
+        )
+        self.image = structure_with_precision(
+            structure=masked_imaging.image, dtype=self.dtype
+        )
+        self.noise_map = structure_with_precision(
+            structure=masked_imaging.noise_map, dtype=self.dtype
+        )
+
+        self.residual_map = np.zeros(masked_imaging.image.shape, dtype=self.dtype)
+        self.chi_squared_map = np.zeros(masked_imaging.image.shape, dtype=self.dtype)
+
+        self.noise_normalization = noise_normalization_from(
+            noise_map=masked_imaging.noise_map
+        )
+
+        self._psf_matrices = None
+
+    @property
+    def psf_matrices(self):
+        """
+        The sparse matrices which blur a batch of images and blurring images with the PSF of the masked imaging's
+        `Convolver` (see `psf_matrix_from`), which are created the first time a batch is fitted.
+        """
+        if self._psf_matrices is None:
+
+            convolver = self.masked_imaging.convolver
+            total_image_pixels = convolver.image_frame_1d_indexes.shape[0]
+
+            self._psf_matrices = (
+                psf_matrix_from(
+                    frame_1d_indexes=convolver.image_frame_1d_indexes,
+                    frame_1d_kernels=convolver.image_frame_1d_kernels,
+                    frame_1d_lengths=convolver.image_frame_1d_lengths,
+                    total_image_pixels=total_image_pixels,
+                ).astype(self.dtype),
+                psf_matrix_from(
+                    frame_1d_indexes=convolver.blurring_frame_1d_indexes,
+                    frame_1d_kernels=convolver.blurring_frame_1d_kernels,
+                    frame_1d_lengths=convolver.blurring_frame_1d_lengths,
+                    total_image_pixels=total_image_pixels,
+                ).astype(self.dtype),
+            )
+
+        return self._psf_matrices
+
+    def log_likelihood_from_plane(
+        self, plane, hyper_image_sky=None, hyper_background_noise=None
+    ) -> float:
+        """
+        Returns the log likelihood of the plane's fit to the masked imaging, which is identical to the
+        `log_likelihood` of the corresponding `FitImaging`.
+
+        Parameters
+        ----------
+        plane : Plane
+            The plane of galaxies whose blurred image fits the masked imaging.
+        hyper_image_sky : HyperImageSky
+            If input, the background sky level added to the image before fitting.
+        hyper_background_noise : HyperBackgroundNoise
+            If input, the background noise level added to the noise-map before fitting.
+        """
+        with profiling_util.timer(stage="blurred_image"):
+            model_image = plane.blurred_image_from_grid_and_convolver(
+                grid=self.grid,
+                convolver=self.masked_imaging.convolver,
+                blurring_grid=self.blurring_grid,
+                psf_gaussians=self.masked_imaging.psf_gaussians,
+            )
+
+        if self.masked_imaging.super_pixels is not None:
+            model_image = self.masked_imaging.super_pixels.binned_array_from(
+                array=model_image
+            )
+
+        image = hyper_image_from_image_and_hyper_image_sky(
+            image=self.image, hyper_image_sky=hyper_image_sky
+        )
+
+        if plane.has_hyper_galaxy or hyper_background_noise is not None:
+
+            noise_map = hyper_noise_map_from_noise_map_plane_and_hyper_background_noise(
+                noise_map=self.noise_map,
+                plane=plane,
+                hyper_background_noise=hyper_background_noise,
+            )
+
+            noise_normalization = noise_normalization_from(noise_map=noise_map)
+
+        else:
+
+            noise_map = self.noise_map
+            noise_normalization = self.noise_normalization
+
+        with profiling_util.timer(stage="chi_squared"):
+
+            np.subtract(image, model_image, out=self.residual_map)
+            np.divide(self.residual_map, noise_map, out=self.chi_squared_map)
+            np.square(self.chi_squared_map, out=self.chi_squared_map)
+
+            chi_squared = float(np.sum(self.chi_squared_map, dtype="float64"))
+
+        return float(-0.5 * (chi_squared + noise_normalization))
+
+    def log_likelihood_batch_from_planes(
+        self, planes, hyper_image_skies=None, hyper_background_noises=None
+    ) -> np.ndarray:
+        """
+        Returns the log likelihood of the fit of every plane in a batch to the masked imaging, which are identical
+        to the values returned by `log_likelihood_from_plane` for each plane.
+
+        The images and blurring images of the planes are stacked and convolved with the PSF in one sparse matrix
+        multiplication (see `psf_matrices`), and the residual-maps and chi-squareds of the batch are computed as
+        single array operations. Planes which are convolved analytically with the PSF Gaussians or use a
+        `GalaxyCache` compute their blurred image individually.
+
+        Parameters
+        ----------
+        planes : [Plane]
+            The planes of galaxies whose blurred images fit the masked imaging.
+        hyper_image_skies : [HyperImageSky] or None
+            The background sky level added to the image for the fit of every plane.
+        hyper_background_noises : [HyperBackgroundNoise] or None
+            The background noise level added to the noise-map for the fit of every plane.
+        """
+        total_planes = len(planes)
+
+        if hyper_image_skies is None:
+            hyper_image_skies = [None] * total_planes
+
+        if hyper_background_noises is None:
+            hyper_background_noises = [None] * total_planes
+
+        psf_gaussians = self.masked_imaging.psf_gaussians
+
+        model_images = np.zeros((total_planes, self.image.shape[0]), dtype=self.dtype)
+
+        convolved_indexes = [
+            index
+            for index, plane in enumerate(planes)
+            if plane.galaxy_cache is None
+            and not (psf_gaussians is not None and plane.has_analytic_psf_convolution)
+        ]
+
+        for index, plane in enumerate(planes):
+
+            if index not in convolved_indexes:
+
+                model_images[index] = plane.blurred_image_from_grid_and_convolver(
+                    grid=self.grid,
+                    convolver=self.masked_imaging.convolver,
+                    blurring_grid=self.blurring_grid,
+                    psf_gaussians=psf_gaussians,
+                )
+
+        if convolved_indexes:
+
+            images = np.stack(
+                [
+                    np.asarray(planes[index].binned_image_from_grid(grid=self.grid))
+                    for index in convolved_indexes
+                ],
+                axis=1,
+            )
+            blurring_images = np.stack(
+                [
+                    np.asarray(
+                        planes[index].binned_image_from_grid(grid=self.blurring_grid)
+                    )
+                    for index in convolved_indexes
+                ],
+                axis=1,
+            )
+
+            psf_matrix, blurring_psf_matrix = self.psf_matrices
+
+            model_images[convolved_indexes] = (
+                psf_matrix @ images + blurring_psf_matrix @ blurring_images
+            ).T
+
+        if self.masked_imaging.super_pixels is not None:
+
+            for index in range(total_planes):
+                model_images[index] = self.masked_imaging.super_pixels.binned_from(
+                    values=model_images[index]
+                )[self.masked_imaging.super_pixels.super_pixel_indexes]
+
+        images = np.stack(
+            [
+                hyper_image_from_image_and_hyper_image_sky(
+                    image=self.image, hyper_image_sky=hyper_image_sky
+                )
+                for hyper_image_sky in hyper_image_skies
+            ]
+        )
+
+        noise_maps = np.zeros(model_images.shape, dtype=self.dtype)
+        noise_normalizations = np.zeros(total_planes)
+
+        for index, (plane, hyper_background_noise) in enumerate(
+            zip(planes, hyper_background_noises)
+        ):
+
+            if plane.has_hyper_galaxy or hyper_background_noise is not None:
+
+                noise_maps[
+                    index
+                ] = hyper_noise_map_from_noise_map_plane_and_hyper_background_noise(
+                    noise_map=self.noise_map,
+                    plane=plane,
+                    hyper_background_noise=hyper_background_noise,
+                )
+
+                noise_normalizations[index] = noise_normalization_from(
+                    noise_map=noise_maps[index]
+                )
+
+            else:
+
+                noise_maps[index] = self.noise_map
+                noise_normalizations[index] = self.noise_normalization
+
+        chi_squareds = np.sum(
+            np.square((images - model_images) / noise_maps), axis=1, dtype="float64"
+        )
+
+        return -0.5 * (chi_squareds + noise_normalizations)
+
+
+class LikelihoodWorkspaceInterferometer(AbstractLikelihoodWorkspace):
+    def __init__(self, masked_interferometer, precision="float64"):
+        """
+        Computes the log likelihood of a plane's fit to a masked interferometer dataset without creating a
+        `FitInterferometer` object, using buffers which are allocated once and reused for every likelihood evaluation
+        (see `LikelihoodWorkspaceImaging`).
+
+        Fits using an `Inversion` are not supported and must use a `FitInterferometer`.
+
+        Parameters
+        ----------
+        masked_interferometer : MaskedInterferometer
+            The masked interferometer dataset that is fitted.
+        precision : str
+            The precision of the evaluation, "float64" or "float32" (see `AbstractLikelihoodWorkspace`), where
+            the visibilities are evaluated as complex64 for "float32".
+        """
+        super().__init__(masked_dataset=masked_interferometer, precision=precision)
+
+        self.masked_interferometer = masked_interferometer
+
+        self.visibilities = structure_with_precision(
+            structure=masked_interferometer.visibilities, dtype=self.complex_dtype
+        )
+        self.noise_map = structure_with_precision(
+            structure=masked_interferometer.noise_map, dtype=self.complex_dtype
+        )
+
+        self.residual_map = np.zeros(
+            masked_interferometer.visibilities.shape, dtype=self.complex_dtype
+        )
+        self.chi_squared_map_real = np.zeros(
+            masked_interferometer.visibilities.shape, dtype=self.dtype
+        )
+        self.chi_squared_map_imag = np.zeros(
+            masked_interferometer.visibilities.shape, dtype=self.dtype
+        )
+
+        self.noise_normalization = noise_normalization_complex_from(
+            noise_map=masked_interferometer.noise_map
+        )
+
+    def log_likelihood_from_plane(self, plane, hyper_background_noise=None) -> float:
+        """
+        Returns the log likelihood of the plane's fit to the masked interferometer, which is identical to the
+        `log_likelihood` of the corresponding `FitInterferometer`.
+
+        Parameters
+        ----------
+        plane : Plane
+            The plane of galaxies whose visibilities fit the masked interferometer.
+        hyper_background_noise : HyperBackgroundNoise
+            If input, the background noise level added to the noise-map before fitting.
+        """
+        with profiling_util.timer(stage="profile_visibilities"):
+            model_visibilities = plane.profile_visibilities_from_grid_and_transformer(
+                grid=self.grid,
+                transformer=self.masked_interferometer.transformer,
+                analytic_visibilities=self.masked_interferometer.settings.analytic_visibilities,
+            )
+
+        if hyper_background_noise is not None:
+
+            noise_map = hyper_background_noise.hyper_noise_map_from_complex_noise_map(
+                noise_map=self.noise_map
+            )
+            noise_normalization = noise_normalization_complex_from(noise_map=noise_map)
+
+        else:
+
+            noise_map = self.noise_map
+            noise_normalization = self.noise_normalization
+
+        with profiling_util.timer(stage="chi_squared"):
+
+            np.subtract(self.visibilities, model_visibilities, out=self.residual_map)
+
+            np.divide(
+                self.residual_map.real, noise_map.real, out=self.chi_squared_map_real
+            )
+            np.square(self.chi_squared_map_real, out=self.chi_squared_map_real)
+
+            np.divide(
+                self.residual_map.imag, noise_map.imag, out=self.chi_squared_map_imag
+            )
+            np.square(self.chi_squared_map_imag, out=self.chi_squared_map_imag)
+
+            chi_squared = float(
+                np.sum(self.chi_squared_map_real, dtype="float64")
+            ) + float(np.sum(self.chi_squared_map_imag, dtype="float64"))
+
+        return float(-0.5 * (chi_squared + noise_normalization))
+
+
 def hyper_image_from_image_and_hyper_image_sky(image, hyper_image_sky):
 
     if hyper_image_sky is not None:
@@ -355,3 +899,17 @@ def hyper_noise_map_from_noise_map_plane_and_hyper_background_noise(
         noise_map[noise_map > noise_map_limit] = noise_map_limit
 
     return noise_map
+
+
+def noise_normalization_from(noise_map):
+
+    noise_map = np.asarray(noise_map, dtype="float64")
+
+    return float(np.sum(np.log(2 * np.pi * noise_map ** 2.0)))
+
+
+def noise_normalization_complex_from(noise_map):
+
+    noise_normalization_real = noise_normalization_from(noise_map=noise_map.real)
+    noise_normalization_imag = noise_normalization_from(noise_map=noise_map.imag)
+    return noise_normalization_real + noise_normalization_imag
@@ -6,8 +6,12 @@ from autoarray.structures import arrays, grids
 from autofit.mapper.model_object import ModelObject
 from autogalaxy import exc
 from autogalaxy import lensing
+from autogalaxy.dataset import grid_adaptive
+from autogalaxy.dataset import super_pixels as sp
 from autogalaxy.profiles import light_profiles as lp
 from autogalaxy.profiles import mass_profiles as mp
+from autogalaxy.util import grid_chunk_util
+from autogalaxy.util import profiling_util
 from autogalaxy.profiles.mass_profiles import (
     dark_mass_profiles as dmp,
     stellar_mass_profiles as smp,
@@ -120,6 +124,24 @@ class Galaxy(ModelObject, lensing.LensingObject):
     def has_light_profile(self):
         return len(self.light_profiles) > 0
 
+    @property
+    def has_analytic_psf_convolution(self):
+        return self.has_light_profile and all(
+            [
+                light_profile.has_analytic_psf_convolution
+                for light_profile in self.light_profiles
+            ]
+        )
+
+    @property
+    def has_analytic_visibilities(self):
+        return self.has_light_profile and all(
+            [
+                light_profile.has_analytic_visibilities
+                for light_profile in self.light_profiles
+            ]
+        )
+
     @property
     def has_mass_profile(self):
         return len(self.mass_profiles) > 0
@@ -367,35 +389,190 @@ class Galaxy(ModelObject, lensing.LensingObject):
             The (y, x) coordinates in the original reference frame of the grid.
 
         """
+        return self.image_from_ndarray(grid=grid)
+
+    def image_from_ndarray(self, grid):
+        """
+        Returns the summed image of all of the galaxy's light profiles on an ndarray of (y,x) coordinates as an
+        ndarray, using the *image_from_ndarray* method of every light profile such that the image is only converted
+        to a grid_like structure once (by *image_from_grid*).
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
         if self.has_light_profile:
-            return sum(map(lambda p: p.image_from_grid(grid=grid), self.light_profiles))
+            with profiling_util.timer(stage="galaxy", obj=self):
+                return sum(
+                    map(
+                        lambda p: profiling_util.timed_call(
+                            func=p.image_from_ndarray,
+                            stage="light_profile",
+                            obj=p,
+                            grid=grid,
+                        ),
+                        self.light_profiles,
+                    )
+                )
         return np.zeros((grid.shape[0],))
 
+    def binned_image_from_grid(self, grid):
+        """
+        Returns the summed image of all of the galaxy's light profiles binned up from the sub-grid to the grid's
+        pixels.
+
+        If the grid has more unmasked pixels than the `grid_chunk_pixels` value in the `parallel` section of the
+        general config, the image is evaluated in chunks of this many pixels which are binned as they are computed,
+        such that the full sub-grid image (and its temporary arrays) is never created (see `grid_chunk_util`).
+
+        If the grid is a `GridAdaptive`, the sub-size of every pixel is adapted to the galaxy's light profile
+        centres and the local curvature of its image.
+
+        If the grid is a `GridSuperPixels`, the galaxy's image is evaluated once in every super-pixel of more than one
+        pixel (see `SuperPixels`).
+
+        Parameters
+        ----------
+        grid : grid_like
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        if isinstance(grid, (grid_adaptive.GridAdaptive, sp.GridSuperPixels)):
+            return grid.binned_array_from_func(
+                func=lambda sub_grid: self.image_from_ndarray(grid=sub_grid),
+                light_profile_centres=self.light_profile_centres,
+            )
+
+        if grid_chunk_util.use_chunks_for_grid(grid=grid):
+            return grid_chunk_util.binned_array_from_func_and_grid(
+                func=lambda sub_grid: self.image_from_ndarray(grid=sub_grid), grid=grid
+            )
+
+        return self.image_from_grid(grid=grid).in_1d_binned
+
     def blurred_image_from_grid_and_psf(self, grid, psf, blurring_grid=None):
 
-        image = self.image_from_grid(grid=grid)
+        image = self.binned_image_from_grid(grid=grid)
 
-        blurring_image = self.image_from_grid(grid=blurring_grid)
+        blurring_image = self.binned_image_from_grid(grid=blurring_grid)
 
         return psf.convolved_array_from_array_2d_and_mask(
             array_2d=image.in_2d_binned + blurring_image.in_2d_binned, mask=grid.mask
         )
 
-    def blurred_image_from_grid_and_convolver(self, grid, convolver, blurring_grid):
+    def blurred_image_from_grid_and_convolver(
+        self, grid, convolver, blurring_grid, psf_gaussians=None
+    ):
+        """
+        Returns the image of the galaxy's light profiles blurred by the PSF of a `Convolver`.
 
-        image = self.image_from_grid(grid=grid)
+        If the PSF is also represented by Gaussians and every light profile of the galaxy can be convolved with them
+        analytically, the image of the PSF convolved galaxy (see *psf_convolved_galaxy_from*) is returned instead,
+        which does not use the convolver or the blurring grid.
 
-        blurring_image = self.image_from_grid(grid=blurring_grid)
+        Parameters
+        ----------
+        grid : grid_like
+            The (y, x) coordinates in the original reference frame of the grid.
+        convolver : Convolver
+            The convolver which blurs the image with the PSF.
+        blurring_grid : grid_like
+            The grid of coordinates outside the mask whose light is blurred into the mask.
+        psf_gaussians : PSFGaussians or None
+            The Gaussians representing the PSF, used for analytic convolution.
+        """
+        if psf_gaussians is not None and self.has_analytic_psf_convolution:
+            return self.psf_convolved_galaxy_from(
+                psf_gaussians=psf_gaussians
+            ).binned_image_from_grid(grid=grid)
+
+        image = self.binned_image_from_grid(grid=grid)
 
-        return convolver.convolved_image_from_image_and_blurring_image(
-            image=image.in_1d_binned, blurring_image=blurring_image.in_1d_binned
+        blurring_image = self.binned_image_from_grid(grid=blurring_grid)
+
+        return profiling_util.timed_call(
+            func=convolver.convolved_image_from_image_and_blurring_image,
+            stage="convolution",
+            image=image,
+            blurring_image=blurring_image,
         )
 
-    def profile_visibilities_from_grid_and_transformer(self, grid, transformer):
+    def psf_convolved_galaxy_from(self, psf_gaussians):
+        """
+        Returns a galaxy whose light profiles are the Gaussians of this galaxy's light profiles analytically convolved
+        with a PSF represented by Gaussians (see *LightProfile.gaussians_convolved_with*), such that its unblurred
+        image is this galaxy's blurred image.
 
-        image = self.image_from_grid(grid=grid)
+        Parameters
+        ----------
+        psf_gaussians : PSFGaussians
+            The Gaussians representing the PSF.
+        """
+        gaussians = [
+            gaussian
+            for light_profile in self.light_profiles
+            for gaussian in light_profile.gaussians_convolved_with(
+                psf_gaussians=psf_gaussians
+            )
+        ]
+
+        return Galaxy(
+            redshift=self.redshift,
+            **{
+                f"light_profile_{index}": gaussian
+                for index, gaussian in enumerate(gaussians)
+            },
+        )
 
-        return transformer.visibilities_from_image(image=image.in_1d_binned)
+    def visibilities_from_uv_wavelengths(self, uv_wavelengths, pixel_scales):
+        """
+        Returns the summed visibilities of the galaxy's light profiles evaluated analytically at every (u,v) baseline
+        (see *LightProfile.visibilities_from_uv_wavelengths*).
+
+        Parameters
+        ----------
+        uv_wavelengths : np.ndarray
+            The (u,v) baselines of the interferometer in units of wavelengths.
+        pixel_scales : (float, float)
+            The (y,x) arc-second to pixel scales of the real-space grid the transformer maps images from.
+        """
+        return sum(
+            map(
+                lambda light_profile: light_profile.visibilities_from_uv_wavelengths(
+                    uv_wavelengths=uv_wavelengths, pixel_scales=pixel_scales
+                ),
+                self.light_profiles,
+            )
+        )
+
+    def profile_visibilities_from_grid_and_transformer(
+        self, grid, transformer, analytic_visibilities=False
+    ):
+        """
+        Returns the visibilities of the galaxy's light profiles, which are the transform of their image evaluated on
+        a grid or, if analytic visibilities are switched on and every light profile supports it, computed
+        analytically at the transformer's baselines (see *visibilities_from_uv_wavelengths*).
+
+        Parameters
+        ----------
+        grid : grid_like
+            The (y, x) coordinates in the original reference frame of the grid.
+        transformer : TransformerDFT or TransformerNUFFT
+            The transformer which maps the image to the uv-plane.
+        analytic_visibilities : bool
+            Whether the visibilities are computed analytically if every light profile supports it.
+        """
+        if analytic_visibilities and self.has_analytic_visibilities:
+            return self.visibilities_from_uv_wavelengths(
+                uv_wavelengths=transformer.uv_wavelengths,
+                pixel_scales=transformer.real_space_mask.pixel_scales,
+            )
+
+        image = self.binned_image_from_grid(grid=grid)
+
+        return profiling_util.timed_call(
+            func=transformer.visibilities_from_image, stage="transform", image=image
+        )
 
     def luminosity_within_circle(self, radius: float):
         """
@@ -429,7 +606,8 @@ class Galaxy(ModelObject, lensing.LensingObject):
         
         See *profiles.mass_profiles* module for details of how this is performed.
 
-        The `grid_like_to_structure` decorator reshapes the NumPy arrays the convergence is outputted on. See \
+        The convergence of every mass profile is computed as an ndarray (see *MassProfile.convergence_from_ndarray*)
+        and the `grid_like_to_structure` decorator reshapes their sum to the structure of the input grid once. See \
         *aa.grid_like_to_structure* for a description of the output.
 
         Parameters
@@ -440,7 +618,7 @@ class Galaxy(ModelObject, lensing.LensingObject):
         """
         if self.has_mass_profile:
             return sum(
-                map(lambda p: p.convergence_from_grid(grid=grid), self.mass_profiles)
+                map(lambda p: p.convergence_from_ndarray(grid=grid), self.mass_profiles)
             )
         return np.zeros((grid.shape[0],))
 
@@ -486,7 +664,7 @@ class Galaxy(ModelObject, lensing.LensingObject):
         """
         if self.has_mass_profile:
             return sum(
-                map(lambda p: p.deflections_from_grid(grid=grid), self.mass_profiles)
+                map(lambda p: p.deflections_from_ndarray(grid=grid), self.mass_profiles)
             )
         return np.zeros((grid.shape[0], 2))
 
@@ -0,0 +1,251 @@
+from collections import OrderedDict
+import threading
+
+import numpy as np
+
+
+def profile_key_from(profile) -> tuple:
+    """
+    Returns a hashable key describing a light or mass profile, composed of its class name and the values of all of its
+    attributes (e.g. its centre, elliptical components, intensity, etc.).
+
+    Two profiles of the same class with identical parameter values therefore return the same key, even if they are
+    different Python objects (which is the case for every model instance created by a `NonLinearSearch`). Private
+    attributes (those whose name begins with an underscore) are not parameters and are omitted from the key.
+
+    Parameters
+    ----------
+    profile : LightProfile or MassProfile
+        The profile whose key is computed.
+    """
+    return (
+        profile.__class__.__name__,
+        tuple(
+            (name, hashable_from(value=value))
+            for name, value in sorted(profile.__dict__.items())
+            if not name.startswith("_")
+        ),
+    )
+
+
+def galaxy_key_from(galaxy) -> tuple:
+    """
+    Returns a hashable key describing a galaxy, composed of its redshift and the keys of all of its light and mass
+    profiles (see `profile_key_from`).
+
+    Parameters
+    ----------
+    galaxy : Galaxy
+        The galaxy whose key is computed.
+    """
+    return (
+        galaxy.redshift,
+        tuple(profile_key_from(profile=profile) for profile in galaxy.light_profiles),
+        tuple(profile_key_from(profile=profile) for profile in galaxy.mass_profiles),
+    )
+
+
+def hashable_from(value):
+    """
+    Convert an attribute of a profile to a hashable value, so it can be used in a key of the `GalaxyCache`.
+    """
+    if isinstance(value, np.ndarray):
+        return value.tobytes()
+    if isinstance(value, (list, tuple)):
+        return tuple(hashable_from(value=item) for item in value)
+    if isinstance(value, dict):
+        return tuple(
+            (key, hashable_from(value=item)) for key, item in sorted(value.items())
+        )
+    try:
+        hash(value)
+    except TypeError:
+        return id(value)
+    return value
+
+
+class GalaxyCache:
+    def __init__(self, masked_dataset, max_size: int = 100):
+        """
+        A bounded least-recently-used (LRU) cache of the blurred images and deflection angles of individual galaxies,
+        computed on the grids of a masked dataset.
+
+        When a `NonLinearSearch` only varies the parameters of some galaxies between consecutive likelihood
+        evaluations (e.g. slice sampling one dimension at a time), the blurred images of the other galaxies are
+        identical to the previous evaluation. A `Plane` which is passed a `GalaxyCache` looks up these quantities
+        in the cache before computing them.
+
+        Entries are keyed on the parameter values of every profile in the galaxy (see `galaxy_key_from`) and the
+        identity and dtype of the masked dataset grids they are computed on. Copies of these grids (e.g. the float32
+        grids of a likelihood workspace) use the cache if they are registered (see `register_grids`). Quantities
+        computed on any other grid (e.g. a `Grid` created for visualization) bypass the cache.
+
+        Parameters
+        ----------
+        masked_dataset : MaskedImaging or MaskedInterferometer
+            The masked dataset whose grids, blurring grid and convolver cached quantities are computed using.
+        max_size : int
+            The maximum number of entries stored in the cache, after which the least recently used entry is removed.
+        """
+        self.masked_dataset = masked_dataset
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+
+        self._registered_grids = []
+
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        """
+        The cached values and lock are not pickled (e.g. when the analysis is sent to another process), such that
+        the unpickled cache starts empty.
+        """
+        state = self.__dict__.copy()
+        del state["_cache"], state["_lock"]
+
+        return state
+
+    def __setstate__(self, state):
+
+        self.__dict__.update(state)
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._cache)
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The fraction of look ups in the cache that returned a previously computed value.
+        """
+        total = self.hits + self.misses
+
+        if total == 0:
+            return 0.0
+
+        return self.hits / total
+
+    def reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        self._cache.clear()
+        self.reset_counters()
+
+    def register_grids(self, grid=None, blurring_grid=None):
+        """
+        Register copies of the masked dataset's grid and blurring grid, such that quantities computed on them use the
+        cache. This is used for the grids of a likelihood workspace with a precision of "float32", which are float32
+        copies of the masked dataset's grids (see `structure_with_precision`).
+
+        Parameters
+        ----------
+        grid : Grid or None
+            A copy of the masked dataset's grid.
+        blurring_grid : Grid or None
+            A copy of the masked dataset's blurring grid.
+        """
+        for registered_grid, grid_name in [
+            (grid, "grid"),
+            (blurring_grid, "blurring_grid"),
+        ]:
+            if registered_grid is not None:
+                self._registered_grids.append((registered_grid, grid_name))
+
+    def grid_name_from(self, grid):
+        """
+        Returns the name of the masked dataset grid the input grid corresponds to, or `None` if the input grid is not
+        one of the masked dataset's grids or a registered copy of them (see `register_grids`).
+        """
+        if grid is getattr(self.masked_dataset, "grid", None):
+            return "grid"
+        elif grid is getattr(self.masked_dataset, "blurring_grid", None):
+            return "blurring_grid"
+
+        for registered_grid, grid_name in self._registered_grids:
+            if grid is registered_grid:
+                return grid_name
+
+    def value_from(self, key, func):
+        """
+        Returns the value in the cache for the input key, computing it using the input function and storing it in the
+        cache if it is not present.
+
+        The cache may be used by a `Plane` computing its galaxies in parallel threads, therefore access to the cache
+        is locked (but the function computing a value is not).
+        """
+        with self._lock:
+            if key in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+            self.misses += 1
+
+        value = func()
+
+        with self._lock:
+            self._cache[key] = value
+
+            if len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+        return value
+
+    def blurred_image_of_galaxy_from_grid_and_convolver(
+        self, galaxy, grid, convolver, blurring_grid
+    ):
+        """
+        Returns the blurred image of a galaxy, computed using the `Galaxy.blurred_image_from_grid_and_convolver` method
+        if it is not already in the cache.
+        """
+
+        def func():
+            return galaxy.blurred_image_from_grid_and_convolver(
+                grid=grid, convolver=convolver, blurring_grid=blurring_grid
+            )
+
+        if (
+            self.grid_name_from(grid=grid) != "grid"
+            or self.grid_name_from(grid=blurring_grid) != "blurring_grid"
+            or convolver is not getattr(self.masked_dataset, "convolver", None)
+        ):
+            return func()
+
+        key = (
+            "blurred_image",
+            id(self.masked_dataset),
+            str(grid.dtype),
+            galaxy_key_from(galaxy=galaxy),
+        )
+
+        return self.value_from(key=key, func=func)
+
+    def deflections_of_galaxy_from_grid(self, galaxy, grid):
+        """
+        Returns the deflection angles of a galaxy, computed using the `Galaxy.deflections_from_grid` method if they
+        are not already in the cache.
+        """
+
+        def func():
+            return galaxy.deflections_from_grid(grid=grid)
+
+        grid_name = self.grid_name_from(grid=grid)
+
+        if grid_name is None:
+            return func()
+
+        key = (
+            "deflections",
+            id(self.masked_dataset),
+            grid_name,
+            str(grid.dtype),
+            galaxy_key_from(galaxy=galaxy),
+        )
+
+        return self.value_from(key=key, func=func)
@@ -1,7 +1,6 @@
 import numpy as np
 from autoarray.structures import arrays, grids
 from autoarray.util import array_util
-from skimage import measure
 from functools import wraps
 
 
@@ -202,6 +201,8 @@ class LensingObject:
     @evaluation_grid
     def tangential_critical_curve_from_grid(self, grid, pixel_scale=0.05):
 
+        from skimage import measure
+
         tangential_eigen_values = self.tangential_eigen_value_from_grid(grid=grid)
 
         tangential_critical_curve_indices = measure.find_contours(
@@ -224,6 +225,8 @@ class LensingObject:
     @evaluation_grid
     def radial_critical_curve_from_grid(self, grid, pixel_scale=0.05):
 
+        from skimage import measure
+
         radial_eigen_values = self.radial_eigen_value_from_grid(grid=grid)
 
         radial_critical_curve_indices = measure.find_contours(
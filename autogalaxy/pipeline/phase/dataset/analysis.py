@@ -1,11 +1,21 @@
 import autofit as af
+from autoconf import conf
+from autogalaxy.dataset import dataset_store as ds
 from autogalaxy.pipeline.phase.abstract import analysis as abstract_analysis
 from autogalaxy.galaxy import galaxy as g
+from autogalaxy.galaxy import galaxy_cache as gc
 from autogalaxy.plane import plane as pl
+from autogalaxy.pipeline import visualization_queue as vq
+from autogalaxy.pipeline.phase.dataset import likelihood_pool as lp
+from autogalaxy.util import profiling_util
+from autofit.exc import FitException
+
+import json
+import os
+import time
 
 import numpy as np
 import pickle
-import dill
 
 
 def last_result_with_use_as_hyper_dataset(results):
@@ -25,6 +35,13 @@ class Analysis(abstract_analysis.Analysis):
 
         self.masked_dataset = masked_dataset
 
+        if settings.galaxy_cache_size is not None:
+            self.galaxy_cache = gc.GalaxyCache(
+                masked_dataset=masked_dataset, max_size=settings.galaxy_cache_size
+            )
+        else:
+            self.galaxy_cache = None
+
         result = last_result_with_use_as_hyper_dataset(results=results)
 
         if result is not None:
@@ -37,6 +54,118 @@ class Analysis(abstract_analysis.Analysis):
             self.hyper_galaxy_image_path_dict = None
             self.hyper_model_image = None
 
+        self.visualize_in_background = conf.instance["general"]["parallel"][
+            "visualize_in_background"
+        ]
+        self.visualization_queue = None
+
+        self.likelihood_processes = settings.likelihood_processes
+        self.likelihood_pool = None
+
+    def __getstate__(self):
+
+        state = self.__dict__.copy()
+        state["visualization_queue"] = None
+        state["likelihood_pool"] = None
+
+        return state
+
+    def log_likelihood_batch(
+        self, instances, resample_figure_of_merit=-np.inf
+    ) -> np.ndarray:
+        """
+        Returns the log likelihood of every model instance of a batch, where an instance whose fit raises a
+        `FitException` is given the `resample_figure_of_merit`.
+
+        If the phase settings input `likelihood_processes`, the batch is evaluated by a `LikelihoodPool` of that
+        many worker processes, which is created the first time a batch is evaluated and reused until
+        `close_likelihood_pool` is called (which the phase does once its search is complete).
+
+        Parameters
+        ----------
+        instances : [af.ModelInstance]
+            The model instances which are fitted.
+        resample_figure_of_merit : float
+            The log likelihood returned for an instance whose fit raises a `FitException`.
+        """
+        if self.likelihood_processes is None or self.likelihood_processes < 2:
+
+            log_likelihoods = []
+
+            for instance in instances:
+
+                try:
+                    log_likelihoods.append(
+                        self.log_likelihood_function(instance=instance)
+                    )
+                except FitException:
+                    log_likelihoods.append(resample_figure_of_merit)
+
+            return np.array(log_likelihoods)
+
+        if self.likelihood_pool is None:
+            self.likelihood_pool = lp.LikelihoodPool(
+                analysis=self, number_of_processes=self.likelihood_processes
+            )
+
+        return self.likelihood_pool.log_likelihood_batch(
+            instances=instances, resample_figure_of_merit=resample_figure_of_merit
+        )
+
+    def close_likelihood_pool(self):
+        """
+        Shut down the `LikelihoodPool` used by `log_likelihood_batch`, if one was created.
+        """
+        if self.likelihood_pool is not None:
+
+            self.likelihood_pool.close()
+            self.likelihood_pool = None
+
+    def close_visualization_queue(self):
+        """
+        Wait for the visualizations of the `VisualizationQueue` used by `visualize_via_queue` to complete and shut
+        down its worker, if one was created.
+        """
+        if self.visualization_queue is not None:
+
+            visualization_queue = self.visualization_queue
+            self.visualization_queue = None
+
+            visualization_queue.close()
+
+    def visualize_via_queue(self, paths: af.Paths, instance, during_analysis) -> bool:
+        """
+        If the `visualize_in_background` value in the `parallel` section of the general config is `True`, hand the
+        visualization of an instance to a background worker process (see `VisualizationQueue`) and return `True`,
+        such that the `visualize` method returns without fitting the dataset itself.
+
+        The visualization at the end of the search (when `during_analysis` is `False`) waits for every queued
+        visualization to complete and shuts down the worker.
+
+        Parameters
+        ----------
+        paths : af.Paths
+            The paths of the phase, which the visualization is output to.
+        instance : af.ModelInstance
+            The model instance which is visualized.
+        during_analysis : bool
+            Whether the visualization is performed during the non-linear search or at its end.
+        """
+        if not self.visualize_in_background:
+            return False
+
+        if self.visualization_queue is None:
+            self.visualization_queue = vq.VisualizationQueue(analysis=self)
+
+        self.visualization_queue.visualize(
+            paths=paths, instance=instance, during_analysis=during_analysis
+        )
+
+        if not during_analysis:
+            self.close_visualization_queue()
+
+        return True
+
     def hyper_image_sky_for_instance(self, instance):
 
         if hasattr(instance, "hyper_image_sky"):
@@ -48,7 +177,7 @@ class Analysis(abstract_analysis.Analysis):
             return instance.hyper_background_noise
 
     def plane_for_instance(self, instance):
-        return pl.Plane(galaxies=instance.galaxies)
+        return pl.Plane(galaxies=instance.galaxies, galaxy_cache=self.galaxy_cache)
 
     def associate_hyper_images(self, instance: af.ModelInstance) -> af.ModelInstance:
         """
@@ -89,6 +218,97 @@ class Analysis(abstract_analysis.Analysis):
 
         return instance
 
+    def profile_log_likelihood_function(
+        self, model, paths: af.Paths, total_evaluations=10, seed=1
+    ) -> dict:
+        """
+        Time the `log_likelihood_function` for a number of random instances of a model and output the time spent in
+        every stage of the likelihood (e.g. the image of every galaxy and light profile class, the PSF convolution,
+        the inversion and the chi-squared, see `profiling_util`) to the files "profiling.json" and "profiling.txt" in
+        the phase's output folder.
+
+        The report also estimates the time a search takes to perform 10^4, 10^5 and 10^6 likelihood evaluations.
+
+        Parameters
+        ----------
+        model : af.ModelMapper
+            The model whose random instances are fitted.
+        paths : af.Paths
+            The paths of the phase, whose output folder the report is output to.
+        total_evaluations : int
+            The number of likelihood evaluations which are timed.
+        seed : int
+            The seed of the random unit vectors the instances are created from.
+        """
+        random_state = np.random.RandomState(seed)
+
+        instances = [
+            model.instance_from_unit_vector(
+                unit_vector=list(random_state.uniform(0.1, 0.9, model.prior_count))
+            )
+            for _ in range(total_evaluations)
+        ]
+
+        with profiling_util.profiling() as profiler:
+
+            start = time.perf_counter()
+
+            for instance in instances:
+
+                profiler.galaxy_names = {
+                    id(galaxy): ".".join(galaxy_path)
+                    for galaxy_path, galaxy in instance.path_instance_tuples_for_class(
+                        g.Galaxy
+                    )
+                }
+
+                try:
+                    self.log_likelihood_function(instance=instance)
+                except FitException:
+                    pass
+
+            seconds = time.perf_counter() - start
+
+        seconds_per_evaluation = seconds / total_evaluations
+
+        report = {
+            "evaluations": total_evaluations,
+            "seconds": seconds,
+            "seconds_per_evaluation": seconds_per_evaluation,
+            "estimated_search_seconds": {
+                str(evaluations): evaluations * seconds_per_evaluation
+                for evaluations in [10000, 100000, 1000000]
+            },
+            "stages": profiler.stages,
+        }
+
+        os.makedirs(paths.output_path, exist_ok=True)
+
+        with open(os.path.join(paths.output_path, "profiling.json"), "w+") as f:
+            json.dump(report, f, indent=4)
+
+        with open(os.path.join(paths.output_path, "profiling.txt"), "w+") as f:
+
+            f.write(
+                f"{total_evaluations} likelihood evaluations: "
+                f"{seconds_per_evaluation:.6f} s per evaluation\n\n"
+            )
+
+            for name, stage in report["stages"].items():
+                f.write(
+                    f"{name:<60} {stage['seconds'] / total_evaluations:12.6f} s "
+                    f"{stage['calls']:>10} calls\n"
+                )
+
+            f.write("\n")
+
+            for evaluations, estimate in report["estimated_search_seconds"].items():
+                f.write(
+                    f"Estimated search time ({evaluations} evaluations): {estimate:.1f} s\n"
+                )
+
+        return report
+
     def save_attributes_for_aggregator(self, paths: af.Paths):
 
         self.save_dataset(paths=paths)
@@ -96,19 +316,35 @@ class Analysis(abstract_analysis.Analysis):
         self.save_settings(paths=paths)
         self.save_attributes(paths=paths)
 
+    @property
+    def dataset_store(self) -> ds.DatasetStore:
+        """
+        The store the datasets and masks of all phases in the output folder are saved to, such that a dataset fitted
+        by many phases is stored once.
+        """
+        return ds.DatasetStore(
+            directory=os.path.join(conf.instance.output_path, "dataset_store")
+        )
+
     def save_dataset(self, paths: af.Paths):
         """
-        Save the dataset associated with the phase
+        Save the dataset associated with the phase to the dataset store, with a reference to it in the phase's
+        pickles folder (dataset.json, alongside a dataset.pickle which unpickles to the dataset).
         """
-        with open(f"{paths.pickle_path}/dataset.pickle", "wb") as f:
-            pickle.dump(self.masked_dataset.dataset, f)
+        self.dataset_store.save_reference(
+            obj=self.masked_dataset.dataset,
+            file_path=os.path.join(paths.pickle_path, "dataset.json"),
+        )
 
     def save_mask(self, paths: af.Paths):
         """
-        Save the mask associated with the phase
+        Save the mask associated with the phase to the dataset store, with a reference to it in the phase's pickles
+        folder (mask.json, alongside a mask.pickle which unpickles to the mask).
         """
-        with open(f"{paths.pickle_path}/mask.pickle", "wb") as f:
-            dill.dump(self.masked_dataset.mask, f)
+        self.dataset_store.save_reference(
+            obj=self.masked_dataset.mask,
+            file_path=os.path.join(paths.pickle_path, "mask.json"),
+        )
 
     def make_attributes(self):
         raise NotImplementedError
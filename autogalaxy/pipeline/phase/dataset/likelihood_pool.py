@@ -0,0 +1,294 @@
+import functools
+import io
+import multiprocessing
+import pickle
+import types
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+_worker = types.SimpleNamespace(analysis=None, shared_memory=None)
+
+
+def shared_ids_from(obj) -> set:
+    """
+    Returns the ids of every ndarray reachable from an object (e.g. a `MaskedImaging`), by walking the attributes
+    of the object, the attributes of those attributes and the entries of lists, tuples and dictionaries.
+
+    Parameters
+    ----------
+    obj
+        The object whose ndarrays are found.
+    """
+    shared_ids = set()
+    visited = set()
+    objects = [obj]
+
+    while objects:
+
+        obj = objects.pop()
+
+        if id(obj) in visited or isinstance(
+            obj, (type, types.ModuleType, types.FunctionType, types.MethodType)
+        ):
+            continue
+
+        visited.add(id(obj))
+
+        if isinstance(obj, np.ndarray):
+            shared_ids.add(id(obj))
+
+        if isinstance(obj, dict):
+            objects.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set)):
+            objects.extend(obj)
+
+        if hasattr(obj, "__dict__"):
+            objects.extend(vars(obj).values())
+
+    return shared_ids
+
+
+class SharedArrayPickler(pickle.Pickler):
+    def __init__(self, file, shared_ids, minimum_shared_bytes=1024):
+        """
+        Pickles an object such that the ndarrays in `shared_ids` are not written to the pickle, but are instead
+        referenced by their offset in a block of shared memory the arrays are copied to (see `LikelihoodPool`).
+
+        Parameters
+        ----------
+        file
+            The file-like object the pickle is written to.
+        shared_ids : set
+            The ids of the ndarrays which are placed in shared memory.
+        minimum_shared_bytes : int
+            Arrays smaller than this number of bytes are pickled normally.
+        """
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.shared_ids = shared_ids
+        self.minimum_shared_bytes = minimum_shared_bytes
+
+        self.arrays = []
+        self.offsets = {}
+        self.total_bytes = 0
+
+    def persistent_id(self, obj):
+
+        if (
+            not isinstance(obj, np.ndarray)
+            or id(obj) not in self.shared_ids
+            or obj.dtype.hasobject
+            or obj.nbytes < self.minimum_shared_bytes
+        ):
+            return None
+
+        if id(obj) not in self.offsets:
+
+            self.offsets[id(obj)] = self.total_bytes
+            self.arrays.append(obj)
+            self.total_bytes += 64 * int(np.ceil(obj.nbytes / 64))
+
+        return (
+            "shared_array",
+            self.offsets[id(obj)],
+            obj.shape,
+            obj.dtype.str,
+            type(obj),
+            getattr(obj, "__dict__", {}),
+        )
+
+    def copy_arrays_to(self, buffer):
+        """
+        Copy the ndarrays referenced by the pickle to their offsets in a block of shared memory.
+        """
+        for array in self.arrays:
+
+            np.ndarray(
+                shape=array.shape,
+                dtype=array.dtype,
+                buffer=buffer,
+                offset=self.offsets[id(array)],
+            )[...] = array
+
+
+class SharedArrayUnpickler(pickle.Unpickler):
+    def __init__(self, file, buffer):
+        """
+        Unpickles an object pickled by a `SharedArrayPickler`, where every ndarray placed in shared memory is a
+        read-only view of the shared memory buffer rather than a copy.
+
+        Parameters
+        ----------
+        file
+            The file-like object the pickle is read from.
+        buffer : memoryview
+            The buffer of the shared memory the arrays were copied to.
+        """
+        super().__init__(file)
+
+        self.buffer = buffer
+        self.arrays = {}
+
+    def persistent_load(self, pid):
+
+        _, offset, shape, dtype, cls, attributes = pid
+
+        if offset not in self.arrays:
+
+            array = np.ndarray(
+                shape=shape, dtype=dtype, buffer=self.buffer, offset=offset
+            )
+            array.flags.writeable = False
+
+            if cls is not np.ndarray:
+                array = array.view(cls)
+                array.__dict__.update(attributes)
+
+            self.arrays[offset] = array
+
+        return self.arrays[offset]
+
+
+def analysis_from_bytes(analysis_bytes, buffer):
+    """
+    Returns an analysis unpickled from the bytes of a `SharedArrayPickler`, whose masked dataset arrays are views of
+    the input shared memory buffer.
+    """
+    return SharedArrayUnpickler(io.BytesIO(analysis_bytes), buffer=buffer).load()
+
+
+def _initialize_worker(shared_memory_name, analysis_bytes):
+
+    _worker.shared_memory = shared_memory.SharedMemory(name=shared_memory_name)
+    _worker.analysis = analysis_from_bytes(
+        analysis_bytes=analysis_bytes, buffer=_worker.shared_memory.buf
+    )
+    _worker.analysis.likelihood_processes = None
+
+
+def _log_likelihood_batch_from(instances, resample_figure_of_merit):
+    return _worker.analysis.log_likelihood_batch(
+        instances=instances, resample_figure_of_merit=resample_figure_of_merit
+    )
+
+
+class LikelihoodPool:
+    def __init__(
+        self,
+        analysis,
+        number_of_processes,
+        minimum_shared_bytes=1024,
+        start_method=None,
+    ):
+        """
+        A persistent pool of worker processes which evaluate the `log_likelihood_function` of an analysis for
+        batches of model instances.
+
+        Pickling an analysis copies its masked dataset (the image, noise-map, grids, `Convolver`, transformer, etc.)
+        into every worker. The pool instead copies every array of the masked dataset into one block of
+        `multiprocessing.shared_memory` once, and pickles the analysis with references to these arrays (see
+        `SharedArrayPickler`). Every worker unpickles the analysis once when it starts, with the arrays as read-only
+        views of the shared memory, such that the dataset is never duplicated. Only the model instances are sent to
+        the workers for every batch.
+
+        The workers are started using "fork" where it is available, such that they inherit the modules already
+        imported by the parent (including the plotting libraries) and start without importing anything.
+
+        Parameters
+        ----------
+        analysis : Analysis
+            The analysis whose log likelihood function the workers evaluate.
+        number_of_processes : int
+            The number of worker processes.
+        minimum_shared_bytes : int
+            Arrays of the masked dataset smaller than this number of bytes are pickled with the analysis.
+        start_method : str or None
+            The multiprocessing start method of the workers, where `None` uses "fork" if available and "spawn"
+            otherwise.
+        """
+        if start_method is None:
+            start_method = (
+                "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+            )
+
+        file = io.BytesIO()
+
+        pickler = SharedArrayPickler(
+            file=file,
+            shared_ids=shared_ids_from(analysis.masked_dataset),
+            minimum_shared_bytes=minimum_shared_bytes,
+        )
+        pickler.dump(analysis)
+
+        self.shared_memory = shared_memory.SharedMemory(
+            create=True, size=max(pickler.total_bytes, 1)
+        )
+
+        pickler.copy_arrays_to(buffer=self.shared_memory.buf)
+
+        self.analysis_bytes = file.getvalue()
+        self.shared_bytes = pickler.total_bytes
+        self.number_of_processes = number_of_processes
+
+        self.executor = ProcessPoolExecutor(
+            max_workers=number_of_processes,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_initialize_worker,
+            initargs=(self.shared_memory.name, self.analysis_bytes),
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def log_likelihood_batch(
+        self, instances, resample_figure_of_merit=-np.inf
+    ) -> np.ndarray:
+        """
+        Returns the log likelihood of every instance of a batch, which are scattered to the workers in chunks.
+
+        Every worker fits its chunk using the `log_likelihood_batch` method of its analysis (with its
+        `likelihood_processes` removed, such that workers do not create pools of their own), such that an analysis
+        which fits a batch as array operations (e.g. the imaging `Analysis`) does so on every chunk.
+
+        Parameters
+        ----------
+        instances : [af.ModelInstance]
+            The model instances which are fitted.
+        resample_figure_of_merit : float
+            The log likelihood returned for an instance whose fit raises a `FitException`, which the search uses to
+            resample or discard it.
+        """
+        chunksize = int(np.ceil(len(instances) / self.number_of_processes))
+
+        chunks = [
+            instances[index : index + chunksize]
+            for index in range(0, len(instances), max(chunksize, 1))
+        ]
+
+        if not chunks:
+            return np.array([])
+
+        return np.concatenate(
+            list(
+                self.executor.map(
+                    functools.partial(
+                        _log_likelihood_batch_from,
+                        resample_figure_of_merit=resample_figure_of_merit,
+                    ),
+                    chunks,
+                )
+            )
+        )
+
+    def close(self):
+        """
+        Shut down the worker processes and release the shared memory.
+        """
+        self.executor.shutdown(wait=True)
+        self.shared_memory.close()
+        self.shared_memory.unlink()
@@ -82,12 +82,25 @@ class PhaseDataset(abstract.AbstractPhase):
 
         analysis = self.make_analysis(dataset=dataset, mask=mask, results=results)
 
-        result = self.run_analysis(
-            analysis=analysis,
-            info=info,
-            pickle_files=pickle_files,
-            log_likelihood_cap=log_likelihood_cap,
-        )
+        if self.settings.profiling_evaluations is not None:
+            analysis.profile_log_likelihood_function(
+                model=self.model,
+                paths=self.search.paths,
+                total_evaluations=self.settings.profiling_evaluations,
+            )
+
+        try:
+            result = self.run_analysis(
+                analysis=analysis,
+                info=info,
+                pickle_files=pickle_files,
+                log_likelihood_cap=log_likelihood_cap,
+            )
+        finally:
+            try:
+                analysis.close_visualization_queue()
+            finally:
+                analysis.close_likelihood_pool()
 
         return self.make_result(result=result, analysis=analysis)
 
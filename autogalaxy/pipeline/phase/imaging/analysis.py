@@ -1,3 +1,5 @@
+import numpy as np
+
 import autofit as af
 from autoarray.exc import PixelizationException, InversionException, GridException
 from autofit.exc import FitException
@@ -16,6 +18,16 @@ class Analysis(analysis_dataset.Analysis):
             results=results,
         )
 
+        self.likelihood_workspace = fit.LikelihoodWorkspaceImaging(
+            masked_imaging=masked_imaging, precision=settings.precision
+        )
+
+        if self.galaxy_cache is not None:
+            self.galaxy_cache.register_grids(
+                grid=self.likelihood_workspace.grid,
+                blurring_grid=self.likelihood_workspace.blurring_grid,
+            )
+
     @property
     def masked_imaging(self):
         return self.masked_dataset
@@ -44,6 +56,13 @@ class Analysis(analysis_dataset.Analysis):
             instance=instance
         )
 
+        if not plane.has_pixelization:
+            return self.likelihood_workspace.log_likelihood_from_plane(
+                plane=plane,
+                hyper_image_sky=hyper_image_sky,
+                hyper_background_noise=hyper_background_noise,
+            )
+
         try:
             fit = self.masked_imaging_fit_for_plane(
                 plane=plane,
@@ -55,6 +74,99 @@ class Analysis(analysis_dataset.Analysis):
         except (PixelizationException, InversionException, GridException) as e:
             raise FitException from e
 
+    def log_likelihood_batch(
+        self, instances, resample_figure_of_merit=-np.inf
+    ) -> np.ndarray:
+        """
+        Returns the log likelihood of every instance of a batch, for example the walkers of an MCMC search or the
+        live points of a nested sampler which are proposed together.
+
+        The fits of all instances whose planes do not have a pixelization are computed together by the likelihood
+        workspace (see `LikelihoodWorkspaceImaging.log_likelihood_batch_from_planes`), such that their PSF
+        convolutions and chi-squareds are single array operations. Instances with a pixelization are fitted
+        individually via the `log_likelihood_function`.
+
+        If the phase settings input `likelihood_processes`, the batch is instead split into chunks which the workers
+        of a `LikelihoodPool` fit in this way (see the dataset `Analysis.log_likelihood_batch`).
+
+        Parameters
+        ----------
+        instances : [af.ModelInstance]
+            The model instances which are fitted.
+        resample_figure_of_merit : float
+            The log likelihood returned for an instance whose fit raises a `FitException`, which the search uses to
+            resample or discard it.
+        """
+        if self.likelihood_processes is not None and self.likelihood_processes >= 2:
+            return super().log_likelihood_batch(
+                instances=instances, resample_figure_of_merit=resample_figure_of_merit
+            )
+
+        log_likelihoods = np.zeros(len(instances))
+
+        batch_indexes = []
+        planes = []
+        hyper_image_skies = []
+        hyper_background_noises = []
+
+        for index, instance in enumerate(instances):
+
+            self.associate_hyper_images(instance=instance)
+            plane = self.plane_for_instance(instance=instance)
+
+            if plane.has_pixelization:
+
+                try:
+                    log_likelihoods[index] = self.log_likelihood_function(
+                        instance=instance
+                    )
+                except FitException:
+                    log_likelihoods[index] = resample_figure_of_merit
+
+                continue
+
+            batch_indexes.append(index)
+            planes.append(plane)
+            hyper_image_skies.append(
+                self.hyper_image_sky_for_instance(instance=instance)
+            )
+            hyper_background_noises.append(
+                self.hyper_background_noise_for_instance(instance=instance)
+            )
+
+        if planes:
+
+            log_likelihoods[
+                batch_indexes
+            ] = self.likelihood_workspace.log_likelihood_batch_from_planes(
+                planes=planes,
+                hyper_image_skies=hyper_image_skies,
+                hyper_background_noises=hyper_background_noises,
+            )
+
+        return log_likelihoods
+
+    def log_likelihood_precision_error_for_instance(self, instance) -> dict:
+        """
+        Returns a report of the error in the log likelihood of an instance caused by the `precision` of the phase
+        settings (see `AbstractLikelihoodWorkspace.log_likelihood_precision_error_from_plane`).
+
+        Parameters
+        ----------
+        instance
+            A model instance with attributes
+        """
+        self.associate_hyper_images(instance=instance)
+        plane = self.plane_for_instance(instance=instance)
+
+        return self.likelihood_workspace.log_likelihood_precision_error_from_plane(
+            plane=plane,
+            hyper_image_sky=self.hyper_image_sky_for_instance(instance=instance),
+            hyper_background_noise=self.hyper_background_noise_for_instance(
+                instance=instance
+            ),
+        )
+
     def masked_imaging_fit_for_plane(
         self, plane, hyper_image_sky, hyper_background_noise, use_hyper_scalings=True
     ):
@@ -71,6 +183,11 @@ class Analysis(analysis_dataset.Analysis):
 
     def visualize(self, paths: af.Paths, instance, during_analysis):
 
+        if self.visualize_via_queue(
+            paths=paths, instance=instance, during_analysis=during_analysis
+        ):
+            return
+
         instance = self.associate_hyper_images(instance=instance)
         plane = self.plane_for_instance(instance=instance)
         hyper_image_sky = self.hyper_image_sky_for_instance(instance=instance)
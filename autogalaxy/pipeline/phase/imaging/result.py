@@ -1,27 +1,74 @@
 import autoarray as aa
 from autoconf import conf
+import dill
+import hashlib
 import numpy as np
 from autogalaxy.galaxy import galaxy as g
 from autogalaxy.pipeline.phase import dataset
 
+import os
+
 
 class Result(dataset.Result):
+    def __init__(
+        self, samples, previous_model, analysis, search, use_as_hyper_dataset=False
+    ):
+        """
+        The results of a `NonLinearSearch` performed by an imaging phase.
+
+        The maximum log likelihood fit and the images of every galaxy derived from it are computed the first time
+        they are used and stored, as creating them requires a full `FitImaging`. The hyper galaxy images are also
+        output to the phase's `hyper_images` folder as .npy files, which are loaded instead of being recomputed when
+        the phase is resumed, provided the hash of the maximum log likelihood instance and mask they were computed
+        from (which is output with them) matches that of this result.
+
+        Parameters
+        ----------
+        samples : af.Samples
+            A class containing the samples of the non-linear search, including methods to get the maximum log
+            likelihood model, errors, etc.
+        previous_model : af.ModelMapper
+            The model used in this result model-fit.
+        analysis : Analysis
+            The Analysis class used by this model-fit to fit the model to the data.
+        search : af.NonLinearSearch
+            The `NonLinearSearch` search used by this model fit.
+        use_as_hyper_dataset : bool
+            Whether this result's phase contains hyper phases, allowing it to be used a hyper dataset.
+        """
+        super().__init__(
+            samples=samples,
+            previous_model=previous_model,
+            analysis=analysis,
+            search=search,
+            use_as_hyper_dataset=use_as_hyper_dataset,
+        )
+
+        self._max_log_likelihood_fit = None
+        self._image_galaxy_dict = None
+        self._hyper_galaxy_image_path_dict = None
+        self._hyper_model_image = None
+
     @property
     def max_log_likelihood_fit(self):
 
-        hyper_image_sky = self.analysis.hyper_image_sky_for_instance(
-            instance=self.instance
-        )
+        if self._max_log_likelihood_fit is None:
 
-        hyper_background_noise = self.analysis.hyper_background_noise_for_instance(
-            instance=self.instance
-        )
+            hyper_image_sky = self.analysis.hyper_image_sky_for_instance(
+                instance=self.instance
+            )
 
-        return self.analysis.masked_imaging_fit_for_plane(
-            plane=self.max_log_likelihood_plane,
-            hyper_image_sky=hyper_image_sky,
-            hyper_background_noise=hyper_background_noise,
-        )
+            hyper_background_noise = self.analysis.hyper_background_noise_for_instance(
+                instance=self.instance
+            )
+
+            self._max_log_likelihood_fit = self.analysis.masked_imaging_fit_for_plane(
+                plane=self.max_log_likelihood_plane,
+                hyper_image_sky=hyper_image_sky,
+                hyper_background_noise=hyper_background_noise,
+            )
+
+        return self._max_log_likelihood_fit
 
     @property
     def unmasked_model_image(self):
@@ -50,10 +97,29 @@ class Result(dataset.Result):
         """
         A dictionary associating galaxy names with model images of those galaxies
         """
-        return {
-            galaxy_path: self.image_for_galaxy(galaxy)
-            for galaxy_path, galaxy in self.path_galaxy_tuples
-        }
+        if self._image_galaxy_dict is None:
+
+            galaxy_model_image_dict = (
+                self.max_log_likelihood_fit.galaxy_model_image_dict
+            )
+
+            self._image_galaxy_dict = {
+                galaxy_path: galaxy_model_image_dict[galaxy]
+                for galaxy_path, galaxy in self.path_galaxy_tuples
+            }
+
+        return self._image_galaxy_dict
+
+    @property
+    def hyper_images_path(self):
+        """
+        The path of the folder the hyper galaxy images are output to, which is `None` if the result does not have
+        a `NonLinearSearch` with output paths.
+        """
+        if self.search is None:
+            return None
+
+        return os.path.join(self.search.paths.output_path, "hyper_images")
 
     @property
     def hyper_galaxy_image_path_dict(self):
@@ -61,33 +127,125 @@ class Result(dataset.Result):
         A dictionary associating 1D hyper_galaxies galaxy images with their names.
         """
 
-        hyper_minimum_percent = conf.instance["general"]["hyper"][
-            "hyper_minimum_percent"
-        ]
+        if self._hyper_galaxy_image_path_dict is None:
+
+            self._hyper_galaxy_image_path_dict = (
+                self.hyper_galaxy_image_path_dict_from_files()
+            )
+
+        if self._hyper_galaxy_image_path_dict is None:
+
+            hyper_minimum_percent = conf.instance["general"]["hyper"][
+                "hyper_minimum_percent"
+            ]
+
+            hyper_galaxy_image_path_dict = {}
+
+            for path, galaxy_image in self.image_galaxy_dict.items():
+
+                galaxy_image = galaxy_image.copy()
+
+                if not np.all(galaxy_image == 0):
+                    minimum_galaxy_value = hyper_minimum_percent * max(galaxy_image)
+                    galaxy_image[
+                        galaxy_image < minimum_galaxy_value
+                    ] = minimum_galaxy_value
+
+                hyper_galaxy_image_path_dict[path] = galaxy_image
+
+            self._hyper_galaxy_image_path_dict = hyper_galaxy_image_path_dict
+
+            self.output_hyper_galaxy_image_path_dict()
+
+        return self._hyper_galaxy_image_path_dict
+
+    def hyper_galaxy_image_file_from_path(self, path):
+        return os.path.join(self.hyper_images_path, f"{'.'.join(path)}.npy")
+
+    @property
+    def hyper_images_hash_file(self):
+        return os.path.join(self.hyper_images_path, "instance_hash")
+
+    @property
+    def hyper_images_hash(self):
+        """
+        A hash of the maximum log likelihood instance, mask and hyper minimum percent the hyper galaxy images are
+        computed from, which is output with the images such that images computed from a different instance (e.g.
+        if the samples of the phase have changed since they were output) are not loaded.
+        """
+        sha = hashlib.sha256(dill.dumps(self.instance))
+        sha.update(np.asarray(self.analysis.masked_imaging.mask).tobytes())
+        sha.update(
+            str(conf.instance["general"]["hyper"]["hyper_minimum_percent"]).encode()
+        )
+        return sha.hexdigest()
+
+    def hyper_galaxy_image_path_dict_from_files(self):
+        """
+        Load the hyper galaxy images of a previous run of this phase from the .npy files in its `hyper_images`
+        folder, returning `None` if this phase has no output, the image of any galaxy is missing or the images were
+        computed from a different instance to this result's (in which case they are recomputed and output again).
+        """
+        if self.hyper_images_path is None:
+            return None
+
+        if not os.path.isfile(self.hyper_images_hash_file):
+            return None
+
+        with open(self.hyper_images_hash_file, "r") as f:
+            if f.read() != self.hyper_images_hash:
+                return None
 
         hyper_galaxy_image_path_dict = {}
 
+        mask = self.analysis.masked_imaging.mask.mask_sub_1
+
         for path, galaxy in self.path_galaxy_tuples:
 
-            galaxy_image = self.image_galaxy_dict[path]
+            file = self.hyper_galaxy_image_file_from_path(path=path)
 
-            if not np.all(galaxy_image == 0):
-                minimum_galaxy_value = hyper_minimum_percent * max(galaxy_image)
-                galaxy_image[galaxy_image < minimum_galaxy_value] = minimum_galaxy_value
+            if not os.path.isfile(file):
+                return None
 
-            hyper_galaxy_image_path_dict[path] = galaxy_image
+            hyper_galaxy_image_path_dict[path] = aa.Array.manual_mask(
+                array=np.load(file), mask=mask
+            )
 
         return hyper_galaxy_image_path_dict
 
+    def output_hyper_galaxy_image_path_dict(self):
+        """
+        Output the hyper galaxy images to the `hyper_images` folder of this phase as .npy files, with the hash of
+        the instance they are computed from.
+        """
+        if self.hyper_images_path is None:
+            return
+
+        os.makedirs(self.hyper_images_path, exist_ok=True)
+
+        for path, galaxy_image in self._hyper_galaxy_image_path_dict.items():
+            np.save(
+                self.hyper_galaxy_image_file_from_path(path=path),
+                np.asarray(galaxy_image.in_1d),
+            )
+
+        with open(self.hyper_images_hash_file, "w") as f:
+            f.write(self.hyper_images_hash)
+
     @property
     def hyper_model_image(self):
 
-        hyper_model_image = aa.Array.manual_mask(
-            array=np.zeros(self.mask.mask_sub_1.pixels_in_mask),
-            mask=self.mask.mask_sub_1,
-        )
+        if self._hyper_model_image is None:
 
-        for path, galaxy in self.path_galaxy_tuples:
-            hyper_model_image += self.hyper_galaxy_image_path_dict[path]
+            mask = self.analysis.masked_imaging.mask.mask_sub_1
+
+            hyper_model_image = aa.Array.manual_mask(
+                array=np.zeros(mask.pixels_in_mask), mask=mask
+            )
+
+            for path, galaxy in self.path_galaxy_tuples:
+                hyper_model_image += self.hyper_galaxy_image_path_dict[path]
+
+            self._hyper_model_image = hyper_model_image
 
-        return hyper_model_image
+        return self._hyper_model_image
@@ -1,3 +1,6 @@
+import json
+import os
+
 import autofit as af
 from autoarray.exc import PixelizationException, InversionException, GridException
 from autofit.exc import FitException
@@ -17,6 +20,13 @@ class Analysis(analysis_data.Analysis):
             results=results,
         )
 
+        self.likelihood_workspace = fit.LikelihoodWorkspaceInterferometer(
+            masked_interferometer=masked_interferometer, precision=settings.precision
+        )
+
+        if self.galaxy_cache is not None:
+            self.galaxy_cache.register_grids(grid=self.likelihood_workspace.grid)
+
         result = analysis_data.last_result_with_use_as_hyper_dataset(results=results)
 
         if result is not None:
@@ -58,6 +68,11 @@ class Analysis(analysis_data.Analysis):
             instance=instance
         )
 
+        if not plane.has_pixelization:
+            return self.likelihood_workspace.log_likelihood_from_plane(
+                plane=plane, hyper_background_noise=hyper_background_noise
+            )
+
         try:
             fit = self.masked_interferometer_fit_for_plane(
                 plane=plane, hyper_background_noise=hyper_background_noise
@@ -67,6 +82,26 @@ class Analysis(analysis_data.Analysis):
         except (PixelizationException, InversionException, GridException) as e:
             raise FitException from e
 
+    def log_likelihood_precision_error_for_instance(self, instance) -> dict:
+        """
+        Returns a report of the error in the log likelihood of an instance caused by the `precision` of the phase
+        settings (see `AbstractLikelihoodWorkspace.log_likelihood_precision_error_from_plane`).
+
+        Parameters
+        ----------
+        instance
+            A model instance with attributes
+        """
+        self.associate_hyper_images(instance=instance)
+        plane = self.plane_for_instance(instance=instance)
+
+        return self.likelihood_workspace.log_likelihood_precision_error_from_plane(
+            plane=plane,
+            hyper_background_noise=self.hyper_background_noise_for_instance(
+                instance=instance
+            ),
+        )
+
     def associate_hyper_visibilities(
         self, instance: af.ModelInstance
     ) -> af.ModelInstance:
@@ -120,6 +155,11 @@ class Analysis(analysis_data.Analysis):
 
     def visualize(self, paths: af.Paths, instance, during_analysis):
 
+        if self.visualize_via_queue(
+            paths=paths, instance=instance, during_analysis=during_analysis
+        ):
+            return
+
         self.associate_hyper_images(instance=instance)
         plane = self.plane_for_instance(instance=instance)
         hyper_background_noise = self.hyper_background_noise_for_instance(
@@ -157,6 +197,60 @@ class Analysis(analysis_data.Analysis):
                 fit=fit, during_analysis=during_analysis, subfolders="fit_no_hyper"
             )
 
+    def save_visibilities_compression(self, paths: af.Paths, instance=None) -> dict:
+        """
+        Output a report of the compression of the visibilities (see `VisibilitiesCompression`) to the file
+        "visibilities_compression.json" in the phase's output folder, if the `SettingsMaskedInterferometer` compress
+        the visibilities.
+
+        The report contains the compression ratio and cell size. If an instance is input, it also contains the error
+        in the log likelihood of the instance's model image caused by the compression, which checks the compressed
+        fit is accurate for the models the search converges on.
+
+        Parameters
+        ----------
+        paths : af.Paths
+            The paths of the phase, whose output folder the report is output to.
+        instance
+            A model instance whose model image the log likelihood error is computed for.
+        """
+        compression = self.masked_interferometer.visibilities_compression
+
+        if compression is None:
+            return None
+
+        settings = self.masked_interferometer.settings
+
+        report = {
+            "method": settings.visibilities_compression,
+            "decorrelation": settings.decorrelation,
+            "cell_size": float(compression.cell_size),
+            "compression_ratio": float(compression.compression_ratio),
+        }
+
+        if instance is not None:
+
+            self.associate_hyper_images(instance=instance)
+            plane = self.plane_for_instance(instance=instance)
+
+            report[
+                "log_likelihood_error"
+            ] = compression.log_likelihood_error_from_image(
+                image=plane.binned_image_from_grid(
+                    grid=self.masked_interferometer.grid
+                ),
+                transformer_class=settings.transformer_class,
+            )
+
+        os.makedirs(paths.output_path, exist_ok=True)
+
+        with open(
+            os.path.join(paths.output_path, "visibilities_compression.json"), "w+"
+        ) as f:
+            json.dump(report, f, indent=4)
+
+        return report
+
     def make_attributes(self):
         return Attributes(
             cosmology=self.cosmology,
@@ -83,7 +83,7 @@ class PhaseInterferometer(dataset.PhaseDataset):
             settings=self.settings.settings_masked_interferometer,
         )
 
-        self.output_phase_info()
+        self.output_phase_info(masked_interferometer=masked_interferometer)
 
         analysis = self.Analysis(
             masked_interferometer=masked_interferometer,
@@ -92,9 +92,22 @@ class PhaseInterferometer(dataset.PhaseDataset):
             results=results,
         )
 
+        analysis.save_visibilities_compression(paths=self.search.paths)
+
         return analysis
 
-    def output_phase_info(self):
+    def make_result(self, result, analysis):
+
+        if analysis.masked_interferometer.visibilities_compression is not None:
+
+            analysis.save_visibilities_compression(
+                paths=self.search.paths,
+                instance=result.samples.max_log_likelihood_instance,
+            )
+
+        return super().make_result(result=result, analysis=analysis)
+
+    def output_phase_info(self, masked_interferometer=None):
 
         file_phase_info = path.join(self.search.paths.output_path, "phase.info")
 
@@ -107,4 +120,14 @@ class PhaseInterferometer(dataset.PhaseDataset):
             )
             phase_info.write("Cosmology = {} \n".format(self.cosmology))
 
+            if (
+                masked_interferometer is not None
+                and masked_interferometer.visibilities_compression is not None
+            ):
+                phase_info.write(
+                    "Visibilities compression ratio = {} \n".format(
+                        masked_interferometer.visibilities_compression.compression_ratio
+                    )
+                )
+
             phase_info.close()
@@ -11,6 +11,10 @@ class SettingsPhase(AbstractSettingsPhase):
         settings_pixelization=pix.SettingsPixelization(),
         settings_inversion=inv.SettingsInversion(),
         log_likelihood_cap=None,
+        galaxy_cache_size=None,
+        precision="float64",
+        profiling_evaluations=None,
+        likelihood_processes=None,
     ):
         """The settings of a phase, which customize how a model is fitted to data in a PyAutoGalaxy `Phase`. for
         example the type of grid used or options or augmenting the data.
@@ -21,13 +25,47 @@ class SettingsPhase(AbstractSettingsPhase):
 
         Parameters
         ----------
-
+        galaxy_cache_size : int or None
+            If input, the phase's `Analysis` stores the blurred images and deflection angles of individual galaxies
+            in a least-recently-used cache of this size, so that galaxies whose parameters do not change between
+            likelihood evaluations are not recomputed. This does not change the results and therefore does not tag
+            the phase.
+        precision : str
+            The precision light profile images, model images and chi-squared maps are evaluated in when the phase's
+            `Analysis` computes the log likelihood, which is "float64" or "float32" (where "float32" also evaluates
+            visibilities as complex64). The chi-squared and noise normalization are always summed in float64.
+        profiling_evaluations : int or None
+            If input, before the non-linear search the phase's `Analysis` times this many likelihood evaluations of
+            random model instances and outputs the time spent in every stage of the likelihood to the phase's output
+            folder (see `Analysis.profile_log_likelihood_function`). This does not change the results and therefore
+            does not tag the phase.
+        likelihood_processes : int or None
+            If input, the phase's `Analysis` evaluates batches of model instances (see
+            `Analysis.log_likelihood_batch`) using a `LikelihoodPool` of this many worker processes, which share the
+            masked dataset via shared memory. This does not change the results and therefore does not tag the phase.
         """
         super().__init__(log_likelihood_cap=log_likelihood_cap)
 
         self.settings_masked_dataset = settings_masked_dataset
         self.settings_pixelization = settings_pixelization
         self.settings_inversion = settings_inversion
+        self.galaxy_cache_size = galaxy_cache_size
+        self.precision = precision
+        self.profiling_evaluations = profiling_evaluations
+        self.likelihood_processes = likelihood_processes
+
+    @property
+    def precision_tag(self):
+        """Generate a precision tag, to customize phase names based on the precision the likelihood is evaluated in.
+
+        This changes the phase settings folder as follows:
+
+        precision = "float64" -> settings
+        precision = "float32" -> settings__prec_float32
+        """
+        if self.precision == "float64":
+            return ""
+        return f"__{conf.instance['notation']['settings_tags']['phase']['precision']}_{self.precision}"
 
 
 class SettingsPhaseImaging(SettingsPhase):
@@ -37,6 +75,10 @@ class SettingsPhaseImaging(SettingsPhase):
         settings_pixelization=pix.SettingsPixelization(),
         settings_inversion=inv.SettingsInversion(),
         log_likelihood_cap=None,
+        galaxy_cache_size=None,
+        precision="float64",
+        profiling_evaluations=None,
+        likelihood_processes=None,
     ):
 
         super().__init__(
@@ -44,6 +86,10 @@ class SettingsPhaseImaging(SettingsPhase):
             settings_pixelization=settings_pixelization,
             settings_inversion=settings_inversion,
             log_likelihood_cap=log_likelihood_cap,
+            galaxy_cache_size=galaxy_cache_size,
+            precision=precision,
+            profiling_evaluations=profiling_evaluations,
+            likelihood_processes=likelihood_processes,
         )
 
     @property
@@ -56,6 +102,7 @@ class SettingsPhaseImaging(SettingsPhase):
             f"{conf.instance['notation']['settings_tags']['phase']['phase']}__"
             f"{self.settings_masked_imaging.tag_no_inversion}"
             f"{self.log_likelihood_cap_tag}"
+            f"{self.precision_tag}"
         )
 
     @property
@@ -66,6 +113,7 @@ class SettingsPhaseImaging(SettingsPhase):
             f"{self.settings_pixelization.tag}__"
             f"{self.settings_inversion.tag}"
             f"{self.log_likelihood_cap_tag}"
+            f"{self.precision_tag}"
         )
 
 
@@ -76,6 +124,10 @@ class SettingsPhaseInterferometer(SettingsPhase):
         settings_pixelization=pix.SettingsPixelization(),
         settings_inversion=inv.SettingsInversion(),
         log_likelihood_cap=None,
+        galaxy_cache_size=None,
+        precision="float64",
+        profiling_evaluations=None,
+        likelihood_processes=None,
     ):
 
         super().__init__(
@@ -83,6 +135,10 @@ class SettingsPhaseInterferometer(SettingsPhase):
             settings_pixelization=settings_pixelization,
             settings_inversion=settings_inversion,
             log_likelihood_cap=log_likelihood_cap,
+            galaxy_cache_size=galaxy_cache_size,
+            precision=precision,
+            profiling_evaluations=profiling_evaluations,
+            likelihood_processes=likelihood_processes,
         )
 
     @property
@@ -96,6 +152,7 @@ class SettingsPhaseInterferometer(SettingsPhase):
             f"{conf.instance['notation']['settings_tags']['phase']['phase']}__"
             f"{self.settings_masked_interferometer.tag_no_inversion}"
             f"{self.log_likelihood_cap_tag}"
+            f"{self.precision_tag}"
         )
 
     @property
@@ -107,4 +164,5 @@ class SettingsPhaseInterferometer(SettingsPhase):
             f"{self.settings_pixelization.tag}__"
             f"{self.settings_inversion.tag}"
             f"{self.log_likelihood_cap_tag}"
+            f"{self.precision_tag}"
         )
@@ -0,0 +1,127 @@
+import multiprocessing
+import pickle
+import threading
+import types
+from concurrent.futures import ProcessPoolExecutor
+
+_worker = types.SimpleNamespace(analysis=None)
+
+
+def _initialize_worker(analysis_bytes):
+
+    _worker.analysis = pickle.loads(analysis_bytes)
+    _worker.analysis.visualize_in_background = False
+
+
+def _visualize(paths, instance, during_analysis):
+    _worker.analysis.visualize(
+        paths=paths, instance=instance, during_analysis=during_analysis
+    )
+
+
+class VisualizationQueue:
+    def __init__(self, analysis, start_method=None):
+        """
+        Performs the visualization of an analysis in a background worker process, such that a non-linear search
+        does not wait for the fit to be rebuilt and its figures to be output every time it visualizes.
+
+        The analysis is pickled to the worker once, when the queue is created. Every visualization request sends
+        only the paths and model instance, from which the worker fits the dataset and outputs the visualization.
+
+        Only one visualization is performed at a time. A request made whilst the worker is busy is held as pending,
+        and a newer request replaces it, such that the worker always visualizes the latest instance next and
+        visualizations never back up behind a slow worker.
+
+        Parameters
+        ----------
+        analysis : Analysis
+            The analysis whose `visualize` method the worker calls.
+        start_method : str or None
+            The multiprocessing start method of the worker, where `None` uses "fork" if available and "spawn"
+            otherwise.
+        """
+        if start_method is None:
+            start_method = (
+                "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+            )
+
+        self.executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_initialize_worker,
+            initargs=(pickle.dumps(analysis),),
+        )
+
+        self._lock = threading.RLock()
+        self._future = None
+        self._pending = None
+
+    def visualize(self, paths, instance, during_analysis):
+        """
+        Request a visualization of an instance, which starts immediately if the worker is idle and otherwise replaces
+        any pending request.
+
+        If the previous visualization raised an exception it is raised here.
+
+        Parameters
+        ----------
+        paths : af.Paths
+            The paths of the phase, which the visualization is output to.
+        instance : af.ModelInstance
+            The model instance which is visualized.
+        during_analysis : bool
+            Whether the visualization is performed during the non-linear search or at its end.
+        """
+        with self._lock:
+
+            if self._future is not None and self._future.done():
+                self._future.result()
+
+            request = (paths, instance, during_analysis)
+
+            if self._future is None or self._future.done():
+                self._submit(request=request)
+            else:
+                self._pending = request
+
+    def _submit(self, request):
+
+        self._future = self.executor.submit(_visualize, *request)
+        self._future.add_done_callback(self._submit_pending)
+
+    def _submit_pending(self, future):
+
+        with self._lock:
+
+            if future is self._future and self._pending is not None:
+
+                request, self._pending = self._pending, None
+                self._submit(request=request)
+
+    def wait(self):
+        """
+        Wait until the current and pending visualizations are complete, raising any exception of the last
+        visualization.
+        """
+        while True:
+
+            with self._lock:
+
+                future = self._future
+
+                if future is None or (future.done() and self._pending is None):
+                    break
+
+            future.result()
+
+        if future is not None:
+            future.result()
+
+    def close(self):
+        """
+        Wait for all visualizations to complete and shut down the worker process.
+        """
+        try:
+            self.wait()
+        finally:
+            self.executor.shutdown(wait=True)
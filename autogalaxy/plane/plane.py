@@ -5,12 +5,16 @@ from autoarray.inversion import pixelizations as pix
 from autoarray.structures import arrays, grids, visibilities as vis
 from autogalaxy import exc
 from autogalaxy import lensing
+from autogalaxy.dataset import grid_adaptive
+from autogalaxy.dataset import super_pixels as sp
 from autogalaxy.galaxy import galaxy as g
+from autogalaxy.util import grid_chunk_util
 from autogalaxy.util import plane_util
+from autogalaxy.util import profiling_util
 
 
 class AbstractPlane(lensing.LensingObject):
-    def __init__(self, redshift, galaxies):
+    def __init__(self, redshift, galaxies, galaxy_cache=None, number_of_threads=None):
         """A plane of galaxies where all galaxies are at the same redshift.
 
         Parameters
@@ -19,6 +23,14 @@ class AbstractPlane(lensing.LensingObject):
             The redshift of the plane.
         galaxies : [Galaxy]
             The list of galaxies in this plane.
+        galaxy_cache : GalaxyCache or None
+            An optional cache of the blurred images and deflection angles of individual galaxies, which the plane
+            checks before computing these quantities (see `autogalaxy.galaxy.galaxy_cache`).
+        number_of_threads : int or None
+            The number of threads the quantities of the plane's galaxies (e.g. their images and deflection angles)
+            are computed in parallel using. If `None` the value in the `parallel` section of the general config is
+            used. The quantities of each galaxy are always summed in the order of the galaxies, such that the result
+            does not depend on the number of threads.
         """
 
         if redshift is None:
@@ -37,11 +49,30 @@ class AbstractPlane(lensing.LensingObject):
 
         self.redshift = redshift
         self.galaxies = galaxies
+        self.galaxy_cache = galaxy_cache
+        self.number_of_threads = number_of_threads
 
     @property
     def galaxy_redshifts(self):
         return [galaxy.redshift for galaxy in self.galaxies]
 
+    def values_of_galaxies_from(self, func):
+        """
+        Returns a list of the values of a function applied to every galaxy in the plane (e.g. their images), in the
+        same order as the plane's galaxies.
+
+        The function is applied to the galaxies in parallel using a pool of threads if the plane's `number_of_threads`
+        is above 1 (see `plane_util.values_of_galaxies_from`).
+
+        Parameters
+        ----------
+        func : function
+            The function applied to each galaxy, which takes the galaxy as its only input.
+        """
+        return plane_util.values_of_galaxies_from(
+            func=func, galaxies=self.galaxies, number_of_threads=self.number_of_threads
+        )
+
     @property
     def has_light_profile(self):
         if self.galaxies is not None:
@@ -54,6 +85,24 @@ class AbstractPlane(lensing.LensingObject):
         if self.galaxies is not None:
             return any(list(map(lambda galaxy: galaxy.has_mass_profile, self.galaxies)))
 
+    @property
+    def has_analytic_psf_convolution(self):
+        return self.has_light_profile and all(
+            [
+                galaxy.has_analytic_psf_convolution
+                for galaxy in self.galaxies_with_light_profile
+            ]
+        )
+
+    @property
+    def has_analytic_visibilities(self):
+        return self.has_light_profile and all(
+            [
+                galaxy.has_analytic_visibilities
+                for galaxy in self.galaxies_with_light_profile
+            ]
+        )
+
     @property
     def has_pixelization(self):
         return any([galaxy.pixelization for galaxy in self.galaxies])
@@ -267,8 +316,13 @@ class AbstractPlane(lensing.LensingObject):
 
 
 class AbstractPlaneLensing(AbstractPlane):
-    def __init__(self, redshift, galaxies):
-        super().__init__(redshift=redshift, galaxies=galaxies)
+    def __init__(self, redshift, galaxies, galaxy_cache=None, number_of_threads=None):
+        super().__init__(
+            redshift=redshift,
+            galaxies=galaxies,
+            galaxy_cache=galaxy_cache,
+            number_of_threads=number_of_threads,
+        )
 
     @grids.grid_like_to_structure
     def image_from_grid(self, grid):
@@ -286,15 +340,65 @@ class AbstractPlaneLensing(AbstractPlane):
             -----------
 
         """
+        return self.image_from_ndarray(grid=grid)
+
+    def image_from_ndarray(self, grid):
+        """
+        Returns the summed image of all galaxies in the plane on an ndarray of (y,x) coordinates as an ndarray, using
+        the *image_from_ndarray* method of every galaxy such that the image is only converted to a grid_like
+        structure once (by *image_from_grid*) rather than once per galaxy and light profile.
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
         if self.galaxies:
             return sum(
-                map(lambda galaxy: galaxy.image_from_grid(grid=grid), self.galaxies)
+                self.values_of_galaxies_from(
+                    func=lambda galaxy: galaxy.image_from_ndarray(grid=grid)
+                )
             )
         return np.zeros((grid.shape[0],))
 
+    def binned_image_from_grid(self, grid):
+        """
+        Returns the summed image of all galaxies in the plane binned up from the sub-grid to the grid's pixels.
+
+        If the grid has more unmasked pixels than the `grid_chunk_pixels` value in the `parallel` section of the
+        general config, the image is evaluated in chunks of this many pixels which are binned as they are computed
+        (see `grid_chunk_util`). The galaxy images of every chunk are summed before binning, therefore the result is
+        identical to binning the output of `image_from_grid`.
+
+        If the grid is a `GridAdaptive`, the sub-size of every pixel is adapted to the plane's light profile centres
+        and the local curvature of its image.
+
+        If the grid is a `GridSuperPixels`, the plane's image is evaluated once in every super-pixel of more than one
+        pixel (see `SuperPixels`).
+
+        Parameters
+        ----------
+        grid : grid_like
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        if self.has_light_profile and isinstance(
+            grid, (grid_adaptive.GridAdaptive, sp.GridSuperPixels)
+        ):
+            return grid.binned_array_from_func(
+                func=lambda sub_grid: self.image_from_ndarray(grid=sub_grid),
+                light_profile_centres=self.light_profile_centres,
+            )
+
+        if self.galaxies and grid_chunk_util.use_chunks_for_grid(grid=grid):
+            return grid_chunk_util.binned_array_from_func_and_grid(
+                func=lambda sub_grid: self.image_from_ndarray(grid=sub_grid), grid=grid
+            )
+
+        return self.image_from_grid(grid=grid).in_1d_binned
+
     def images_of_galaxies_from_grid(self, grid):
-        return list(
-            map(lambda galaxy: galaxy.image_from_grid(grid=grid), self.galaxies)
+        return self.values_of_galaxies_from(
+            func=lambda galaxy: galaxy.image_from_grid(grid=grid)
         )
 
     def padded_image_from_grid_and_psf_shape(self, grid, psf_shape_2d):
@@ -324,7 +428,11 @@ class AbstractPlaneLensing(AbstractPlane):
             The galaxies whose mass profiles are used to compute the surface densities.
         """
         if self.galaxies:
-            return sum(map(lambda g: g.convergence_from_grid(grid=grid), self.galaxies))
+            return sum(
+                self.values_of_galaxies_from(
+                    func=lambda g: g.convergence_from_grid(grid=grid)
+                )
+            )
         else:
             return np.zeros(shape=(grid.shape[0],))
 
@@ -349,13 +457,29 @@ class AbstractPlaneLensing(AbstractPlane):
             The galaxies whose mass profiles are used to compute the surface densities.
         """
         if self.galaxies:
-            return sum(map(lambda g: g.potential_from_grid(grid=grid), self.galaxies))
+            return sum(
+                self.values_of_galaxies_from(
+                    func=lambda g: g.potential_from_grid(grid=grid)
+                )
+            )
         return np.zeros((grid.shape[0]))
 
     @grids.grid_like_to_structure
     def deflections_from_grid(self, grid):
         if self.galaxies:
-            return sum(map(lambda g: g.deflections_from_grid(grid=grid), self.galaxies))
+            if self.galaxy_cache is not None:
+                return sum(
+                    self.values_of_galaxies_from(
+                        func=lambda g: self.galaxy_cache.deflections_of_galaxy_from_grid(
+                            galaxy=g, grid=grid
+                        )
+                    )
+                )
+            return sum(
+                self.values_of_galaxies_from(
+                    func=lambda g: g.deflections_from_grid(grid=grid)
+                )
+            )
         return np.zeros(shape=(grid.shape[0], 2))
 
     @grids.grid_like_to_structure
@@ -366,47 +490,123 @@ class AbstractPlaneLensing(AbstractPlane):
 
 
 class AbstractPlaneData(AbstractPlaneLensing):
-    def __init__(self, redshift, galaxies):
+    def __init__(self, redshift, galaxies, galaxy_cache=None, number_of_threads=None):
 
-        super().__init__(redshift=redshift, galaxies=galaxies)
+        super().__init__(
+            redshift=redshift,
+            galaxies=galaxies,
+            galaxy_cache=galaxy_cache,
+            number_of_threads=number_of_threads,
+        )
 
     def blurred_image_from_grid_and_psf(self, grid, psf, blurring_grid):
 
-        image = self.image_from_grid(grid=grid)
+        image = self.binned_image_from_grid(grid=grid)
 
-        blurring_image = self.image_from_grid(grid=blurring_grid)
+        blurring_image = self.binned_image_from_grid(grid=blurring_grid)
 
         return psf.convolved_array_from_array_2d_and_mask(
             array_2d=image.in_2d_binned + blurring_image.in_2d_binned, mask=grid.mask
         )
 
     def blurred_images_of_galaxies_from_grid_and_psf(self, grid, psf, blurring_grid):
-        return [
-            galaxy.blurred_image_from_grid_and_psf(
+        return self.values_of_galaxies_from(
+            func=lambda galaxy: galaxy.blurred_image_from_grid_and_psf(
                 grid=grid, psf=psf, blurring_grid=blurring_grid
             )
-            for galaxy in self.galaxies
-        ]
+        )
+
+    def blurred_image_from_grid_and_convolver(
+        self, grid, convolver, blurring_grid, psf_gaussians=None
+    ):
+        """
+        Returns the image of all galaxies in the plane blurred by the PSF of a `Convolver`.
 
-    def blurred_image_from_grid_and_convolver(self, grid, convolver, blurring_grid):
+        If the PSF is also represented by Gaussians and every light profile in the plane can be convolved with them
+        analytically, the image of the PSF convolved plane (see *psf_convolved_plane_from*) is returned instead,
+        which does not use the convolver or the blurring grid.
 
-        image = self.image_from_grid(grid=grid)
+        Parameters
+        ----------
+        grid : grid_like
+            The (y, x) coordinates in the original reference frame of the grid.
+        convolver : Convolver
+            The convolver which blurs the image with the PSF.
+        blurring_grid : grid_like
+            The grid of coordinates outside the mask whose light is blurred into the mask.
+        psf_gaussians : PSFGaussians or None
+            The Gaussians representing the PSF, used for analytic convolution.
+        """
+        if psf_gaussians is not None and self.has_analytic_psf_convolution:
+            return self.psf_convolved_plane_from(
+                psf_gaussians=psf_gaussians
+            ).binned_image_from_grid(grid=grid)
+
+        if self.galaxy_cache is not None and self.galaxies:
+            return sum(
+                self.blurred_images_of_galaxies_from_grid_and_convolver(
+                    grid=grid, convolver=convolver, blurring_grid=blurring_grid
+                )
+            )
+
+        image = self.binned_image_from_grid(grid=grid)
 
-        blurring_image = self.image_from_grid(grid=blurring_grid)
+        blurring_image = self.binned_image_from_grid(grid=blurring_grid)
 
-        return convolver.convolved_image_from_image_and_blurring_image(
-            image=image, blurring_image=blurring_image
+        return profiling_util.timed_call(
+            func=convolver.convolved_image_from_image_and_blurring_image,
+            stage="convolution",
+            image=image,
+            blurring_image=blurring_image,
         )
 
     def blurred_images_of_galaxies_from_grid_and_convolver(
-        self, grid, convolver, blurring_grid
+        self, grid, convolver, blurring_grid, psf_gaussians=None
     ):
-        return [
-            galaxy.blurred_image_from_grid_and_convolver(
+        if psf_gaussians is not None and self.has_analytic_psf_convolution:
+            return self.values_of_galaxies_from(
+                func=lambda galaxy: galaxy.blurred_image_from_grid_and_convolver(
+                    grid=grid,
+                    convolver=convolver,
+                    blurring_grid=blurring_grid,
+                    psf_gaussians=psf_gaussians,
+                )
+            )
+
+        if self.galaxy_cache is not None:
+            return self.values_of_galaxies_from(
+                func=lambda galaxy: self.galaxy_cache.blurred_image_of_galaxy_from_grid_and_convolver(
+                    galaxy=galaxy,
+                    grid=grid,
+                    convolver=convolver,
+                    blurring_grid=blurring_grid,
+                )
+            )
+
+        return self.values_of_galaxies_from(
+            func=lambda galaxy: galaxy.blurred_image_from_grid_and_convolver(
                 grid=grid, convolver=convolver, blurring_grid=blurring_grid
             )
-            for galaxy in self.galaxies
-        ]
+        )
+
+    def psf_convolved_plane_from(self, psf_gaussians):
+        """
+        Returns a plane of the PSF convolved galaxies of every galaxy with a light profile in this plane (see
+        *Galaxy.psf_convolved_galaxy_from*), such that its unblurred image is this plane's blurred image.
+
+        Parameters
+        ----------
+        psf_gaussians : PSFGaussians
+            The Gaussians representing the PSF.
+        """
+        return Plane(
+            redshift=self.redshift,
+            galaxies=[
+                galaxy.psf_convolved_galaxy_from(psf_gaussians=psf_gaussians)
+                for galaxy in self.galaxies_with_light_profile
+            ],
+            number_of_threads=self.number_of_threads,
+        )
 
     def unmasked_blurred_image_from_grid_and_psf(self, grid, psf):
 
@@ -436,24 +636,99 @@ class AbstractPlaneData(AbstractPlaneLensing):
 
         return unmasked_blurred_images_of_galaxies
 
-    def profile_visibilities_from_grid_and_transformer(self, grid, transformer):
+    def profile_visibilities_from_grid_and_transformer(
+        self, grid, transformer, analytic_visibilities=False
+    ):
+        """
+        Returns the visibilities of the light profiles of the plane's galaxies.
+
+        If analytic visibilities are switched on and every galaxy with a light profile supports it, the visibilities
+        are computed analytically at the transformer's baselines (see *Galaxy.visibilities_from_uv_wavelengths*),
+        which skips evaluating the image on the grid and transforming it.
+
+        Parameters
+        ----------
+        grid : grid_like
+            The (y, x) coordinates in the original reference frame of the grid.
+        transformer : TransformerDFT or TransformerNUFFT
+            The transformer which maps the image to the uv-plane.
+        analytic_visibilities : bool
+            Whether the visibilities are computed analytically if every galaxy supports it.
+        """
+        if analytic_visibilities and self.has_analytic_visibilities:
+            return sum(
+                [
+                    galaxy.visibilities_from_uv_wavelengths(
+                        uv_wavelengths=transformer.uv_wavelengths,
+                        pixel_scales=transformer.real_space_mask.pixel_scales,
+                    )
+                    for galaxy in self.galaxies_with_light_profile
+                ]
+            )
 
         if self.galaxies:
-            image = self.image_from_grid(grid=grid)
-            return transformer.visibilities_from_image(image=image)
+            image = self.binned_image_from_grid(grid=grid)
+            return profiling_util.timed_call(
+                func=transformer.visibilities_from_image, stage="transform", image=image
+            )
         else:
             return vis.Visibilities.zeros(
                 shape_1d=(transformer.uv_wavelengths.shape[0],)
             )
 
     def profile_visibilities_of_galaxies_from_grid_and_transformer(
-        self, grid, transformer
+        self, grid, transformer, analytic_visibilities=False
     ):
+        """
+        Returns the visibilities of the light profiles of every galaxy in the plane, in the same order as the plane's
+        galaxies.
+
+        If analytic visibilities are switched on, the visibilities of galaxies which support it are computed
+        analytically (see *Galaxy.visibilities_from_uv_wavelengths*). The images of all other galaxies are evaluated and then Fourier
+        transformed together in one batch (see `plane_util.visibilities_of_images_from`), rather than by a call to the
+        transformer per galaxy. The transform is linear, therefore the visibilities of the galaxies sum to the
+        plane's visibilities (see *profile_visibilities_from_grid_and_transformer*).
+
+        Parameters
+        ----------
+        grid : grid_like
+            The (y, x) coordinates in the original reference frame of the grid.
+        transformer : TransformerDFT or TransformerNUFFT
+            The transformer which maps the images to the uv-plane.
+        analytic_visibilities : bool
+            Whether the visibilities of galaxies which support it are computed analytically.
+        """
+        analytic_galaxies = [
+            analytic_visibilities and galaxy.has_analytic_visibilities
+            for galaxy in self.galaxies
+        ]
+
+        galaxies_to_transform = [
+            galaxy
+            for galaxy, is_analytic in zip(self.galaxies, analytic_galaxies)
+            if not is_analytic
+        ]
+
+        images_of_galaxies = plane_util.values_of_galaxies_from(
+            func=lambda galaxy: galaxy.binned_image_from_grid(grid=grid),
+            galaxies=galaxies_to_transform,
+            number_of_threads=self.number_of_threads,
+        )
+
+        transformed_visibilities_of_galaxies = iter(
+            plane_util.visibilities_of_images_from(
+                images=images_of_galaxies, transformer=transformer
+            )
+        )
+
         return [
-            galaxy.profile_visibilities_from_grid_and_transformer(
-                grid=grid, transformer=transformer
+            galaxy.visibilities_from_uv_wavelengths(
+                uv_wavelengths=transformer.uv_wavelengths,
+                pixel_scales=transformer.real_space_mask.pixel_scales,
             )
-            for galaxy in self.galaxies
+            if is_analytic
+            else next(transformed_visibilities_of_galaxies)
+            for galaxy, is_analytic in zip(self.galaxies, analytic_galaxies)
         ]
 
     def sparse_image_plane_grid_from_grid(
@@ -660,7 +935,7 @@ class AbstractPlaneData(AbstractPlaneLensing):
         return galaxy_blurred_image_dict
 
     def galaxy_profile_visibilities_dict_from_grid_and_transformer(
-        self, grid, transformer
+        self, grid, transformer, analytic_visibilities=False
     ) -> {g.Galaxy: np.ndarray}:
         """
         A dictionary associating galaxies with their corresponding model images
@@ -669,7 +944,9 @@ class AbstractPlaneData(AbstractPlaneLensing):
         galaxy_profile_visibilities_image_dict = dict()
 
         profile_visibilities_of_galaxies = self.profile_visibilities_of_galaxies_from_grid_and_transformer(
-            grid=grid, transformer=transformer
+            grid=grid,
+            transformer=transformer,
+            analytic_visibilities=analytic_visibilities,
         )
         for (galaxy_index, galaxy) in enumerate(self.galaxies):
             galaxy_profile_visibilities_image_dict[
@@ -694,8 +971,15 @@ class AbstractPlaneData(AbstractPlaneLensing):
 
 
 class Plane(AbstractPlaneData):
-    def __init__(self, redshift=None, galaxies=None):
-        super(Plane, self).__init__(redshift=redshift, galaxies=galaxies)
+    def __init__(
+        self, redshift=None, galaxies=None, galaxy_cache=None, number_of_threads=None
+    ):
+        super(Plane, self).__init__(
+            redshift=redshift,
+            galaxies=galaxies,
+            galaxy_cache=galaxy_cache,
+            number_of_threads=number_of_threads,
+        )
 
 
 class PlaneImage:
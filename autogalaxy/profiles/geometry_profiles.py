@@ -1,9 +1,40 @@
 import numpy as np
+from autoconf import conf
 from autoarray.structures import grids
 from autogalaxy import convert
 import typing
 
 
+_radial_minimums = {}
+
+
+def radial_minimum_from(class_name: str) -> float:
+    """
+    Returns the radial minimum of a profile class from the 'radial_minimum.ini' config, which coordinates evaluated
+    by the `*_from_ndarray` methods of profiles are relocated to (see `grids.relocate_to_radial_minimum`).
+
+    The radial minimum of every class is read from the config once and cached. The cache is keyed by the list of
+    configs of `conf.instance`, which is replaced when a new config is pushed, such that a pushed config is read.
+
+    Parameters
+    ----------
+    class_name : str
+        The name of the profile class.
+    """
+    configs = conf.instance.configs
+
+    if class_name in _radial_minimums and _radial_minimums[class_name][0] is configs:
+        return _radial_minimums[class_name][1]
+
+    radial_minimum = conf.instance["grids"]["radial_minimum"]["radial_minimum"][
+        class_name
+    ]
+
+    _radial_minimums[class_name] = (configs, radial_minimum)
+
+    return radial_minimum
+
+
 class GeometryProfile:
     def __init__(self, centre: typing.Tuple[float, float] = (0.0, 0.0)):
         """An abstract geometry profile, which describes profiles with y and x centre Cartesian coordinates
@@ -22,6 +53,47 @@ class GeometryProfile:
     def transform_grid_from_reference_frame(self, grid):
         raise NotImplemented()
 
+    def transform_ndarray_to_reference_frame(self, grid):
+        raise NotImplemented()
+
+    @property
+    def radial_minimum(self) -> float:
+        return radial_minimum_from(class_name=self.__class__.__name__)
+
+    def transformed_ndarray_from(self, grid) -> np.ndarray:
+        """
+        Returns an ndarray of (y,x) coordinates transformed to the reference frame of the profile and relocated
+        to the profile's radial minimum, which is the operation the `grids.transform` and
+        `grids.relocate_to_radial_minimum` decorators perform but without creating `GridTransformedNumpy` views or
+        wrapping the grid in a grid_like structure.
+
+        Coordinates which are already transformed (e.g. a `GridTransformedNumpy`) are only relocated.
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        if isinstance(grid, (grids.GridTransformed, grids.GridTransformedNumpy)):
+            grid = np.array(grid)
+        else:
+            grid = self.transform_ndarray_to_reference_frame(grid=np.asarray(grid))
+
+        radial_minimum = self.radial_minimum
+
+        with np.errstate(all="ignore"):  # Division by zero fixed via isnan
+
+            grid_radii = np.sqrt(np.add(np.square(grid[:, 0]), np.square(grid[:, 1])))
+
+            grid_radial_scale = np.where(
+                grid_radii < radial_minimum, radial_minimum / grid_radii, 1.0
+            )
+            grid = np.multiply(grid, grid_radial_scale[:, None])
+
+        grid[np.isnan(grid)] = radial_minimum
+
+        return grid
+
     def __repr__(self):
         return "{}\n{}".format(
             self.__class__.__name__,
@@ -57,6 +129,18 @@ class SphericalProfile(GeometryProfile):
         """
         return np.sqrt(np.add(np.square(grid[:, 0]), np.square(grid[:, 1])))
 
+    def grid_radii_from_ndarray(self, grid):
+        """
+        Convert an ndarray of (y,x) coordinates in the reference frame of the profile to their circular radii,
+        without the transformation performed by *grid_to_grid_radii* (see *transformed_ndarray_from*).
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the reference frame of the profile.
+        """
+        return np.sqrt(np.add(np.square(grid[:, 0]), np.square(grid[:, 1])))
+
     def grid_angle_to_profile(self, grid_thetas):
         """The angle between each (y,x) coordinate on the grid and the profile, in radians.
 
@@ -110,6 +194,17 @@ class SphericalProfile(GeometryProfile):
         transformed = np.add(grid, self.centre)
         return transformed.view(grids.GridTransformedNumpy)
 
+    def transform_ndarray_to_reference_frame(self, grid):
+        """Transform an ndarray of (y,x) coordinates to the reference frame of the profile, including a translation to \
+        its centre, returning an ndarray (see *transform_grid_to_reference_frame*).
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        return np.subtract(grid, self.centre)
+
 
 class EllipticalProfile(SphericalProfile):
     def __init__(
@@ -247,6 +342,60 @@ class EllipticalProfile(SphericalProfile):
             np.sqrt(self.axis_ratio), self.grid_to_elliptical_radii(grid)
         ).view(np.ndarray)
 
+    def elliptical_radii_from_ndarray(self, grid):
+        """
+        Convert an ndarray of (y,x) coordinates in the reference frame of the profile to an elliptical radius, without
+        the transformation and relocation performed by *grid_to_elliptical_radii* (see *transformed_ndarray_from*).
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the reference frame of the elliptical profile.
+        """
+        return np.sqrt(
+            np.add(
+                np.square(grid[:, 1]), np.square(np.divide(grid[:, 0], self.axis_ratio))
+            )
+        )
+
+    def eccentric_radii_from_ndarray(self, grid):
+        """
+        Convert an ndarray of (y,x) coordinates in the reference frame of the profile to an eccentric radius (see
+        *grid_to_eccentric_radii* and *elliptical_radii_from_ndarray*).
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the reference frame of the elliptical profile.
+        """
+        return np.multiply(
+            np.sqrt(self.axis_ratio), self.elliptical_radii_from_ndarray(grid=grid)
+        )
+
+    def transform_ndarray_to_reference_frame(self, grid):
+        """Transform an ndarray of (y,x) coordinates to the reference frame of the profile, including a translation to \
+        its centre and a rotation to it orientation, returning an ndarray (see *transform_grid_to_reference_frame*).
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        if self.__class__.__name__.startswith("Spherical"):
+            return super().transform_ndarray_to_reference_frame(grid=grid)
+        shifted_coordinates = np.subtract(grid, self.centre)
+        radius = np.sqrt(np.sum(shifted_coordinates ** 2.0, 1))
+        theta_coordinate_to_profile = (
+            np.arctan2(shifted_coordinates[:, 0], shifted_coordinates[:, 1])
+            - self.phi_radians
+        )
+        return np.vstack(
+            (
+                radius * np.sin(theta_coordinate_to_profile),
+                radius * np.cos(theta_coordinate_to_profile),
+            )
+        ).T
+
     @grids.grid_like_to_structure
     def transform_grid_to_reference_frame(self, grid):
         """Transform a grid of (y,x) coordinates to the reference frame of the profile, including a translation to \
@@ -1,9 +1,100 @@
 import numpy as np
-from autoarray.structures import grids
+from autoconf import conf
+from autoarray.structures import grids, visibilities as vis
+from autogalaxy import convert
 from autogalaxy.profiles import geometry_profiles
+from autogalaxy.util import mge_util
 from scipy.integrate import quad
 import typing
 
+_light_profile_mge = (None, None)
+
+
+def light_profile_mge_from() -> bool:
+    """
+    Returns the `light_profile_mge` value in the `profiles` section of the general config, which switches Sersic
+    family light profiles to their multi-Gaussian expansion (see *AbstractEllipticalSersic.use_mge*).
+
+    The value is read from the config once and cached until a new config is pushed, in the same way as the radial
+    minima of profiles (see `geometry_profiles.radial_minimum_from`), as it is checked every time an image is
+    evaluated.
+    """
+    global _light_profile_mge
+
+    configs = conf.instance.configs
+
+    if _light_profile_mge[0] is not configs:
+        _light_profile_mge = (
+            configs,
+            conf.instance["general"]["profiles"]["light_profile_mge"],
+        )
+
+    return _light_profile_mge[1]
+
+
+def visibilities_of_gaussians_from(
+    uv_wavelengths, pixel_scales, centre, phi, intensities, sigmas_x, sigmas_y
+):
+    """
+    Returns the visibilities of a sum of elliptical Gaussians, which share a centre and orientation, evaluated
+    analytically at every (u,v) baseline.
+
+    The Fourier transform of a Gaussian is a Gaussian, therefore the visibilities are computed without evaluating the
+    image on a real-space grid. A Gaussian with intensity I and sigmas (sigma_x, sigma_y) along the x and y axes of its
+    rotated reference frame has the Fourier transform:
+
+    2 * pi * I * sigma_x * sigma_y * exp(-2 * pi^2 * (sigma_x^2 * k_x^2 + sigma_y^2 * k_y^2))
+
+    where (k_x, k_y) are the baselines in units of inverse arc-seconds rotated to the same reference frame. The
+    offset of the centre from the origin applies a phase. The visibilities are divided by the area of a pixel, such
+    that they follow the convention of the transformers, which sum the values of the image's pixels.
+
+    Parameters
+    ----------
+    uv_wavelengths : np.ndarray
+        The (u,v) baselines of the interferometer in units of wavelengths.
+    pixel_scales : (float, float)
+        The (y,x) arc-second to pixel scales of the real-space grid the transformer maps images from.
+    centre : (float, float)
+        The (y,x) arc-second coordinates of the centre of the Gaussians.
+    phi : float
+        The rotation angle of the Gaussians counter-clockwise from the positive x-axis in degrees.
+    intensities : [float]
+        The intensity of every Gaussian.
+    sigmas_x : [float]
+        The sigma of every Gaussian along the x-axis of its reference frame in arc-seconds.
+    sigmas_y : [float]
+        The sigma of every Gaussian along the y-axis of its reference frame in arc-seconds.
+    """
+    k_x = uv_wavelengths[:, 0] * np.pi / 648000.0
+    k_y = uv_wavelengths[:, 1] * np.pi / 648000.0
+
+    cos_phi = np.cos(np.radians(phi))
+    sin_phi = np.sin(np.radians(phi))
+
+    k_x_squared = np.square(k_x * cos_phi + k_y * sin_phi)
+    k_y_squared = np.square(-k_x * sin_phi + k_y * cos_phi)
+
+    amplitudes = np.zeros(shape=uv_wavelengths.shape[0])
+
+    for intensity, sigma_x, sigma_y in zip(intensities, sigmas_x, sigmas_y):
+        amplitudes += (
+            2.0
+            * np.pi
+            * intensity
+            * sigma_x
+            * sigma_y
+            * np.exp(
+                -2.0
+                * np.pi ** 2.0
+                * (sigma_x ** 2.0 * k_x_squared + sigma_y ** 2.0 * k_y_squared)
+            )
+        )
+
+    phases = np.exp(-2.0j * np.pi * (k_x * centre[1] + k_y * centre[0]))
+
+    return amplitudes * phases / (pixel_scales[0] * pixel_scales[1])
+
 
 class LightProfile:
     """Mixin class that implements functions common to all light profiles"""
@@ -35,6 +126,67 @@ class LightProfile:
         """
         raise NotImplementedError("image_from_grid should be overridden")
 
+    def image_from_ndarray(self, grid):
+        """
+        Returns the intensity of the light profile on an ndarray of Cartesian (y,x) coordinates as an ndarray.
+
+        This is the internal layer of *image_from_grid*, which `Galaxy` and `Plane` objects call directly so that the
+        input grid is converted to and from a grid_like structure once, instead of once per light profile. Light
+        profiles which do not override this method are evaluated via their *image_from_grid* method.
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        return np.asarray(self.image_from_grid(grid=np.asarray(grid)))
+
+    @property
+    def has_analytic_psf_convolution(self) -> bool:
+        """
+        Returns `True` if the light profile can be convolved with a PSF represented by Gaussians analytically (see
+        *gaussians_convolved_with*).
+        """
+        return False
+
+    def gaussians_convolved_with(self, psf_gaussians):
+        """
+        Abstract method returning a list of `EllipticalGaussian` light profiles whose summed image is the image of
+        the light profile convolved with a PSF represented by Gaussians.
+
+        Parameters
+        ----------
+        psf_gaussians : PSFGaussians
+            The Gaussians representing the PSF.
+        """
+        raise NotImplementedError("gaussians_convolved_with should be overridden")
+
+    @property
+    def has_analytic_visibilities(self) -> bool:
+        """
+        Returns `True` if the visibilities of the light profile can be computed analytically in the uv-plane (see
+        *visibilities_from_uv_wavelengths*), without transforming its image from a real-space grid. They are only
+        computed analytically if this is switched on via the `analytic_visibilities` input of
+        *profile_visibilities_from_grid_and_transformer*.
+        """
+        return False
+
+    def visibilities_from_uv_wavelengths(self, uv_wavelengths, pixel_scales):
+        """
+        Abstract method returning the visibilities of the light profile evaluated analytically at every (u,v)
+        baseline.
+
+        Parameters
+        ----------
+        uv_wavelengths : np.ndarray
+            The (u,v) baselines of the interferometer in units of wavelengths.
+        pixel_scales : (float, float)
+            The (y,x) arc-second to pixel scales of the real-space grid the transformer maps images from.
+        """
+        raise NotImplementedError(
+            "visibilities_from_uv_wavelengths should be overridden"
+        )
+
     def luminosity_within_circle(self, radius: float):
         raise NotImplementedError()
 
@@ -125,7 +277,30 @@ class EllipticalLightProfile(geometry_profiles.EllipticalProfile, LightProfile):
             image=image.in_1d_binned, blurring_image=blurring_image.in_1d_binned
         )
 
-    def profile_visibilities_from_grid_and_transformer(self, grid, transformer):
+    def profile_visibilities_from_grid_and_transformer(
+        self, grid, transformer, analytic_visibilities=False
+    ):
+        """
+        Returns the visibilities of the light profile's image evaluated on a grid and Fourier transformed to the
+        uv-plane by a transformer.
+
+        If analytic visibilities are switched on and the light profile's visibilities can be computed analytically
+        (see *visibilities_from_uv_wavelengths*), they are evaluated directly at the transformer's baselines instead.
+
+        Parameters
+        ----------
+        grid : grid_like
+            The (y, x) coordinates in the original reference frame of the grid.
+        transformer : TransformerDFT or TransformerNUFFT
+            The transformer which maps the image to the uv-plane.
+        analytic_visibilities : bool
+            Whether the visibilities are computed analytically if the light profile supports it.
+        """
+        if analytic_visibilities and self.has_analytic_visibilities:
+            return self.visibilities_from_uv_wavelengths(
+                uv_wavelengths=transformer.uv_wavelengths,
+                pixel_scales=transformer.real_space_mask.pixel_scales,
+            )
 
         image = self.image_from_grid(grid=grid)
 
@@ -166,8 +341,21 @@ class PointSource(EllipticalLightProfile):
 
     @grids.grid_like_to_structure
     def image_from_grid(self, grid):
+        return self.image_from_ndarray(grid=grid)
+
+    def image_from_ndarray(self, grid):
         return np.zeros(shape=grid.shape[0])
 
+    @property
+    def has_analytic_visibilities(self) -> bool:
+        return True
+
+    def visibilities_from_uv_wavelengths(self, uv_wavelengths, pixel_scales):
+        """
+        The visibilities of a point source, which are zeros to be consistent with its image.
+        """
+        return vis.Visibilities.zeros(shape_1d=(uv_wavelengths.shape[0],))
+
 
 class PointSourceFlux(PointSource):
     def __init__(
@@ -228,8 +416,6 @@ class EllipticalGaussian(EllipticalLightProfile):
         )
 
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def image_from_grid(self, grid, grid_radial_minimum=None):
         """
         Calculate the intensity of the light profile on a grid of Cartesian (y,x) coordinates.
@@ -241,8 +427,99 @@ class EllipticalGaussian(EllipticalLightProfile):
         grid : grid_like
             The (y, x) coordinates in the original reference frame of the grid.
         """
+        return self.image_from_ndarray(grid=grid)
+
+    def image_from_ndarray(self, grid):
+        """
+        Calculate the intensity of the light profile on an ndarray of Cartesian (y,x) coordinates, returning an
+        ndarray (see *LightProfile.image_from_ndarray*).
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        return self.image_from_grid_radii(
+            self.eccentric_radii_from_ndarray(grid=self.transformed_ndarray_from(grid))
+        )
+
+    @property
+    def has_analytic_psf_convolution(self) -> bool:
+        return True
+
+    def gaussians_convolved_with(self, psf_gaussians):
+        """
+        Returns the Gaussian light profiles whose summed image is the image of this Gaussian convolved with a PSF
+        represented by circular Gaussians (see `PSFGaussians`).
+
+        The Gaussian has a sigma of sigma / axis_ratio along its major axis and sigma along its minor axis. Convolving
+        it with a circular Gaussian adds that Gaussian's sigma to both in quadrature, which changes the axis ratio but
+        not the orientation. The total flux is preserved, therefore the intensity is reduced by the ratio of the
+        areas of the two Gaussians and multiplied by the weight of the PSF Gaussian.
+
+        Parameters
+        ----------
+        psf_gaussians : PSFGaussians
+            The Gaussians representing the PSF.
+        """
+        sigma_major = self.sigma / self.axis_ratio
+        sigma_minor = self.sigma
+
+        gaussians = []
+
+        for psf_sigma, psf_weight in zip(psf_gaussians.sigmas, psf_gaussians.weights):
+
+            if psf_weight <= 0.0:
+                continue
+
+            convolved_sigma_major = np.sqrt(sigma_major ** 2.0 + psf_sigma ** 2.0)
+            convolved_sigma_minor = np.sqrt(sigma_minor ** 2.0 + psf_sigma ** 2.0)
+
+            gaussians.append(
+                EllipticalGaussian(
+                    centre=self.centre,
+                    elliptical_comps=convert.elliptical_comps_from(
+                        axis_ratio=convolved_sigma_minor / convolved_sigma_major,
+                        phi=self.phi,
+                    ),
+                    intensity=psf_weight
+                    * self.intensity
+                    * (sigma_major * sigma_minor)
+                    / (convolved_sigma_major * convolved_sigma_minor),
+                    sigma=convolved_sigma_minor,
+                )
+            )
+
+        return gaussians
+
+    @property
+    def has_analytic_visibilities(self) -> bool:
+        return True
+
+    def visibilities_from_uv_wavelengths(self, uv_wavelengths, pixel_scales):
+        """
+        Returns the visibilities of the Gaussian evaluated analytically at every (u,v) baseline (see
+        `visibilities_of_gaussians_from`). The Gaussian has a sigma of sigma / axis_ratio along the x-axis of its
+        reference frame and sigma along its y-axis.
 
-        return self.image_from_grid_radii(self.grid_to_eccentric_radii(grid))
+        Parameters
+        ----------
+        uv_wavelengths : np.ndarray
+            The (u,v) baselines of the interferometer in units of wavelengths.
+        pixel_scales : (float, float)
+            The (y,x) arc-second to pixel scales of the real-space grid the transformer maps images from.
+        """
+        return vis.Visibilities(
+            visibilities=visibilities_of_gaussians_from(
+                uv_wavelengths=uv_wavelengths,
+                pixel_scales=pixel_scales,
+                centre=self.centre,
+                phi=self.phi,
+                intensities=[self.intensity],
+                sigmas_x=[self.sigma / self.axis_ratio],
+                sigmas_y=[self.sigma],
+            )
+        )
 
 
 class SphericalGaussian(EllipticalGaussian):
@@ -339,6 +616,119 @@ class AbstractEllipticalSersic(EllipticalLightProfile):
             * (((radius / self.effective_radius) ** (1.0 / self.sersic_index)) - 1)
         )
 
+    @property
+    def use_mge(self) -> bool:
+        """
+        If `True` the image of the profile is evaluated as a multi-Gaussian expansion (MGE) (see
+        *decompose_image_into_gaussians*), which allows it to be convolved with a PSF represented by Gaussians
+        analytically. This is set via the `light_profile_mge` value in the `profiles` section of the general config
+        (see `light_profile_mge_from`).
+        """
+        return light_profile_mge_from()
+
+    @property
+    def has_analytic_psf_convolution(self) -> bool:
+        return self.use_mge
+
+    def decompose_image_into_gaussians(self):
+        """
+        Decompose the image of the profile as a function of eccentric radius into Gaussians, returning the intensity
+        and sigma of every Gaussian.
+
+        The decomposition of a Sersic profile with an intensity of 1.0 is cached and shared with the Sersic mass
+        profiles (see `mge_util.sersic_gaussians_from`), therefore it is only recomputed when the effective radius or
+        Sersic index changes.
+        """
+        amps, sigmas = mge_util.sersic_gaussians_from(
+            effective_radius=self.effective_radius,
+            sersic_index=self.sersic_index,
+            sersic_constant=self.sersic_constant,
+            radii_min=self.effective_radius / 100.0,
+            radii_max=self.effective_radius * 20.0,
+        )
+
+        return self.intensity * amps, sigmas
+
+    @property
+    def gaussians(self):
+        """
+        The `EllipticalGaussian` light profiles the profile is decomposed into (see *decompose_image_into_gaussians*),
+        which share its centre and elliptical components.
+        """
+        amps, sigmas = self.decompose_image_into_gaussians()
+
+        return [
+            EllipticalGaussian(
+                centre=self.centre,
+                elliptical_comps=self.elliptical_comps,
+                intensity=amp,
+                sigma=sigma * np.sqrt(self.axis_ratio),
+            )
+            for amp, sigma in zip(amps, sigmas)
+        ]
+
+    def image_from_ndarray_via_gaussians(self, grid):
+        """
+        Calculate the intensity of the profile's multi-Gaussian expansion on an ndarray of Cartesian (y,x)
+        coordinates, returning an ndarray (see *decompose_image_into_gaussians*).
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        grid_radii = self.eccentric_radii_from_ndarray(
+            grid=self.transformed_ndarray_from(grid)
+        )
+
+        amps, sigmas = self.decompose_image_into_gaussians()
+
+        image = np.zeros(shape=grid_radii.shape[0])
+
+        for amp, sigma in zip(amps, sigmas):
+            image += amp * np.exp(-0.5 * np.square(np.divide(grid_radii, sigma)))
+
+        return image
+
+    def gaussians_convolved_with(self, psf_gaussians):
+        return [
+            convolved_gaussian
+            for gaussian in self.gaussians
+            for convolved_gaussian in gaussian.gaussians_convolved_with(
+                psf_gaussians=psf_gaussians
+            )
+        ]
+
+    @property
+    def has_analytic_visibilities(self) -> bool:
+        return self.use_mge
+
+    def visibilities_from_uv_wavelengths(self, uv_wavelengths, pixel_scales):
+        """
+        Returns the visibilities of the profile's multi-Gaussian expansion evaluated analytically at every (u,v)
+        baseline (see *decompose_image_into_gaussians* and `visibilities_of_gaussians_from`).
+
+        Parameters
+        ----------
+        uv_wavelengths : np.ndarray
+            The (u,v) baselines of the interferometer in units of wavelengths.
+        pixel_scales : (float, float)
+            The (y,x) arc-second to pixel scales of the real-space grid the transformer maps images from.
+        """
+        amps, sigmas = self.decompose_image_into_gaussians()
+
+        return vis.Visibilities(
+            visibilities=visibilities_of_gaussians_from(
+                uv_wavelengths=uv_wavelengths,
+                pixel_scales=pixel_scales,
+                centre=self.centre,
+                phi=self.phi,
+                intensities=amps,
+                sigmas_x=sigmas / np.sqrt(self.axis_ratio),
+                sigmas_y=sigmas * np.sqrt(self.axis_ratio),
+            )
+        )
+
 
 class EllipticalSersic(AbstractEllipticalSersic, EllipticalLightProfile):
     def __init__(
@@ -401,8 +791,6 @@ class EllipticalSersic(AbstractEllipticalSersic, EllipticalLightProfile):
         )
 
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def image_from_grid(self, grid, grid_radial_minimum=None):
         """Calculate the intensity of the light profile on a grid of Cartesian (y,x) coordinates.
 
@@ -413,7 +801,24 @@ class EllipticalSersic(AbstractEllipticalSersic, EllipticalLightProfile):
         grid : grid_like
             The (y, x) coordinates in the original reference frame of the grid.
         """
-        return self.image_from_grid_radii(self.grid_to_eccentric_radii(grid))
+        return self.image_from_ndarray(grid=grid)
+
+    def image_from_ndarray(self, grid):
+        """
+        Calculate the intensity of the light profile on an ndarray of Cartesian (y,x) coordinates, returning an
+        ndarray (see *LightProfile.image_from_ndarray*).
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        if self.use_mge:
+            return self.image_from_ndarray_via_gaussians(grid=grid)
+
+        return self.image_from_grid_radii(
+            self.eccentric_radii_from_ndarray(grid=self.transformed_ndarray_from(grid))
+        )
 
 
 class SphericalSersic(EllipticalSersic):
@@ -634,6 +1039,24 @@ class EllipticalCoreSersic(EllipticalSersic):
             )
         )
 
+    def decompose_image_into_gaussians(self):
+        """
+        Decompose the image of the cored-Sersic profile as a function of eccentric radius into Gaussians, using the
+        decomposition shared with the cored-Sersic mass profiles (see `mge_util.core_sersic_gaussians_from`).
+        """
+        amps, sigmas = mge_util.core_sersic_gaussians_from(
+            effective_radius=self.effective_radius,
+            sersic_index=self.sersic_index,
+            sersic_constant=self.sersic_constant,
+            radius_break=self.radius_break,
+            alpha=self.alpha,
+            gamma=self.gamma,
+            radii_min=self.effective_radius / 50.0,
+            radii_max=self.effective_radius * 20.0,
+        )
+
+        return self.intensity_prime * amps, sigmas
+
     def image_from_grid_radii(self, grid_radii):
         """Calculate the intensity of the cored-Sersic light profile on a grid of radial coordinates.
 
@@ -797,8 +1220,6 @@ class EllipticalChameleon(EllipticalLightProfile):
         )
 
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def image_from_grid(self, grid, grid_radial_minimum=None):
         """
         Calculate the intensity of the light profile on a grid of Cartesian (y,x) coordinates.
@@ -808,7 +1229,21 @@ class EllipticalChameleon(EllipticalLightProfile):
         grid : grid_like
             The (y, x) coordinates in the original reference frame of the grid.
         """
-        return self.image_from_grid_radii(self.grid_to_elliptical_radii(grid))
+        return self.image_from_ndarray(grid=grid)
+
+    def image_from_ndarray(self, grid):
+        """
+        Calculate the intensity of the light profile on an ndarray of Cartesian (y,x) coordinates, returning an
+        ndarray (see *LightProfile.image_from_ndarray*).
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        return self.image_from_grid_radii(
+            self.elliptical_radii_from_ndarray(grid=self.transformed_ndarray_from(grid))
+        )
 
 
 class SphericalChameleon(EllipticalChameleon):
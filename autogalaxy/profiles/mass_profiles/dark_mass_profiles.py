@@ -9,8 +9,6 @@ from autoarray.structures import arrays, grids
 from autogalaxy import exc
 from autogalaxy.profiles import mass_profiles as mp
 from autogalaxy.util import cosmology_util
-from colossus.cosmology import cosmology as col_cosmology
-from colossus.halo.concentration import concentration as col_concentration
 from numba import cfunc
 from numba.types import intc, CPointer, float64
 
@@ -1370,6 +1368,9 @@ def kappa_s_and_scale_radius_for_duffy(mass_at_200, redshift_object, redshift_so
 
 def kappa_s_and_scale_radius_for_ludlow(mass_at_200, redshift_object, redshift_source):
 
+    from colossus.cosmology import cosmology as col_cosmology
+    from colossus.halo.concentration import concentration as col_concentration
+
     cosmology = cosmo.Planck15
 
     col_cosmo = col_cosmology.setCosmology("planck15")
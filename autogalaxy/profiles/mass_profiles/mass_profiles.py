@@ -7,7 +7,8 @@ from scipy.optimize import root_scalar
 from autoarray.structures import grids
 from autogalaxy import lensing
 from autogalaxy.profiles import geometry_profiles
-from scipy.special import wofz, comb
+from autogalaxy.util import mge_util
+from scipy.special import wofz
 
 
 class MassProfile(lensing.LensingObject):
@@ -15,6 +16,33 @@ class MassProfile(lensing.LensingObject):
     def mass_profiles(self):
         return [self]
 
+    def convergence_from_ndarray(self, grid):
+        """
+        Returns the convergence of the mass profile on an ndarray of Cartesian (y,x) coordinates as an ndarray.
+
+        This is the internal layer of *convergence_from_grid*, which `Galaxy` objects call directly so that the input
+        grid is converted to and from a grid_like structure once, instead of once per mass profile. Mass profiles
+        which do not override this method are evaluated via their *convergence_from_grid* method.
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        return np.asarray(self.convergence_from_grid(grid=np.asarray(grid)))
+
+    def deflections_from_ndarray(self, grid):
+        """
+        Returns the deflection angles of the mass profile on an ndarray of Cartesian (y,x) coordinates as an ndarray
+        (see *convergence_from_ndarray*).
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        return np.asarray(self.deflections_from_grid(grid=np.asarray(grid)))
+
     @property
     def has_mass_profile(self):
         return True
@@ -189,29 +217,14 @@ class MassProfileMGE:
         """
         see Eq.(6) of 1906.08263
         """
-        n_list = np.arange(0, 2 * p + 1, 1)
-        return (2.0 * p * np.log(10) / 3.0 + 2.0 * np.pi * n_list * 1j) ** (0.5)
+        return mge_util.kesi(p=p)
 
     @staticmethod
     def eta(p):
         """
         see Eq.(6) of 1906.00263
         """
-        eta_list = np.zeros(int(2 * p + 1))
-        kesi_list = np.zeros(int(2 * p + 1))
-        kesi_list[0] = 0.5
-        kesi_list[1 : p + 1] = 1.0
-        kesi_list[int(2 * p)] = 1.0 / 2.0 ** p
-
-        for i in np.arange(1, p, 1):
-            kesi_list[2 * p - i] = kesi_list[2 * p - i + 1] + 2 ** (-p) * comb(p, i)
-
-        for i in np.arange(0, 2 * p + 1, 1):
-            eta_list[i] = (
-                (-1) ** i * 2.0 * np.sqrt(2.0 * np.pi) * 10 ** (p / 3.0) * kesi_list[i]
-            )
-
-        return eta_list
+        return mge_util.eta(p=p)
 
     def decompose_convergence_into_gaussians(self):
         raise NotImplementedError()
@@ -235,30 +248,13 @@ class MassProfileMGE:
         Returns
         -------
         """
-
-        kesis = self.kesi(func_terms)  # kesi in Eq.(6) of 1906.08263
-        etas = self.eta(func_terms)  # eta in Eqr.(6) of 1906.08263
-
-        def f(sigma):
-            """Eq.(5) of 1906.08263"""
-            return np.sum(etas * np.real(target_function(sigma * kesis)))
-
-        # sigma is sampled from logspace between these radii.
-
-        log_sigmas = np.linspace(np.log(radii_min), np.log(radii_max), func_gaussians)
-        d_log_sigma = log_sigmas[1] - log_sigmas[0]
-        sigmas = np.exp(log_sigmas)
-
-        amps = np.zeros(func_gaussians)
-
-        for i in range(func_gaussians):
-            f_sigma = np.sum(etas * np.real(func(sigmas[i] * kesis)))
-            if (i == -1) or (i == (func_gaussians - 1)):
-                amps[i] = 0.5 * f_sigma * d_log_sigma / np.sqrt(2.0 * np.pi)
-            else:
-                amps[i] = f_sigma * d_log_sigma / np.sqrt(2.0 * np.pi)
-
-        return amps, sigmas
+        return mge_util.decompose_func_into_gaussians(
+            func=func,
+            radii_min=radii_min,
+            radii_max=radii_max,
+            func_terms=func_terms,
+            func_gaussians=func_gaussians,
+        )
 
     def convergence_from_grid_via_gaussians(self, grid_radii):
         raise NotImplementedError()
@@ -305,7 +301,7 @@ class MassProfileMGE:
             axis_ratio = 0.9999
 
         amps, sigmas = self.decompose_convergence_into_gaussians()
-        sigmas *= sigmas_factor
+        sigmas = sigmas * sigmas_factor
 
         angle = self.zeta_from_grid(
             grid=grid, amps=amps, sigmas=sigmas, axis_ratio=axis_ratio
@@ -3,6 +3,7 @@ import numpy as np
 from autoarray.structures import arrays
 from autoarray.structures import grids
 from autogalaxy.profiles import mass_profiles as mp
+from autogalaxy.util import mge_util
 
 from pyquad import quad_grid
 from scipy.special import wofz
@@ -331,23 +332,20 @@ class AbstractEllipticalSersic(
         return self.effective_radius / np.sqrt(self.axis_ratio)
 
     def decompose_convergence_into_gaussians(self):
-        radii_min = self.effective_radius / 100.0
-        radii_max = self.effective_radius * 20.0
-
-        def sersic_2d(r):
-            return (
-                self.mass_to_light_ratio
-                * self.intensity
-                * np.exp(
-                    -self.sersic_constant
-                    * (((r / self.effective_radius) ** (1.0 / self.sersic_index)) - 1.0)
-                )
-            )
-
-        return self._decompose_convergence_into_gaussians(
-            func=sersic_2d, radii_min=radii_min, radii_max=radii_max
+        """
+        Decompose the convergence of the Sersic profile into Gaussians, using the decomposition of a Sersic profile
+        with an intensity of 1.0 that is shared with the Sersic light profiles (see `mge_util.sersic_gaussians_from`).
+        """
+        amps, sigmas = mge_util.sersic_gaussians_from(
+            effective_radius=self.effective_radius,
+            sersic_index=self.sersic_index,
+            sersic_constant=self.sersic_constant,
+            radii_min=self.effective_radius / 100.0,
+            radii_max=self.effective_radius * 20.0,
         )
 
+        return self.mass_to_light_ratio * self.intensity * amps, sigmas
+
 
 class EllipticalSersic(AbstractEllipticalSersic, MassProfileMGE):
     @grids.grid_like_to_structure
@@ -891,30 +889,24 @@ class EllipticalCoreSersic(EllipticalSersic):
         )
 
     def decompose_convergence_into_gaussians(self):
-        radii_min = self.effective_radius / 50.0
-        radii_max = self.effective_radius * 20.0
-
-        def core_sersic_2D(r):
-            return (
-                self.mass_to_light_ratio
-                * self.intensity
-                * (
-                    self.intensity_prime
-                    * (1.0 + (self.radius_break / r) ** self.alpha)
-                    ** (self.gamma / self.alpha)
-                    * np.exp(
-                        -self.sersic_constant
-                        * (
-                            (r ** self.alpha + self.radius_break ** self.alpha)
-                            / self.effective_radius ** self.alpha
-                        )
-                        ** (1.0 / (self.sersic_index * self.alpha))
-                    )
-                )
-            )
+        """
+        Decompose the convergence of the cored-Sersic profile into Gaussians, using the decomposition shared with the
+        cored-Sersic light profiles (see `mge_util.core_sersic_gaussians_from`).
+        """
+        amps, sigmas = mge_util.core_sersic_gaussians_from(
+            effective_radius=self.effective_radius,
+            sersic_index=self.sersic_index,
+            sersic_constant=self.sersic_constant,
+            radius_break=self.radius_break,
+            alpha=self.alpha,
+            gamma=self.gamma,
+            radii_min=self.effective_radius / 50.0,
+            radii_max=self.effective_radius * 20.0,
+        )
 
-        return self._decompose_convergence_into_gaussians(
-            func=core_sersic_2D, radii_min=radii_min, radii_max=radii_max
+        return (
+            self.mass_to_light_ratio * self.intensity * self.intensity_prime * amps,
+            sigmas,
         )
 
 
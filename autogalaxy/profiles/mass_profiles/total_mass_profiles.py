@@ -41,10 +41,22 @@ class PointMass(geometry_profiles.SphericalProfile, mp.MassProfile):
         return convergence
 
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def deflections_from_grid(self, grid):
-        grid_radii = self.grid_to_grid_radii(grid=grid)
+        return self.deflections_from_ndarray(grid=grid)
+
+    def deflections_from_ndarray(self, grid):
+        """
+        Calculate the deflection angles on an ndarray of (y,x) arc-second coordinates, returning an ndarray (see
+        *MassProfile.deflections_from_ndarray*).
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        grid = self.transformed_ndarray_from(grid)
+
+        grid_radii = self.grid_radii_from_ndarray(grid=grid)
         return self.grid_to_grid_cartesian(
             grid=grid, radius=self.einstein_radius ** 2 / grid_radii
         )
@@ -274,8 +286,6 @@ class EllipticalCoredPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
         )
 
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def convergence_from_grid(self, grid):
         """ Calculate the projected convergence on a grid of (y,x) arc-second coordinates.
 
@@ -288,15 +298,27 @@ class EllipticalCoredPowerLaw(mp.EllipticalMassProfile, mp.MassProfile):
             The grid of (y,x) arc-second coordinates the convergence is computed on.
 
         """
+        return self.convergence_from_ndarray(grid=grid)
 
-        covnergence_grid = np.zeros(grid.shape[0])
+    def convergence_from_ndarray(self, grid):
+        """
+        Calculate the projected convergence on an ndarray of (y,x) arc-second coordinates, returning an ndarray (see
+        *MassProfile.convergence_from_ndarray*).
 
-        grid_eta = self.grid_to_elliptical_radii(grid)
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        grid = self.transformed_ndarray_from(grid)
 
-        for i in range(grid.shape[0]):
-            covnergence_grid[i] = self.convergence_func(grid_eta[i])
+        grid_eta = self.elliptical_radii_from_ndarray(grid=grid)
 
-        return covnergence_grid
+        with np.errstate(divide="ignore"):
+            return self.einstein_radius_rescaled * np.power(
+                np.add(self.core_radius ** 2, np.square(grid_eta)),
+                -(self.slope - 1) / 2.0,
+            )
 
     @grids.grid_like_to_structure
     @grids.transform
@@ -425,8 +447,6 @@ class SphericalCoredPowerLaw(EllipticalCoredPowerLaw):
         )
 
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def deflections_from_grid(self, grid):
         """
         Calculate the deflection angles on a grid of (y,x) arc-second coordinates.
@@ -437,7 +457,21 @@ class SphericalCoredPowerLaw(EllipticalCoredPowerLaw):
             The grid of (y,x) arc-second coordinates the deflection angles are computed on.
 
         """
-        eta = self.grid_to_grid_radii(grid=grid)
+        return self.deflections_from_ndarray(grid=grid)
+
+    def deflections_from_ndarray(self, grid):
+        """
+        Calculate the deflection angles on an ndarray of (y,x) arc-second coordinates, returning an ndarray (see
+        *MassProfile.deflections_from_ndarray*).
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        grid = self.transformed_ndarray_from(grid)
+
+        eta = self.grid_radii_from_ndarray(grid=grid)
         deflection = np.multiply(
             2.0 * self.einstein_radius_rescaled,
             np.divide(
@@ -487,8 +521,6 @@ class EllipticalPowerLaw(EllipticalCoredPowerLaw):
         )
 
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def deflections_from_grid(self, grid):
         """
         Calculate the deflection angles on a grid of (y,x) arc-second coordinates.
@@ -504,6 +536,19 @@ class EllipticalPowerLaw(EllipticalCoredPowerLaw):
         grid : aa.Grid
             The grid of (y,x) arc-second coordinates the deflection angles are computed on.
         """
+        return self.deflections_from_ndarray(grid=grid)
+
+    def deflections_from_ndarray(self, grid):
+        """
+        Calculate the deflection angles on an ndarray of (y,x) arc-second coordinates, returning an ndarray (see
+        *MassProfile.deflections_from_ndarray*).
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        grid = self.transformed_ndarray_from(grid)
 
         slope = self.slope - 1.0
         einstein_radius = (
@@ -584,11 +629,22 @@ class SphericalPowerLaw(EllipticalPowerLaw):
         )
 
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def deflections_from_grid(self, grid):
+        return self.deflections_from_ndarray(grid=grid)
+
+    def deflections_from_ndarray(self, grid):
+        """
+        Calculate the deflection angles on an ndarray of (y,x) arc-second coordinates, returning an ndarray (see
+        *MassProfile.deflections_from_ndarray*).
 
-        eta = self.grid_to_grid_radii(grid)
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        grid = self.transformed_ndarray_from(grid)
+
+        eta = self.grid_radii_from_ndarray(grid=grid)
         deflection_r = (
             2.0
             * self.einstein_radius_rescaled
@@ -694,8 +750,6 @@ class EllipticalIsothermal(EllipticalPowerLaw):
             self.axis_ratio = 0.99999
 
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def deflections_from_grid(self, grid):
         """
         Calculate the deflection angles on a grid of (y,x) arc-second coordinates.
@@ -708,6 +762,19 @@ class EllipticalIsothermal(EllipticalPowerLaw):
         grid : aa.Grid
             The grid of (y,x) arc-second coordinates the deflection angles are computed on.
         """
+        return self.deflections_from_ndarray(grid=grid)
+
+    def deflections_from_ndarray(self, grid):
+        """
+        Calculate the deflection angles on an ndarray of (y,x) arc-second coordinates, returning an ndarray (see
+        *MassProfile.deflections_from_ndarray*).
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        grid = self.transformed_ndarray_from(grid)
 
         factor = (
             2.0
@@ -794,8 +861,6 @@ class SphericalIsothermal(EllipticalIsothermal):
         return 2.0 * self.einstein_radius_rescaled * eta
 
     @grids.grid_like_to_structure
-    @grids.transform
-    @grids.relocate_to_radial_minimum
     def deflections_from_grid(self, grid):
         """
         Calculate the deflection angles on a grid of (y,x) arc-second coordinates.
@@ -805,6 +870,20 @@ class SphericalIsothermal(EllipticalIsothermal):
         grid : aa.Grid
             The grid of (y,x) arc-second coordinates the deflection angles are computed on.
         """
+        return self.deflections_from_ndarray(grid=grid)
+
+    def deflections_from_ndarray(self, grid):
+        """
+        Calculate the deflection angles on an ndarray of (y,x) arc-second coordinates, returning an ndarray (see
+        *MassProfile.deflections_from_ndarray*).
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y, x) coordinates in the original reference frame of the grid.
+        """
+        grid = self.transformed_ndarray_from(grid)
+
         return self.grid_to_grid_cartesian(
             grid=grid,
             radius=np.full(grid.shape[0], 2.0 * self.einstein_radius_rescaled),
@@ -0,0 +1,134 @@
+import numpy as np
+from autoconf import conf
+from autoarray.structures import arrays, grids
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+_executors = {}
+_executor_lock = threading.Lock()
+
+
+def pixels_per_chunk_from_config():
+    return conf.instance["general"]["parallel"]["grid_chunk_pixels"]
+
+
+def number_of_threads_from_config():
+    return conf.instance["general"]["parallel"]["grid_chunk_threads"]
+
+
+def executor_from(number_of_threads):
+    """
+    Returns the thread pool used to evaluate the chunks of a grid in parallel, which is created the first time it is
+    requested for a given number of threads and shared thereafter.
+
+    This pool is separate from the pool used by a `Plane` to compute its galaxies in parallel, such that a galaxy
+    being computed in a thread of that pool can evaluate its grid in chunks without the pool waiting on itself.
+
+    Parameters
+    ----------
+    number_of_threads : int
+        The number of threads in the pool.
+    """
+    if number_of_threads is None or number_of_threads <= 1:
+        return None
+
+    with _executor_lock:
+
+        if number_of_threads not in _executors:
+            _executors[number_of_threads] = ThreadPoolExecutor(
+                max_workers=number_of_threads
+            )
+
+        return _executors[number_of_threads]
+
+
+def use_chunks_for_grid(grid, pixels_per_chunk=None) -> bool:
+    """
+    Returns `True` if a binned quantity should be computed on the input grid in chunks, which is the case if the grid
+    is a `Grid` with more unmasked pixels than the number of pixels per chunk (a value of 0 or below disables
+    chunking).
+
+    Grids which compute their values using their own scheme (e.g. `GridIterate`, `GridInterpolate`) are never
+    evaluated in chunks.
+
+    Parameters
+    ----------
+    grid : grid_like
+        The grid the quantity is computed on.
+    pixels_per_chunk : int or None
+        The number of unmasked pixels in every chunk, where `None` uses the `grid_chunk_pixels` value in the
+        `parallel` section of the general config.
+    """
+    if not isinstance(grid, grids.Grid):
+        return False
+
+    if pixels_per_chunk is None:
+        pixels_per_chunk = pixels_per_chunk_from_config()
+
+    if pixels_per_chunk <= 0:
+        return False
+
+    return grid.mask.pixels_in_mask > pixels_per_chunk
+
+
+def binned_array_from_func_and_grid(
+    func, grid, pixels_per_chunk=None, number_of_threads=None
+):
+    """
+    Returns the binned-up values of a function evaluated on the sub-grid of a `Grid`, where the sub-grid is split
+    into chunks of whole pixels that are evaluated separately and binned as they are computed.
+
+    For large masks with a high sub-size the function would otherwise create the transformed sub-grid, and several
+    temporary arrays of the same size, for every profile. Evaluating in chunks means the memory used scales with the
+    chunk size instead. The chunks are evaluated in parallel threads if `number_of_threads` is above 1.
+
+    The sub-pixels of every pixel are contiguous in a `Grid`'s 1D representation and every pixel is binned
+    independently, therefore the result is identical to evaluating the function on the full sub-grid and binning
+    its output (e.g. via `in_1d_binned`).
+
+    Parameters
+    ----------
+    func : function
+        A function which takes a NumPy array of (y,x) sub-grid coordinates of shape [total_sub_pixels, 2] and returns
+        the value of a quantity (e.g. the image of a light profile) at every coordinate.
+    grid : Grid
+        The grid whose sub-grid the function is evaluated on.
+    pixels_per_chunk : int or None
+        The number of unmasked pixels in every chunk, where `None` uses the `grid_chunk_pixels` value in the
+        `parallel` section of the general config.
+    number_of_threads : int or None
+        The number of threads the chunks are evaluated in, where `None` uses the `grid_chunk_threads` value in the
+        `parallel` section of the general config.
+    """
+    if pixels_per_chunk is None:
+        pixels_per_chunk = pixels_per_chunk_from_config()
+
+    if number_of_threads is None:
+        number_of_threads = number_of_threads_from_config()
+
+    sub_length = grid.mask.sub_length
+    total_pixels = grid.mask.pixels_in_mask
+
+    sub_grid_1d = np.asarray(grid.in_1d)
+
+    def binned_chunk_from(pixel_start):
+
+        pixel_end = min(pixel_start + pixels_per_chunk, total_pixels)
+
+        sub_grid_chunk = sub_grid_1d[pixel_start * sub_length : pixel_end * sub_length]
+
+        return np.asarray(func(sub_grid_chunk)).reshape(-1, sub_length).sum(axis=1)
+
+    pixel_starts = range(0, total_pixels, pixels_per_chunk)
+
+    executor = executor_from(number_of_threads=number_of_threads)
+
+    if executor is None or len(pixel_starts) < 2:
+        binned_chunks = list(map(binned_chunk_from, pixel_starts))
+    else:
+        binned_chunks = list(executor.map(binned_chunk_from, pixel_starts))
+
+    binned_array_1d = np.multiply(grid.mask.sub_fraction, np.concatenate(binned_chunks))
+
+    return arrays.Array.manual_mask(array=binned_array_1d, mask=grid.mask.mask_sub_1)
@@ -0,0 +1,173 @@
+import functools
+
+import numpy as np
+from scipy.special import comb
+
+from autogalaxy.util import profiling_util
+
+
+def kesi(p):
+    """
+    see Eq.(6) of 1906.08263
+    """
+    n_list = np.arange(0, 2 * p + 1, 1)
+    return (2.0 * p * np.log(10) / 3.0 + 2.0 * np.pi * n_list * 1j) ** (0.5)
+
+
+def eta(p):
+    """
+    see Eq.(6) of 1906.00263
+    """
+    eta_list = np.zeros(int(2 * p + 1))
+    kesi_list = np.zeros(int(2 * p + 1))
+    kesi_list[0] = 0.5
+    kesi_list[1 : p + 1] = 1.0
+    kesi_list[int(2 * p)] = 1.0 / 2.0 ** p
+
+    for i in np.arange(1, p, 1):
+        kesi_list[2 * p - i] = kesi_list[2 * p - i + 1] + 2 ** (-p) * comb(p, i)
+
+    for i in np.arange(0, 2 * p + 1, 1):
+        eta_list[i] = (
+            (-1) ** i * 2.0 * np.sqrt(2.0 * np.pi) * 10 ** (p / 3.0) * kesi_list[i]
+        )
+
+    return eta_list
+
+
+def decompose_func_into_gaussians(
+    func, radii_min, radii_max, func_terms=28, func_gaussians=20
+):
+    """
+    Decompose a circularly symmetric function of radius into a sum of Gaussians, returning the amplitude and sigma of
+    every Gaussian (see 1906.08263).
+
+    Parameters
+    ----------
+    func : func
+        The function representing the profile that is decomposed into Gaussians, which must accept complex radii.
+    radii_min : float
+        The smallest sigma of the Gaussians.
+    radii_max : float
+        The largest sigma of the Gaussians.
+    func_terms : int
+        The number of terms used to approximate the input func.
+    func_gaussians : int
+        The number of Gaussians used to represent the input func.
+    """
+    with profiling_util.timer(stage="mge"):
+
+        kesis = kesi(func_terms)  # kesi in Eq.(6) of 1906.08263
+        etas = eta(func_terms)  # eta in Eqr.(6) of 1906.08263
+
+        # sigma is sampled from logspace between these radii.
+
+        log_sigmas = np.linspace(np.log(radii_min), np.log(radii_max), func_gaussians)
+        d_log_sigma = log_sigmas[1] - log_sigmas[0]
+        sigmas = np.exp(log_sigmas)
+
+        amps = np.zeros(func_gaussians)
+
+        for i in range(func_gaussians):
+            f_sigma = np.sum(etas * np.real(func(sigmas[i] * kesis)))
+            if (i == -1) or (i == (func_gaussians - 1)):
+                amps[i] = 0.5 * f_sigma * d_log_sigma / np.sqrt(2.0 * np.pi)
+            else:
+                amps[i] = f_sigma * d_log_sigma / np.sqrt(2.0 * np.pi)
+
+        return amps, sigmas
+
+
+def read_only(amps, sigmas):
+    """
+    Flag the arrays of a cached decomposition as read-only, so that a caller cannot change the cached values in place.
+    """
+    amps.setflags(write=False)
+    sigmas.setflags(write=False)
+    return amps, sigmas
+
+
+@functools.lru_cache(maxsize=256)
+def sersic_gaussians_from(
+    effective_radius, sersic_index, sersic_constant, radii_min, radii_max
+):
+    """
+    Returns the amplitudes and sigmas of the Gaussians a Sersic profile with an intensity of 1.0 is decomposed into.
+
+    The decomposition is the same for the Sersic light profiles and the Sersic mass profiles (whose convergence is
+    the Sersic profile multiplied by its intensity and mass-to-light ratio), therefore both use this function, whose
+    results are cached for the most recently used parameters. The returned arrays are read-only.
+
+    Parameters
+    ----------
+    effective_radius : float
+        The circular radius containing half the light of the profile.
+    sersic_index : float
+        Controls the concentration of the of the profile.
+    sersic_constant : float
+        The Sersic constant derived from the Sersic index.
+    radii_min : float
+        The smallest sigma of the Gaussians.
+    radii_max : float
+        The largest sigma of the Gaussians.
+    """
+
+    def sersic_2d(r):
+        return np.exp(
+            -sersic_constant * (((r / effective_radius) ** (1.0 / sersic_index)) - 1.0)
+        )
+
+    return read_only(
+        *decompose_func_into_gaussians(
+            func=sersic_2d, radii_min=radii_min, radii_max=radii_max
+        )
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def core_sersic_gaussians_from(
+    effective_radius,
+    sersic_index,
+    sersic_constant,
+    radius_break,
+    alpha,
+    gamma,
+    radii_min,
+    radii_max,
+):
+    """
+    Returns the amplitudes and sigmas of the Gaussians a cored-Sersic profile with an intensity prime of 1.0 is
+    decomposed into, which are cached and shared by light and mass profiles (see `sersic_gaussians_from`).
+
+    Parameters
+    ----------
+    effective_radius : float
+        The circular radius containing half the light of the profile.
+    sersic_index : float
+        Controls the concentration of the of the profile.
+    sersic_constant : float
+        The Sersic constant derived from the Sersic index.
+    radius_break : float
+        The break radius separating the inner power-law and outer Sersic function.
+    alpha : float
+        Controls the sharpness of the transition between the inner core / outer Sersic profiles.
+    gamma : float
+        The logarithmic power-law slope of the inner core profiles.
+    radii_min : float
+        The smallest sigma of the Gaussians.
+    radii_max : float
+        The largest sigma of the Gaussians.
+    """
+
+    def core_sersic_2D(r):
+        return (1.0 + (radius_break / r) ** alpha) ** (gamma / alpha) * np.exp(
+            -sersic_constant
+            * ((r ** alpha + radius_break ** alpha) / effective_radius ** alpha)
+            ** (1.0 / (sersic_index * alpha))
+        )
+
+    return read_only(
+        *decompose_func_into_gaussians(
+            func=core_sersic_2D, radii_min=radii_min, radii_max=radii_max
+        )
+    )
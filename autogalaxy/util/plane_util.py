@@ -1,8 +1,124 @@
 import numpy as np
-from autoarray.structures import grids
+from autoconf import conf
+from autoarray.structures import grids, visibilities as vis
 from autogalaxy import exc
 from autogalaxy.plane import plane as pl
 
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+_executors = {}
+_executor_lock = threading.Lock()
+_worker_state = threading.local()
+
+
+def number_of_threads_from_config():
+    return conf.instance["general"]["parallel"]["plane_threads"]
+
+
+def executor_from(number_of_threads):
+    """
+    Returns the thread pool used to compute the quantities of galaxies in parallel, which is created the first time
+    it is requested for a given number of threads and shared by all planes thereafter (planes are created for every
+    likelihood evaluation, therefore creating a pool per plane would be too slow).
+
+    `None` is returned if the number of threads is 1 or below, indicating the galaxies are computed serially.
+
+    Parameters
+    ----------
+    number_of_threads : int
+        The number of threads in the pool.
+    """
+    if number_of_threads is None or number_of_threads <= 1:
+        return None
+
+    with _executor_lock:
+
+        if number_of_threads not in _executors:
+            _executors[number_of_threads] = ThreadPoolExecutor(
+                max_workers=number_of_threads, initializer=_set_is_worker
+            )
+
+        return _executors[number_of_threads]
+
+
+def _set_is_worker():
+    _worker_state.is_worker = True
+
+
+def values_of_galaxies_from(func, galaxies, number_of_threads=None):
+    """
+    Returns a list of the values of a function applied to a list of galaxies, in the same order as the galaxies.
+
+    If the number of threads is above 1 the function is applied to the galaxies in parallel using a shared thread
+    pool. Most of the calculation of a galaxy's image or deflection angles is in NumPy, scipy and numba functions
+    which release the GIL, so the galaxies are computed concurrently. The values are always returned in the order of
+    the galaxies, so summing them gives the same result (to the bit) as computing them serially.
+
+    Calls made from within a thread of the pool (e.g. a plane nested inside a galaxy calculation) are performed
+    serially, so the pool cannot deadlock waiting on itself.
+
+    Parameters
+    ----------
+    func : function
+        The function applied to each galaxy, which takes the galaxy as its only input.
+    galaxies : [Galaxy]
+        The galaxies the function is applied to.
+    number_of_threads : int or None
+        The number of threads used, where `None` uses the `plane_threads` value in the `parallel` section of the
+        general config.
+    """
+    if number_of_threads is None:
+        number_of_threads = number_of_threads_from_config()
+
+    if (
+        len(galaxies) < 2
+        or number_of_threads <= 1
+        or getattr(_worker_state, "is_worker", False)
+    ):
+        return list(map(func, galaxies))
+
+    return list(executor_from(number_of_threads=number_of_threads).map(func, galaxies))
+
+
+def visibilities_of_images_from(images, transformer):
+    """
+    Returns the visibilities of a list of images, which are Fourier transformed by a transformer in one batch.
+
+    The images are stacked as the columns of a (total_image_pixels, total_images) matrix which is transformed using
+    the transformer's `transformed_mapping_matrix_from_mapping_matrix` method, such that the `TransformerDFT`'s
+    preloaded transforms and the `TransformerNUFFT`'s plan are used for every image in one call. The visibilities of
+    each image are the same as those of `visibilities_from_image`.
+
+    The mapping matrix transform skips pixels with negative values, therefore if any image has a negative value the
+    images are transformed individually.
+
+    Parameters
+    ----------
+    images : [Array]
+        The images (binned to the transformer's real-space mask) which are Fourier transformed.
+    transformer : TransformerDFT or TransformerNUFFT
+        The transformer which maps the images to the uv-plane.
+    """
+    if not images:
+        return []
+
+    images_matrix = np.stack(
+        [np.asarray(image.in_1d_binned) for image in images], axis=1
+    )
+
+    if np.any(images_matrix < 0.0):
+        return [transformer.visibilities_from_image(image=image) for image in images]
+
+    visibilities_matrix = transformer.transformed_mapping_matrix_from_mapping_matrix(
+        mapping_matrix=images_matrix
+    )
+
+    return [
+        vis.Visibilities(visibilities=visibilities_matrix[:, image_index])
+        for image_index in range(len(images))
+    ]
+
 
 def plane_image_of_galaxies_from(shape, grid, galaxies, buffer=1.0e-2):
 
@@ -0,0 +1,130 @@
+import contextlib
+import threading
+import time
+from collections import defaultdict
+
+
+class Profiler:
+    def __init__(self):
+        """
+        Accumulates the time spent in, and the number of calls to, every stage of a likelihood evaluation which is
+        wrapped in a `timer` whilst the profiler is active (see `profiling`).
+
+        Stages are named by the stage and, for galaxies and profiles, the galaxy's name or the profile's class (e.g.
+        "galaxy.galaxies.lens" or "light_profile.EllipticalSersic"). The time of a stage includes the time of any
+        stages nested within it, for example a galaxy's time includes the time of its light profiles.
+        """
+        self.seconds = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.galaxy_names = {}
+
+        self._lock = threading.Lock()
+
+    def add(self, name, seconds):
+
+        with self._lock:
+            self.seconds[name] += seconds
+            self.calls[name] += 1
+
+    def name_from(self, stage, obj=None) -> str:
+        """
+        Returns the name a stage is recorded under, which for a galaxy is the name given to it in `galaxy_names`
+        (e.g. its path in the model instance) and for any other object is its class name.
+        """
+        if obj is None:
+            return stage
+        if stage == "galaxy":
+            return (
+                f"{stage}.{self.galaxy_names.get(id(obj), f'redshift_{obj.redshift}')}"
+            )
+        return f"{stage}.{type(obj).__name__}"
+
+    @property
+    def stages(self) -> dict:
+        """
+        A dictionary of the total seconds and calls of every stage, ordered from the slowest stage.
+        """
+        return {
+            name: {"seconds": self.seconds[name], "calls": self.calls[name]}
+            for name in sorted(self.seconds, key=self.seconds.get, reverse=True)
+        }
+
+
+_profiler = None
+
+
+class _Timer:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.profiler.add(name=self.name, seconds=time.perf_counter() - self.start)
+
+
+class _NoTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+_no_timer = _NoTimer()
+
+
+@contextlib.contextmanager
+def profiling():
+    """
+    Activate a `Profiler` for the duration of a with block, which every `timer` records into.
+
+    When no profiler is active a `timer` does nothing, such that the stages of a likelihood evaluation are not
+    timed unless profiling is requested.
+    """
+    global _profiler
+
+    previous_profiler = _profiler
+    _profiler = Profiler()
+
+    try:
+        yield _profiler
+    finally:
+        _profiler = previous_profiler
+
+
+def timer(stage, obj=None):
+    """
+    Returns a context manager which records the time of a stage in the active profiler, or does nothing if no
+    profiler is active (see `profiling`).
+
+    Parameters
+    ----------
+    stage : str
+        The name of the stage, e.g. "convolution".
+    obj
+        If input, the galaxy or profile the stage is computed for, whose name or class name is appended to the
+        stage name.
+    """
+    if _profiler is None:
+        return _no_timer
+    return _Timer(profiler=_profiler, name=_profiler.name_from(stage=stage, obj=obj))
+
+
+def timed_call(func, stage, obj=None, **kwargs):
+    """
+    Returns the value of a function called with the input keyword arguments, recording its time as a stage (see
+    `timer`).
+    """
+    if _profiler is None:
+        return func(**kwargs)
+
+    with timer(stage=stage, obj=obj):
+        return func(**kwargs)
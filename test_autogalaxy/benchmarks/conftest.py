@@ -0,0 +1,187 @@
+"""
+Benchmarks of the light profiles, mass profiles, planes and fits of **PyAutoGalaxy**, which time the hot paths of a
+likelihood evaluation at several mask sizes and sub-grid sizes using pytest-benchmark.
+
+The benchmarks are only collected if pytest-benchmark is installed and `--benchmark-only` is input, such that they
+are not run with the unit tests. From the root of the repository, a baseline is stored with:
+
+    pytest test_autogalaxy/benchmarks --benchmark-only --benchmark-storage=test_autogalaxy/benchmarks/baselines
+    --benchmark-autosave
+
+and a later run is compared to the latest baseline, failing if the mean time of any benchmark increases by more
+than 10%, with:
+
+    pytest test_autogalaxy/benchmarks --benchmark-only --benchmark-storage=test_autogalaxy/benchmarks/baselines
+    --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+
+try:
+    import pytest_benchmark
+except ImportError:
+    pytest_benchmark = None
+
+pixel_scales = (0.1, 0.1)
+shape_2d = (71, 71)
+
+mask_radii = [1.0, 2.0, 3.0]
+sub_sizes = [1, 2, 4]
+
+
+def pytest_ignore_collect(path, config):
+
+    if path.basename.startswith("test_"):
+        return pytest_benchmark is None or not config.getoption(
+            "benchmark_only", default=False
+        )
+
+
+def make_plane(model):
+    """
+    Returns a plane of one of the representative models the benchmarks are performed for:
+
+    - sersic: a single `EllipticalSersic` galaxy.
+    - bulge_disk: a galaxy with an `EllipticalDevVaucouleurs` bulge, `EllipticalExponential` disk and an
+      `EllipticalIsothermal` mass profile.
+    - group: a bulge-disk galaxy and four `EllipticalSersic` satellites with `SphericalIsothermal` mass profiles.
+    """
+    if model == "sersic":
+        return ag.Plane(
+            galaxies=[
+                ag.Galaxy(
+                    redshift=0.5,
+                    light=ag.lp.EllipticalSersic(
+                        centre=(0.0, 0.0),
+                        elliptical_comps=(0.1, 0.0),
+                        intensity=1.0,
+                        effective_radius=0.8,
+                        sersic_index=3.0,
+                    ),
+                )
+            ]
+        )
+
+    bulge_disk = ag.Galaxy(
+        redshift=0.5,
+        bulge=ag.lp.EllipticalDevVaucouleurs(
+            centre=(0.0, 0.0),
+            elliptical_comps=(0.05, 0.0),
+            intensity=1.0,
+            effective_radius=0.5,
+        ),
+        disk=ag.lp.EllipticalExponential(
+            centre=(0.0, 0.0),
+            elliptical_comps=(0.2, 0.1),
+            intensity=0.5,
+            effective_radius=1.2,
+        ),
+        mass=ag.mp.EllipticalIsothermal(
+            centre=(0.0, 0.0), elliptical_comps=(0.1, 0.0), einstein_radius=1.0
+        ),
+    )
+
+    if model == "bulge_disk":
+        return ag.Plane(galaxies=[bulge_disk])
+
+    satellites = [
+        ag.Galaxy(
+            redshift=0.5,
+            light=ag.lp.EllipticalSersic(
+                centre=centre,
+                elliptical_comps=(0.0, 0.1),
+                intensity=0.2,
+                effective_radius=0.2,
+                sersic_index=2.0,
+            ),
+            mass=ag.mp.SphericalIsothermal(centre=centre, einstein_radius=0.1),
+        )
+        for centre in [(1.0, 1.0), (-1.0, 1.0), (1.0, -1.0), (-1.0, -1.0)]
+    ]
+
+    return ag.Plane(galaxies=[bulge_disk] + satellites)
+
+
+@pytest.fixture(
+    name="sub_size", params=sub_sizes, ids=lambda sub_size: f"sub_{sub_size}"
+)
+def make_sub_size(request):
+    return request.param
+
+
+@pytest.fixture(name="mask", params=mask_radii, ids=lambda radius: f"radius_{radius}")
+def make_mask(request, sub_size):
+    return ag.Mask2D.circular(
+        shape_2d=shape_2d,
+        radius=request.param,
+        pixel_scales=pixel_scales,
+        sub_size=sub_size,
+    )
+
+
+@pytest.fixture(name="grid")
+def make_grid(mask):
+    return ag.Grid.from_mask(mask=mask)
+
+
+@pytest.fixture(name="imaging", scope="session")
+def make_imaging():
+
+    simulator = ag.SimulatorImaging(
+        exposure_time=300.0,
+        psf=ag.Kernel.from_gaussian(
+            shape_2d=(11, 11), sigma=0.1, pixel_scales=pixel_scales
+        ),
+        background_sky_level=0.1,
+        add_poisson_noise=True,
+        noise_seed=1,
+    )
+
+    return simulator.from_plane_and_grid(
+        plane=make_plane(model="group"),
+        grid=ag.Grid.uniform(shape_2d=shape_2d, pixel_scales=pixel_scales, sub_size=2),
+    )
+
+
+@pytest.fixture(name="interferometer", scope="session")
+def make_interferometer():
+
+    simulator = ag.SimulatorInterferometer(
+        uv_wavelengths=np.random.RandomState(seed=1).uniform(
+            low=-1.0e5, high=1.0e5, size=(1000, 2)
+        ),
+        exposure_time=300.0,
+        transformer_class=ag.TransformerNUFFT,
+        noise_sigma=0.1,
+        noise_seed=1,
+    )
+
+    return simulator.from_plane_and_grid(
+        plane=make_plane(model="group"),
+        grid=ag.Grid.uniform(shape_2d=shape_2d, pixel_scales=pixel_scales, sub_size=2),
+    )
+
+
+@pytest.fixture(name="masked_imaging")
+def make_masked_imaging(imaging, mask, sub_size):
+    return ag.MaskedImaging(
+        imaging=imaging,
+        mask=mask,
+        settings=ag.SettingsMaskedImaging(sub_size=sub_size),
+    )
+
+
+@pytest.fixture(name="masked_interferometer")
+def make_masked_interferometer(interferometer, mask, sub_size):
+    return ag.MaskedInterferometer(
+        interferometer=interferometer,
+        visibilities_mask=np.full(
+            fill_value=False, shape=interferometer.visibilities.shape
+        ),
+        real_space_mask=mask,
+        settings=ag.SettingsMaskedInterferometer(
+            sub_size=sub_size, transformer_class=ag.TransformerNUFFT
+        ),
+    )
@@ -0,0 +1,30 @@
+import pytest
+
+import autogalaxy as ag
+from test_autogalaxy.benchmarks.conftest import make_plane
+
+models = ["sersic", "bulge_disk", "group"]
+
+
+@pytest.mark.parametrize("model", models)
+def test__fit_imaging(benchmark, model, masked_imaging):
+
+    plane = make_plane(model=model)
+
+    def func():
+        return ag.FitImaging(masked_imaging=masked_imaging, plane=plane).figure_of_merit
+
+    benchmark(func)
+
+
+@pytest.mark.parametrize("model", models)
+def test__fit_interferometer(benchmark, model, masked_interferometer):
+
+    plane = make_plane(model=model)
+
+    def func():
+        return ag.FitInterferometer(
+            masked_interferometer=masked_interferometer, plane=plane
+        ).figure_of_merit
+
+    benchmark(func)
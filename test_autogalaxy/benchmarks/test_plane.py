@@ -0,0 +1,34 @@
+import pytest
+
+from test_autogalaxy.benchmarks.conftest import make_plane
+
+models = ["sersic", "bulge_disk", "group"]
+
+
+@pytest.mark.parametrize("model", models)
+def test__image_from_grid(benchmark, model, grid):
+
+    plane = make_plane(model=model)
+
+    benchmark(plane.image_from_grid, grid=grid)
+
+
+@pytest.mark.parametrize("model", ["bulge_disk", "group"])
+def test__deflections_from_grid(benchmark, model, grid):
+
+    plane = make_plane(model=model)
+
+    benchmark(plane.deflections_from_grid, grid=grid)
+
+
+@pytest.mark.parametrize("model", models)
+def test__blurred_image_from_grid_and_convolver(benchmark, model, masked_imaging):
+
+    plane = make_plane(model=model)
+
+    benchmark(
+        plane.blurred_image_from_grid_and_convolver,
+        grid=masked_imaging.grid,
+        convolver=masked_imaging.convolver,
+        blurring_grid=masked_imaging.blurring_grid,
+    )
@@ -0,0 +1,53 @@
+import inspect
+
+import pytest
+
+import autogalaxy as ag
+
+
+def profile_classes_from(module, base_class, exclude):
+    return [
+        cls
+        for name, cls in sorted(vars(module).items())
+        if inspect.isclass(cls)
+        and issubclass(cls, base_class)
+        and cls.__module__.startswith("autogalaxy.profiles")
+        and cls not in exclude
+    ]
+
+
+light_profile_classes = profile_classes_from(
+    module=ag.lp,
+    base_class=ag.lp.LightProfile,
+    exclude=[
+        ag.lp.LightProfile,
+        ag.lp.EllipticalLightProfile,
+        ag.lp.AbstractEllipticalSersic,
+    ],
+)
+
+mass_profile_classes = profile_classes_from(
+    module=ag.mp,
+    base_class=ag.mp.MassProfile,
+    exclude=[ag.mp.MassProfile, ag.mp.EllipticalMassProfile, ag.mp.InputDeflections],
+)
+
+
+@pytest.mark.parametrize(
+    "light_profile_class", light_profile_classes, ids=lambda cls: cls.__name__
+)
+def test__image_from_grid(benchmark, light_profile_class, grid):
+
+    light_profile = light_profile_class()
+
+    benchmark(light_profile.image_from_grid, grid=grid)
+
+
+@pytest.mark.parametrize(
+    "mass_profile_class", mass_profile_classes, ids=lambda cls: cls.__name__
+)
+def test__deflections_from_grid(benchmark, mass_profile_class, grid):
+
+    mass_profile = mass_profile_class()
+
+    benchmark(mass_profile.deflections_from_grid, grid=grid)
@@ -41,9 +41,19 @@ def test__dataset_generator_from_aggregator(imaging_7x7, mask_7x7, samples):
 
     agg = af.Aggregator(directory=phase_imaging_7x7.paths.output_path)
 
+    dataset = list(agg.map(func=ag.agg.dataset_from_agg_obj))
+
+    assert (dataset[0].image == imaging_7x7.image).all()
+    assert (dataset[0].psf == imaging_7x7.psf).all()
+
+    mask = list(agg.map(func=ag.agg.mask_from_agg_obj))
+
+    assert (mask[0] == mask_7x7).all()
+    assert mask[0].pixel_scales == mask_7x7.pixel_scales
+
     dataset = list(agg.values("dataset"))
 
-    print(dataset)
+    assert (dataset[0].image == imaging_7x7.image).all()
 
 
 def test__plane_generator_from_aggregator(imaging_7x7, mask_7x7, samples):
@@ -198,3 +208,72 @@ def test__fit_interferometer_generator_from_aggregator(
         assert (
             fit_interferometer.masked_interferometer.real_space_mask == mask_7x7
         ).all()
+
+
+def figure_of_merit_from(agg_obj):
+    return ag.agg.fit_imaging_from_agg_obj(agg_obj=agg_obj).figure_of_merit
+
+
+@pytest.fixture(name="agg_imaging")
+def make_agg_imaging(imaging_7x7, mask_7x7, samples):
+    phase_imaging_7x7 = ag.PhaseImaging(
+        galaxies=dict(
+            galaxy=ag.GalaxyModel(redshift=0.5, light=ag.lp.EllipticalSersic),
+            source=ag.GalaxyModel(redshift=1.0, light=ag.lp.EllipticalSersic),
+        ),
+        search=mock.MockSearch(samples=samples, name="test_phase_aggregator"),
+    )
+
+    phase_imaging_7x7.run(
+        dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults(samples=samples)
+    )
+
+    return af.Aggregator(directory=phase_imaging_7x7.paths.output_path)
+
+
+def test__generators_mapped_with_worker_processes__same_as_serial(agg_imaging):
+
+    fits = list(ag.agg.FitImaging(aggregator=agg_imaging))
+    fits_pool = list(ag.agg.FitImaging(aggregator=agg_imaging, number_of_processes=2))
+
+    assert len(fits_pool) == len(fits)
+
+    for fit, fit_pool in zip(fits, fits_pool):
+        assert fit_pool.figure_of_merit == pytest.approx(fit.figure_of_merit, 1.0e-8)
+
+
+def test__masked_imaging_reused_for_same_dataset_mask_and_settings(agg_imaging):
+
+    masked_imaging_0 = ag.agg.masked_imaging_from_agg_obj(agg_obj=agg_imaging[0])
+    masked_imaging_1 = ag.agg.masked_imaging_from_agg_obj(agg_obj=agg_imaging[0])
+
+    assert masked_imaging_0 is masked_imaging_1
+
+
+def test__cached_generator__values_loaded_from_disk_after_first_run(agg_imaging):
+
+    figures_of_merit = list(
+        ag.agg.Cached(
+            aggregator=agg_imaging,
+            name="figure_of_merit",
+            func=figure_of_merit_from,
+            number_of_processes=2,
+        )
+    )
+
+    assert figures_of_merit[0] == pytest.approx(
+        figure_of_merit_from(agg_obj=agg_imaging[0]), 1.0e-8
+    )
+    assert path.exists(
+        path.join(
+            agg_imaging[0].directory, "aggregator_cache", "figure_of_merit.pickle"
+        )
+    )
+
+    def func(agg_obj):
+        raise AssertionError("The cached value was not loaded")
+
+    assert (
+        list(ag.agg.Cached(aggregator=agg_imaging, name="figure_of_merit", func=func))
+        == figures_of_merit
+    )
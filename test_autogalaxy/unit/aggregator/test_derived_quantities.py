@@ -0,0 +1,390 @@
+import os
+
+import numpy as np
+import pytest
+
+import autofit as af
+import autogalaxy as ag
+from autofit.non_linear.samples import Sample
+from autogalaxy.aggregator import derived_quantities as dq
+
+
+def instance_from(**galaxies):
+    instance = af.ModelInstance()
+    instance.galaxies = af.ModelInstance()
+
+    for name, galaxy in galaxies.items():
+        setattr(instance.galaxies, name, galaxy)
+
+    return instance
+
+
+def samples_from(model, total_samples=20):
+    random_state = np.random.RandomState(1)
+
+    parameters = [
+        model.vector_from_unit_vector(
+            unit_vector=random_state.uniform(0.2, 0.8, model.prior_count)
+        )
+        for _ in range(total_samples)
+    ]
+
+    weights = random_state.uniform(0.0, 1.0, total_samples)
+    weights[:5] = 0.0
+
+    return af.PDFSamples(
+        model=model,
+        samples=Sample.from_lists(
+            model=model,
+            parameters=parameters,
+            log_likelihoods=[1.0] * total_samples,
+            log_priors=[0.0] * total_samples,
+            weights=list(weights),
+        ),
+    )
+
+
+@pytest.fixture(name="samples")
+def make_samples():
+    model = af.ModelMapper()
+    model.galaxies = af.CollectionPriorModel(
+        lens=ag.GalaxyModel(
+            redshift=0.5, light=ag.lp.SphericalSersic, mass=ag.mp.SphericalIsothermal
+        )
+    )
+
+    return samples_from(model=model)
+
+
+@pytest.fixture(name="grid")
+def make_grid():
+    return ag.Grid.uniform(shape_2d=(50, 50), pixel_scales=0.2)
+
+
+class TestClosedForms:
+    def test__light_profiles__match_luminosity_within_circle(self):
+
+        for profile in [
+            ag.lp.SphericalSersic(
+                intensity=3.0, effective_radius=2.0, sersic_index=2.0
+            ),
+            ag.lp.EllipticalExponential(
+                elliptical_comps=(0.1, 0.2), intensity=1.0, effective_radius=0.6
+            ),
+            ag.lp.EllipticalGaussian(
+                elliptical_comps=(0.1, 0.2), intensity=2.0, sigma=0.8
+            ),
+        ]:
+
+            func, parameters = dq.within_circle_func_and_parameters_from(
+                profile=profile
+            )
+
+            assert func(1.5, *parameters) == pytest.approx(
+                profile.luminosity_within_circle(radius=1.5), 1.0e-4
+            )
+
+    def test__mass_profiles__match_mass_angular_within_circle(self):
+
+        for profile in [
+            ag.mp.EllipticalSersic(
+                intensity=3.0,
+                effective_radius=2.0,
+                sersic_index=2.0,
+                mass_to_light_ratio=2.0,
+            ),
+            ag.mp.SphericalIsothermal(einstein_radius=1.5),
+            ag.mp.EllipticalCoredPowerLaw(
+                elliptical_comps=(0.1, 0.2),
+                einstein_radius=1.2,
+                slope=2.3,
+                core_radius=0.2,
+            ),
+            ag.mp.SphericalNFW(kappa_s=0.3, scale_radius=1.5),
+        ]:
+
+            func, parameters = dq.within_circle_func_and_parameters_from(
+                profile=profile
+            )
+
+            for radius in [0.5, 1.5, 2.2]:
+                assert func(radius, *parameters) == pytest.approx(
+                    profile.mass_angular_within_circle(radius=radius), 1.0e-4
+                )
+
+    def test__profiles_without_closed_form__return_none(self):
+
+        assert (
+            dq.within_circle_func_and_parameters_from(
+                profile=ag.lp.SphericalCoreSersic()
+            )
+            is None
+        )
+        assert (
+            dq.within_circle_func_and_parameters_from(
+                profile=ag.mp.SphericalTruncatedNFW()
+            )
+            is None
+        )
+
+    def test__profile_batch__sums_profiles_of_each_sample(self):
+
+        sersic_0 = ag.lp.SphericalSersic(intensity=1.0)
+        sersic_1 = ag.lp.SphericalSersic(intensity=2.0, effective_radius=0.3)
+        gaussian = ag.lp.EllipticalGaussian(intensity=2.0, sigma=0.8)
+
+        batch = dq.ProfileBatch.from_profiles(
+            profiles_of_samples=[[sersic_0, gaussian], [sersic_1], []]
+        )
+
+        values = batch.values_within_circles_from(radii=np.array([1.0, 2.0, 3.0]))
+
+        assert values[0] == pytest.approx(
+            sersic_0.luminosity_within_circle(radius=1.0)
+            + gaussian.luminosity_within_circle(radius=1.0),
+            1.0e-4,
+        )
+        assert values[1] == pytest.approx(
+            sersic_1.luminosity_within_circle(radius=2.0), 1.0e-4
+        )
+        assert values[2] == 0.0
+
+        assert (
+            dq.ProfileBatch.from_profiles(
+                profiles_of_samples=[[sersic_0], [ag.lp.SphericalCoreSersic()]]
+            )
+            is None
+        )
+
+
+class TestQuantities:
+    def test__einstein_radius__circular_lens_computed_in_closed_form(self, grid):
+
+        einstein_radius = dq.EinsteinRadius(grid=grid)
+
+        instance = instance_from(
+            lens=ag.Galaxy(
+                redshift=0.5, mass=ag.mp.SphericalIsothermal(einstein_radius=1.5)
+            )
+        )
+
+        assert einstein_radius.values_from(instances=[instance]) == pytest.approx(
+            [1.5], 1.0e-6
+        )
+        assert einstein_radius.value_from(instance=instance) == pytest.approx(
+            1.5, 1.0e-1
+        )
+
+        galaxy = ag.Galaxy(
+            redshift=0.5,
+            mass=ag.mp.SphericalCoredPowerLaw(
+                einstein_radius=1.0, slope=2.2, core_radius=0.1
+            ),
+            dark=ag.mp.SphericalNFW(kappa_s=0.2, scale_radius=2.0),
+        )
+
+        radius = einstein_radius.values_from(instances=[instance_from(lens=galaxy)])[0]
+
+        assert galaxy.mass_angular_within_circle(radius=radius) == pytest.approx(
+            np.pi * radius ** 2, 1.0e-4
+        )
+
+        einstein_mass = dq.EinsteinMass(grid=grid)
+
+        assert einstein_mass.values_from(instances=[instance]) == pytest.approx(
+            [np.pi * 1.5 ** 2], 1.0e-6
+        )
+
+    def test__einstein_radius__elliptical_or_offset_lens__no_closed_form(self, grid):
+
+        einstein_radius = dq.EinsteinRadius(grid=grid)
+
+        instance = instance_from(
+            lens=ag.Galaxy(
+                redshift=0.5,
+                mass=ag.mp.EllipticalIsothermal(
+                    elliptical_comps=(0.0, -0.25), einstein_radius=2.0
+                ),
+            )
+        )
+
+        assert einstein_radius.values_from(instances=[instance]) is None
+
+        instance = instance_from(
+            lens=ag.Galaxy(
+                redshift=0.5,
+                mass_0=ag.mp.SphericalIsothermal(centre=(0.0, 0.0)),
+                mass_1=ag.mp.SphericalIsothermal(centre=(0.0, 1.0)),
+            )
+        )
+
+        assert einstein_radius.values_from(instances=[instance]) is None
+
+    def test__luminosity_within_circle__galaxy_names_select_galaxies(self):
+
+        lens = ag.Galaxy(redshift=0.5, light=ag.lp.SphericalSersic(intensity=1.0))
+        source = ag.Galaxy(
+            redshift=1.0, light=ag.lp.EllipticalGaussian(intensity=2.0, sigma=0.5)
+        )
+
+        instance = instance_from(lens=lens, source=source)
+
+        luminosity = dq.LuminosityWithinCircle(radius=1.0, galaxy_names=["source"])
+
+        assert luminosity.values_from(instances=[instance]) == pytest.approx(
+            [source.luminosity_within_circle(radius=1.0)], 1.0e-4
+        )
+        assert luminosity.value_from(instance=instance) == pytest.approx(
+            source.luminosity_within_circle(radius=1.0), 1.0e-4
+        )
+
+        luminosity = dq.LuminosityWithinCircle(radius=1.0)
+
+        assert luminosity.values_from(instances=[instance]) == pytest.approx(
+            [
+                lens.luminosity_within_circle(radius=1.0)
+                + source.luminosity_within_circle(radius=1.0)
+            ],
+            1.0e-4,
+        )
+
+    def test__stellar_and_dark_fractions__match_galaxy(self):
+
+        galaxy = ag.Galaxy(
+            redshift=0.5,
+            stellar=ag.mp.SphericalSersic(intensity=1.0, mass_to_light_ratio=2.0),
+            dark=ag.mp.SphericalNFW(kappa_s=0.2, scale_radius=2.0),
+        )
+
+        instance = instance_from(lens=galaxy)
+
+        dark_fraction = dq.DarkFractionAtRadius(radius=1.0)
+        stellar_fraction = dq.StellarFractionAtRadius(radius=1.0)
+
+        assert dark_fraction.values_from(instances=[instance]) == pytest.approx(
+            [galaxy.dark_fraction_at_radius(radius=1.0)], 1.0e-4
+        )
+        assert dark_fraction.value_from(instance=instance) == pytest.approx(
+            galaxy.dark_fraction_at_radius(radius=1.0), 1.0e-4
+        )
+        assert stellar_fraction.values_from(instances=[instance]) == pytest.approx(
+            [galaxy.stellar_fraction_at_radius(radius=1.0)], 1.0e-4
+        )
+
+
+class TestDerivedQuantitySamples:
+    def test__weighted_summary_statistics(self):
+
+        samples = dq.DerivedQuantitySamples(
+            values=[1.0, 2.0, 3.0, np.nan], weights=[1.0, 1.0, 1.0, 5.0]
+        )
+
+        assert samples.mean == pytest.approx(2.0, 1.0e-8)
+        assert samples.standard_deviation == pytest.approx(np.sqrt(2.0 / 3.0), 1.0e-8)
+        assert samples.median == pytest.approx(2.0, 1.0e-8)
+
+        lower, upper = samples.value_at_sigma(sigma=3.0)
+
+        assert lower <= samples.median <= upper
+
+
+class TestDerivedQuantitiesFromSamples:
+    def test__all_samples__uses_samples_with_positive_weights(self, samples, grid):
+
+        quantities = dq.derived_quantities_from_samples(
+            samples=samples,
+            quantities=[
+                dq.EinsteinRadius(grid=grid),
+                dq.LuminosityWithinCircle(radius=1.0),
+            ],
+        )
+
+        assert list(quantities) == ["einstein_radius", "luminosity_within_circle"]
+
+        instances = [
+            samples.instance_from_sample_index(sample_index=index)
+            for index in range(5, 20)
+        ]
+
+        assert quantities["einstein_radius"].values == pytest.approx(
+            [instance.galaxies.lens.mass.einstein_radius for instance in instances],
+            1.0e-6,
+        )
+        assert quantities["luminosity_within_circle"].values == pytest.approx(
+            [
+                instance.galaxies.lens.luminosity_within_circle(radius=1.0)
+                for instance in instances
+            ],
+            1.0e-4,
+        )
+        assert quantities["einstein_radius"].weights == pytest.approx(
+            samples.weights[5:], 1.0e-8
+        )
+
+    def test__total_draws__unique_samples_weighted_by_draws(self, samples, grid):
+
+        quantities = dq.derived_quantities_from_samples(
+            samples=samples, quantities=[dq.EinsteinRadius(grid=grid)], total_draws=100
+        )
+
+        einstein_radii = quantities["einstein_radius"]
+
+        assert sum(einstein_radii.weights) == 100
+        assert len(einstein_radii.values) == len(set(einstein_radii.values))
+
+        indexes, weights = dq.sample_indexes_and_weights_from(
+            samples=samples, total_draws=100
+        )
+
+        assert min(indexes) >= 5
+
+    def test__cache_directory__values_loaded_from_cache(self, samples, grid, tmp_path):
+
+        cache_directory = str(tmp_path)
+        quantity = dq.LuminosityWithinCircle(radius=1.0)
+
+        values = dq.derived_quantities_from_samples(
+            samples=samples, quantities=[quantity], cache_directory=cache_directory
+        )["luminosity_within_circle"].values
+
+        file_names = os.listdir(cache_directory)
+
+        assert len(file_names) == 1
+
+        np.save(os.path.join(cache_directory, file_names[0]), np.zeros(values.shape))
+
+        cached_values = dq.derived_quantities_from_samples(
+            samples=samples, quantities=[quantity], cache_directory=cache_directory
+        )["luminosity_within_circle"].values
+
+        assert (cached_values == np.zeros(values.shape)).all()
+
+        dq.derived_quantities_from_samples(
+            samples=samples,
+            quantities=[dq.LuminosityWithinCircle(radius=2.0)],
+            cache_directory=cache_directory,
+        )
+
+        assert len(os.listdir(cache_directory)) == 2
+
+    def test__no_closed_form__process_pool_matches_serial(self):
+
+        model = af.ModelMapper()
+        model.galaxies = af.CollectionPriorModel(
+            lens=ag.GalaxyModel(redshift=0.5, light=ag.lp.SphericalCoreSersic)
+        )
+
+        samples = samples_from(model=model, total_samples=8)
+
+        quantities = [dq.LuminosityWithinCircle(radius=1.0)]
+
+        serial = dq.derived_quantities_from_samples(
+            samples=samples, quantities=quantities
+        )
+        parallel = dq.derived_quantities_from_samples(
+            samples=samples, quantities=quantities, number_of_processes=2
+        )
+
+        assert parallel["luminosity_within_circle"].values == pytest.approx(
+            serial["luminosity_within_circle"].values, 1.0e-8
+        )
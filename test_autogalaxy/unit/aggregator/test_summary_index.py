@@ -0,0 +1,113 @@
+from os import path
+
+import pytest
+
+import autofit as af
+import autogalaxy as ag
+from autogalaxy.aggregator import summary_index as si
+from autogalaxy.mock import mock
+
+
+def redshift_sum_from(agg_obj):
+    return sum(
+        galaxy.redshift
+        for galaxy in agg_obj.samples.max_log_likelihood_instance.galaxies
+    )
+
+
+@pytest.fixture(name="output_path")
+def make_output_path(imaging_7x7, mask_7x7):
+    galaxy_0 = ag.Galaxy(redshift=0.5, light=ag.lp.EllipticalSersic(centre=(0.0, 1.0)))
+    galaxy_1 = ag.Galaxy(redshift=1.0, light=ag.lp.EllipticalSersic())
+
+    samples = mock.MockSamples(
+        max_log_likelihood_instance=ag.Plane(galaxies=[galaxy_0, galaxy_1])
+    )
+
+    phase_imaging_7x7 = ag.PhaseImaging(
+        galaxies=dict(
+            galaxy=ag.GalaxyModel(redshift=0.5, light=ag.lp.EllipticalSersic),
+            source=ag.GalaxyModel(redshift=1.0, light=ag.lp.EllipticalSersic),
+        ),
+        search=mock.MockSearch(samples=samples, name="test_phase_summary_index"),
+    )
+
+    phase_imaging_7x7.run(
+        dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults(samples=samples)
+    )
+
+    return phase_imaging_7x7.paths.output_path
+
+
+class TestParametersFromInstance:
+    def test__galaxy_parameters_keyed_by_path__tuples_split(self):
+
+        instance = af.ModelInstance()
+        instance.galaxies = af.ModelInstance()
+        instance.galaxies.lens = ag.Galaxy(
+            redshift=0.5,
+            mass=ag.mp.SphericalIsothermal(centre=(0.1, 0.2), einstein_radius=1.5),
+        )
+
+        parameters = si.parameters_from_instance(instance=instance)
+
+        assert parameters["galaxies.lens.redshift"] == 0.5
+        assert parameters["galaxies.lens.mass.centre_0"] == 0.1
+        assert parameters["galaxies.lens.mass.centre_1"] == 0.2
+        assert parameters["galaxies.lens.mass.einstein_radius"] == 1.5
+        assert parameters["galaxies.lens.mass.axis_ratio"] == 1.0
+
+
+class TestSummaryIndex:
+    def test__update__results_indexed_once(self, output_path, tmp_path):
+
+        with ag.agg.SummaryIndex(
+            file_path=path.join(str(tmp_path), "index.sqlite")
+        ) as index:
+
+            assert index.update(directory=output_path) == 1
+            assert index.update(directory=output_path) == 0
+            assert len(index) == 1
+
+            row = index.rows(names=["galaxies.0.light.centre_1"])[0]
+
+            assert row["name"] == "test_phase_summary_index"
+            assert row["log_likelihood"] == 3.0
+            assert row["galaxies.0.light.centre_1"] == 1.0
+
+    def test__derived_quantities__stored_with_parameters(self, output_path, tmp_path):
+
+        with ag.agg.SummaryIndex(
+            file_path=path.join(str(tmp_path), "index.sqlite")
+        ) as index:
+
+            index.update(
+                directory=output_path,
+                derived_quantities={"redshift_sum": redshift_sum_from},
+            )
+
+            assert "redshift_sum" in index.value_names
+            assert index.rows(names=["redshift_sum"])[0][
+                "redshift_sum"
+            ] == pytest.approx(1.5, 1.0e-4)
+
+    def test__aggregator__only_selected_results_loaded(self, output_path, tmp_path):
+
+        with ag.agg.SummaryIndex(
+            file_path=path.join(str(tmp_path), "index.sqlite")
+        ) as index:
+
+            index.update(directory=output_path)
+
+            agg = index.aggregator(
+                names=["galaxies.1.redshift"], where='"galaxies.1.redshift" > 0.9'
+            )
+
+            assert len(agg) == 1
+
+            for plane in ag.agg.Plane(aggregator=agg):
+                assert plane.galaxies[1].redshift == 1.0
+
+            agg = index.aggregator(where="log_likelihood > ?", parameters=(10.0,))
+
+            assert len(agg) == 0
@@ -0,0 +1,162 @@
+import json
+import os
+from os import path
+
+import dill
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+from autogalaxy.dataset import dataset_store as ds
+
+
+@pytest.fixture(name="store")
+def make_store(tmp_path):
+    return ds.DatasetStore(
+        directory=path.join(str(tmp_path), "dataset_store"), minimum_stored_bytes=0
+    )
+
+
+class TestArrayKey:
+    def test__identical_arrays_have_same_key__different_arrays_do_not(self):
+
+        array = np.arange(6.0)
+
+        assert ds.array_key_from(array=array) == ds.array_key_from(array=np.arange(6.0))
+        assert ds.array_key_from(array=array) != ds.array_key_from(
+            array=np.arange(6.0) + 1.0
+        )
+        assert ds.array_key_from(array=array) != ds.array_key_from(
+            array=array.reshape(2, 3)
+        )
+        assert ds.array_key_from(array=array) != ds.array_key_from(
+            array=array.astype("float32")
+        )
+
+
+class TestDatasetStore:
+    def test__save_and_load_imaging__arrays_are_memory_mapped(self, store, imaging_7x7):
+
+        key = store.save(obj=imaging_7x7)
+
+        imaging = store.load(key=key)
+
+        assert isinstance(imaging, ag.Imaging)
+        assert isinstance(imaging.image, ag.Array)
+        assert (imaging.image == imaging_7x7.image).all()
+        assert (imaging.noise_map == imaging_7x7.noise_map).all()
+        assert (imaging.psf == imaging_7x7.psf).all()
+        assert imaging.image.pixel_scales == imaging_7x7.image.pixel_scales
+        assert isinstance(imaging.image.base, np.memmap)
+        assert not imaging.image.flags.writeable
+
+        imaging = store.load(key=key, mmap_mode=None)
+
+        assert not isinstance(imaging.image.base, np.memmap)
+        assert (imaging.image == imaging_7x7.image).all()
+
+    def test__save_and_load_mask(self, store, mask_7x7):
+
+        mask = store.load(key=store.save(obj=mask_7x7))
+
+        assert isinstance(mask, ag.Mask2D)
+        assert (mask == mask_7x7).all()
+        assert mask.pixel_scales == mask_7x7.pixel_scales
+
+    def test__output_folder_moved__json_reference_loads__pickle_raises_helpful_error(
+        self, tmp_path, mask_7x7
+    ):
+
+        output_path = path.join(str(tmp_path), "output")
+
+        os.makedirs(path.join(output_path, "phase", "pickles"))
+
+        store = ds.DatasetStore(
+            directory=path.join(output_path, "dataset_store"), minimum_stored_bytes=0
+        )
+
+        store.save_reference(
+            obj=mask_7x7,
+            file_path=path.join(output_path, "phase", "pickles", "mask.json"),
+        )
+
+        moved_path = path.join(str(tmp_path), "moved")
+
+        os.rename(output_path, moved_path)
+
+        mask = ds.load_from_reference(
+            file_path=path.join(moved_path, "phase", "pickles", "mask.json")
+        )
+
+        assert (mask == mask_7x7).all()
+
+        with open(path.join(moved_path, "phase", "pickles", "mask.pickle"), "rb") as f:
+            with pytest.raises(FileNotFoundError, match="mask_from_agg_obj"):
+                dill.load(f)
+        assert mask.sub_size == mask_7x7.sub_size
+
+    def test__identical_objects_saved_once(self, store, imaging_7x7, mask_7x7):
+
+        key_0 = store.save(obj=imaging_7x7)
+        total_arrays = len(os.listdir(path.join(store.directory, "arrays")))
+
+        key_1 = store.save(obj=imaging_7x7)
+
+        assert key_0 == key_1
+        assert len(os.listdir(path.join(store.directory, "objects"))) == 1
+        assert len(os.listdir(path.join(store.directory, "arrays"))) == total_arrays
+
+        store.save(obj=mask_7x7)
+
+        assert len(os.listdir(path.join(store.directory, "objects"))) == 2
+
+    def test__small_arrays_are_pickled_with_object(self, tmp_path, imaging_7x7):
+
+        store = ds.DatasetStore(
+            directory=path.join(str(tmp_path), "dataset_store"),
+            minimum_stored_bytes=10 ** 6,
+        )
+
+        imaging = store.load(key=store.save(obj=imaging_7x7))
+
+        assert not path.exists(path.join(store.directory, "arrays"))
+        assert (imaging.image == imaging_7x7.image).all()
+
+
+class TestReference:
+    def test__reference_is_relative_to_store(self, store, tmp_path, mask_7x7):
+
+        os.makedirs(path.join(str(tmp_path), "phase", "pickles"))
+
+        file_path = path.join(str(tmp_path), "phase", "pickles", "mask.json")
+
+        store.save_reference(obj=mask_7x7, file_path=file_path)
+
+        with open(file_path) as f:
+            reference = json.load(f)
+
+        assert reference["type"] == "Mask2D"
+        assert reference["store"] == path.join("..", "..", "dataset_store")
+
+        mask = ds.load_from_reference(file_path=file_path)
+
+        assert (mask == mask_7x7).all()
+
+    def test__pickle_reference__unpickles_object_from_store(
+        self, store, tmp_path, mask_7x7
+    ):
+
+        os.makedirs(path.join(str(tmp_path), "phase", "pickles"))
+
+        store.save_reference(
+            obj=mask_7x7,
+            file_path=path.join(str(tmp_path), "phase", "pickles", "mask.json"),
+        )
+
+        with open(
+            path.join(str(tmp_path), "phase", "pickles", "mask.pickle"), "rb"
+        ) as f:
+            mask = dill.load(f)
+
+        assert (mask == mask_7x7).all()
+        assert mask.pixel_scales == mask_7x7.pixel_scales
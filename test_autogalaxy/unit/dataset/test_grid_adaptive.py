@@ -0,0 +1,139 @@
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+from autogalaxy import exc
+
+
+class TestGridAdaptive:
+    def test__from_mask__coordinates_are_pixel_centres_and_blurring_grid_is_adaptive(
+        self, mask_7x7
+    ):
+
+        grid = ag.GridAdaptive.from_mask(mask=mask_7x7, fractional_accuracy=0.99)
+
+        grid_sub_1 = ag.Grid.from_mask(mask=mask_7x7.mask_sub_1)
+
+        assert isinstance(grid, ag.GridAdaptive)
+        assert grid.sub_size == 1
+        assert grid.fractional_accuracy == 0.99
+        assert grid.sub_steps == [2, 4, 8, 16]
+        assert (grid == grid_sub_1).all()
+
+        blurring_grid = grid.blurring_grid_from_kernel_shape(kernel_shape_2d=(3, 3))
+
+        assert isinstance(blurring_grid, ag.GridAdaptive)
+        assert blurring_grid.fractional_accuracy == 0.99
+
+    def test__grid_at_sub_size__identical_to_sub_grid_of_pixels(self, mask_7x7):
+
+        grid = ag.GridAdaptive.from_mask(mask=mask_7x7)
+
+        mask_sub_4 = mask_7x7.mask_new_sub_size_from_mask(mask=mask_7x7, sub_size=4)
+        grid_sub_4 = ag.Grid.from_mask(mask=mask_sub_4)
+
+        sub_grid = grid.grid_at_sub_size_from(
+            pixel_indexes=np.array([0, 4, 8]), sub_size=4
+        )
+
+        for index, pixel_index in enumerate([0, 4, 8]):
+
+            assert np.sort(
+                sub_grid[index * 16 : (index + 1) * 16], axis=0
+            ) == pytest.approx(
+                np.sort(grid_sub_4[pixel_index * 16 : (pixel_index + 1) * 16], axis=0),
+                1.0e-8,
+            )
+
+    def test__image_of_galaxy__matches_high_sub_size_with_fewer_evaluations(self):
+
+        mask = ag.Mask2D.circular(
+            shape_2d=(51, 51), pixel_scales=0.1, radius=2.4, sub_size=1
+        )
+
+        galaxy = ag.Galaxy(
+            redshift=0.5,
+            light=ag.lp.EllipticalSersic(
+                centre=(0.02, 0.01),
+                elliptical_comps=(0.1, 0.05),
+                intensity=1.0,
+                effective_radius=0.5,
+                sersic_index=4.0,
+            ),
+        )
+
+        grid = ag.GridAdaptive.from_mask(mask=mask, fractional_accuracy=0.99)
+
+        total_coordinates = []
+
+        def func(sub_grid):
+            total_coordinates.append(sub_grid.shape[0])
+            return galaxy.image_from_grid(grid=sub_grid)
+
+        image = grid.binned_array_from_func(
+            func=func, light_profile_centres=galaxy.light_profile_centres
+        )
+
+        mask_sub_16 = mask.mask_new_sub_size_from_mask(mask=mask, sub_size=16)
+        image_sub_16 = galaxy.image_from_grid(
+            grid=ag.Grid.from_mask(mask=mask_sub_16)
+        ).in_1d_binned
+
+        assert image == pytest.approx(image_sub_16, 1.0e-2)
+        assert sum(total_coordinates) < 4 * mask.pixels_in_mask
+
+        assert (galaxy.binned_image_from_grid(grid=grid) == image).all()
+
+        plane = ag.Plane(galaxies=[galaxy])
+
+        assert plane.binned_image_from_grid(grid=grid) == pytest.approx(image, 1.0e-8)
+
+    def test__smooth_pixels__linear_values_are_smooth__masked_neighbours_are_not(self,):
+
+        mask = ag.Mask2D.unmasked(shape_2d=(4, 4), pixel_scales=1.0)
+
+        grid = ag.GridAdaptive.from_mask(mask=mask, fractional_accuracy=0.99)
+
+        values = 10.0 + np.asarray(grid)[:, 0] + 2.0 * np.asarray(grid)[:, 1]
+
+        smooth_pixels = grid.smooth_pixels_from(values=values)
+
+        assert smooth_pixels.reshape(4, 4)[1:3, 1:3].all()
+        assert not smooth_pixels.reshape(4, 4)[0, :].any()
+
+        values[5] += 5.0
+
+        smooth_pixels = grid.smooth_pixels_from(values=values)
+
+        assert not smooth_pixels[5]
+
+
+class TestSettingsMaskedImaging:
+    def test__grid_class_adaptive__masked_imaging_uses_adaptive_grids(
+        self, imaging_7x7, mask_7x7
+    ):
+
+        masked_imaging = ag.MaskedImaging(
+            imaging=imaging_7x7,
+            mask=mask_7x7,
+            settings=ag.SettingsMaskedImaging(
+                grid_class=ag.GridAdaptive, fractional_accuracy=0.999
+            ),
+        )
+
+        assert isinstance(masked_imaging.grid, ag.GridAdaptive)
+        assert isinstance(masked_imaging.blurring_grid, ag.GridAdaptive)
+        assert masked_imaging.grid.fractional_accuracy == 0.999
+
+    def test__tag(self):
+
+        settings = ag.SettingsMaskedImaging(
+            grid_class=ag.GridAdaptive, fractional_accuracy=0.999
+        )
+
+        assert settings.grid_fractional_accuracy_tag == "adapt_facc_0.999"
+
+    def test__grid_inversion_class_adaptive__raises_exception(self):
+
+        with pytest.raises(exc.DatasetException):
+            ag.SettingsMaskedImaging(grid_inversion_class=ag.GridAdaptive)
@@ -3,7 +3,9 @@ from astropy.io import fits
 import os
 from os import path
 import numpy as np
+import pytest
 import autogalaxy as ag
+from autogalaxy import exc
 
 
 def create_fits(fits_path, array):
@@ -106,6 +108,73 @@ class TestMaskedImaging:
         assert (masked_imaging_7x7.blurring_grid.in_1d == blurring_grid_7x7).all()
         assert (masked_imaging_7x7.blurring_grid == blurring_grid).all()
 
+    def test__psf_total_gaussians__psf_fitted_with_gaussians(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        masked_imaging_7x7 = ag.MaskedImaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+
+        assert masked_imaging_7x7.psf_gaussians is None
+
+        settings = ag.SettingsMaskedImaging(psf_total_gaussians=2)
+
+        masked_imaging_7x7 = ag.MaskedImaging(
+            imaging=imaging_7x7, mask=sub_mask_7x7, settings=settings
+        )
+
+        assert len(masked_imaging_7x7.psf_gaussians) == 2
+        assert type(masked_imaging_7x7.convolver) == ag.Convolver
+
+        assert settings.psf_total_gaussians_tag == "__psf_gauss_2"
+        assert ag.SettingsMaskedImaging().psf_total_gaussians_tag == ""
+
+    def test__super_pixel_signal_to_noise__image_noise_map_and_grid_use_super_pixels(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        masked_imaging_7x7 = ag.MaskedImaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+
+        assert masked_imaging_7x7.super_pixels is None
+
+        settings = ag.SettingsMaskedImaging(super_pixel_signal_to_noise=1.0)
+
+        masked_imaging_7x7 = ag.MaskedImaging(
+            imaging=imaging_7x7, mask=sub_mask_7x7, settings=settings
+        )
+
+        assert masked_imaging_7x7.super_pixels.total_super_pixels == 4
+        assert isinstance(masked_imaging_7x7.grid, ag.GridSuperPixels)
+        assert type(masked_imaging_7x7.blurring_grid) == ag.Grid
+
+        assert masked_imaging_7x7.image.in_1d == pytest.approx(np.ones(9), 1.0e-4)
+
+        assert masked_imaging_7x7.noise_map.in_1d == pytest.approx(
+            np.full(9, 2.0), 1.0e-4
+        )
+
+        assert settings.super_pixels_tag == "__super_pix_snr_1.0"
+        assert (
+            ag.SettingsMaskedImaging(
+                super_pixel_signal_to_noise=5.0, super_pixel_max_size=4
+            ).super_pixels_tag
+            == "__super_pix_snr_5.0_max_4"
+        )
+        assert ag.SettingsMaskedImaging().super_pixels_tag == ""
+
+    def test__super_pixel_signal_to_noise_with_grid_class_other_than_grid__raises_exception(
+        self
+    ):
+
+        with pytest.raises(exc.DatasetException):
+            ag.SettingsMaskedImaging(
+                grid_class=ag.GridIterate, super_pixel_signal_to_noise=1.0
+            )
+
+        with pytest.raises(exc.DatasetException):
+            ag.SettingsMaskedImaging(
+                grid_class=ag.GridAdaptive, super_pixel_signal_to_noise=1.0
+            )
+
     def test__modified_image_and_noise_map(
         self, image_7x7, noise_map_7x7, imaging_7x7, sub_mask_7x7
     ):
@@ -101,6 +101,54 @@ class TestMaskedInterferometer:
             == 3.0 * np.ones((19, 2))
         ).all()
 
+    def test__visibilities_compression__dataset_and_transformer_use_compressed_visibilities(
+        self,
+    ):
+        interferometer = ag.Interferometer(
+            visibilities=ag.Visibilities.ones(shape_1d=(19,)),
+            noise_map=ag.Visibilities.full(fill_value=2.0, shape_1d=(19,)),
+            uv_wavelengths=3.0 * np.ones((19, 2)),
+        )
+
+        visibilities_mask = np.full(fill_value=False, shape=(19,))
+
+        real_space_mask = ag.Mask2D.unmasked(
+            shape_2d=(19, 19), pixel_scales=1.0, invert=True, sub_size=8
+        )
+        real_space_mask[9, 9] = False
+
+        masked_interferometer = ag.MaskedInterferometer(
+            interferometer=interferometer,
+            visibilities_mask=visibilities_mask,
+            real_space_mask=real_space_mask,
+            settings=ag.SettingsMaskedInterferometer(
+                transformer_class=ag.TransformerDFT, visibilities_compression="average"
+            ),
+        )
+
+        assert masked_interferometer.visibilities_compression.compression_ratio == 19.0
+        assert masked_interferometer.visibilities.in_1d == pytest.approx(
+            np.array([1.0 + 1.0j]), 1.0e-8
+        )
+        assert masked_interferometer.noise_map.in_1d == pytest.approx(
+            np.array([(2.0 + 2.0j) / np.sqrt(19.0)]), 1.0e-8
+        )
+        assert (
+            masked_interferometer.visibilities_mask
+            == np.full(fill_value=False, shape=(1,))
+        ).all()
+        assert masked_interferometer.transformer.uv_wavelengths == pytest.approx(
+            3.0 * np.ones((1, 2)), 1.0e-8
+        )
+
+        masked_interferometer = ag.MaskedInterferometer(
+            interferometer=interferometer,
+            visibilities_mask=visibilities_mask,
+            real_space_mask=real_space_mask,
+        )
+
+        assert masked_interferometer.visibilities_compression is None
+
 
 class TestSimulatorInterferometer:
     def test__from_plane__same_as_plane_input(self):
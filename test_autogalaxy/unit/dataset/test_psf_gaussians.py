@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+
+
+class TestPSFGaussians:
+    def test__from_kernel__gaussian_kernel__fitted_accurately(self):
+
+        kernel = ag.Kernel.from_gaussian(
+            shape_2d=(21, 21), pixel_scales=0.1, sigma=0.2, renormalize=True
+        )
+
+        psf_gaussians = ag.PSFGaussians.from_kernel(kernel=kernel, total_gaussians=3)
+
+        assert len(psf_gaussians) == 3
+        assert sum(psf_gaussians.weights) == pytest.approx(1.0, 1.0e-2)
+        assert psf_gaussians.fractional_residual < 0.05
+
+        sigma_mean = np.sqrt(
+            sum(
+                weight * sigma ** 2.0
+                for sigma, weight in zip(psf_gaussians.sigmas, psf_gaussians.weights)
+            )
+        )
+
+        assert sigma_mean == pytest.approx(0.2, 5.0e-2)
+
+    def test__from_kernel__two_gaussian_kernel__more_gaussians_fit_better(self):
+
+        kernel_0 = ag.Kernel.from_gaussian(
+            shape_2d=(21, 21), pixel_scales=0.1, sigma=0.15, renormalize=True
+        )
+        kernel_1 = ag.Kernel.from_gaussian(
+            shape_2d=(21, 21), pixel_scales=0.1, sigma=0.5, renormalize=True
+        )
+
+        kernel = ag.Kernel.manual_2d(
+            array=0.7 * kernel_0.in_2d + 0.3 * kernel_1.in_2d, pixel_scales=0.1
+        )
+
+        psf_gaussians_x1 = ag.PSFGaussians.from_kernel(kernel=kernel, total_gaussians=1)
+        psf_gaussians_x3 = ag.PSFGaussians.from_kernel(kernel=kernel, total_gaussians=3)
+
+        assert (
+            psf_gaussians_x3.fractional_residual < psf_gaussians_x1.fractional_residual
+        )
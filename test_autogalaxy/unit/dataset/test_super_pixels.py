@@ -0,0 +1,140 @@
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+
+
+class TestSuperPixels:
+    def test__quadtree__low_signal_to_noise_pixels_grouped(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        masked_imaging = ag.MaskedImaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+
+        super_pixels = ag.SuperPixels.from_mask_image_and_noise_map(
+            mask=masked_imaging.mask,
+            image=masked_imaging.image,
+            noise_map=masked_imaging.noise_map,
+            signal_to_noise_threshold=10.0,
+        )
+
+        assert super_pixels.total_super_pixels == 1
+        assert (super_pixels.super_pixel_indexes == np.zeros(9)).all()
+
+        super_pixels = ag.SuperPixels.from_mask_image_and_noise_map(
+            mask=masked_imaging.mask,
+            image=masked_imaging.image,
+            noise_map=masked_imaging.noise_map,
+            signal_to_noise_threshold=1.0,
+        )
+
+        assert super_pixels.total_super_pixels == 4
+        assert sorted(super_pixels.sizes) == [1, 2, 2, 4]
+
+        super_pixels = ag.SuperPixels.from_mask_image_and_noise_map(
+            mask=masked_imaging.mask,
+            image=masked_imaging.image,
+            noise_map=masked_imaging.noise_map,
+            signal_to_noise_threshold=0.0,
+        )
+
+        assert super_pixels.total_super_pixels == 9
+        assert (super_pixels.sizes == np.ones(9)).all()
+
+    def test__binned_image_and_noise_map__chi_squared_equals_super_pixel_chi_squared(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        masked_imaging = ag.MaskedImaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+
+        super_pixels = ag.SuperPixels(
+            super_pixel_indexes=np.array([0, 0, 1, 0, 0, 1, 2, 2, 1]),
+            total_super_pixels=3,
+        )
+
+        image = masked_imaging.image.copy()
+        image[:] = np.arange(9.0)
+        noise_map = masked_imaging.noise_map.copy()
+        noise_map[:] = np.arange(1.0, 10.0)
+        model_image = masked_imaging.image.copy()
+        model_image[:] = np.arange(9.0) ** 2.0
+
+        binned_image = super_pixels.binned_array_from(array=image)
+        binned_noise_map = super_pixels.noise_map_from(noise_map=noise_map)
+        binned_model_image = super_pixels.binned_array_from(array=model_image)
+
+        assert binned_image.in_1d == pytest.approx(
+            np.array([2.0, 2.0, 5.0, 2.0, 2.0, 5.0, 6.5, 6.5, 5.0]), 1.0e-4
+        )
+        assert binned_image.in_2d[2, 2] == pytest.approx(2.0, 1.0e-4)
+
+        chi_squared = np.sum(
+            ((binned_image - binned_model_image) / binned_noise_map) ** 2.0
+        )
+
+        super_pixel_chi_squared = 0.0
+
+        for super_pixel in range(3):
+
+            members = super_pixels.super_pixel_indexes == super_pixel
+
+            super_pixel_noise = np.sqrt(np.sum(np.asarray(noise_map)[members] ** 2.0))
+            super_pixel_noise /= np.sum(members)
+
+            super_pixel_chi_squared += (
+                (
+                    np.mean(np.asarray(image)[members])
+                    - np.mean(np.asarray(model_image)[members])
+                )
+                / super_pixel_noise
+            ) ** 2.0
+
+        assert chi_squared == pytest.approx(super_pixel_chi_squared, 1.0e-4)
+
+
+class TestGridSuperPixels:
+    def test__binned_image__single_pixels_same_as_sub_grid_and_grouped_pixels_at_centre(
+        self, sub_mask_7x7
+    ):
+
+        galaxy = ag.Galaxy(
+            redshift=0.5,
+            light=ag.lp.EllipticalSersic(centre=(0.1, 0.1), intensity=1.0),
+        )
+
+        grid = ag.GridSuperPixels.from_mask(
+            mask=sub_mask_7x7,
+            super_pixels=ag.SuperPixels(
+                super_pixel_indexes=np.arange(9), total_super_pixels=9
+            ),
+            sub_size=2,
+        )
+
+        assert grid.sub_size == 1
+
+        image = galaxy.binned_image_from_grid(grid=grid)
+
+        image_sub_2 = galaxy.image_from_grid(grid=ag.Grid.from_mask(mask=sub_mask_7x7))
+
+        assert image.in_1d == pytest.approx(image_sub_2.in_1d_binned, 1.0e-4)
+
+        grid = ag.GridSuperPixels.from_mask(
+            mask=sub_mask_7x7,
+            super_pixels=ag.SuperPixels(
+                super_pixel_indexes=np.zeros(9, dtype="int"), total_super_pixels=1
+            ),
+        )
+
+        assert grid.super_pixel_centres == pytest.approx(np.array([[0.0, 0.0]]), 1.0e-4)
+
+        image = galaxy.binned_image_from_grid(grid=grid)
+
+        image_centre = galaxy.image_from_grid(grid=ag.GridIrregular(grid=[(0.0, 0.0)]))
+
+        assert image.in_1d == pytest.approx(np.full(9, image_centre[0]), 1.0e-4)
+
+        plane = ag.Plane(galaxies=[galaxy])
+
+        assert plane.binned_image_from_grid(grid=grid).in_1d == pytest.approx(
+            image.in_1d, 1.0e-4
+        )
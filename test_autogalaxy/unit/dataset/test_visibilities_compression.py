@@ -0,0 +1,224 @@
+import numpy as np
+import pytest
+
+import autogalaxy as ag
+from autogalaxy import exc
+from autogalaxy.dataset import visibilities_compression
+
+
+@pytest.fixture(name="compression_mask")
+def make_compression_mask():
+    return ag.Mask2D.circular(shape_2d=(21, 21), pixel_scales=0.1, radius=0.5)
+
+
+def make_interferometer(uv_wavelengths, visibilities, noise_map):
+    return ag.Interferometer(
+        visibilities=ag.Visibilities(visibilities=np.array(visibilities)),
+        noise_map=ag.Visibilities(visibilities=np.array(noise_map)),
+        uv_wavelengths=np.array(uv_wavelengths),
+    )
+
+
+class TestVisibilitiesCompression:
+    def test__cell_size_from__set_by_mask_extent_and_decorrelation(
+        self, compression_mask
+    ):
+
+        cell_size = visibilities_compression.cell_size_from(
+            real_space_mask=compression_mask, decorrelation=0.01
+        )
+
+        theta_max = (0.5 + 0.05) * np.pi / 648000.0
+
+        assert cell_size == pytest.approx(np.sqrt(0.03) / (np.pi * theta_max), 1.0e-2)
+
+        cell_size_small = visibilities_compression.cell_size_from(
+            real_space_mask=compression_mask, decorrelation=0.0001
+        )
+
+        assert cell_size_small == pytest.approx(0.1 * cell_size, 1.0e-4)
+
+        cell_size_grid = visibilities_compression.cell_size_from(
+            real_space_mask=compression_mask, decorrelation=0.01, method="grid"
+        )
+
+        assert cell_size_grid == pytest.approx(0.01 / (2.0 * np.pi * theta_max), 1.0e-2)
+        assert cell_size_grid < cell_size
+
+    def test__from_interferometer__noise_weighted_combination_and_conjugate_folding(
+        self, compression_mask
+    ):
+
+        interferometer = make_interferometer(
+            uv_wavelengths=[
+                [1.0e5, 2.0e5],
+                [1.001e5, 2.001e5],
+                [-1.0005e5, -2.0005e5],
+                [5.0e5, 1.0e5],
+            ],
+            visibilities=[1.0 + 2.0j, 3.0 + 4.0j, 5.0 - 6.0j, 7.0 + 8.0j],
+            noise_map=[1.0 + 1.0j, 2.0 + 2.0j, 1.0 + 1.0j, 1.0 + 1.0j],
+        )
+
+        compression = ag.VisibilitiesCompression.from_interferometer(
+            interferometer=interferometer,
+            real_space_mask=compression_mask,
+            decorrelation=0.01,
+            method="average",
+        )
+
+        assert compression.compression_ratio == 2.0
+        assert compression.interferometer.visibilities == pytest.approx(
+            np.array([3.0 + 4.0j, 7.0 + 8.0j]), 1.0e-8
+        )
+        assert compression.interferometer.noise_map == pytest.approx(
+            np.array([(2.0 + 2.0j) / 3.0, 1.0 + 1.0j]), 1.0e-8
+        )
+        assert compression.scatter_chi_squared == pytest.approx(16.0, 1.0e-8)
+
+        assert compression.interferometer.uv_wavelengths[0, 0] == pytest.approx(
+            (2.0 * 1.0e5 + 0.5 * 1.001e5 + 2.0 * 1.0005e5) / 4.5, 1.0e-8
+        )
+        assert compression.interferometer.uv_wavelengths[1] == pytest.approx(
+            np.array([5.0e5, 1.0e5]), 1.0e-8
+        )
+
+        compression = ag.VisibilitiesCompression.from_interferometer(
+            interferometer=interferometer,
+            real_space_mask=compression_mask,
+            decorrelation=0.01,
+            method="grid",
+        )
+
+        cell_size = compression.cell_size
+
+        assert compression.interferometer.uv_wavelengths[1] == pytest.approx(
+            (np.floor(np.array([5.0e5, 1.0e5]) / cell_size) + 0.5) * cell_size, 1.0e-8,
+        )
+
+    def test__from_interferometer__masked_visibilities_removed_before_combination(
+        self, compression_mask
+    ):
+
+        interferometer = make_interferometer(
+            uv_wavelengths=[
+                [1.0e5, 2.0e5],
+                [1.001e5, 2.001e5],
+                [-1.0005e5, -2.0005e5],
+                [5.0e5, 1.0e5],
+            ],
+            visibilities=[1.0 + 2.0j, 3.0 + 4.0j, 5.0 - 6.0j, 7.0 + 8.0j],
+            noise_map=[1.0 + 1.0j, 2.0 + 2.0j, 1.0 + 1.0j, 1.0 + 1.0j],
+        )
+
+        compression = ag.VisibilitiesCompression.from_interferometer(
+            interferometer=interferometer,
+            real_space_mask=compression_mask,
+            decorrelation=0.01,
+            method="average",
+            visibilities_mask=np.array([False, False, True, False]),
+        )
+
+        assert compression.uncompressed_interferometer.visibilities.shape[0] == 3
+        assert compression.interferometer.visibilities == pytest.approx(
+            np.array([(4.0 * (1.0 + 2.0j) + 3.0 + 4.0j) / 5.0, 7.0 + 8.0j]), 1.0e-8
+        )
+
+    def test__from_interferometer__invalid_method__raises_exception(
+        self, compression_mask
+    ):
+
+        interferometer = make_interferometer(
+            uv_wavelengths=[[1.0e5, 2.0e5]],
+            visibilities=[1.0 + 2.0j],
+            noise_map=[1.0 + 1.0j],
+        )
+
+        with pytest.raises(exc.DatasetException):
+            ag.VisibilitiesCompression.from_interferometer(
+                interferometer=interferometer,
+                real_space_mask=compression_mask,
+                method="median",
+            )
+
+    def test__log_likelihood_error_from_image__point_at_phase_centre__no_error(self):
+
+        image = ag.Array.manual_2d(
+            array=[[0.0, 0.0, 0.0], [0.0, 2.0, 0.0], [0.0, 0.0, 0.0]], pixel_scales=0.1,
+        )
+
+        uv_wavelengths = np.random.RandomState(1).uniform(
+            low=-5.0e4, high=5.0e4, size=(100, 2)
+        )
+        visibilities = np.random.RandomState(2).normal(size=(100, 2))
+
+        interferometer = make_interferometer(
+            uv_wavelengths=uv_wavelengths,
+            visibilities=visibilities[:, 0] + 1j * visibilities[:, 1],
+            noise_map=np.full(fill_value=1.0 + 1.0j, shape=(100,)),
+        )
+
+        compression = ag.VisibilitiesCompression.from_interferometer(
+            interferometer=interferometer,
+            real_space_mask=image.mask,
+            decorrelation=0.01,
+        )
+
+        assert compression.compression_ratio > 1.0
+
+        log_likelihood_error = compression.log_likelihood_error_from_image(
+            image=image, transformer_class=ag.TransformerDFT
+        )
+
+        assert log_likelihood_error == pytest.approx(0.0, abs=1.0e-6)
+
+    def test__log_likelihood_error_from_image__reduced_by_lower_decorrelation(
+        self, compression_mask
+    ):
+
+        grid = ag.Grid.from_mask(mask=compression_mask)
+
+        image = ag.lp.EllipticalGaussian(
+            centre=(0.2, -0.1), intensity=1.0, sigma=0.1
+        ).image_from_grid(grid=grid)
+
+        uv_wavelengths = np.random.RandomState(1).uniform(
+            low=-1.0e5, high=1.0e5, size=(300, 2)
+        )
+
+        transformer = ag.TransformerDFT(
+            uv_wavelengths=uv_wavelengths, real_space_mask=compression_mask
+        )
+
+        interferometer = make_interferometer(
+            uv_wavelengths=uv_wavelengths,
+            visibilities=transformer.visibilities_from_image(image=image),
+            noise_map=np.full(fill_value=1.0 + 1.0j, shape=(300,)),
+        )
+
+        compression = ag.VisibilitiesCompression.from_interferometer(
+            interferometer=interferometer,
+            real_space_mask=compression_mask,
+            decorrelation=0.1,
+        )
+
+        compression_low_decorrelation = ag.VisibilitiesCompression.from_interferometer(
+            interferometer=interferometer,
+            real_space_mask=compression_mask,
+            decorrelation=0.001,
+        )
+
+        assert (
+            compression.compression_ratio
+            > compression_low_decorrelation.compression_ratio
+        )
+
+        assert abs(
+            compression_low_decorrelation.log_likelihood_error_from_image(
+                image=image, transformer_class=ag.TransformerDFT
+            )
+        ) < abs(
+            compression.log_likelihood_error_from_image(
+                image=image, transformer_class=ag.TransformerDFT
+            )
+        )
@@ -3,6 +3,8 @@ import pytest
 
 import autogalaxy as ag
 from autoarray.inversion import inversions
+from autogalaxy import exc
+from autogalaxy.fit import fit as fit_module
 from autogalaxy.mock.mock import MockLightProfile
 
 
@@ -1385,6 +1387,33 @@ class TestFitImaging:
             assert fit.subtracted_images_of_galaxies[1].in_1d[0] == -3.0
             assert fit.subtracted_images_of_galaxies[2].in_1d[0] == 0.0
 
+        def test__blurred_images_of_galaxies__computed_once_and_reused(
+            self, masked_imaging_7x7
+        ):
+
+            g0 = ag.Galaxy(
+                redshift=0.5, light_profile=ag.lp.EllipticalSersic(intensity=1.0)
+            )
+
+            g1 = ag.Galaxy(
+                redshift=1.0, light_profile=ag.lp.EllipticalSersic(intensity=2.0)
+            )
+
+            plane = ag.Plane(redshift=0.75, galaxies=[g0, g1])
+
+            fit = ag.FitImaging(masked_imaging=masked_imaging_7x7, plane=plane)
+
+            blurred_images_of_galaxies = fit.blurred_images_of_galaxies
+
+            assert fit.blurred_images_of_galaxies is blurred_images_of_galaxies
+            assert fit.model_images_of_galaxies[0] is blurred_images_of_galaxies[0]
+            assert fit.galaxy_model_image_dict[g1] is blurred_images_of_galaxies[1]
+
+            assert (
+                fit.subtracted_images_of_galaxies[0]
+                == fit.image - blurred_images_of_galaxies[1]
+            ).all()
+
 
 class TestFitInterferometer:
     class TestLikelihood:
@@ -2263,3 +2292,203 @@ class TestFitInterferometer:
             )
 
             assert hyper_noise_map.in_1d == pytest.approx(fit.noise_map.in_1d)
+
+
+class TestLikelihoodWorkspaceImaging:
+    def test__log_likelihood__same_as_fit_imaging(self, masked_imaging_7x7):
+
+        g0 = ag.Galaxy(
+            redshift=0.5, light_profile=ag.lp.EllipticalSersic(intensity=1.0)
+        )
+        g1 = ag.Galaxy(
+            redshift=1.0, light_profile=ag.lp.EllipticalSersic(intensity=2.0)
+        )
+
+        plane = ag.Plane(redshift=0.75, galaxies=[g0, g1])
+
+        workspace = fit_module.LikelihoodWorkspaceImaging(
+            masked_imaging=masked_imaging_7x7
+        )
+
+        fit = ag.FitImaging(masked_imaging=masked_imaging_7x7, plane=plane)
+
+        assert workspace.log_likelihood_from_plane(plane=plane) == fit.log_likelihood
+        assert workspace.log_likelihood_from_plane(plane=plane) == fit.log_likelihood
+
+    def test__log_likelihood__including_hyper_methods__same_as_fit_imaging(
+        self, masked_imaging_7x7
+    ):
+        hyper_image_sky = ag.hyper_data.HyperImageSky(sky_scale=1.0)
+        hyper_background_noise = ag.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        g0 = ag.Galaxy(
+            redshift=0.5,
+            light_profile=ag.lp.EllipticalSersic(intensity=1.0),
+            hyper_galaxy=ag.HyperGalaxy(
+                contribution_factor=1.0, noise_factor=1.0, noise_power=1.0
+            ),
+            hyper_model_image=np.ones(9),
+            hyper_galaxy_image=np.ones(9),
+            hyper_minimum_value=0.0,
+        )
+
+        plane = ag.Plane(redshift=0.75, galaxies=[g0])
+
+        workspace = fit_module.LikelihoodWorkspaceImaging(
+            masked_imaging=masked_imaging_7x7
+        )
+
+        fit = ag.FitImaging(
+            masked_imaging=masked_imaging_7x7,
+            plane=plane,
+            hyper_image_sky=hyper_image_sky,
+            hyper_background_noise=hyper_background_noise,
+        )
+
+        log_likelihood = workspace.log_likelihood_from_plane(
+            plane=plane,
+            hyper_image_sky=hyper_image_sky,
+            hyper_background_noise=hyper_background_noise,
+        )
+
+        assert log_likelihood == fit.log_likelihood
+
+    def test__log_likelihood_batch__same_as_log_likelihood_of_every_plane(
+        self, masked_imaging_7x7
+    ):
+        hyper_image_sky = ag.hyper_data.HyperImageSky(sky_scale=1.0)
+        hyper_background_noise = ag.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        planes = [
+            ag.Plane(
+                redshift=0.75,
+                galaxies=[
+                    ag.Galaxy(
+                        redshift=0.5,
+                        light_profile=ag.lp.EllipticalSersic(intensity=intensity),
+                    )
+                ],
+            )
+            for intensity in [1.0, 2.0, 3.0]
+        ]
+
+        workspace = fit_module.LikelihoodWorkspaceImaging(
+            masked_imaging=masked_imaging_7x7
+        )
+
+        log_likelihoods = workspace.log_likelihood_batch_from_planes(
+            planes=planes,
+            hyper_image_skies=[None, hyper_image_sky, None],
+            hyper_background_noises=[None, None, hyper_background_noise],
+        )
+
+        assert log_likelihoods.shape == (3,)
+        assert log_likelihoods[0] == pytest.approx(
+            workspace.log_likelihood_from_plane(plane=planes[0]), 1.0e-8
+        )
+        assert log_likelihoods[1] == pytest.approx(
+            workspace.log_likelihood_from_plane(
+                plane=planes[1], hyper_image_sky=hyper_image_sky
+            ),
+            1.0e-8,
+        )
+        assert log_likelihoods[2] == pytest.approx(
+            workspace.log_likelihood_from_plane(
+                plane=planes[2], hyper_background_noise=hyper_background_noise
+            ),
+            1.0e-8,
+        )
+
+
+class TestLikelihoodWorkspaceInterferometer:
+    def test__log_likelihood__same_as_fit_interferometer(self, masked_interferometer_7):
+        hyper_background_noise = ag.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        g0 = ag.Galaxy(
+            redshift=0.5, light_profile=ag.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        plane = ag.Plane(redshift=0.75, galaxies=[g0])
+
+        workspace = fit_module.LikelihoodWorkspaceInterferometer(
+            masked_interferometer=masked_interferometer_7
+        )
+
+        fit = ag.FitInterferometer(
+            masked_interferometer=masked_interferometer_7, plane=plane
+        )
+
+        assert workspace.log_likelihood_from_plane(plane=plane) == fit.log_likelihood
+
+        fit = ag.FitInterferometer(
+            masked_interferometer=masked_interferometer_7,
+            plane=plane,
+            hyper_background_noise=hyper_background_noise,
+        )
+
+        log_likelihood = workspace.log_likelihood_from_plane(
+            plane=plane, hyper_background_noise=hyper_background_noise
+        )
+
+        assert log_likelihood == fit.log_likelihood
+
+
+class TestLikelihoodWorkspacePrecision:
+    def test__float32__buffers_are_float32_and_log_likelihood_close_to_float64(
+        self, masked_imaging_7x7
+    ):
+
+        g0 = ag.Galaxy(
+            redshift=0.5, light_profile=ag.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        plane = ag.Plane(redshift=0.75, galaxies=[g0])
+
+        workspace = fit_module.LikelihoodWorkspaceImaging(
+            masked_imaging=masked_imaging_7x7, precision="float32"
+        )
+
+        assert workspace.grid.dtype == "float32"
+        assert workspace.image.dtype == "float32"
+        assert workspace.chi_squared_map.dtype == "float32"
+
+        fit = ag.FitImaging(masked_imaging=masked_imaging_7x7, plane=plane)
+
+        assert workspace.log_likelihood_from_plane(plane=plane) == pytest.approx(
+            fit.log_likelihood, 1.0e-4
+        )
+
+        report = workspace.log_likelihood_precision_error_from_plane(plane=plane)
+
+        assert report["precision"] == "float32"
+        assert report["log_likelihood_float64"] == fit.log_likelihood
+        assert report["absolute_error"] == pytest.approx(
+            abs(report["log_likelihood"] - fit.log_likelihood), 1.0e-8
+        )
+        assert report["relative_error"] < 1.0e-4
+
+    def test__float64__grids_are_masked_dataset_grids(
+        self, masked_imaging_7x7, masked_interferometer_7
+    ):
+
+        workspace = fit_module.LikelihoodWorkspaceImaging(
+            masked_imaging=masked_imaging_7x7
+        )
+
+        assert workspace.grid is masked_imaging_7x7.grid
+        assert workspace.blurring_grid is masked_imaging_7x7.blurring_grid
+
+        workspace = fit_module.LikelihoodWorkspaceInterferometer(
+            masked_interferometer=masked_interferometer_7, precision="float32"
+        )
+
+        assert workspace.visibilities.dtype == "complex64"
+        assert workspace.residual_map.dtype == "complex64"
+        assert workspace.chi_squared_map_real.dtype == "float32"
+
+    def test__invalid_precision__raises_exception(self, masked_imaging_7x7):
+
+        with pytest.raises(exc.PrecisionException):
+            fit_module.LikelihoodWorkspaceImaging(
+                masked_imaging=masked_imaging_7x7, precision="float16"
+            )
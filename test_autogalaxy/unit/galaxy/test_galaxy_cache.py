@@ -0,0 +1,204 @@
+import pickle
+
+from astropy import cosmology as cosmo
+
+import autogalaxy as ag
+import pytest
+from autogalaxy.fit import fit
+from autogalaxy.galaxy import galaxy_cache as gc
+
+
+class TestGalaxyKey:
+    def test__galaxies_with_same_parameters__same_key(self):
+
+        galaxy_0 = ag.Galaxy(
+            redshift=0.5, light=ag.lp.EllipticalSersic(centre=(0.1, 0.1), intensity=1.0)
+        )
+        galaxy_1 = ag.Galaxy(
+            redshift=0.5, light=ag.lp.EllipticalSersic(centre=(0.1, 0.1), intensity=1.0)
+        )
+
+        assert gc.galaxy_key_from(galaxy=galaxy_0) == gc.galaxy_key_from(
+            galaxy=galaxy_1
+        )
+
+    def test__galaxies_with_different_parameters__different_key(self):
+
+        galaxy_0 = ag.Galaxy(
+            redshift=0.5, light=ag.lp.EllipticalSersic(centre=(0.1, 0.1), intensity=1.0)
+        )
+        galaxy_1 = ag.Galaxy(
+            redshift=0.5, light=ag.lp.EllipticalSersic(centre=(0.1, 0.1), intensity=2.0)
+        )
+
+        assert gc.galaxy_key_from(galaxy=galaxy_0) != gc.galaxy_key_from(
+            galaxy=galaxy_1
+        )
+
+
+class TestGalaxyCache:
+    def test__value_from__counts_hits_and_misses(self, masked_imaging_7x7):
+
+        cache = gc.GalaxyCache(masked_dataset=masked_imaging_7x7, max_size=2)
+
+        assert cache.value_from(key="a", func=lambda: 1) == 1
+        assert cache.value_from(key="a", func=lambda: 2) == 1
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.hit_rate == 0.5
+
+        cache.reset_counters()
+
+        assert cache.hits == 0
+        assert cache.misses == 0
+
+    def test__value_from__least_recently_used_entry_removed(self, masked_imaging_7x7):
+
+        cache = gc.GalaxyCache(masked_dataset=masked_imaging_7x7, max_size=2)
+
+        cache.value_from(key="a", func=lambda: 1)
+        cache.value_from(key="b", func=lambda: 2)
+        cache.value_from(key="a", func=lambda: 1)
+        cache.value_from(key="c", func=lambda: 3)
+
+        assert len(cache) == 2
+        assert cache.value_from(key="a", func=lambda: 4) == 1
+        assert cache.value_from(key="b", func=lambda: 5) == 5
+
+    def test__pickle__unpickled_cache_is_empty(self, masked_imaging_7x7):
+
+        cache = gc.GalaxyCache(masked_dataset=masked_imaging_7x7, max_size=2)
+
+        cache.value_from(key="a", func=lambda: 1)
+
+        cache = pickle.loads(pickle.dumps(cache))
+
+        assert len(cache) == 0
+        assert cache.max_size == 2
+        assert cache.value_from(key="a", func=lambda: 2) == 2
+
+    def test__plane_blurred_image__same_as_without_cache(self, masked_imaging_7x7):
+
+        galaxy_0 = ag.Galaxy(
+            redshift=0.5, light=ag.lp.EllipticalSersic(centre=(0.1, 0.1), intensity=1.0)
+        )
+        galaxy_1 = ag.Galaxy(
+            redshift=0.5, light=ag.lp.EllipticalSersic(centre=(0.2, 0.2), intensity=2.0)
+        )
+
+        cache = gc.GalaxyCache(masked_dataset=masked_imaging_7x7)
+
+        plane = ag.Plane(galaxies=[galaxy_0, galaxy_1])
+        plane_cached = ag.Plane(galaxies=[galaxy_0, galaxy_1], galaxy_cache=cache)
+
+        blurred_image = plane.blurred_image_from_grid_and_convolver(
+            grid=masked_imaging_7x7.grid,
+            convolver=masked_imaging_7x7.convolver,
+            blurring_grid=masked_imaging_7x7.blurring_grid,
+        )
+
+        blurred_image_cached = plane_cached.blurred_image_from_grid_and_convolver(
+            grid=masked_imaging_7x7.grid,
+            convolver=masked_imaging_7x7.convolver,
+            blurring_grid=masked_imaging_7x7.blurring_grid,
+        )
+
+        assert blurred_image_cached == pytest.approx(blurred_image, 1.0e-4)
+        assert cache.misses == 2
+
+        plane_cached.blurred_image_from_grid_and_convolver(
+            grid=masked_imaging_7x7.grid,
+            convolver=masked_imaging_7x7.convolver,
+            blurring_grid=masked_imaging_7x7.blurring_grid,
+        )
+
+        assert cache.hits == 2
+
+    def test__grid_not_from_masked_dataset__bypasses_cache(self, masked_imaging_7x7):
+
+        galaxy = ag.Galaxy(
+            redshift=0.5, mass=ag.mp.SphericalIsothermal(einstein_radius=1.0)
+        )
+
+        cache = gc.GalaxyCache(masked_dataset=masked_imaging_7x7)
+
+        plane = ag.Plane(galaxies=[galaxy], galaxy_cache=cache)
+
+        grid = ag.Grid.uniform(shape_2d=(3, 3), pixel_scales=1.0)
+
+        deflections = plane.deflections_from_grid(grid=grid)
+
+        assert deflections == pytest.approx(
+            galaxy.deflections_from_grid(grid=grid), 1.0e-4
+        )
+        assert len(cache) == 0
+
+        plane.deflections_from_grid(grid=masked_imaging_7x7.grid)
+
+        assert cache.misses == 1
+
+    def test__float32_workspace_grids__registered__use_cache(self, masked_imaging_7x7):
+
+        galaxy = ag.Galaxy(
+            redshift=0.5, light=ag.lp.EllipticalSersic(centre=(0.1, 0.1), intensity=1.0)
+        )
+
+        cache = gc.GalaxyCache(masked_dataset=masked_imaging_7x7)
+
+        workspace = fit.LikelihoodWorkspaceImaging(
+            masked_imaging=masked_imaging_7x7, precision="float32"
+        )
+
+        plane = ag.Plane(galaxies=[galaxy])
+        plane_cached = ag.Plane(galaxies=[galaxy], galaxy_cache=cache)
+
+        assert cache.grid_name_from(grid=workspace.grid) is None
+
+        cache.register_grids(grid=workspace.grid, blurring_grid=workspace.blurring_grid)
+
+        assert cache.grid_name_from(grid=workspace.grid) == "grid"
+        assert cache.grid_name_from(grid=workspace.blurring_grid) == "blurring_grid"
+
+        log_likelihood = workspace.log_likelihood_from_plane(plane=plane)
+
+        assert workspace.log_likelihood_from_plane(plane=plane_cached) == pytest.approx(
+            log_likelihood, 1.0e-4
+        )
+        assert cache.misses == 1
+
+        assert workspace.log_likelihood_from_plane(plane=plane_cached) == pytest.approx(
+            log_likelihood, 1.0e-4
+        )
+        assert cache.hits == 1
+
+        plane_cached.blurred_image_from_grid_and_convolver(
+            grid=masked_imaging_7x7.grid,
+            convolver=masked_imaging_7x7.convolver,
+            blurring_grid=masked_imaging_7x7.blurring_grid,
+        )
+
+        assert cache.misses == 2
+        assert len(cache) == 2
+
+    def test__analysis__float32_precision__workspace_grids_registered(
+        self, masked_imaging_7x7
+    ):
+
+        analysis = ag.PhaseImaging.Analysis(
+            masked_imaging=masked_imaging_7x7,
+            settings=ag.SettingsPhaseImaging(galaxy_cache_size=10, precision="float32"),
+            cosmology=cosmo.Planck15,
+        )
+
+        assert (
+            analysis.galaxy_cache.grid_name_from(
+                grid=analysis.likelihood_workspace.grid
+            )
+            == "grid"
+        )
+        assert (
+            analysis.galaxy_cache.grid_name_from(
+                grid=analysis.likelihood_workspace.blurring_grid
+            )
+            == "blurring_grid"
+        )
@@ -64,3 +64,31 @@ class TestHyperMethods:
         assert instance.galaxies.source.hyper_model_image.in_2d == pytest.approx(
             3.0 * np.ones((3, 3)), 1.0e-4
         )
+
+
+class MockVisualizationQueue:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class TestClose:
+    def test__close_visualization_queue(self, masked_imaging_7x7):
+
+        analysis = ag.PhaseImaging.Analysis(
+            masked_imaging=masked_imaging_7x7,
+            settings=ag.SettingsPhaseImaging(),
+            cosmology=cosmo.Planck15,
+        )
+
+        analysis.close_visualization_queue()
+
+        visualization_queue = MockVisualizationQueue()
+
+        analysis.visualization_queue = visualization_queue
+        analysis.close_visualization_queue()
+
+        assert visualization_queue.closed is True
+        assert analysis.visualization_queue is None
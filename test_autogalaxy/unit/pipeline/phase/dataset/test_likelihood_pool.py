@@ -0,0 +1,158 @@
+import io
+import pickle
+from multiprocessing import shared_memory
+
+import autogalaxy as ag
+import numpy as np
+import pytest
+from autogalaxy.mock import mock
+from autogalaxy.pipeline.phase.dataset import likelihood_pool as lp
+
+
+@pytest.fixture(name="phase_and_analysis")
+def make_phase_and_analysis(imaging_7x7, mask_7x7):
+
+    phase_imaging_7x7 = ag.PhaseImaging(
+        galaxies=dict(
+            galaxy=ag.GalaxyModel(redshift=0.5, light=ag.lp.EllipticalSersic)
+        ),
+        search=mock.MockSearch(name="test_phase"),
+    )
+
+    analysis = phase_imaging_7x7.make_analysis(
+        dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+    )
+
+    return phase_imaging_7x7, analysis
+
+
+class TestSharedArrayPickler:
+    def test__masked_dataset_arrays_unpickled_as_views_of_shared_memory(
+        self, phase_and_analysis
+    ):
+        phase_imaging_7x7, analysis = phase_and_analysis
+
+        file = io.BytesIO()
+
+        pickler = lp.SharedArrayPickler(
+            file=file,
+            shared_ids=lp.shared_ids_from(analysis.masked_dataset),
+            minimum_shared_bytes=0,
+        )
+        pickler.dump(analysis)
+
+        assert pickler.total_bytes > 0
+
+        memory = shared_memory.SharedMemory(create=True, size=pickler.total_bytes)
+
+        try:
+
+            pickler.copy_arrays_to(buffer=memory.buf)
+
+            shared_analysis = lp.analysis_from_bytes(
+                analysis_bytes=file.getvalue(), buffer=memory.buf
+            )
+
+            image = shared_analysis.masked_dataset.image
+
+            assert isinstance(image, ag.Array)
+            assert not image.flags.owndata
+            assert not image.flags.writeable
+            assert image.in_2d == pytest.approx(
+                analysis.masked_dataset.image.in_2d, 1.0e-8
+            )
+            assert isinstance(shared_analysis.masked_dataset.grid, ag.Grid)
+
+            instance = phase_imaging_7x7.model.instance_from_unit_vector(
+                [0.5] * phase_imaging_7x7.model.prior_count
+            )
+
+            assert shared_analysis.log_likelihood_function(
+                instance=instance
+            ) == pytest.approx(
+                analysis.log_likelihood_function(instance=instance), 1.0e-8
+            )
+
+            del image, shared_analysis
+
+        finally:
+
+            memory.close()
+            memory.unlink()
+
+
+class TestLikelihoodPool:
+    def test__log_likelihood_batch__same_as_log_likelihood_function(
+        self, phase_and_analysis
+    ):
+        phase_imaging_7x7, analysis = phase_and_analysis
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [unit_value] * phase_imaging_7x7.model.prior_count
+            )
+            for unit_value in [0.2, 0.5, 0.8]
+        ]
+
+        with lp.LikelihoodPool(
+            analysis=analysis, number_of_processes=2, minimum_shared_bytes=0
+        ) as pool:
+
+            log_likelihoods = pool.log_likelihood_batch(instances=instances)
+
+        assert log_likelihoods == pytest.approx(
+            np.array(
+                [
+                    analysis.log_likelihood_function(instance=instance)
+                    for instance in instances
+                ]
+            ),
+            1.0e-8,
+        )
+
+
+class TestAnalysis:
+    def test__log_likelihood_batch__uses_pool_if_likelihood_processes_input(
+        self, imaging_7x7, mask_7x7
+    ):
+
+        phase_imaging_7x7 = ag.PhaseImaging(
+            galaxies=dict(
+                galaxy=ag.GalaxyModel(redshift=0.5, light=ag.lp.EllipticalSersic)
+            ),
+            settings=ag.SettingsPhaseImaging(
+                galaxy_cache_size=2, likelihood_processes=2
+            ),
+            search=mock.MockSearch(name="test_phase"),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [unit_value] * phase_imaging_7x7.model.prior_count
+            )
+            for unit_value in [0.2, 0.5, 0.8]
+        ]
+
+        try:
+
+            log_likelihoods = analysis.log_likelihood_batch(instances=instances)
+
+            assert isinstance(analysis.likelihood_pool, lp.LikelihoodPool)
+            assert pickle.loads(pickle.dumps(analysis)).likelihood_pool is None
+
+        finally:
+
+            analysis.close_likelihood_pool()
+
+        assert analysis.likelihood_pool is None
+
+        analysis.likelihood_processes = None
+
+        assert analysis.log_likelihood_batch(instances=instances) == pytest.approx(
+            log_likelihoods, 1.0e-8
+        )
+        assert analysis.likelihood_pool is None
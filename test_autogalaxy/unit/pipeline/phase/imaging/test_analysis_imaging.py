@@ -104,6 +104,35 @@ class TestFit:
 
         assert fit.log_likelihood == fit_figure_of_merit
 
+    def test__log_likelihood_batch__same_as_log_likelihood_function_of_every_instance(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = ag.PhaseImaging(
+            galaxies=dict(
+                galaxy=ag.GalaxyModel(redshift=0.5, light=ag.lp.EllipticalSersic)
+            ),
+            search=mock.MockSearch(name="test_phase"),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [unit_value] * phase_imaging_7x7.model.prior_count
+            )
+            for unit_value in [0.2, 0.5, 0.8]
+        ]
+
+        log_likelihoods = analysis.log_likelihood_batch(instances=instances)
+
+        for instance, log_likelihood in zip(instances, log_likelihoods):
+
+            assert log_likelihood == pytest.approx(
+                analysis.log_likelihood_function(instance=instance), 1.0e-8
+            )
+
     def test__uses_hyper_fit_correctly(self, masked_imaging_7x7):
 
         galaxies = af.ModelInstance()
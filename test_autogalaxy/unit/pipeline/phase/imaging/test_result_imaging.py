@@ -1,6 +1,9 @@
+from os import path
+
 import autofit as af
 import autogalaxy as ag
 import numpy as np
+import pytest
 from astropy import cosmology as cosmo
 from autogalaxy.mock import mock
 
@@ -38,3 +41,151 @@ class TestImagePassing:
         image_dict = result.image_galaxy_dict
         assert (image_dict[("galaxies", "galaxy")].in_2d == np.zeros((7, 7))).all()
         assert isinstance(image_dict[("galaxies", "source")], np.ndarray)
+
+
+class TestHyperImages:
+    def test__fit_and_hyper_images__computed_once(self, masked_imaging_7x7):
+
+        galaxies = af.ModelInstance()
+        galaxies.galaxy = ag.Galaxy(
+            redshift=0.5, light=ag.lp.EllipticalSersic(intensity=1.0)
+        )
+        galaxies.source = ag.Galaxy(
+            redshift=1.0, light=ag.lp.EllipticalSersic(intensity=2.0)
+        )
+
+        instance = af.ModelInstance()
+        instance.galaxies = galaxies
+
+        analysis = ag.PhaseImaging.Analysis(
+            masked_imaging=masked_imaging_7x7,
+            settings=ag.SettingsPhaseImaging(),
+            results=mock.MockResults(),
+            cosmology=cosmo.Planck15,
+        )
+
+        result = ag.PhaseImaging.Result(
+            samples=mock.MockSamples(max_log_likelihood_instance=instance),
+            previous_model=af.ModelMapper(),
+            analysis=analysis,
+            search=None,
+        )
+
+        assert result.max_log_likelihood_fit is result.max_log_likelihood_fit
+        assert result.image_galaxy_dict is result.image_galaxy_dict
+        assert (
+            result.hyper_galaxy_image_path_dict is result.hyper_galaxy_image_path_dict
+        )
+        assert result.hyper_model_image is result.hyper_model_image
+
+        assert result.hyper_model_image == pytest.approx(
+            result.hyper_galaxy_image_path_dict[("galaxies", "galaxy")]
+            + result.hyper_galaxy_image_path_dict[("galaxies", "source")],
+            1.0e-4,
+        )
+
+    def test__hyper_images__output_to_files_and_loaded_by_new_result(
+        self, masked_imaging_7x7
+    ):
+
+        galaxies = af.ModelInstance()
+        galaxies.galaxy = ag.Galaxy(
+            redshift=0.5, light=ag.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        instance = af.ModelInstance()
+        instance.galaxies = galaxies
+
+        analysis = ag.PhaseImaging.Analysis(
+            masked_imaging=masked_imaging_7x7,
+            settings=ag.SettingsPhaseImaging(),
+            results=mock.MockResults(),
+            cosmology=cosmo.Planck15,
+        )
+
+        search = mock.MockSearch(name="test_phase_hyper_images")
+
+        result = ag.PhaseImaging.Result(
+            samples=mock.MockSamples(max_log_likelihood_instance=instance),
+            previous_model=af.ModelMapper(),
+            analysis=analysis,
+            search=search,
+        )
+
+        hyper_galaxy_image_path_dict = result.hyper_galaxy_image_path_dict
+
+        assert path.isfile(
+            path.join(search.paths.output_path, "hyper_images", "galaxies.galaxy.npy")
+        )
+
+        result = ag.PhaseImaging.Result(
+            samples=mock.MockSamples(max_log_likelihood_instance=instance),
+            previous_model=af.ModelMapper(),
+            analysis=analysis,
+            search=search,
+        )
+
+        assert result.hyper_galaxy_image_path_dict[
+            ("galaxies", "galaxy")
+        ] == pytest.approx(hyper_galaxy_image_path_dict[("galaxies", "galaxy")])
+        assert result._max_log_likelihood_fit is None
+
+    def test__hyper_images_of_different_instance_in_files__recomputed(
+        self, masked_imaging_7x7
+    ):
+
+        galaxies = af.ModelInstance()
+        galaxies.galaxy = ag.Galaxy(
+            redshift=0.5, light=ag.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        instance = af.ModelInstance()
+        instance.galaxies = galaxies
+
+        analysis = ag.PhaseImaging.Analysis(
+            masked_imaging=masked_imaging_7x7,
+            settings=ag.SettingsPhaseImaging(),
+            results=mock.MockResults(),
+            cosmology=cosmo.Planck15,
+        )
+
+        search = mock.MockSearch(name="test_phase_hyper_images_hash")
+
+        result = ag.PhaseImaging.Result(
+            samples=mock.MockSamples(max_log_likelihood_instance=instance),
+            previous_model=af.ModelMapper(),
+            analysis=analysis,
+            search=search,
+        )
+
+        hyper_galaxy_image_path_dict = result.hyper_galaxy_image_path_dict
+
+        galaxies = af.ModelInstance()
+        galaxies.galaxy = ag.Galaxy(
+            redshift=0.5, light=ag.lp.EllipticalSersic(intensity=2.0)
+        )
+
+        instance = af.ModelInstance()
+        instance.galaxies = galaxies
+
+        result = ag.PhaseImaging.Result(
+            samples=mock.MockSamples(max_log_likelihood_instance=instance),
+            previous_model=af.ModelMapper(),
+            analysis=analysis,
+            search=search,
+        )
+
+        assert result.hyper_galaxy_image_path_dict[
+            ("galaxies", "galaxy")
+        ] != pytest.approx(hyper_galaxy_image_path_dict[("galaxies", "galaxy")])
+        assert result._max_log_likelihood_fit is not None
+
+        result = ag.PhaseImaging.Result(
+            samples=mock.MockSamples(max_log_likelihood_instance=instance),
+            previous_model=af.ModelMapper(),
+            analysis=analysis,
+            search=search,
+        )
+
+        assert result.hyper_galaxy_image_path_dict is not None
+        assert result._max_log_likelihood_fit is None
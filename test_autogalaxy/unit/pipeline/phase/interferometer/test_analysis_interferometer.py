@@ -1,3 +1,4 @@
+import json
 from os import path
 
 import autogalaxy as ag
@@ -116,3 +117,69 @@ class TestFit:
         )
 
         assert fit.log_likelihood == fit_figure_of_merit
+
+
+class TestVisibilitiesCompression:
+    def test__save_visibilities_compression__outputs_ratio_and_log_likelihood_error(
+        self, interferometer_7, mask_7x7, visibilities_mask_7
+    ):
+        galaxy = ag.Galaxy(redshift=0.5, light=ag.lp.EllipticalSersic(intensity=0.1))
+
+        phase_interferometer_7 = ag.PhaseInterferometer(
+            galaxies=dict(galaxy=galaxy),
+            settings=ag.SettingsPhaseInterferometer(
+                settings_masked_interferometer=ag.SettingsMaskedInterferometer(
+                    visibilities_compression="average", decorrelation=0.01
+                )
+            ),
+            search=mock.MockSearch(name="test_phase_compression"),
+            real_space_mask=mask_7x7,
+        )
+
+        analysis = phase_interferometer_7.make_analysis(
+            dataset=interferometer_7,
+            mask=visibilities_mask_7,
+            results=mock.MockResults(),
+        )
+
+        compression = analysis.masked_interferometer.visibilities_compression
+
+        instance = phase_interferometer_7.model.instance_from_unit_vector([])
+
+        report = analysis.save_visibilities_compression(
+            paths=phase_interferometer_7.search.paths, instance=instance
+        )
+
+        assert report["compression_ratio"] == compression.compression_ratio
+        assert report["cell_size"] == compression.cell_size
+        assert "log_likelihood_error" in report
+
+        with open(
+            path.join(
+                phase_interferometer_7.search.paths.output_path,
+                "visibilities_compression.json",
+            )
+        ) as f:
+            assert json.load(f)["compression_ratio"] == compression.compression_ratio
+
+    def test__save_visibilities_compression__no_compression__no_report(
+        self, interferometer_7, mask_7x7, visibilities_mask_7
+    ):
+        phase_interferometer_7 = ag.PhaseInterferometer(
+            galaxies=dict(galaxy=ag.Galaxy(redshift=0.5)),
+            search=mock.MockSearch(name="test_phase"),
+            real_space_mask=mask_7x7,
+        )
+
+        analysis = phase_interferometer_7.make_analysis(
+            dataset=interferometer_7,
+            mask=visibilities_mask_7,
+            results=mock.MockResults(),
+        )
+
+        assert (
+            analysis.save_visibilities_compression(
+                paths=phase_interferometer_7.search.paths
+            )
+            is None
+        )
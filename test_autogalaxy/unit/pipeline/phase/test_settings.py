@@ -81,3 +81,81 @@ def test__tag__mixture_of_values():
         settings.phase_tag_with_inversion
         == "settings__interferometer[grid_facc_0.1_inv_sub_3__nufft]__pix[use_border]__inv[lop]"
     )
+
+
+def test__tag__visibilities_compression():
+
+    settings = ag.SettingsPhaseInterferometer(
+        settings_masked_interferometer=ag.SettingsMaskedInterferometer(
+            grid_class=ag.Grid,
+            sub_size=2,
+            transformer_class=ag.TransformerNUFFT,
+            visibilities_compression="average",
+            decorrelation=0.01,
+        )
+    )
+
+    assert (
+        settings.phase_tag_no_inversion
+        == "settings__interferometer[grid_sub_2__nufft__vis_avg_0.01]"
+    )
+
+    settings = ag.SettingsPhaseInterferometer(
+        settings_masked_interferometer=ag.SettingsMaskedInterferometer(
+            grid_class=ag.Grid,
+            sub_size=2,
+            transformer_class=ag.TransformerNUFFT,
+            visibilities_compression="grid",
+            decorrelation=0.001,
+        )
+    )
+
+    assert (
+        settings.phase_tag_no_inversion
+        == "settings__interferometer[grid_sub_2__nufft__vis_grid_0.001]"
+    )
+
+
+def test__tag__analytic_visibilities():
+
+    settings = ag.SettingsPhaseInterferometer(
+        settings_masked_interferometer=ag.SettingsMaskedInterferometer(
+            grid_class=ag.Grid,
+            sub_size=2,
+            transformer_class=ag.TransformerNUFFT,
+            analytic_visibilities=True,
+        )
+    )
+
+    assert (
+        settings.phase_tag_no_inversion
+        == "settings__interferometer[grid_sub_2__nufft__vis_analytic]"
+    )
+
+
+def test__tag__super_pixels():
+
+    settings = ag.SettingsPhaseImaging(
+        settings_masked_imaging=ag.SettingsMaskedImaging(
+            grid_class=ag.Grid, sub_size=2, super_pixel_signal_to_noise=5.0
+        )
+    )
+
+    assert (
+        settings.phase_tag_no_inversion
+        == "settings__imaging[grid_sub_2__super_pix_snr_5.0]"
+    )
+
+
+def test__tag__precision():
+
+    settings = ag.SettingsPhaseImaging(
+        settings_masked_imaging=ag.SettingsMaskedImaging(
+            grid_class=ag.Grid, sub_size=2
+        ),
+        precision="float32",
+    )
+
+    assert (
+        settings.phase_tag_no_inversion == "settings__imaging[grid_sub_2]__prec_float32"
+    )
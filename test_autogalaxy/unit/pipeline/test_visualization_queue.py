@@ -0,0 +1,39 @@
+import time
+from os import path
+
+from autogalaxy.pipeline import visualization_queue as vq
+
+
+class MockAnalysis:
+    def __init__(self, output_file):
+
+        self.output_file = output_file
+        self.visualize_in_background = True
+
+    def visualize(self, paths, instance, during_analysis):
+
+        time.sleep(0.5)
+
+        with open(self.output_file, "a") as f:
+            f.write(f"{paths} {instance} {during_analysis}\n")
+
+
+class TestVisualizationQueue:
+    def test__requests_while_busy_coalesce_to_latest__wait_for_completion(
+        self, tmp_path
+    ):
+        output_file = path.join(tmp_path, "visualize.txt")
+
+        queue = vq.VisualizationQueue(analysis=MockAnalysis(output_file=output_file))
+
+        for instance in range(5):
+            queue.visualize(paths="paths", instance=instance, during_analysis=True)
+
+        queue.visualize(paths="paths", instance=5, during_analysis=False)
+
+        queue.close()
+
+        with open(output_file) as f:
+            lines = f.read().splitlines()
+
+        assert lines == ["paths 0 True", "paths 5 False"]
@@ -766,6 +766,30 @@ class TestAbstractPlaneProfiles:
             assert (image[0] == 0.0).all()
             assert (image[1] == 0.0).all()
 
+        def test__image_from_ndarray__same_as_image_from_grid(self, sub_grid_7x7):
+
+            g0 = ag.Galaxy(
+                redshift=0.5,
+                light_profile_0=ag.lp.EllipticalSersic(intensity=1.0),
+                light_profile_1=ag.lp.SphericalGaussian(intensity=2.0),
+            )
+            g1 = ag.Galaxy(
+                redshift=0.5, light_profile=ag.lp.EllipticalExponential(intensity=3.0)
+            )
+
+            plane = ag.Plane(galaxies=[g0, g1], redshift=0.5)
+
+            image = plane.image_from_grid(grid=sub_grid_7x7)
+            image_ndarray = plane.image_from_ndarray(grid=np.asarray(sub_grid_7x7))
+
+            assert image_ndarray == pytest.approx(np.asarray(image), 1.0e-8)
+
+            g0_image_ndarray = g0.image_from_ndarray(grid=np.asarray(sub_grid_7x7))
+
+            assert g0_image_ndarray == pytest.approx(
+                np.asarray(g0.image_from_grid(grid=sub_grid_7x7)), 1.0e-8
+            )
+
         def test__x1_plane__padded_image__compare_to_galaxy_images_using_padded_grid_stack(
             self, sub_grid_7x7
         ):
@@ -1439,6 +1463,100 @@ class TestAbstractPlaneData:
             assert (blurred_image_dict[g1].in_1d == g1_blurred_image.in_1d).all()
             assert (blurred_image_dict[g2].in_1d == g2_blurred_image.in_1d).all()
 
+        def test__blurred_image_from_grid_and_convolver__psf_gaussians__analytic_convolution(
+            self,
+        ):
+
+            mask = ag.Mask2D.circular(
+                shape_2d=(21, 21), pixel_scales=1.0, radius=5.0, sub_size=1
+            )
+
+            grid = ag.Grid.from_mask(mask=mask)
+
+            psf = ag.Kernel.from_gaussian(
+                shape_2d=(11, 11), pixel_scales=1.0, sigma=1.0, renormalize=True
+            )
+
+            convolver = ag.Convolver(mask=mask, kernel=psf)
+            blurring_grid = grid.blurring_grid_from_kernel_shape(
+                kernel_shape_2d=psf.shape_2d
+            )
+
+            psf_gaussians = ag.PSFGaussians(sigmas=[1.0], weights=[1.0])
+
+            g0 = ag.Galaxy(
+                redshift=0.5,
+                light_profile=ag.lp.EllipticalGaussian(
+                    centre=(0.5, -0.5),
+                    elliptical_comps=(0.1, 0.05),
+                    intensity=1.0,
+                    sigma=2.0,
+                ),
+            )
+            g1 = ag.Galaxy(
+                redshift=0.5,
+                light_profile=ag.lp.SphericalGaussian(intensity=2.0, sigma=3.0),
+            )
+
+            plane = ag.Plane(redshift=0.5, galaxies=[g0, g1])
+
+            assert plane.has_analytic_psf_convolution is True
+
+            blurred_image = plane.blurred_image_from_grid_and_convolver(
+                grid=grid, convolver=convolver, blurring_grid=blurring_grid
+            )
+
+            blurred_image_analytic = plane.blurred_image_from_grid_and_convolver(
+                grid=grid,
+                convolver=convolver,
+                blurring_grid=blurring_grid,
+                psf_gaussians=psf_gaussians,
+            )
+
+            assert blurred_image_analytic.in_1d == pytest.approx(
+                blurred_image.in_1d, 1.0e-3
+            )
+
+            blurred_images_of_galaxies = plane.blurred_images_of_galaxies_from_grid_and_convolver(
+                grid=grid,
+                convolver=convolver,
+                blurring_grid=blurring_grid,
+                psf_gaussians=psf_gaussians,
+            )
+
+            assert sum(blurred_images_of_galaxies).in_1d == pytest.approx(
+                blurred_image_analytic.in_1d, 1.0e-8
+            )
+
+        def test__blurred_image_from_grid_and_convolver__psf_gaussians__non_gaussian_profile_uses_convolver(
+            self, sub_grid_7x7, blurring_grid_7x7, convolver_7x7
+        ):
+
+            g0 = ag.Galaxy(
+                redshift=0.5,
+                light_profile_0=ag.lp.EllipticalGaussian(intensity=1.0),
+                light_profile_1=ag.lp.EllipticalSersic(intensity=1.0),
+            )
+
+            plane = ag.Plane(redshift=0.5, galaxies=[g0])
+
+            assert plane.has_analytic_psf_convolution is False
+
+            blurred_image = plane.blurred_image_from_grid_and_convolver(
+                grid=sub_grid_7x7,
+                convolver=convolver_7x7,
+                blurring_grid=blurring_grid_7x7,
+            )
+
+            blurred_image_psf_gaussians = plane.blurred_image_from_grid_and_convolver(
+                grid=sub_grid_7x7,
+                convolver=convolver_7x7,
+                blurring_grid=blurring_grid_7x7,
+                psf_gaussians=ag.PSFGaussians(sigmas=[1.0], weights=[1.0]),
+            )
+
+            assert (blurred_image_psf_gaussians.in_1d == blurred_image.in_1d).all()
+
     class TestUnmaskedBlurredProfileImages:
         def test__unmasked_images_of_plane_planes_and_galaxies(self):
             psf = ag.Kernel.manual_2d(
@@ -1552,6 +1670,67 @@ class TestAbstractPlaneData:
 
             assert (plane_visibilities.in_1d == 0.0 + 0.0j * np.zeros((7,))).all()
 
+        def test__visibilities_from_grid_and_transformer__gaussians__analytic_visibilities(
+            self,
+        ):
+
+            mask = ag.Mask2D.circular(
+                shape_2d=(41, 41), pixel_scales=0.1, radius=2.0, sub_size=4
+            )
+
+            grid = ag.Grid.from_mask(mask=mask)
+
+            transformer = ag.TransformerDFT(
+                uv_wavelengths=np.array(
+                    [[1.0e4, 2.0e4], [-3.0e4, 5.0e4], [8.0e4, -6.0e4]]
+                ),
+                real_space_mask=mask,
+            )
+
+            g0 = ag.Galaxy(
+                redshift=0.5,
+                light_profile=ag.lp.EllipticalGaussian(
+                    centre=(0.1, -0.2),
+                    elliptical_comps=(0.1, 0.05),
+                    intensity=1.0,
+                    sigma=0.3,
+                ),
+            )
+            g1 = ag.Galaxy(
+                redshift=0.5,
+                light_profile=ag.lp.SphericalGaussian(intensity=2.0, sigma=0.2),
+            )
+            g2 = ag.Galaxy(redshift=0.5)
+
+            plane = ag.Plane(redshift=0.5, galaxies=[g0, g1, g2])
+
+            assert plane.has_analytic_visibilities is True
+
+            image = plane.image_from_grid(grid=grid)
+
+            visibilities = transformer.visibilities_from_image(image=image.in_1d_binned)
+
+            plane_visibilities = plane.profile_visibilities_from_grid_and_transformer(
+                grid=grid, transformer=transformer, analytic_visibilities=True
+            )
+
+            assert plane_visibilities == pytest.approx(
+                visibilities, abs=1.0e-2 * np.max(np.abs(visibilities))
+            )
+
+            plane = ag.Plane(
+                redshift=0.5,
+                galaxies=[
+                    g0,
+                    ag.Galaxy(
+                        redshift=0.5,
+                        light_profile=ag.lp.EllipticalSersic(intensity=1.0),
+                    ),
+                ],
+            )
+
+            assert plane.has_analytic_visibilities is False
+
         def test__visibilities_of_galaxies_from_grid_and_transformer(
             self, sub_grid_7x7, transformer_7x7_7
         ):
@@ -1588,6 +1767,52 @@ class TestAbstractPlaneData:
                 plane_visibilities, 1.0e-4
             )
 
+        def test__visibilities_of_galaxies_from_grid_and_transformer__sum_to_plane_visibilities(
+            self, sub_grid_7x7, transformer_7x7_7
+        ):
+            g0 = ag.Galaxy(
+                redshift=0.5, light_profile=ag.lp.EllipticalSersic(intensity=1.0)
+            )
+            g1 = ag.Galaxy(
+                redshift=0.5,
+                light_profile=ag.lp.EllipticalGaussian(intensity=2.0, sigma=0.5),
+            )
+            g2 = ag.Galaxy(redshift=0.5)
+
+            plane = ag.Plane(redshift=0.5, galaxies=[g0, g1, g2])
+
+            plane_visibilities_of_galaxies = plane.profile_visibilities_of_galaxies_from_grid_and_transformer(
+                grid=sub_grid_7x7,
+                transformer=transformer_7x7_7,
+                analytic_visibilities=True,
+            )
+
+            assert len(plane_visibilities_of_galaxies) == 3
+
+            assert plane_visibilities_of_galaxies[1] == pytest.approx(
+                g1.profile_visibilities_from_grid_and_transformer(
+                    grid=sub_grid_7x7,
+                    transformer=transformer_7x7_7,
+                    analytic_visibilities=True,
+                ),
+                1.0e-8,
+            )
+            assert (plane_visibilities_of_galaxies[2] == 0.0 + 0.0j).all()
+
+            plane = ag.Plane(redshift=0.5, galaxies=[g0, g2])
+
+            plane_visibilities_of_galaxies = plane.profile_visibilities_of_galaxies_from_grid_and_transformer(
+                grid=sub_grid_7x7, transformer=transformer_7x7_7
+            )
+
+            plane_visibilities = plane.profile_visibilities_from_grid_and_transformer(
+                grid=sub_grid_7x7, transformer=transformer_7x7_7
+            )
+
+            assert sum(plane_visibilities_of_galaxies) == pytest.approx(
+                plane_visibilities, 1.0e-8
+            )
+
         def test__galaxy_visibilities_dict_from_grid_and_transformer(
             self, sub_grid_7x7, transformer_7x7_7
         ):
@@ -1492,3 +1492,79 @@ class TestIsothermal:
         deflections = isothermal.deflections_from_grid(grid=grid)
 
         assert deflections.shape_2d == (2, 2)
+
+
+class TestFromNdarray:
+    def test__same_values_as_from_grid(self, sub_grid_7x7):
+
+        mass_profiles = [
+            ag.mp.PointMass(centre=(0.1, 0.2), einstein_radius=1.0),
+            ag.mp.SphericalCoredPowerLaw(
+                centre=(0.1, 0.2), einstein_radius=1.0, slope=2.2, core_radius=0.1
+            ),
+            ag.mp.EllipticalPowerLaw(
+                centre=(0.1, 0.2),
+                elliptical_comps=(0.1, 0.2),
+                einstein_radius=1.0,
+                slope=2.2,
+            ),
+            ag.mp.SphericalPowerLaw(centre=(0.1, 0.2), einstein_radius=1.0, slope=2.2),
+            ag.mp.EllipticalIsothermal(
+                centre=(0.1, 0.2), elliptical_comps=(0.1, 0.2), einstein_radius=1.0
+            ),
+            ag.mp.SphericalIsothermal(centre=(0.1, 0.2), einstein_radius=1.0),
+        ]
+
+        for mass_profile in mass_profiles:
+
+            deflections = mass_profile.deflections_from_grid(grid=sub_grid_7x7)
+            deflections_ndarray = mass_profile.deflections_from_ndarray(
+                grid=np.asarray(sub_grid_7x7)
+            )
+
+            assert isinstance(deflections_ndarray, np.ndarray)
+            assert deflections_ndarray == pytest.approx(np.asarray(deflections), 1.0e-8)
+
+            convergence = mass_profile.convergence_from_grid(grid=sub_grid_7x7)
+            convergence_ndarray = mass_profile.convergence_from_ndarray(
+                grid=np.asarray(sub_grid_7x7)
+            )
+
+            assert isinstance(convergence_ndarray, np.ndarray)
+            assert convergence_ndarray == pytest.approx(np.asarray(convergence), 1.0e-8)
+
+    def test__convergence__same_values_as_convergence_func(self):
+
+        power_law = ag.mp.EllipticalCoredPowerLaw(
+            centre=(0.1, 0.2),
+            elliptical_comps=(0.1, 0.2),
+            einstein_radius=1.0,
+            slope=2.2,
+            core_radius=0.1,
+        )
+
+        grid_eta = power_law.grid_to_elliptical_radii(grid=grid)
+
+        assert power_law.convergence_from_grid(grid=grid) == pytest.approx(
+            np.array([power_law.convergence_func(eta) for eta in grid_eta]), 1.0e-8
+        )
+
+    def test__galaxy__deflections_are_sum_of_mass_profiles(self, sub_grid_7x7):
+
+        isothermal = ag.mp.EllipticalIsothermal(
+            centre=(0.1, 0.2), elliptical_comps=(0.1, 0.2), einstein_radius=1.0
+        )
+        power_law = ag.mp.SphericalPowerLaw(
+            centre=(0.1, 0.2), einstein_radius=1.0, slope=2.2
+        )
+
+        galaxy = ag.Galaxy(redshift=0.5, mass_0=isothermal, mass_1=power_law)
+
+        deflections = galaxy.deflections_from_grid(grid=sub_grid_7x7)
+
+        assert isinstance(deflections, ag.Grid)
+        assert deflections.in_1d == pytest.approx(
+            isothermal.deflections_from_grid(grid=sub_grid_7x7).in_1d
+            + power_law.deflections_from_grid(grid=sub_grid_7x7).in_1d,
+            1.0e-8,
+        )
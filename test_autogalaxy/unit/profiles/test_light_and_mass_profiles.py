@@ -105,6 +105,22 @@ class TestSersic:
             spherical.deflections_from_grid(grid=grid),
         )
 
+    def test__light_and_mass_decomposition_into_gaussians_shared(self):
+
+        sersic = ag.lmp.EllipticalSersic(
+            elliptical_comps=(0.1, 0.05),
+            intensity=1.0,
+            effective_radius=0.6,
+            sersic_index=2.0,
+            mass_to_light_ratio=2.0,
+        )
+
+        amps_light, sigmas_light = sersic.decompose_image_into_gaussians()
+        amps_mass, sigmas_mass = sersic.decompose_convergence_into_gaussians()
+
+        assert sigmas_light is sigmas_mass
+        assert amps_mass == pytest.approx(2.0 * amps_light, 1.0e-8)
+
 
 class TestExponential:
     def test__grid_calculations__same_as_exponential(self):
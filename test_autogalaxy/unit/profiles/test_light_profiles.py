@@ -6,6 +6,7 @@ import numpy as np
 import pytest
 import scipy.special
 
+from autoconf import conf
 import autogalaxy as ag
 from autogalaxy.mock import mock
 
@@ -184,6 +185,44 @@ class TestGaussian:
 
         assert image.shape_2d == (2, 2)
 
+    def test__gaussians_convolved_with__sigmas_add_in_quadrature_and_flux_conserved(
+        self,
+    ):
+
+        psf_gaussians = ag.PSFGaussians(sigmas=[0.3, 0.6], weights=[0.75, 0.25])
+
+        gaussian = ag.lp.SphericalGaussian(intensity=2.0, sigma=0.4)
+
+        assert gaussian.has_analytic_psf_convolution is True
+
+        gaussians = gaussian.gaussians_convolved_with(psf_gaussians=psf_gaussians)
+
+        assert len(gaussians) == 2
+        assert gaussians[0].sigma == pytest.approx(0.5, 1.0e-4)
+        assert gaussians[0].axis_ratio == pytest.approx(1.0, 1.0e-4)
+        assert gaussians[0].intensity == pytest.approx(0.75 * 2.0 * 0.16 / 0.25, 1.0e-4)
+        assert gaussians[1].sigma == pytest.approx(np.sqrt(0.52), 1.0e-4)
+
+        gaussian = ag.lp.EllipticalGaussian(
+            centre=(0.1, 0.2), elliptical_comps=(0.1, 0.2), intensity=2.0, sigma=0.4,
+        )
+
+        gaussians = gaussian.gaussians_convolved_with(psf_gaussians=psf_gaussians)
+
+        def flux_from(gaussian):
+            return (
+                2.0 * np.pi * gaussian.intensity * gaussian.sigma ** 2.0
+            ) / gaussian.axis_ratio
+
+        assert sum(flux_from(gaussian=g) for g in gaussians) == pytest.approx(
+            flux_from(gaussian=gaussian), 1.0e-4
+        )
+        assert gaussians[0].centre == (0.1, 0.2)
+        assert gaussians[0].phi == pytest.approx(gaussian.phi, 1.0e-4)
+        assert gaussian.axis_ratio < gaussians[0].axis_ratio < 1.0
+
+        assert ag.lp.EllipticalSersic().has_analytic_psf_convolution is False
+
 
 class TestSersic:
     def test__image_from_grid_radii__correct_value(self):
@@ -276,6 +315,58 @@ class TestSersic:
 
         assert image.shape_2d == (2, 2)
 
+    def test__use_mge__config_value_cached_until_configs_change(self):
+
+        light_profile_mge = conf.instance["general"]["profiles"]["light_profile_mge"]
+
+        assert ag.lp.EllipticalSersic().use_mge == light_profile_mge
+
+        ag.lp._light_profile_mge = (conf.instance.configs, not light_profile_mge)
+
+        assert ag.lp.EllipticalSersic().use_mge == (not light_profile_mge)
+
+        ag.lp._light_profile_mge = ([], not light_profile_mge)
+
+        assert ag.lp.EllipticalSersic().use_mge == light_profile_mge
+
+    def test__image_from_ndarray_via_gaussians__matches_sersic_image(self):
+
+        sersic = ag.lp.EllipticalSersic(
+            centre=(0.1, 0.2),
+            elliptical_comps=(0.1, 0.2),
+            intensity=2.0,
+            effective_radius=1.0,
+            sersic_index=2.0,
+        )
+
+        assert sersic.has_analytic_psf_convolution is False
+
+        image = sersic.image_from_grid(grid=grid)
+        image_via_gaussians = sersic.image_from_ndarray_via_gaussians(grid=grid)
+
+        assert image_via_gaussians == pytest.approx(image, 1.0e-2)
+
+        image_of_gaussians = sum(
+            gaussian.image_from_ndarray(grid=grid) for gaussian in sersic.gaussians
+        )
+
+        assert image_of_gaussians == pytest.approx(image_via_gaussians, 1.0e-4)
+
+    def test__decompose_image_into_gaussians__cached_and_scaled_by_intensity(self):
+
+        sersic_0 = ag.lp.EllipticalSersic(
+            intensity=1.0, effective_radius=1.0, sersic_index=2.0
+        )
+        sersic_1 = ag.lp.EllipticalSersic(
+            intensity=3.0, effective_radius=1.0, sersic_index=2.0
+        )
+
+        amps_0, sigmas_0 = sersic_0.decompose_image_into_gaussians()
+        amps_1, sigmas_1 = sersic_1.decompose_image_into_gaussians()
+
+        assert sigmas_0 is sigmas_1
+        assert amps_1 == pytest.approx(3.0 * amps_0, 1.0e-8)
+
 
 class TestExponential:
     def test__image_from_grid_radii__correct_value(self):
@@ -518,6 +609,24 @@ class TestCoreSersic:
 
         assert image.shape_2d == (2, 2)
 
+    def test__image_from_ndarray_via_gaussians__matches_core_sersic_image(self):
+
+        core_sersic = ag.lp.EllipticalCoreSersic(
+            elliptical_comps=(0.0, 0.333333),
+            intensity=1.0,
+            effective_radius=5.0,
+            sersic_index=4.0,
+            radius_break=0.01,
+            intensity_break=0.1,
+            gamma=1.0,
+            alpha=1.0,
+        )
+
+        image = core_sersic.image_from_grid(grid=grid)
+        image_via_gaussians = core_sersic.image_from_ndarray_via_gaussians(grid=grid)
+
+        assert image_via_gaussians == pytest.approx(image, 1.0e-2)
+
 
 class TestChameleon:
     def test__image_from_grid_radii__correct_value(self):
@@ -679,6 +788,77 @@ class TestVisibilities:
 
         assert visibilities == pytest.approx(light_profile_visibilities, 1.0e-4)
 
+    def test__gaussian__analytic_visibilities_same_as_transformed_image(self):
+
+        mask = ag.Mask2D.circular(
+            shape_2d=(41, 41), pixel_scales=0.1, radius=2.0, sub_size=4
+        )
+
+        grid = ag.Grid.from_mask(mask=mask)
+
+        uv_wavelengths = np.array(
+            [
+                [0.0, 0.0],
+                [1.0e4, 2.0e4],
+                [-3.0e4, 5.0e4],
+                [8.0e4, -6.0e4],
+                [1.0e5, 1.0e5],
+            ]
+        )
+
+        transformer = ag.TransformerDFT(
+            uv_wavelengths=uv_wavelengths, real_space_mask=mask
+        )
+
+        light_profile = ag.lp.EllipticalGaussian(
+            centre=(0.1, -0.2), elliptical_comps=(0.1, 0.05), intensity=1.0, sigma=0.3
+        )
+
+        assert light_profile.has_analytic_visibilities is True
+
+        image = light_profile.image_from_grid(grid=grid)
+
+        visibilities = transformer.visibilities_from_image(image=image.in_1d_binned)
+
+        light_profile_visibilities = light_profile.profile_visibilities_from_grid_and_transformer(
+            grid=grid, transformer=transformer, analytic_visibilities=True
+        )
+
+        assert light_profile_visibilities == pytest.approx(
+            visibilities, abs=1.0e-2 * np.max(np.abs(visibilities))
+        )
+        assert (
+            light_profile.profile_visibilities_from_grid_and_transformer(
+                grid=grid, transformer=transformer
+            )
+            == visibilities
+        ).all()
+
+    def test__sersic__visibilities_from_uv_wavelengths_are_sum_of_gaussians(self):
+
+        light_profile = ag.lp.EllipticalSersic(
+            centre=(0.1, -0.2), elliptical_comps=(0.1, 0.05), intensity=1.0
+        )
+
+        assert light_profile.has_analytic_visibilities is False
+
+        uv_wavelengths = np.array([[1.0e4, 2.0e4], [-3.0e4, 5.0e4]])
+
+        visibilities = light_profile.visibilities_from_uv_wavelengths(
+            uv_wavelengths=uv_wavelengths, pixel_scales=(0.1, 0.1)
+        )
+
+        visibilities_of_gaussians = sum(
+            [
+                gaussian.visibilities_from_uv_wavelengths(
+                    uv_wavelengths=uv_wavelengths, pixel_scales=(0.1, 0.1)
+                )
+                for gaussian in light_profile.gaussians
+            ]
+        )
+
+        assert visibilities == pytest.approx(visibilities_of_gaussians, 1.0e-8)
+
 
 def luminosity_from_radius_and_profile(radius, profile):
     x = profile.sersic_constant * (
@@ -870,3 +1050,64 @@ class TestGrids:
         radii_1 = elliptical.grid_to_eccentric_radii(np.array([[-1, -1]]))
 
         assert radii_0 == pytest.approx(radii_1, 1e-10)
+
+
+class TestImageFromNdarray:
+    def test__same_values_as_image_from_grid(self, sub_grid_7x7):
+
+        light_profiles = [
+            ag.lp.EllipticalGaussian(
+                centre=(0.1, 0.2), elliptical_comps=(0.1, 0.2), intensity=1.0, sigma=1.0
+            ),
+            ag.lp.SphericalGaussian(centre=(0.1, 0.2), intensity=1.0, sigma=1.0),
+            ag.lp.EllipticalSersic(
+                centre=(0.1, 0.2),
+                elliptical_comps=(0.1, 0.2),
+                intensity=1.0,
+                effective_radius=0.6,
+                sersic_index=2.0,
+            ),
+            ag.lp.SphericalExponential(
+                centre=(0.1, 0.2), intensity=1.0, effective_radius=0.6
+            ),
+            ag.lp.EllipticalCoreSersic(
+                centre=(0.1, 0.2), elliptical_comps=(0.1, 0.2), intensity=1.0
+            ),
+            ag.lp.EllipticalChameleon(
+                centre=(0.1, 0.2), elliptical_comps=(0.1, 0.2), intensity=1.0
+            ),
+        ]
+
+        for light_profile in light_profiles:
+
+            image = light_profile.image_from_grid(grid=sub_grid_7x7)
+            image_ndarray = light_profile.image_from_ndarray(
+                grid=np.asarray(sub_grid_7x7)
+            )
+
+            assert isinstance(image_ndarray, np.ndarray)
+            assert image_ndarray == pytest.approx(np.asarray(image), 1.0e-8)
+
+            image = light_profile.image_from_grid(grid=grid)
+            image_ndarray = light_profile.image_from_ndarray(grid=grid)
+
+            assert image_ndarray == pytest.approx(image, 1.0e-8)
+
+    def test__coordinate_at_centre__relocated_to_radial_minimum(self):
+
+        sersic = ag.lp.EllipticalSersic(centre=(1.0, 1.0))
+
+        image_ndarray = sersic.image_from_ndarray(grid=np.array([[1.0, 1.0]]))
+
+        assert np.isfinite(image_ndarray).all()
+        assert image_ndarray == pytest.approx(
+            sersic.image_from_grid(grid=np.array([[1.0, 1.0]])), 1.0e-8
+        )
+
+    def test__point_source__image_is_zeros(self):
+
+        point_source = ag.lp.PointSource(centre=(0.0, 0.0))
+
+        image_ndarray = point_source.image_from_ndarray(grid=grid)
+
+        assert (image_ndarray == np.zeros(shape=4)).all()
@@ -3,6 +3,7 @@ from __future__ import division, print_function
 from os import path
 from autoconf import conf
 import autogalaxy as ag
+from autogalaxy.profiles import geometry_profiles as gp
 
 import numpy as np
 import pytest
@@ -506,3 +507,25 @@ class TestExternalShear:
         deflections_1 = shear.deflections_from_grid(grid=[[1e-8, 0.0]])
         deflections_0 = shear.deflections_from_grid(grid=[[1e-9, 0.0]])
         assert deflections_0 == pytest.approx(deflections_1, 1.0e-4)
+
+
+class TestRadialMinimumFrom:
+    def test__value_cached_per_class_until_configs_change(self):
+
+        radial_minimum = conf.instance["grids"]["radial_minimum"]["radial_minimum"][
+            "EllipticalSersic"
+        ]
+
+        assert gp.radial_minimum_from(class_name="EllipticalSersic") == radial_minimum
+        assert gp._radial_minimums["EllipticalSersic"] == (
+            conf.instance.configs,
+            radial_minimum,
+        )
+
+        gp._radial_minimums["EllipticalSersic"] = (conf.instance.configs, 1.0)
+
+        assert gp.radial_minimum_from(class_name="EllipticalSersic") == 1.0
+
+        gp._radial_minimums["EllipticalSersic"] = ([], 1.0)
+
+        assert gp.radial_minimum_from(class_name="EllipticalSersic") == radial_minimum
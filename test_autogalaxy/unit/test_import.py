@@ -0,0 +1,60 @@
+import subprocess
+import sys
+
+import autogalaxy as ag
+
+
+def modules_imported_by(statement):
+
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; {statement}; print(' '.join(sys.modules))",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    return output.split()
+
+
+class TestLazyImports:
+    def test__import_autogalaxy__does_not_import_plotting_aggregator_pipeline_or_cosmology_modules(
+        self,
+    ):
+
+        modules = modules_imported_by(statement="import autogalaxy")
+
+        assert "autogalaxy.fit.fit" in modules
+        assert "autogalaxy.profiles.mass_profiles.dark_mass_profiles" in modules
+
+        for module in [
+            "autogalaxy.plot",
+            "autogalaxy.aggregator",
+            "autogalaxy.pipeline",
+            "colossus",
+            "skimage",
+        ]:
+            assert module not in modules
+
+    def test__lazy_attributes__are_imported_on_first_access(self):
+
+        modules = modules_imported_by(
+            statement="import autogalaxy as ag; ag.PhaseImaging"
+        )
+
+        assert "autogalaxy.pipeline.phase.imaging.phase" in modules
+        assert "autogalaxy.plot" in modules
+
+    def test__lazy_attributes__are_the_objects_of_their_modules(self):
+
+        from autogalaxy.pipeline.phase.imaging.phase import PhaseImaging
+        from autogalaxy.pipeline.setup import SetupHyper
+
+        assert ag.PhaseImaging is PhaseImaging
+        assert ag.SetupHyper is SetupHyper
+        assert ag.agg.Plane is not None
+        assert ag.plot is sys.modules["autogalaxy.plot"]
+        assert "PhaseImaging" in dir(ag)
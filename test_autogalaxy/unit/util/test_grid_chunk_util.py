@@ -0,0 +1,47 @@
+import autogalaxy as ag
+import numpy as np
+from autogalaxy.util import grid_chunk_util
+
+
+class TestUseChunksForGrid:
+    def test__only_grids_with_more_pixels_than_chunk_size_use_chunks(
+        self, sub_grid_7x7
+    ):
+
+        assert grid_chunk_util.use_chunks_for_grid(
+            grid=sub_grid_7x7, pixels_per_chunk=2
+        )
+        assert not grid_chunk_util.use_chunks_for_grid(
+            grid=sub_grid_7x7, pixels_per_chunk=9
+        )
+        assert not grid_chunk_util.use_chunks_for_grid(
+            grid=sub_grid_7x7, pixels_per_chunk=0
+        )
+        assert not grid_chunk_util.use_chunks_for_grid(
+            grid=np.asarray(sub_grid_7x7), pixels_per_chunk=2
+        )
+
+
+class TestBinnedArrayFromFuncAndGrid:
+    def test__chunked_binned_image_identical_to_binned_image(self, sub_grid_7x7):
+
+        galaxy = ag.Galaxy(
+            redshift=0.5,
+            light_0=ag.lp.EllipticalSersic(intensity=1.0),
+            light_1=ag.lp.SphericalExponential(centre=(0.2, 0.1), intensity=2.0),
+        )
+
+        image = galaxy.image_from_grid(grid=sub_grid_7x7).in_1d_binned
+
+        for pixels_per_chunk, number_of_threads in [(2, 1), (3, 1), (2, 2), (4, 2)]:
+
+            binned_image = grid_chunk_util.binned_array_from_func_and_grid(
+                func=lambda sub_grid: galaxy.image_from_grid(grid=sub_grid),
+                grid=sub_grid_7x7,
+                pixels_per_chunk=pixels_per_chunk,
+                number_of_threads=number_of_threads,
+            )
+
+            assert binned_image.shape == image.shape
+            assert (binned_image == image).all()
+            assert (binned_image.in_2d_binned == image.in_2d_binned).all()
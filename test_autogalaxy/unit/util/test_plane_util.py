@@ -7,6 +7,8 @@ from autogalaxy.util.plane_util import (
     ordered_plane_redshifts_from,
     ordered_plane_redshifts_with_slicing_from,
     galaxies_in_redshift_ordered_planes_from,
+    values_of_galaxies_from,
+    visibilities_of_images_from,
 )
 
 
@@ -393,3 +395,90 @@ class TestGalaxyOrdering:
         assert galaxies_in_redshift_ordered_planes[4][0].redshift == 1.45
         assert galaxies_in_redshift_ordered_planes[4][1].redshift == 1.55
         assert galaxies_in_redshift_ordered_planes[6][0].redshift == 1.9
+
+
+class TestValuesOfGalaxies:
+    def test__values_returned_in_order_of_galaxies_for_any_number_of_threads(self):
+
+        galaxies = [ag.Galaxy(redshift=float(index)) for index in range(10)]
+
+        for number_of_threads in [1, 2, 4]:
+
+            values = values_of_galaxies_from(
+                func=lambda galaxy: galaxy.redshift,
+                galaxies=galaxies,
+                number_of_threads=number_of_threads,
+            )
+
+            assert values == [float(index) for index in range(10)]
+
+    def test__plane_quantities_with_threads__identical_to_serial(self, sub_grid_7x7):
+
+        galaxies = [
+            ag.Galaxy(
+                redshift=0.5,
+                light=ag.lp.EllipticalSersic(
+                    centre=(0.1 * index, 0.0), intensity=1.0 + index
+                ),
+                mass=ag.mp.EllipticalIsothermal(
+                    centre=(0.0, 0.1 * index), einstein_radius=1.0 + index
+                ),
+            )
+            for index in range(5)
+        ]
+
+        plane = ag.Plane(galaxies=galaxies, number_of_threads=1)
+        plane_threaded = ag.Plane(galaxies=galaxies, number_of_threads=4)
+
+        assert (
+            plane.image_from_grid(grid=sub_grid_7x7)
+            == plane_threaded.image_from_grid(grid=sub_grid_7x7)
+        ).all()
+        assert (
+            plane.deflections_from_grid(grid=sub_grid_7x7)
+            == plane_threaded.deflections_from_grid(grid=sub_grid_7x7)
+        ).all()
+
+
+class TestVisibilitiesOfImages:
+    def test__batched_transform_same_as_transform_of_each_image(
+        self, sub_grid_7x7, transformer_7x7_7
+    ):
+
+        images = [
+            ag.lp.EllipticalSersic(intensity=1.0).image_from_grid(grid=sub_grid_7x7),
+            ag.lp.EllipticalSersic(centre=(0.1, 0.1), intensity=2.0).image_from_grid(
+                grid=sub_grid_7x7
+            ),
+        ]
+
+        visibilities_of_images = visibilities_of_images_from(
+            images=images, transformer=transformer_7x7_7
+        )
+
+        assert len(visibilities_of_images) == 2
+
+        for image, visibilities in zip(images, visibilities_of_images):
+            assert visibilities == pytest.approx(
+                transformer_7x7_7.visibilities_from_image(image=image), 1.0e-8
+            )
+
+        assert (
+            visibilities_of_images_from(images=[], transformer=transformer_7x7_7) == []
+        )
+
+    def test__negative_image__transformed_individually(
+        self, sub_grid_7x7, transformer_7x7_7
+    ):
+
+        image = ag.lp.EllipticalSersic(intensity=-1.0).image_from_grid(
+            grid=sub_grid_7x7
+        )
+
+        visibilities_of_images = visibilities_of_images_from(
+            images=[image], transformer=transformer_7x7_7
+        )
+
+        assert visibilities_of_images[0] == pytest.approx(
+            transformer_7x7_7.visibilities_from_image(image=image), 1.0e-8
+        )
@@ -0,0 +1,89 @@
+import json
+from os import path
+
+import autogalaxy as ag
+from autogalaxy.mock import mock
+from autogalaxy.util import profiling_util
+
+
+class TestProfiling:
+    def test__timers_only_record_when_profiling(self):
+
+        with profiling_util.timer(stage="convolution"):
+            pass
+
+        with profiling_util.profiling() as profiler:
+
+            with profiling_util.timer(stage="convolution"):
+                pass
+
+            assert (
+                profiling_util.timed_call(func=lambda x: x + 1, stage="add", x=1) == 2
+            )
+
+        with profiling_util.timer(stage="convolution"):
+            pass
+
+        assert profiler.calls["convolution"] == 1
+        assert profiler.calls["add"] == 1
+        assert profiler.seconds["convolution"] >= 0.0
+        assert set(profiler.stages) == {"convolution", "add"}
+
+    def test__galaxy_and_light_profile_stages__named_by_galaxy_name_and_class(
+        self, sub_grid_7x7
+    ):
+
+        galaxy = ag.Galaxy(
+            redshift=0.5,
+            light_0=ag.lp.EllipticalSersic(intensity=1.0),
+            light_1=ag.lp.EllipticalGaussian(intensity=1.0),
+        )
+
+        with profiling_util.profiling() as profiler:
+
+            profiler.galaxy_names = {id(galaxy): "galaxies.lens"}
+
+            galaxy.image_from_grid(grid=sub_grid_7x7)
+
+        assert profiler.calls["galaxy.galaxies.lens"] == 1
+        assert profiler.calls["light_profile.EllipticalSersic"] == 1
+        assert profiler.calls["light_profile.EllipticalGaussian"] == 1
+
+
+class TestProfileLogLikelihoodFunction:
+    def test__report_of_stages_output_to_phase_output_path(self, imaging_7x7, mask_7x7):
+
+        phase_imaging_7x7 = ag.PhaseImaging(
+            galaxies=dict(
+                galaxy=ag.GalaxyModel(redshift=0.5, light=ag.lp.EllipticalSersic)
+            ),
+            search=mock.MockSearch(name="test_phase_profiling"),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        report = analysis.profile_log_likelihood_function(
+            model=phase_imaging_7x7.model,
+            paths=phase_imaging_7x7.search.paths,
+            total_evaluations=2,
+        )
+
+        assert report["evaluations"] == 2
+        assert report["stages"]["galaxy.galaxies.galaxy"]["calls"] == 4
+        assert report["stages"]["light_profile.EllipticalSersic"]["calls"] == 4
+        assert report["stages"]["convolution"]["calls"] == 2
+        assert report["stages"]["chi_squared"]["calls"] == 2
+        assert report["estimated_search_seconds"]["10000"] == 10000 * (
+            report["seconds_per_evaluation"]
+        )
+
+        with open(
+            path.join(phase_imaging_7x7.search.paths.output_path, "profiling.json")
+        ) as f:
+            assert json.load(f)["evaluations"] == 2
+
+        assert path.isfile(
+            path.join(phase_imaging_7x7.search.paths.output_path, "profiling.txt")
+        )